@@ -58,6 +58,8 @@ def main():
             os.environ["RB_HOST"] = config.ramic_bridge.host
         if config.ramic_bridge.port:
             os.environ["RB_PORT"] = str(config.ramic_bridge.port)
+        if getattr(config.ramic_bridge, 'pool', None):
+            print(f"   RAMIC bridge pool: {len(config.ramic_bridge.pool)} daemons")
 
     # Setup logging
     class Args:
@@ -8,6 +8,7 @@ Supports blank type for domain mismatch cases
 from typing import List
 from ..device_classifier import DeviceClassifier
 from ..position_calculator import PositionCalculator
+from ..layout_component import LayoutComponent
 from ..T28.inner_pad_handler import InnerPadHandler
 from ..T28.auto_filler import get_corner_domain
 from ..process_node_config import get_process_node_config
@@ -81,21 +82,21 @@ class AutoFillerGeneratorT180:
                 if first_pad_domain == "null":
                     first_pad_domain = "analog"
                 if corner_domain == first_pad_domain:
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "view_name": "layout",
                         "type": "filler",
                         "name": "sep_top_left_corner",
                         "device": self.corner_filler,
                         "position": [x, y],
                         "orientation": "R180"
-                    })
+                    }))
                 else:
                     # Domain mismatch: insert blank
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "blank",
                         "position": [x, y],
                         "orientation": "R180"
-                    })
+                    }))
                 
                 # Between last pad and top-right corner
                 last_pad = pad_list[-1]
@@ -103,14 +104,14 @@ class AutoFillerGeneratorT180:
                 lph = last_pad.get("pad_height") or pad_height
                 x = last_pad["position"][0] + 10
                 y = chip_height
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "view_name": "layout",
                     "type": "filler",
                     "name": "filler_top_right_corner",
                     "device": "PFILLER10",
                     "position": [x, y],
                     "orientation": "R180"
-                })
+                }))
                 
             elif orientation == "R90":  # Right edge
                 # Between top-right corner and first pad
@@ -124,21 +125,21 @@ class AutoFillerGeneratorT180:
                 if first_pad_domain == "null":
                     first_pad_domain = "analog"
                 if corner_domain == first_pad_domain:
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "view_name": "layout",
                         "type": "filler",
                         "name": "filler_right_top_corner",
                         "device": self.corner_filler,
                         "position": [x, y],
                         "orientation": "R90"
-                    })
+                    }))
                 else:
                     # Domain mismatch: insert blank
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "blank",
                         "position": [x, y],
                         "orientation": "R90"
-                    })
+                    }))
 
                 # Between last pad and bottom-right corner
                 last_pad = pad_list[-1]
@@ -146,14 +147,14 @@ class AutoFillerGeneratorT180:
                 lph = last_pad.get("pad_height") or pad_height
                 x = chip_width
                 y = last_pad["position"][1] - 10
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "view_name": "layout",
                     "type": "filler",
                     "name": "filler_right_bottom_corner",
                     "device": "PFILLER10",
                     "position": [x, y],
                     "orientation": "R90"
-                })
+                }))
                 
             elif orientation == "R0":  # Bottom edge
                 # Between bottom-right corner and first pad
@@ -166,35 +167,35 @@ class AutoFillerGeneratorT180:
                 if first_pad_domain == "null":
                     first_pad_domain = "analog"
                 if corner_domain == first_pad_domain:
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "view_name": "layout",
                         "type": "filler",
                         "name": "sep_bottom_right_corner",
                         "device": self.corner_filler,
                         "position": [x, y],
                         "orientation": "R0"
-                    })
+                    }))
                 else:
                     # Domain mismatch: insert blank
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "blank",
                         "position": [x, y],
                         "orientation": "R0"
-                    })
+                    }))
 
                 # Between last pad and bottom-left corner
                 last_pad = pad_list[-1]
                 lpw = last_pad.get("pad_width") or pad_width
                 x = last_pad["position"][0] - 10
                 y = 0
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "view_name": "layout",
                     "type": "filler",
                     "name": "filler_bottom_left_corner",
                     "device": "PFILLER10",
                     "position": [x, y],
                     "orientation": "R0"
-                })
+                }))
                 
             elif orientation == "R270":  # Left edge
                 # Between bottom-left corner and first pad
@@ -207,35 +208,35 @@ class AutoFillerGeneratorT180:
                 if first_pad_domain == "null":
                     first_pad_domain = "analog"
                 if corner_domain == first_pad_domain:
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "view_name": "layout",
                         "type": "filler",
                         "name": "filler_left_bottom_corner",
                         "device": self.corner_filler,
                         "position": [x, y],
                         "orientation": "R270"
-                    })
+                    }))
                 else:
                     # Domain mismatch: insert blank
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "blank",
                         "position": [x, y],
                         "orientation": "R270"
-                    })
+                    }))
                 
                 # Between last pad and top-left corner
                 last_pad = pad_list[-1]
                 lpw = last_pad.get("pad_width") or pad_width
                 x = 0
                 y = last_pad["position"][1] + 10
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "view_name": "layout",
                     "type": "filler",
                     "name": "sep_left_top_corner",
                     "device": "PFILLER10",
                     "position": [x, y],
                     "orientation": "R270"
-                })
+                }))
             
             # 2. Filler between pads (with blank support for domain mismatch)
             for i in range(len(pad_list) - 1):
@@ -265,21 +266,21 @@ class AutoFillerGeneratorT180:
                     next_domain = "analog"
                 
                 if curr_domain == next_domain:
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "view_name": curr_pad.get("view_name", self.config.get("view_name", "layout")),
                         "type": "filler",
                         "name": f"filler_{orientation}_{i+1}_1",
                         "device": "PFILLER10",
                         "position": [x, y],
                         "orientation": orientation
-                    })
+                    }))
                 else:
                     # Domain mismatch: insert blank
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "blank",
                         "position": [x, y],
                         "orientation": orientation
-                    })
+                    }))
 
         return layout_components + fillers
 
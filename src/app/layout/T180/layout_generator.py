@@ -8,18 +8,22 @@ Includes PSUB2 generation specific to T180
 
 import os
 import json
-from typing import Dict, Tuple, List
+from typing import Callable, Dict, Tuple, List, Optional
 
 from ..device_classifier import DeviceClassifier
 from ..voltage_domain import VoltageDomainHandler
 from ..position_calculator import PositionCalculator
+from ..layout_component import LayoutComponent, components_from_dicts
 from ..filler_generator import FillerGenerator
 from ..layout_validator import LayoutValidator
+from ..ring_topology import RingTopology
+from ..ring_hierarchy import RingHierarchy
 from ..T28.inner_pad_handler import InnerPadHandler
 from .skill_generator import SkillGeneratorT180
 from .auto_filler import AutoFillerGeneratorT180
 from ..process_node_config import get_process_node_config
 from .layout_visualizer import visualize_layout_T180, visualize_layout_from_components_T180
+from ...utils.skill_emitter import SkillEmitter
 from pathlib import Path
 
 
@@ -55,6 +59,8 @@ class LayoutGeneratorT180:
         self.inner_pad_handler = InnerPadHandler(self.config)
         self.skill_generator = SkillGeneratorT180(self.config)
         self.auto_filler_generator = AutoFillerGeneratorT180(self.config)
+        # Outer ring in placement order, built by convert_relative_to_absolute()
+        self.ring_topology: Optional[RingTopology] = None
         # Instantiate classifier for instance-based queries (matching merge_source)
         self.classifier = DeviceClassifier(process_node="T180")
     
@@ -81,6 +87,7 @@ class LayoutGeneratorT180:
         """Convert relative positions to absolute positions for 180nm format"""
         converted_components = []
         inner_pads = []
+        ring_slots = []
         
         for instance in instances:
             relative_pos = instance.get("position", "")
@@ -113,14 +120,15 @@ class LayoutGeneratorT180:
                 inner_pads.append(instance)
                 continue
             
-            # Calculate position (matching merge_source: pass instance parameter)
+            # Calculate position (matching merge_source: pass instance parameter;
+            # pads and corners are computed for the whole ring below)
             if component_type == "filler":
                 position, orientation = self.position_calculator.calculate_filler_position_from_relative(relative_pos, ring_config, instance)
             else:
-                position, orientation = self.position_calculator.calculate_position_from_relative(relative_pos, ring_config, instance)
+                position, orientation = None, None
             
             # Build component configuration - use device field
-            component = {
+            component = LayoutComponent({
                 "view_name": view_name,
                 "type": component_type,
                 "name": name,
@@ -130,7 +138,7 @@ class LayoutGeneratorT180:
                 "orientation": orientation,
                 "pad_width": pad_width,
                 "pad_height": pad_height
-            }
+            })
             
             if relative_pos:
                 component["position_str"] = relative_pos
@@ -147,13 +155,26 @@ class LayoutGeneratorT180:
                 component["pin_config"] = pin_config  # Use pin_config for 180nm
             
             converted_components.append(component)
+            if position is None:
+                ring_slots.append((component, relative_pos, instance))
+        
+        ring_positions = self.position_calculator.calculate_positions_from_relative(
+            [relative_pos for _, relative_pos, _ in ring_slots], ring_config,
+            [instance for _, _, instance in ring_slots])
+        for (component, _, _), (position, orientation) in zip(ring_slots, ring_positions):
+            component["position"] = position
+            component["orientation"] = orientation
         
         # Check corners
         has_corners = any(comp.get("type") == "corner" for comp in converted_components)
         if not has_corners:
             raise ValueError("❌ Error: Corner components are missing in the intent graph!")
         
-        # Handle inner pads
+        # Outer ring in placement order, shared by the inner pads and SKILL generation
+        ring_components = [comp for comp in converted_components if comp.get("type") in ("pad", "corner")]
+        self.ring_topology = self.inner_pad_handler.build_ring_topology(ring_components, ring_config, inner_pads)
+        
+        # Handle inner pads (placed relative to the outer pads only)
         for inner_pad in inner_pads:
             name = inner_pad.get("name", "")
             device = inner_pad.get("device", "")
@@ -166,17 +187,16 @@ class LayoutGeneratorT180:
             voltage_domain = inner_pad.get("voltage_domain", {})
             pin_config = inner_pad.get("pin_config", {})
             
-            outer_pads_for_inner = [comp for comp in converted_components if comp.get("type") == "pad"]
-            position, orientation = self.inner_pad_handler.calculate_inner_pad_position(position_str, outer_pads_for_inner, ring_config)
+            position, orientation = self.ring_topology.inner_pad_position(position_str)
             
-            component = {
+            component = LayoutComponent({
                 "type": "inner_pad",
                 "name": name,
                 "device": device,  # Use device field
                 "position": position,
                 "orientation": orientation,
                 "position_str": position_str
-            }
+            })
             
             if io_type:
                 component["io_direction"] = io_type
@@ -192,8 +212,29 @@ class LayoutGeneratorT180:
         return converted_components
 
 
-def generate_layout_from_json(json_file: str, output_file: str = "generated_layout.il"):
-    """Generate 180nm layout from JSON file"""
+def generate_layout_from_json(json_file: str, output_file: str = "generated_layout.il",
+                              max_chunk_bytes: Optional[int] = None,
+                              on_chunk: Optional[Callable[[str], None]] = None,
+                              compact: bool = False, hierarchical: bool = False) -> Optional[dict]:
+    """Generate 180nm layout from JSON file
+    
+    Args:
+        json_file: Intent graph JSON file
+        output_file: SKILL script path
+        max_chunk_bytes: Split the script into chunks of about this size, output_file then
+            loads them in order (see src/app/utils/skill_emitter.py)
+        on_chunk: Called with each finished chunk path while the script is being generated
+        compact: Write instances, paths and labels as placement tables with one foreach
+            loop per batch (see src/app/utils/skill_compact.py)
+        hierarchical: Write pads, bond pads and fillers into generated per-side sub-cells
+            (see src/app/layout/ring_hierarchy.py)
+    
+    Returns:
+        Dict with 'output_file', 'chunk_files' (files holding the SKILL statements, in load
+        order), 'components' (ring components with absolute positions, as rendered in the
+        visualization), 'visualization_file' (None if rendering failed) and 'hierarchy'
+        (hierarchy manifest, None unless hierarchical), or None if layout rule validation failed
+    """
     print(f"📖 Reading intent graph file: {json_file}")
     print(f"🔧 Using process node: 180nm")
     
@@ -257,6 +298,9 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
     # Convert relative positions
     if any("position" in instance and "_" in str(instance["position"]) for instance in instances):
         instances = generator.convert_relative_to_absolute(instances, ring_config)
+    else:
+        # Absolute positions: use the instances as components directly
+        instances = components_from_dicts(instances)
     
     # Separate components
     outer_pads = []
@@ -283,6 +327,11 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
         print(f"❌ Layout rule validation failed: {validation_result['message']}")
         return None
     
+    # Outer ring in placement order, computed once for this generation
+    topology = generator.ring_topology
+    if topology is None:
+        topology = generator.inner_pad_handler.build_ring_topology(validation_components, ring_config, inner_pads)
+    
     # Check fillers - use device field
     all_instances = instances
     existing_fillers = [comp for comp in all_instances if comp.get("type") == "filler" or 
@@ -297,20 +346,26 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
     
     # Generate SKILL script
     print("🚀 Starting Layout Skill script generation...")
-    skill_commands = []
+    emitter = SkillEmitter(output_file, preamble=["cv = geGetWindowCellView()"],
+                           max_chunk_bytes=max_chunk_bytes, on_chunk=on_chunk, compact=compact)
     
-    skill_commands.append("cv = geGetWindowCellView()")
     # File header
-    skill_commands.append("; Generated Layout Script with Dual Ring Support")
-    skill_commands.append("")
+    emitter.emit("; Generated Layout Script with Dual Ring Support")
+    emitter.emit("")
     
-    # Sort components
-    placement_order = ring_config.get("placement_order", "counterclockwise")
-    all_components = outer_pads + corners
-    sorted_components = generator.position_calculator.sort_components_by_position(all_components, placement_order)
+    # Components in placement order
+    sorted_components = topology.sorted_components
+    
+    # In hierarchical mode the outer ring instances are collected into sub-cells, written after the fillers
+    hierarchy = RingHierarchy() if hierarchical else None
+    
+    def emit_instance(library, device, view, name, x, y, orientation, side_orientation=None, starts_group=False):
+        if hierarchy is None or not hierarchy.add(library, device, view, name, x, y, orientation,
+                                                  side_orientation, starts_group):
+            emitter.emit(f'dbCreateParamInstByMasterName(cv "{library}" "{device}" "{view}" "{name}" list({x} {y}) "{orientation}")')
     
     # 1. Generate all components (matching merge_source format)
-    skill_commands.append("; ==================== All Components (Sorted by Placement Order) ====================")
+    emitter.emit("; ==================== All Components (Sorted by Placement Order) ====================")
     for i, component in enumerate(sorted_components):
         x, y = component["position"]
         orientation = component["orientation"]
@@ -322,7 +377,8 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
         view = component.get("view_name", ring_config.get("view_name", "layout"))
         
         # Use name_position_str format (matching merge_source, no sanitization)
-        skill_commands.append(f'dbCreateParamInstByMasterName(cv "{lib}" "{device}" "{view}" "{name}_{position_str}" list({x} {y}) "{orientation}")')
+        side_orientation = orientation if component_type != "corner" else None
+        emit_instance(lib, device, view, f"{name}_{position_str}", x, y, orientation, side_orientation, component_type == "pad")
         
         # Add PAD70 for pad components with adjusted orientation/position (matching merge_source)
         if component_type == "pad":
@@ -349,20 +405,19 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
             device_masters = ring_config.get("device_masters", {})
             pad_library = device_masters.get("pad_library", "tpb018v_cup_6lm")
             pad_master = device_masters.get("pad_master", "PAD70LU_TRL")
-            skill_commands.append(
-                f'dbCreateParamInstByMasterName(cv "{pad_library}" "{pad_master}" "layout" "pad70lu_{name}_{position_str}" list({x70} {y70}) "{pad70_orient}")'
-            )
+            emit_instance(pad_library, pad_master, "layout", f"pad70lu_{name}_{position_str}", x70, y70, pad70_orient,
+                          side_orientation)
     
-    skill_commands.append("")
+    emitter.emit("")
     
     # 2. PSUB2_layer Drawing (matching merge_source)
-    skill_commands.append("; ==================== PSUB2 Layer ====================")
+    emitter.emit("; ==================== PSUB2 Layer ====================")
     PSUB2_commands = generator.skill_generator.generate_psub2(outer_pads, corners, ring_config)
-    skill_commands.extend(PSUB2_commands)
-    skill_commands.append("")
+    emitter.emit_all(PSUB2_commands)
+    emitter.emit("")
     
     # 3. Filler components (matching merge_source)
-    skill_commands.append("; ==================== Filler Components ====================")
+    emitter.emit("; ==================== Filler Components ====================")
     
     if existing_fillers:
         # If JSON has fillers, extract filler components from instances
@@ -376,7 +431,7 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
                 x, y = position
                 lib = ring_config.get("library_name", generator.config.get("library_name", "tpd018bcdnv5"))
                 view = instance.get("view_name", ring_config.get("view_name", "layout"))
-                skill_commands.append(f'dbCreateParamInstByMasterName(cv "{lib}" "{device}" "{view}" "{name}" list({x} {y}) "{orientation}")')
+                emit_instance(lib, device, view, name, x, y, orientation, orientation)
     else:
         # If JSON does not have fillers, use auto-generated fillers
         # Skip blank types (they are for visualization only, not SKILL generation)
@@ -389,29 +444,37 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
                 name = filler["name"]
                 lib = ring_config.get("library_name", generator.config.get("library_name", "tpd018bcdnv5"))
                 view = filler.get("view_name", ring_config.get("view_name", "layout"))
-                skill_commands.append(f'dbCreateParamInstByMasterName(cv "{lib}" "{device}" "{view}" "{name}" list({x} {y}) "{orientation}")')
+                emit_instance(lib, device, view, name, x, y, orientation, orientation)
             # Skip blank types - they are for visualization only
     
-    skill_commands.append("")
+    hierarchy_manifest = None
+    if hierarchy is not None:
+        emitter.emit("")
+        emitter.emit("; ==================== Ring Sub-cells (Hierarchical) ====================")
+        hierarchy_layout = hierarchy.build()
+        emitter.emit_all(hierarchy.skill_commands(hierarchy_layout))
+        hierarchy_manifest = hierarchy.manifest(hierarchy_layout)
+        print(f"🧩 Hierarchical ring: {hierarchy.instance_count} instances in {len(hierarchy_layout['slot_cells'])} slot "
+              f"and {len(hierarchy_layout['side_cells'])} side cell(s)")
+    
+    emitter.emit("")
     
     # 5. Digital IO features
-    skill_commands.append("; ==================== Digital IO Features (with Inner Pad Support) ====================")
-    digital_io_commands = generator.skill_generator.generate_digital_io_features_with_inner(outer_pads, inner_pads, ring_config)
-    skill_commands.extend(digital_io_commands)
-    skill_commands.append("")
+    emitter.emit("; ==================== Digital IO Features (with Inner Pad Support) ====================")
+    digital_io_commands = generator.skill_generator.generate_digital_io_features_with_inner(outer_pads, inner_pads, ring_config, topology)
+    emitter.emit_all(digital_io_commands)
+    emitter.emit("")
     
     # 6. Pin labels
-    skill_commands.append("; ==================== Pin Labels (with Inner Pad Support) ====================")
-    pin_label_commands = generator.skill_generator.generate_pin_labels_with_inner(outer_pads, inner_pads, ring_config)
-    skill_commands.extend(pin_label_commands)
-    skill_commands.append("")
-    skill_commands.append("dbSave(cv)")
-
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(skill_commands))
+    emitter.emit("; ==================== Pin Labels (with Inner Pad Support) ====================")
+    pin_label_commands = generator.skill_generator.generate_pin_labels_with_inner(outer_pads, inner_pads, ring_config, topology)
+    emitter.emit_all(pin_label_commands)
+    emitter.emit("")
+    emitter.emit("dbSave(cv)")
+    chunk_files = emitter.close()
     
     # Generate visualization (T180 uses layout_visualizer_T180)
+    visualization_path = None
     try:
         output_dir = os.path.dirname(output_file) or "output"
         vis_name = os.path.splitext(os.path.basename(output_file))[0] + "_visualization.png"
@@ -421,6 +484,7 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
         visualize_layout_from_components_T180(all_components_with_fillers, visualization_path, ring_config)
         print(f"📊 Visualization generated: {visualization_path}")
     except Exception as e:
+        visualization_path = None
         print(f"⚠️  Visualization generation failed: {e}")
     
     # Calculate chip size (matching merge_source)
@@ -432,6 +496,9 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
     if inner_pads:
         print(f"📊 Inner ring pads: {len(inner_pads)}")
     print(f"✅ Layout Skill script generated: {output_file}")
+    if max_chunk_bytes is not None:
+        print(f"📦 Split into {len(chunk_files)} chunk(s) loaded by {output_file}")
     
-    return output_file
+    return {"output_file": output_file, "chunk_files": chunk_files, "components": all_components_with_fillers,
+            "visualization_file": visualization_path, "hierarchy": hierarchy_manifest}
 
@@ -7,28 +7,18 @@ Optimized for T180 process node with different device sizes and types
 """
 
 import re
-import json
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Mapping, Tuple, Optional
 from collections import defaultdict
+from functools import lru_cache
 
-# Get config directory path
-# layout_visualizer.py is in src/app/layout/T180/
-# config files are in src/app/layout/config/
-_CONFIG_DIR = Path(__file__).parent.parent / "config"
-
-def _load_180nm_config() -> Dict:
-    """Load 180nm device configuration from JSON file"""
-    config_file = _CONFIG_DIR / "lydevices_180.json"
-    if config_file.exists():
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+from ..device_classifier import CLASSIFICATION_CACHE_SIZE, get_classification_table
+from ..layout_renderer import render_layout_items
+from ..process_node_config import get_process_node_registry
+
+def _load_180nm_config() -> Mapping:
+    """Load 180nm device configuration from the shared process node registry"""
+    return get_process_node_registry().get_device_config("T180") or {}
 
 # Load 180nm configuration
 _180NM_CONFIG = _load_180nm_config()
@@ -105,6 +95,7 @@ def parse_skill_layout_180nm(il_file_path: str) -> List[Dict]:
     - device_type: device type for color mapping
     - device_category: category (io, corner, filler, inner_pad)
     """
+    device_table = get_classification_table("T180")
     with open(il_file_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
@@ -130,21 +121,14 @@ def parse_skill_layout_180nm(il_file_path: str) -> List[Dict]:
         # Inner pads have instance names starting with "inner_pad_"
         is_inner_pad = inst_name.startswith('inner_pad_')
         
-        # Use configuration file to classify devices
-        digital_devices = _180NM_CONFIG.get("digital_devices", [])
-        analog_devices = _180NM_CONFIG.get("analog_devices", [])
-        corner_devices = _180NM_CONFIG.get("corner_devices", [])
-        filler_devices = _180NM_CONFIG.get("filler_devices", [])
-        cut_devices = _180NM_CONFIG.get("cut_devices", [])
-        
-        # Check device type using config
-        if any(dev in cell_name for dev in corner_devices):
+        # Check device type using the compiled config classification table
+        if device_table.contains(cell_name, "corner_devices"):
             device_type = cell_name
             device_category = 'corner'
-        elif any(dev in cell_name for dev in filler_devices) or any(dev in cell_name for dev in cut_devices):
+        elif device_table.contains(cell_name, "filler_devices", "cut_devices"):
             device_type = cell_name
             device_category = 'filler'
-        elif any(dev in cell_name for dev in digital_devices) or any(dev in cell_name for dev in analog_devices):
+        elif device_table.contains(cell_name, "digital_devices", "analog_devices"):
             device_type = cell_name
             if is_inner_pad:
                 device_category = 'inner_pad'  # Inner pad (dual ring pad)
@@ -184,34 +168,28 @@ def parse_skill_layout_180nm(il_file_path: str) -> List[Dict]:
     return devices
 
 
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
 def get_device_color_180nm(device_type: str) -> str:
     """Get color for device type based on 180nm configuration"""
-    # Use configuration file for device classification
-    digital_io = _180NM_CONFIG.get("digital_io", [])
-    digital_vol = _180NM_CONFIG.get("digital_vol", [])
-    analog_io = _180NM_CONFIG.get("analog_io", [])
-    analog_vol = _180NM_CONFIG.get("analog_vol", [])
-    corner_devices = _180NM_CONFIG.get("corner_devices", [])
-    filler_devices = _180NM_CONFIG.get("filler_devices", [])
-    
+    device_table = get_classification_table("T180")
     # Check if device matches any in config lists
-    if any(dev in device_type for dev in digital_io):
+    if device_table.contains(device_type, "digital_io"):
         return '#32CD32'  # Medium green - Digital IO
-    elif any(dev in device_type for dev in digital_vol):
+    elif device_table.contains(device_type, "digital_vol"):
         if 'PVDD' in device_type:
             return '#90EE90'  # Light green - Digital power
         else:
             return '#228B22'  # Dark green - Digital ground
-    elif any(dev in device_type for dev in analog_io):
+    elif device_table.contains(device_type, "analog_io"):
         return '#4A90E2'  # Medium blue - Analog IO
-    elif any(dev in device_type for dev in analog_vol):
+    elif device_table.contains(device_type, "analog_vol"):
         if 'PVDD' in device_type:
             return '#5BA0F2'  # Light blue - Analog power
         else:
             return '#3A80D2'  # Dark blue - Analog ground
-    elif any(dev in device_type for dev in corner_devices):
+    elif device_table.contains(device_type, "corner_devices"):
         return '#FF6B6B'  # Medium red - Corner
-    elif any(dev in device_type for dev in filler_devices):
+    elif device_table.contains(device_type, "filler_devices"):
         return '#C0C0C0'  # Light gray - Filler
     
     # Try prefix match
@@ -221,6 +199,10 @@ def get_device_color_180nm(device_type: str) -> str:
     
     return DEVICE_COLORS_180NM['default']
 
+# Colors depend on the device lists, recompute them after a config reload
+get_process_node_registry().add_reload_listener(
+    lambda process_node: process_node == "T180" and get_device_color_180nm.cache_clear())
+
 
 def get_rectangle_for_rotation_180nm(x: float, y: float, rotation: str, width: float, height: float) -> Tuple[float, float, float, float]:
     """
@@ -321,75 +303,68 @@ def get_rectangle_for_rotation_180nm(x: float, y: float, rotation: str, width: f
             return (x, y, width, height)
 
 
-def visualize_layout_T180(il_file_path: str, output_path: Optional[str] = None) -> str:
+def _device_sort_key_180nm(device: Dict) -> Tuple:
+    """Sort by side first (left, bottom, right, top), then by position along that side"""
+    x, y = device['x'], device['y']
+    rotation = device['rotation']
+    if rotation == 'R270':  # Left side
+        return (0, y)
+    elif rotation == 'R0':  # Bottom side
+        return (1, x)
+    elif rotation == 'R90':  # Right side
+        return (2, -y)
+    elif rotation == 'R180':  # Top side
+        return (3, -x)
+    else:
+        return (4, 0)
+
+
+def visualize_layout_T180(il_file_path: str, output_path: Optional[str] = None, backend: Optional[str] = None) -> str:
     """
     Generate visual diagram from SKILL layout file for T180
-    
+
     Args:
         il_file_path: Path to SKILL layout file
         output_path: Optional output path for image (default: same directory as input with .png extension)
-    
+        backend: Render backend, "collection" (default) or "artist" (see layout_renderer.py)
+
     Returns:
         Path to generated image file
     """
+    device_table = get_classification_table("T180")
     # Parse SKILL file
     devices = parse_skill_layout_180nm(il_file_path)
-    
+
     if not devices:
         raise ValueError(f"No devices found in {il_file_path}")
-    
+
     # Include all devices: pads, corners, and fillers
     all_devices = devices
-    
+
     # Calculate bounds from all devices
     all_x = [d['x'] for d in all_devices]
     all_y = [d['y'] for d in all_devices]
     min_x, max_x = min(all_x), max(all_x)
     min_y, max_y = min(all_y), max(all_y)
-    
+
     # Add padding for visualization
     padding = 50
     fig_width = max(max_x - min_x + 2 * padding, 400)
     fig_height = max(max_y - min_y + 2 * padding, 400)
-    
-    # Create figure
-    fig, ax = plt.subplots(1, 1, figsize=(fig_width/50, fig_height/50))
-    ax.set_xlim(min_x - padding, max_x + padding)
-    ax.set_ylim(min_y - padding, max_y + padding)
-    ax.set_aspect('equal')
-    # SKILL coordinates: x increases RIGHT, y increases UP (no inversion needed)
-    ax.axis('off')
-    
-    # Sort pad devices by position to ensure proper ordering
-    # Sort by side first (left, bottom, right, top), then by position along that side
-    def get_sort_key(device):
-        x, y = device['x'], device['y']
-        rotation = device['rotation']
-        # Determine which side based on rotation and position
-        if rotation == 'R270':  # Left side
-            return (0, y)  # Sort by y coordinate
-        elif rotation == 'R0':  # Bottom side
-            return (1, x)  # Sort by x coordinate
-        elif rotation == 'R90':  # Right side
-            return (2, -y)  # Sort by y coordinate (descending)
-        elif rotation == 'R180':  # Top side
-            return (3, -x)  # Sort by x coordinate (descending)
-        else:
-            return (4, 0)
-    
-    all_devices_sorted = sorted(all_devices, key=get_sort_key)
-    
-    # Draw each device
-    for device in all_devices_sorted:
+    bounds = (min_x - padding, min_x - padding + fig_width, min_y - padding, min_y - padding + fig_height)
+
+    # Build one render item per device
+    items = []
+    for device in sorted(all_devices, key=_device_sort_key_180nm):
         x, y = device['x'], device['y']
         rotation = device['rotation']
         device_type = device['device_type']
         device_category = device.get('device_category', 'io')
         inst_name = device['inst_name']
-        
+
         # Get color
         color = get_device_color_180nm(device_type)
-        
+
         # Get device dimensions based on category
         if device_category == 'corner':
             width = CORNER_SIZE_180NM
@@ -415,37 +390,7 @@ def visualize_layout_T180(il_file_path: str, output_path: Optional[str] = None)
             # IO devices: 80×120 for 180nm
             width = PAD_WIDTH_180NM
             height = PAD_HEIGHT_180NM
-        
-        # Calculate rectangle based on rotation
-        rect_x, rect_y, rect_w, rect_h = get_rectangle_for_rotation_180nm(
-            x, y, rotation, width, height
-        )
-        
-        # Create rectangle with thicker border for better visibility
-        # Inner pads use dashed border to distinguish from regular IO devices
-        # Blank uses red color with dashed border
-        if device_category == 'inner_pad':
-            # Inner pad: dashed border using FancyBboxPatch for better style support
-            rect = patches.FancyBboxPatch(
-                (rect_x, rect_y), rect_w, rect_h,
-                boxstyle='round,pad=0',
-                linewidth=2, edgecolor='black', facecolor=color, alpha=0.8,
-                linestyle='--'  # Dashed border for inner pad
-            )
-        elif device_category == 'blank':
-            # Blank: red color with dashed border
-            rect = patches.Rectangle(
-                (rect_x, rect_y), rect_w, rect_h,
-                linewidth=2, edgecolor='black', facecolor='#FF0000', alpha=0.6,
-                linestyle='--'  # Dashed border for blank
-            )
-        else:
-            rect = patches.Rectangle(
-                (rect_x, rect_y), rect_w, rect_h,
-                linewidth=2, edgecolor='black', facecolor=color, alpha=0.8
-            )
-        ax.add_patch(rect)
-        
+
         # Add text label in center
         if device_category == 'io' or device_category == 'inner_pad':
             # Extract signal name from instance name
@@ -459,12 +404,9 @@ def visualize_layout_T180(il_file_path: str, output_path: Optional[str] = None)
             else:
                 # Regular IO: remove _(left|right|top|bottom)_\d+$
                 signal_name = re.sub(r'_(left|right|top|bottom)_\d+$', '', signal_name)
-            
-            # Get device type (cell_name)
-            device_type_label = device['cell_name']
-            
+
             # Format: "signal_name:device_type"
-            label = f"{signal_name}:{device_type_label}"
+            label = f"{signal_name}:{device['cell_name']}"
         elif device_category == 'corner':
             label = device['cell_name']
         elif device_category == 'filler':
@@ -474,64 +416,48 @@ def visualize_layout_T180(il_file_path: str, output_path: Optional[str] = None)
         else:
             label = inst_name
             label = re.sub(r'_(left|right|top|bottom)_\d+$', '', label)
-        
-        # Calculate center of rectangle
-        center_x = rect_x + rect_w / 2
-        center_y = rect_y + rect_h / 2
-        
+
         # Adjust font size based on device size
         if device_category == 'corner':
             font_size = 8
-        elif device_category == 'filler':
-            font_size = 6
-        elif device_category == 'blank':
+        elif device_category == 'filler' or device_category == 'blank':
             font_size = 6
-        elif device_category == 'inner_pad':
-            font_size = 7
-        else:  # io (IO devices)
+        else:  # io and inner_pad
             font_size = 7
-        
+
         # Determine text rotation to align with rectangle's long edge
-        if rotation == 'R0' or rotation == 'R180':
-            # Horizontal rectangle: long edge is vertical, text should be vertical
-            text_rotation = 90
-        elif rotation == 'R90' or rotation == 'R270':
-            # Vertical rectangle: long edge is horizontal, text should be horizontal
-            text_rotation = 0
-        else:
-            text_rotation = 0
-        
-        ax.text(center_x, center_y, label, 
-                ha='center', va='center', 
-                fontsize=font_size, 
-                rotation=text_rotation,
-                rotation_mode='anchor',
-                weight='bold' if device_category == 'corner' else 'normal')
-    
-    ax.set_title('IO Ring Layout Visualization (T180)', fontsize=14, fontweight='bold', pad=20)
-    
+        # R0/R180: long edge is vertical -> vertical text, R90/R270: horizontal text
+        text_rotation = 90 if rotation in ('R0', 'R180') else 0
+
+        # Inner pads use dashed border to distinguish from regular IO devices
+        # Blank uses red color with dashed border
+        items.append({
+            'rect': get_rectangle_for_rotation_180nm(x, y, rotation, width, height),
+            'facecolor': '#FF0000' if device_category == 'blank' else color,
+            'alpha': 0.6 if device_category == 'blank' else 0.8,
+            'linestyle': '--' if device_category in ('inner_pad', 'blank') else '-',
+            'label': label,
+            'fontsize': font_size,
+            'rotation': text_rotation,
+            'fontweight': 'bold' if device_category == 'corner' else 'normal',
+            'label_box': False,
+        })
+
     # Add legend - separate digital and analog IO devices
     device_types_found = set(d['device_type'] for d in all_devices)
-    
+
     # Categorize devices using config
-    digital_io = _180NM_CONFIG.get("digital_io", [])
-    analog_io = _180NM_CONFIG.get("analog_io", [])
-    digital_vol = _180NM_CONFIG.get("digital_vol", [])
-    analog_vol = _180NM_CONFIG.get("analog_vol", [])
-    corner_devices = _180NM_CONFIG.get("corner_devices", [])
-    filler_devices = _180NM_CONFIG.get("filler_devices", [])
-    
     digital_io_types = []
     analog_io_types = []
     other_types = []
-    
+
     for dev_type in sorted(device_types_found):
         # Check using config lists
-        if any(dev in dev_type for dev in digital_io + digital_vol):
+        if device_table.contains(dev_type, "digital_io", "digital_vol"):
             digital_io_types.append(dev_type)
-        elif any(dev in dev_type for dev in analog_io + analog_vol):
+        elif device_table.contains(dev_type, "analog_io", "analog_vol"):
             analog_io_types.append(dev_type)
-        elif any(dev in dev_type for dev in corner_devices + filler_devices):
+        elif device_table.contains(dev_type, "corner_devices", "filler_devices"):
             other_types.append(dev_type)
         else:
             # Fallback to pattern matching
@@ -541,104 +467,70 @@ def visualize_layout_T180(il_file_path: str, output_path: Optional[str] = None)
                 analog_io_types.append(dev_type)
             else:
                 other_types.append(dev_type)
-    
-    # Build legend elements with grouping
-    legend_elements = []
-    
-    # Add header for digital IO (green shades)
-    if digital_io_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Digital IO (Green Shades)'))
-        for dev_type in sorted(digital_io_types):
-            color = get_device_color_180nm(dev_type)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=dev_type))
-    
-    # Add header for analog IO (blue shades)
-    if analog_io_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Analog IO (Blue Shades)'))
-        for dev_type in sorted(analog_io_types):
-            color = get_device_color_180nm(dev_type)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=dev_type))
-    
-    # Add other devices (corners, fillers, etc.) with header
-    if other_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Other Components'))
-        for dev_type in sorted(other_types):
-            color = get_device_color_180nm(dev_type)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=dev_type))
-    
+
+    # Build legend entries with grouping
+    legend_entries = []
+    for header, group in (('Digital IO (Green Shades)', digital_io_types),
+                          ('Analog IO (Blue Shades)', analog_io_types),
+                          ('Other Components', other_types)):
+        if group:
+            legend_entries.append({'facecolor': 'none', 'edgecolor': 'none', 'label': header})
+            for dev_type in group:
+                legend_entries.append({'facecolor': get_device_color_180nm(dev_type), 'label': dev_type})
+
     # Add blank to legend if present
     if any(d.get('device_category') == 'blank' for d in all_devices):
-        legend_elements.append(patches.Patch(facecolor='#FF0000', edgecolor='black', linestyle='--', label='Blank (Domain Mismatch)'))
-    
-    if legend_elements:
-        # Position legend in upper right, but outside the plot area to avoid overlap
-        ax.legend(handles=legend_elements, 
-                 loc='upper left',
-                 bbox_to_anchor=(1.02, 1.0),
-                 fontsize=8,
-                 frameon=True,
-                 fancybox=True,
-                 shadow=False,
-                 handlelength=1.5)
-    
+        legend_entries.append({'facecolor': '#FF0000', 'linestyle': '--', 'label': 'Blank (Domain Mismatch)'})
+
     # Save figure
     if output_path is None:
         il_path = Path(il_file_path)
         output_path = il_path.parent / f"{il_path.stem}_visualization.png"
-    else:
-        output_path = Path(output_path)
-    
-    # Adjust layout to make room for legend
-    plt.tight_layout(rect=[0, 0, 0.85, 1])  # Leave 15% space on the right for legend
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    
-    return str(output_path)
 
+    return render_layout_items(items, bounds, 'IO Ring Layout Visualization (T180)', legend_entries,
+                               output_path, backend)
 
-def visualize_layout_from_components_T180(layout_components: List[Dict], output_path: str, ring_config: Dict) -> str:
+
+def visualize_layout_from_components_T180(layout_components: List[Dict], output_path: str, ring_config: Dict,
+                                          backend: Optional[str] = None) -> str:
     """
     Generate visual diagram from layout component data for T180
     Supports blank type visualization
-    
+
     Args:
         layout_components: List of component dictionaries with position, type, device, etc.
         output_path: Output path for image
         ring_config: Ring configuration with chip dimensions
-    
+        backend: Render backend, "collection" (default) or "artist" (see layout_renderer.py)
+
     Returns:
         Path to generated image file
     """
     if not layout_components:
         raise ValueError("No layout components provided")
-    
+
     # Get chip dimensions
     chip_width = ring_config.get("chip_width", 2250)
     chip_height = ring_config.get("chip_height", 2160)
-    
+
     # Add padding for visualization
     padding = 50
     fig_width = max(chip_width + 2 * padding, 400)
     fig_height = max(chip_height + 2 * padding, 400)
-    
-    # Create figure
-    fig, ax = plt.subplots(1, 1, figsize=(fig_width/50, fig_height/50))
-    ax.set_xlim(-padding, chip_width + padding)
-    ax.set_ylim(-padding, chip_height + padding)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    
-    # Draw each component
+    bounds = (-padding, -padding + fig_width, -padding, -padding + fig_height)
+
+    # Build one render item per component
+    items = []
     for component in layout_components:
         comp_type = component.get("type", "pad")
         x, y = component.get("position", [0, 0])
         orientation = component.get("orientation", "R0")
         device = component.get("device") or component.get("device_type", "")
         name = component.get("name", "")
-        
+
         # Get color
         color = get_device_color_180nm(device if device else "default")
-        
+
         # Get device dimensions based on type
         if comp_type == "corner":
             width = CORNER_SIZE_180NM
@@ -657,61 +549,30 @@ def visualize_layout_from_components_T180(layout_components: List[Dict], output_
         else:  # pad or inner_pad
             width = PAD_WIDTH_180NM
             height = PAD_HEIGHT_180NM
-        
-        # Calculate rectangle based on rotation
-        rect_x, rect_y, rect_w, rect_h = get_rectangle_for_rotation_180nm(
-            x, y, orientation, width, height
-        )
-        
-        # Create rectangle
-        if comp_type == "blank":
-            rect = patches.Rectangle(
-                (rect_x, rect_y), rect_w, rect_h,
-                linewidth=2, edgecolor='black', facecolor='#FF0000', alpha=0.6,
-                linestyle='--'  # Dashed border for blank
-            )
-        else:
-            rect = patches.Rectangle(
-                (rect_x, rect_y), rect_w, rect_h,
-                linewidth=2, edgecolor='black', facecolor=color, alpha=0.8
-            )
-        ax.add_patch(rect)
-        
-        # Add text label
-        if comp_type == "blank":
-            label = "Blank"
-        else:
-            label = name or device
-        
-        center_x = rect_x + rect_w / 2
-        center_y = rect_y + rect_h / 2
-        
-        font_size = 6 if comp_type in ["filler", "blank"] else 7
-        ax.text(center_x, center_y, label, 
-                ha='center', va='center', 
-                fontsize=font_size, 
-                weight='normal')
-    
-    ax.set_title('IO Ring Layout Visualization (T180)', fontsize=14, fontweight='bold', pad=20)
-    
+
+        items.append({
+            'rect': get_rectangle_for_rotation_180nm(x, y, orientation, width, height),
+            'facecolor': color,
+            'alpha': 0.6 if comp_type == "blank" else 0.8,
+            'linestyle': '--' if comp_type == "blank" else '-',  # Dashed border for blank
+            'label': "Blank" if comp_type == "blank" else (name or device),
+            'fontsize': 6 if comp_type in ["filler", "blank"] else 7,
+            'rotation': 0,
+            'fontweight': 'normal',
+            'label_box': False,
+        })
+
     # Add legend
-    legend_elements = [
-        patches.Patch(facecolor='#32CD32', edgecolor='black', label='Digital IO'),
-        patches.Patch(facecolor='#4A90E2', edgecolor='black', label='Analog IO'),
-        patches.Patch(facecolor='#FF6B6B', edgecolor='black', label='Corner'),
-        patches.Patch(facecolor='#C0C0C0', edgecolor='black', label='Filler'),
-        patches.Patch(facecolor='#FF0000', edgecolor='black', linestyle='--', label='Blank (Domain Mismatch)')
+    legend_entries = [
+        {'facecolor': '#32CD32', 'label': 'Digital IO'},
+        {'facecolor': '#4A90E2', 'label': 'Analog IO'},
+        {'facecolor': '#FF6B6B', 'label': 'Corner'},
+        {'facecolor': '#C0C0C0', 'label': 'Filler'},
+        {'facecolor': '#FF0000', 'linestyle': '--', 'label': 'Blank (Domain Mismatch)'},
     ]
-    ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1.0), fontsize=8)
-    
-    # Save figure
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.tight_layout(rect=[0, 0, 0.85, 1])
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    
-    return str(output_path)
+
+    return render_layout_items(items, bounds, 'IO Ring Layout Visualization (T180)', legend_entries,
+                               output_path, backend)
 
 
 if __name__ == '__main__':
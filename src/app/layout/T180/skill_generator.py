@@ -5,9 +5,10 @@ SKILL Script Generation Module for T180
 Includes _generate_config_io_wires() method and 180nm-specific digital IO features
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from ..T28.inner_pad_handler import InnerPadHandler
 from ..position_calculator import PositionCalculator
+from ..ring_topology import RingTopology
 from ..voltage_domain import VoltageDomainHandler
 
 
@@ -173,13 +174,14 @@ class SkillGeneratorT180:
 
         return skill_commands, side_endpoints
 
-    def generate_digital_io_features_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict) -> List[str]:
+    def generate_digital_io_features_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict,
+                                                topology: Optional[RingTopology] = None) -> List[str]:
         """Generate digital IO features for 180nm (configuration lines + secondary lines + pin labels), supporting inner pads."""
         skill_commands = []
         # Get all digital pads (not distinguishing IO)
-        all_digital_pads = self.inner_pad_handler.get_all_digital_pads_with_inner_any(outer_pads, inner_pads, ring_config)
+        all_digital_pads = self.inner_pad_handler.get_all_digital_pads_with_inner_any(outer_pads, inner_pads, ring_config, topology)
         # Get all digital IO pads
-        digital_io_pads = self.inner_pad_handler.get_all_digital_pads_with_inner(outer_pads, inner_pads, ring_config)
+        digital_io_pads = self.inner_pad_handler.get_all_digital_pads_with_inner(outer_pads, inner_pads, ring_config, topology)
         if not all_digital_pads:
             return skill_commands
         
@@ -332,7 +334,8 @@ class SkillGeneratorT180:
                     )
         return skill_commands
     
-    def generate_pin_labels_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict) -> List[str]:
+    def generate_pin_labels_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict,
+                                       topology: Optional[RingTopology] = None) -> List[str]:
         """Generate main pin labels for 180nm, supporting inner pads"""
         skill_commands = []
         
@@ -378,6 +381,7 @@ class SkillGeneratorT180:
                 skill_commands.append(f'dbCreateLabel(cv list("M2" "pin") {core_pos} "{core_label}" "{core_just}" "{core_orient}" "roman" 2)')
         
         # Main pin labels for inner pads (move 152 units inward, opposite direction)
+        topology = self.inner_pad_handler.ensure_ring_topology(inner_pads, outer_pads, ring_config, topology)
         for inner_pad in inner_pads:
             # If position is already absolute coordinates, use directly
             if isinstance(inner_pad["position"], list):
@@ -385,7 +389,7 @@ class SkillGeneratorT180:
                 orient = inner_pad["orientation"]
             else:
                 # Otherwise, recalculate position
-                position, orient = self.inner_pad_handler.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config)
+                position, orient = self.inner_pad_handler.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config, topology)
             
             x, y = position
             name = inner_pad["name"]
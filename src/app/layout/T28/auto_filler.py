@@ -4,11 +4,13 @@
 Auto Filler Component Generation Module for T28
 """
 
-from typing import List
+from typing import List, Optional
 from ..device_classifier import DeviceClassifier
 from ..voltage_domain import VoltageDomainHandler
 from ..filler_generator import FillerGenerator
 from ..position_calculator import PositionCalculator
+from ..layout_component import LayoutComponent
+from ..ring_topology import RingTopology
 from .inner_pad_handler import InnerPadHandler
 from ..process_node_config import get_process_node_config
 
@@ -69,8 +71,13 @@ class AutoFillerGeneratorT28:
         self.position_calculator = PositionCalculator(config)
         self.inner_pad_handler = InnerPadHandler(config)
     
-    def auto_insert_fillers_with_inner_pads(self, layout_components: List[dict], inner_pads: List[dict]) -> List[dict]:
-        """Auto-insert filler components for 28nm, supporting inner pad space reservation, compatible with clockwise and counterclockwise placement"""
+    def auto_insert_fillers_with_inner_pads(self, layout_components: List[dict], inner_pads: List[dict],
+                                            topology: Optional[RingTopology] = None) -> List[dict]:
+        """Auto-insert filler components for 28nm, supporting inner pad space reservation, compatible with clockwise and counterclockwise placement
+        
+        topology: Ring topology of layout_components with the inner pad gaps of inner_pads
+        (built here if None)
+        """
         process_node = self.config.get("process_node", "T28")
         
         # Check if filler components are already included
@@ -85,8 +92,12 @@ class AutoFillerGeneratorT28:
         # Get placement order
         placement_order = self.config.get("placement_order", "counterclockwise")
         
-        # Sort components by position
-        sorted_components = self.position_calculator.sort_components_by_position(layout_components, placement_order)
+        # Components in placement order with their indices and the inner pad gap set,
+        # so each adjacent pad pair below is checked in O(1)
+        if topology is None:
+            topology = self.inner_pad_handler.build_ring_topology(layout_components, inner_pads=inner_pads)
+        sorted_components = topology.sorted_components
+        inner_pad_gap_set = topology.gap_set
         
         # Separate pads and corners
         pads = [comp for comp in sorted_components if comp.get("type") == "pad"]
@@ -189,13 +200,13 @@ class AutoFillerGeneratorT28:
                 y = chip_height  # 28nm: filler on top edge, not chip_height - pad_height
                 pad1, pad2 = get_adjacent_pads_for_corner("R180", True)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNERA_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "sep_top_left_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R180"
-                })
+                }))
                 
                 # Between last pad and top-right corner
                 last_pad = pad_list[-1]
@@ -203,13 +214,13 @@ class AutoFillerGeneratorT28:
                 y = chip_height  # 28nm: filler on top edge, not chip_height - pad_height
                 pad1, pad2 = get_adjacent_pads_for_corner("R180", False)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNERA_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "filler_top_right_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R180"
-                })
+                }))
                 
             elif orientation == "R90":  # Right edge
                 # Between top-right corner and first pad
@@ -218,13 +229,13 @@ class AutoFillerGeneratorT28:
                 y = first_pad["position"][1] + pad_width
                 pad1, pad2 = get_adjacent_pads_for_corner("R90", True)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNERA_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "filler_right_top_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R90"
-                })
+                }))
                 
                 # Between last pad and bottom-right corner
                 last_pad = pad_list[-1]
@@ -232,13 +243,13 @@ class AutoFillerGeneratorT28:
                 y = last_pad["position"][1] - pad_width
                 pad1, pad2 = get_adjacent_pads_for_corner("R90", False)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNERA_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "filler_right_bottom_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R90"
-                })
+                }))
                 
             elif orientation == "R0":  # Bottom edge
                 # Between bottom-right corner and first pad
@@ -247,13 +258,13 @@ class AutoFillerGeneratorT28:
                 y = 0
                 pad1, pad2 = get_adjacent_pads_for_corner("R0", True)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNERA_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "sep_bottom_right_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R0"
-                })
+                }))
                 
                 # Between last pad and bottom-left corner
                 last_pad = pad_list[-1]
@@ -261,13 +272,13 @@ class AutoFillerGeneratorT28:
                 y = 0
                 pad1, pad2 = get_adjacent_pads_for_corner("R0", False)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNER_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "filler_bottom_left_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R0"
-                })
+                }))
                 
             elif orientation == "R270":  # Left edge
                 # Between bottom-left corner and first pad
@@ -276,13 +287,13 @@ class AutoFillerGeneratorT28:
                 y = first_pad["position"][1] - pad_width
                 pad1, pad2 = get_adjacent_pads_for_corner("R270", True)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNER_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "filler_left_bottom_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R270"
-                })
+                }))
                 
                 # Between last pad and top-left corner
                 last_pad = pad_list[-1]
@@ -290,13 +301,13 @@ class AutoFillerGeneratorT28:
                 y = last_pad["position"][1] + pad_width
                 pad1, pad2 = get_adjacent_pads_for_corner("R270", False)
                 filler_type = FillerGenerator.get_filler_type_for_corner_and_pad("PCORNERA_G", pad1, pad2, process_node)
-                fillers.append({
+                fillers.append(LayoutComponent({
                     "type": "filler",
                     "name": "sep_left_top_corner",
                     "device": filler_type,
                     "position": [x, y],
                     "orientation": "R270"
-                })
+                }))
             
             # 2. Filler between pads
             for i in range(len(pad_list) - 1):
@@ -318,10 +329,10 @@ class AutoFillerGeneratorT28:
                     y = curr_pad["position"][1] + pad_width
                 
                 # 28nm: Use original logic with 2 fillers
-                curr_index = sorted_components.index(curr_pad)
-                next_index = sorted_components.index(next_pad)
+                curr_index = topology.index_of(curr_pad)
+                next_index = topology.index_of(next_pad)
                 
-                if self.inner_pad_handler.is_inner_pad_gap_by_index(curr_index, next_index, inner_pads, sorted_components):
+                if self.inner_pad_handler.is_inner_pad_gap_by_index(curr_index, next_index, inner_pads, sorted_components, inner_pad_gap_set):
                     # Reserve space for inner pad, use 10 unit filler
                     filler_type = FillerGenerator.get_filler_type(curr_pad, next_pad, process_node)
                     
@@ -345,13 +356,13 @@ class AutoFillerGeneratorT28:
                         x1 = x
                         y1 = y - 10
 
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "filler",
                         "name": f"filler_{orientation}_{i+1}_1",
                         "device": filler_type,
                         "position": [x1, y1],
                         "orientation": orientation
-                    })
+                    }))
                     
                     # Position of the second filler
                     if orientation == "R0":  # Bottom edge
@@ -367,25 +378,25 @@ class AutoFillerGeneratorT28:
                         x2 = x
                         y2 = y + 20
                     
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "filler",
                         "name": f"filler_{orientation}_{i+1}_2",
                         "device": filler_type,
                         "position": [x2, y2],
                         "orientation": orientation
-                    })
+                    }))
                 else:
                     # Normal spacing, use 20 unit filler
                     filler_type = FillerGenerator.get_filler_type(curr_pad, next_pad, process_node)
                     
                     # Insert two 20 unit fillers
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "filler",
                         "name": f"filler_{orientation}_{i+1}_1",
                         "device": filler_type,
                         "position": [x, y],
                         "orientation": orientation
-                    })
+                    }))
                     
                     # Position of the second filler
                     if orientation == "R0":  # Bottom edge
@@ -401,13 +412,13 @@ class AutoFillerGeneratorT28:
                         x2 = x
                         y2 = y + 20
                     
-                    fillers.append({
+                    fillers.append(LayoutComponent({
                         "type": "filler",
                         "name": f"filler_{orientation}_{i+1}_2",
                         "device": filler_type,
                         "position": [x2, y2],
                         "orientation": orientation
-                    })
+                    }))
         
         return layout_components + fillers
 
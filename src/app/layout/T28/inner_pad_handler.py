@@ -4,9 +4,10 @@
 Inner Pad Processing Module
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from ..device_classifier import DeviceClassifier
 from ..position_calculator import PositionCalculator
+from ..ring_topology import RingTopology, count_pads_per_side, side_start_indices
 
 class InnerPadHandler:
     """Inner Pad Handler"""
@@ -15,6 +16,34 @@ class InnerPadHandler:
         self.config = config
         self.position_calculator = PositionCalculator(config)
     
+    @staticmethod
+    def count_pads_per_side(sorted_outer_pads: List[dict]) -> Dict[str, int]:
+        """Count outer pads per orientation in a single pass"""
+        return count_pads_per_side(sorted_outer_pads)
+    
+    @staticmethod
+    def get_side_start_indices(sorted_outer_pads: List[dict], placement_order: str) -> Dict[str, int]:
+        """Get the index of the first pad of each side in placement order"""
+        return side_start_indices(count_pads_per_side(sorted_outer_pads), placement_order)
+    
+    def build_ring_topology(self, outer_pads: List[dict], ring_config: Optional[dict] = None,
+                            inner_pads: List[dict] = ()) -> RingTopology:
+        """Sort the outer ring once and precompute side offsets, lookups and inner pad gaps
+        
+        Uses placement_order, width and height from ring_config (self.config if None).
+        """
+        config = self.config if ring_config is None else ring_config
+        return RingTopology(outer_pads, config.get("placement_order", "counterclockwise"),
+                            config.get("width", 3), config.get("height", 3), inner_pads,
+                            self.position_calculator)
+    
+    def ensure_ring_topology(self, inner_pads: List[dict], outer_pads: List[dict], ring_config: dict,
+                                 topology: Optional[RingTopology]) -> Optional[RingTopology]:
+        """Build a topology only if none is given and an inner pad still has a relative position"""
+        if topology is None and any(isinstance(inner_pad["position"], str) for inner_pad in inner_pads):
+            topology = self.build_ring_topology(outer_pads, ring_config)
+        return topology
+    
     def sanitize_skill_instance_name(self, name: str) -> str:
         """
         Sanitize instance names for SKILL compatibility.
@@ -33,103 +62,36 @@ class InnerPadHandler:
             sanitized = sanitized.replace('__', '_')
         return sanitized
     
-    def calculate_inner_pad_position(self, position_str: str, outer_pads: List[dict], ring_config: dict) -> tuple:
-        """Calculate inner pad position and orientation, supporting clockwise/counterclockwise"""
-        parts = position_str.split('_')
-        if len(parts) != 3:
-            raise ValueError(f"Invalid inner pad position format: {position_str}")
-        side = parts[0]  # top, bottom, left, right
-        pad1_index = int(parts[1])
-        pad2_index = int(parts[2])
-        placement_order = ring_config.get("placement_order", "counterclockwise")
-
-        # Calculate pad count per side
-        width = ring_config.get("width", 3)
-        height = ring_config.get("height", 3)
-        side_pad_count = {
-            "top": width,
-            "bottom": width,
-            "left": height,
-            "right": height
-        }
-        N = side_pad_count.get(side, 0)
-        if placement_order == "clockwise":
-            real_pad1_index = pad1_index
-            real_pad2_index = pad2_index
-        else:
-            real_pad1_index = (N - 1) - pad1_index
-            real_pad2_index = (N - 1) - pad2_index
-
-        # Sort outer pads by placement order
-        sorted_outer_pads = self.position_calculator.sort_components_by_position(outer_pads, placement_order)
+    def calculate_inner_pad_position(self, position_str: str, outer_pads: List[dict], ring_config: dict,
+                                     topology: Optional[RingTopology] = None) -> tuple:
+        """Calculate inner pad position and orientation, supporting clockwise/counterclockwise
         
-        # Determine pad starting index based on placement order
-        if placement_order == "clockwise":
-            # Clockwise: Top-left -> Top edge -> Top-right -> Right edge -> Bottom-right -> Bottom edge -> Bottom-left -> Left edge
-            side_start_indices = {
-                "top": 0,
-                "right": len([p for p in sorted_outer_pads if p["orientation"] == "R180"]),
-                "bottom": len([p for p in sorted_outer_pads if p["orientation"] == "R180"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R90"]),
-                "left": len([p for p in sorted_outer_pads if p["orientation"] == "R180"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R90"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R0"])
-            }
-        else:
-            # Counterclockwise: Top-left -> Left edge -> Bottom-left -> Bottom edge -> Bottom-right -> Right edge -> Top-right -> Top edge
-            side_start_indices = {
-                "left": 0,
-                "bottom": len([p for p in sorted_outer_pads if p["orientation"] == "R270"]),
-                "right": len([p for p in sorted_outer_pads if p["orientation"] == "R270"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R0"]),
-                "top": len([p for p in sorted_outer_pads if p["orientation"] == "R270"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R0"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R90"])
-            }
-        
-        if side not in side_start_indices:
-            raise ValueError(f"Invalid side: {side}")
-        start_index = side_start_indices[side]
-        pad1_global_index = start_index + real_pad1_index
-        pad2_global_index = start_index + real_pad2_index
-
-        # Get positions of two outer pads
-        pad1 = sorted_outer_pads[pad1_global_index]
-        pad2 = sorted_outer_pads[pad2_global_index]
-
-        # Calculate middle position
-        x1, y1 = pad1["position"]
-        x2, y2 = pad2["position"]
-        orientation = pad1["orientation"]
-
-        # Calculate middle position based on orientation
-        if orientation == "R180":  # Top edge
-            x = (x1 + x2) // 2
-            y = y1
-        elif orientation == "R0":  # Bottom edge
-            x = (x1 + x2) // 2
-            y = y1
-        elif orientation == "R90":  # Right edge
-            x = x1
-            y = (y1 + y2) // 2
-        elif orientation == "R270":  # Left edge
-            x = x1
-            y = (y1 + y2) // 2
-        else:
-            raise ValueError(f"Invalid orientation: {orientation}")
-
-        return ([x, y], orientation)
+        Pass the ring topology of the generation when placing several inner pads, otherwise
+        the outer pads are sorted on every call.
+        """
+        if topology is None:
+            topology = self.build_ring_topology(outer_pads, ring_config)
+        return topology.inner_pad_position(position_str)
     
-    def generate_inner_pad_skill_commands(self, inner_pads: List[dict], outer_pads: List[dict], ring_config: dict) -> List[str]:
+    def resolve_inner_pad_placement(self, inner_pad: dict, outer_pads: List[dict], ring_config: dict,
+                                    topology: Optional[RingTopology] = None) -> Tuple[List, str]:
+        """Get the absolute position and orientation of an inner pad"""
+        # If position is already absolute coordinates, use directly
+        if isinstance(inner_pad["position"], list):
+            return inner_pad["position"], inner_pad["orientation"]
+        # Otherwise, recalculate position
+        return self.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config, topology)
+    
+    def generate_inner_pad_skill_commands(self, inner_pads: List[dict], outer_pads: List[dict], ring_config: dict,
+                                          topology: Optional[RingTopology] = None) -> List[str]:
         """Generate SKILL commands for inner pads"""
         skill_commands = []
+        topology = self.ensure_ring_topology(inner_pads, outer_pads, ring_config, topology)
         
         for i, inner_pad in enumerate(inner_pads):
             name = inner_pad["name"]
             device = inner_pad["device"]
-            
-            # If position is already absolute coordinates, use directly
-            if isinstance(inner_pad["position"], list):
-                position = inner_pad["position"]
-                orientation = inner_pad["orientation"]
-            else:
-                # Otherwise, recalculate position
-                position_str = inner_pad["position"]
-                position, orientation = self.calculate_inner_pad_position(position_str, outer_pads, ring_config)
+            position, orientation = self.resolve_inner_pad_placement(inner_pad, outer_pads, ring_config, topology)
             
             x, y = position
             position_str = inner_pad["position_str"]
@@ -147,11 +109,13 @@ class InnerPadHandler:
         
         return skill_commands
     
-    def get_all_digital_pads_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict) -> List[dict]:
+    def get_all_digital_pads_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict,
+                                        topology: Optional[RingTopology] = None) -> List[dict]:
         """Get all digital IO pad information (including outer and inner rings)"""
         # Get process_node from ring_config or config
         process_node = ring_config.get("process_node", self.config.get("process_node", "T28"))
         digital_pads = []
+        topology = self.ensure_ring_topology(inner_pads, outer_pads, ring_config, topology)
         
         # Outer ring digital IO pads
         for pad in outer_pads:
@@ -174,7 +138,7 @@ class InnerPadHandler:
                     orientation = inner_pad["orientation"]
                 else:
                     # Otherwise, recalculate position
-                    position, orientation = self.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config)
+                    position, orientation = self.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config, topology)
                 
                 digital_pads.append({
                     "position": position,
@@ -187,11 +151,13 @@ class InnerPadHandler:
         
         return digital_pads
     
-    def get_all_digital_pads_with_inner_any(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict) -> List[dict]:
+    def get_all_digital_pads_with_inner_any(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict,
+                                            topology: Optional[RingTopology] = None) -> List[dict]:
         """Get all digital pad information (including outer and inner rings, all digital pads, not limited to IO)"""
         # Get process_node from ring_config or config
         process_node = ring_config.get("process_node", self.config.get("process_node", "T28"))
         digital_pads = []
+        topology = self.ensure_ring_topology(inner_pads, outer_pads, ring_config, topology)
         # Outer ring digital pads
         for pad in outer_pads:
             if DeviceClassifier.is_digital_device(pad["device"], process_node):
@@ -210,7 +176,7 @@ class InnerPadHandler:
                     position = inner_pad["position"]
                     orientation = inner_pad["orientation"]
                 else:
-                    position, orientation = self.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config)
+                    position, orientation = self.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config, topology)
                 digital_pads.append({
                     "position": position,
                     "orientation": orientation,
@@ -221,77 +187,31 @@ class InnerPadHandler:
                 })
         return digital_pads
     
-    def get_inner_pad_gap_indices(self, inner_pads: List[dict], outer_pads: List[dict]) -> List[tuple]:
-        """Get index pairs that need to reserve space for inner pads, calculated based on placement order, supporting clockwise/counterclockwise"""
-        placement_order = self.config.get("placement_order", "counterclockwise")
-        gap_pairs = []
+    def get_inner_pad_gap_indices(self, inner_pads: List[dict], outer_pads: List[dict],
+                                  topology: Optional[RingTopology] = None) -> List[tuple]:
+        """Get index pairs that need to reserve space for inner pads, calculated based on placement order, supporting clockwise/counterclockwise
         
-        # Sort outer pads by placement order
-        sorted_outer_pads = self.position_calculator.sort_components_by_position(outer_pads, placement_order)
-        
-        for inner_pad in inner_pads:
-            # Inner pad position may be absolute coordinates, need to get position_str from original configuration
-            # Here we match by name, or directly use the position_str field
-            position_str = inner_pad.get("position_str", "")
-            if not position_str and isinstance(inner_pad.get("position"), str):
-                position_str = inner_pad.get("position")
-            
-            # If position_str is empty, it means it's already absolute coordinates, skip this inner pad
-            if not position_str or not isinstance(position_str, str):
-                continue
-                
-            parts = position_str.split('_')
-            if len(parts) == 3:
-                side = parts[0]
-                pad1_index = int(parts[1])
-                pad2_index = int(parts[2])
-                
-                # Calculate pad count per side
-                width = self.config.get("width", 3)
-                height = self.config.get("height", 3)
-                side_pad_count = {
-                    "top": width,
-                    "bottom": width,
-                    "left": height,
-                    "right": height
-                }
-                N = side_pad_count.get(side, 0)
-                
-                # Adjust index direction based on placement_order
-                if placement_order == "clockwise":
-                    real_pad1_index = pad1_index
-                    real_pad2_index = pad2_index
-                else:
-                    real_pad1_index = (N - 1) - pad1_index
-                    real_pad2_index = (N - 1) - pad2_index
-                
-                # Determine pad starting index based on placement order
-                if placement_order == "clockwise":
-                    # Clockwise: Top-left -> Top edge -> Top-right -> Right edge -> Bottom-right -> Bottom edge -> Bottom-left -> Left edge
-                    side_start_indices = {
-                        "top": 0,
-                        "right": len([p for p in sorted_outer_pads if p["orientation"] == "R180"]),
-                        "bottom": len([p for p in sorted_outer_pads if p["orientation"] == "R180"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R90"]),
-                        "left": len([p for p in sorted_outer_pads if p["orientation"] == "R180"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R90"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R0"])
-                    }
-                else:
-                    # Counterclockwise: Top-left -> Left edge -> Bottom-left -> Bottom edge -> Bottom-right -> Right edge -> Top-right -> Top edge
-                    side_start_indices = {
-                        "left": 0,
-                        "bottom": len([p for p in sorted_outer_pads if p["orientation"] == "R270"]),
-                        "right": len([p for p in sorted_outer_pads if p["orientation"] == "R270"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R0"]),
-                        "top": len([p for p in sorted_outer_pads if p["orientation"] == "R270"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R0"]) + len([p for p in sorted_outer_pads if p["orientation"] == "R90"])
-                    }
-                
-                if side in side_start_indices:
-                    start_index = side_start_indices[side]
-                    pad1_global_index = start_index + real_pad1_index
-                    pad2_global_index = start_index + real_pad2_index
-                    gap_pairs.append((pad1_global_index, pad2_global_index))
-        
-        return gap_pairs
+        Indices refer to outer_pads sorted in placement order (topology.sorted_components).
+        """
+        if topology is None:
+            topology = self.build_ring_topology(outer_pads)
+        return topology.find_gap_pairs(inner_pads)
     
-    def is_inner_pad_gap_by_index(self, index1: int, index2: int, inner_pads: List[dict], outer_pads: List[dict]) -> bool:
-        """Check if space needs to be reserved for inner pads between two pads based on index"""
-        gap_pairs = self.get_inner_pad_gap_indices(inner_pads, outer_pads)
-        return (index1, index2) in gap_pairs or (index2, index1) in gap_pairs 
\ No newline at end of file
+    def get_inner_pad_gap_set(self, inner_pads: List[dict], outer_pads: List[dict],
+                              topology: Optional[RingTopology] = None) -> Set[Tuple[int, int]]:
+        """Get the inner pad gap pairs as a set containing both (i, j) and (j, i), for O(1) lookups"""
+        gap_set = set()
+        for index1, index2 in self.get_inner_pad_gap_indices(inner_pads, outer_pads, topology):
+            gap_set.add((index1, index2))
+            gap_set.add((index2, index1))
+        return gap_set
+    
+    def is_inner_pad_gap_by_index(self, index1: int, index2: int, inner_pads: List[dict], outer_pads: List[dict], gap_set: Set[Tuple[int, int]] = None) -> bool:
+        """Check if space needs to be reserved for inner pads between two pads based on index
+        
+        Pass a gap_set from get_inner_pad_gap_set() (or RingTopology.gap_set) when checking many
+        pairs of the same ring, otherwise the gap pairs are rebuilt on every call.
+        """
+        if gap_set is None:
+            gap_set = self.get_inner_pad_gap_set(inner_pads, outer_pads)
+        return (index1, index2) in gap_set 
\ No newline at end of file
@@ -7,18 +7,22 @@ No inheritance, completely standalone
 
 import os
 import json
-from typing import Dict, Tuple, List
+from typing import Callable, Dict, Tuple, List, Optional
 
 from ..device_classifier import DeviceClassifier
 from ..voltage_domain import VoltageDomainHandler
 from ..position_calculator import PositionCalculator
+from ..layout_component import LayoutComponent, components_from_dicts
 from ..filler_generator import FillerGenerator
 from ..layout_validator import LayoutValidator
+from ..ring_topology import RingTopology
+from ..ring_hierarchy import RingHierarchy
 from .inner_pad_handler import InnerPadHandler
 from .skill_generator import SkillGeneratorT28
 from .auto_filler import AutoFillerGeneratorT28
 from ..process_node_config import get_process_node_config
-from .layout_visualizer import visualize_layout
+from .layout_visualizer import visualize_layout_from_components
+from ...utils.skill_emitter import SkillEmitter
 
 
 class LayoutGeneratorT28:
@@ -53,6 +57,8 @@ class LayoutGeneratorT28:
         self.inner_pad_handler = InnerPadHandler(self.config)
         self.skill_generator = SkillGeneratorT28(self.config)
         self.auto_filler_generator = AutoFillerGeneratorT28(self.config)
+        # Outer ring in placement order, built by convert_relative_to_absolute()
+        self.ring_topology: Optional[RingTopology] = None
     
     def sanitize_skill_instance_name(self, name: str) -> str:
         """Sanitize instance names for SKILL compatibility"""
@@ -77,6 +83,7 @@ class LayoutGeneratorT28:
         """Convert relative positions to absolute positions for 28nm format"""
         converted_components = []
         inner_pads = []
+        ring_slots = []
         
         for instance in instances:
             relative_pos = instance.get("position", "")
@@ -95,19 +102,19 @@ class LayoutGeneratorT28:
                 inner_pads.append(instance)
                 continue
             
-            # Calculate position
+            # Calculate position (pads and corners are computed for the whole ring below)
             if component_type == "filler":
                 position, orientation = self.position_calculator.calculate_filler_position_from_relative(relative_pos, ring_config)
             else:
-                position, orientation = self.position_calculator.calculate_position_from_relative(relative_pos, ring_config)
+                position, orientation = None, None
             
-            component = {
+            component = LayoutComponent({
                 "type": component_type,
                 "name": name,
                 "device": device,
                 "position": position,
                 "orientation": orientation
-            }
+            })
             
             if relative_pos:
                 component["position_str"] = relative_pos
@@ -123,13 +130,26 @@ class LayoutGeneratorT28:
                 component["pin_connection"] = pin_connection
             
             converted_components.append(component)
+            if position is None:
+                ring_slots.append((component, relative_pos, instance))
+        
+        ring_positions = self.position_calculator.calculate_positions_from_relative(
+            [relative_pos for _, relative_pos, _ in ring_slots], ring_config,
+            None)
+        for (component, _, _), (position, orientation) in zip(ring_slots, ring_positions):
+            component["position"] = position
+            component["orientation"] = orientation
         
         # Check corners
         has_corners = any(comp.get("type") == "corner" for comp in converted_components)
         if not has_corners:
             raise ValueError("❌ Error: Corner components are missing in the intent graph!")
         
-        # Handle inner pads
+        # Outer ring in placement order, shared by the inner pads, auto-filler and SKILL generation
+        ring_components = [comp for comp in converted_components if comp.get("type") in ("pad", "corner")]
+        self.ring_topology = self.inner_pad_handler.build_ring_topology(ring_components, ring_config, inner_pads)
+        
+        # Handle inner pads (placed relative to the outer pads only)
         for inner_pad in inner_pads:
             name = inner_pad.get("name", "")
             device = inner_pad.get("device", "")
@@ -142,17 +162,16 @@ class LayoutGeneratorT28:
             voltage_domain = inner_pad.get("voltage_domain", {})
             pin_connection = inner_pad.get("pin_connection", {})
             
-            outer_pads_for_inner = [comp for comp in converted_components if comp.get("type") == "pad"]
-            position, orientation = self.inner_pad_handler.calculate_inner_pad_position(position_str, outer_pads_for_inner, ring_config)
+            position, orientation = self.ring_topology.inner_pad_position(position_str)
             
-            component = {
+            component = LayoutComponent({
                 "type": "inner_pad",
                 "name": name,
                 "device": device,
                 "position": position,
                 "orientation": orientation,
                 "position_str": position_str
-            }
+            })
             
             if direction:
                 component["io_direction"] = direction
@@ -168,8 +187,29 @@ class LayoutGeneratorT28:
         return converted_components
 
 
-def generate_layout_from_json(json_file: str, output_file: str = "generated_layout.il"):
-    """Generate 28nm layout from JSON file"""
+def generate_layout_from_json(json_file: str, output_file: str = "generated_layout.il",
+                              max_chunk_bytes: Optional[int] = None,
+                              on_chunk: Optional[Callable[[str], None]] = None,
+                              compact: bool = False, hierarchical: bool = False) -> Optional[dict]:
+    """Generate 28nm layout from JSON file
+    
+    Args:
+        json_file: Intent graph JSON file
+        output_file: SKILL script path
+        max_chunk_bytes: Split the script into chunks of about this size, output_file then
+            loads them in order (see src/app/utils/skill_emitter.py)
+        on_chunk: Called with each finished chunk path while the script is being generated
+        compact: Write instances, paths and labels as placement tables with one foreach
+            loop per batch (see src/app/utils/skill_compact.py)
+        hierarchical: Write pads, bond pads and fillers into generated per-side sub-cells
+            (see src/app/layout/ring_hierarchy.py)
+    
+    Returns:
+        Dict with 'output_file', 'chunk_files' (files holding the SKILL statements, in load
+        order), 'components' (placed instances with absolute positions, as rendered in the
+        visualization), 'visualization_file' (None if rendering failed) and 'hierarchy'
+        (hierarchy manifest, None unless hierarchical), or None if layout rule validation failed
+    """
     print(f"📖 Reading intent graph file: {json_file}")
     print(f"🔧 Using process node: 28nm")
     
@@ -240,6 +280,9 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
     # Convert relative positions
     if any("position" in instance and "_" in str(instance["position"]) for instance in instances):
         instances = generator.convert_relative_to_absolute(instances, ring_config)
+    else:
+        # Absolute positions: use the instances as components directly
+        instances = components_from_dicts(instances)
     
     # Separate components
     outer_pads = []
@@ -266,6 +309,11 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
         print(f"❌ Layout rule validation failed: {validation_result['message']}")
         return None
     
+    # Outer ring in placement order with the inner pad gaps, computed once for this generation
+    topology = generator.ring_topology
+    if topology is None:
+        topology = generator.inner_pad_handler.build_ring_topology(validation_components, ring_config, inner_pads)
+    
     # Check fillers
     all_instances = instances
     existing_fillers = [comp for comp in all_instances if comp.get("type") == "filler" or 
@@ -283,23 +331,32 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
         print(f"🔍 Detected filler components in JSON: {len(existing_fillers)} fillers, {len(existing_separators)} separators")
         all_components_with_fillers = validation_components
     else:
-        all_components_with_fillers = generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(validation_components, inner_pads)
+        all_components_with_fillers = generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(validation_components, inner_pads, topology)
     
     # Generate SKILL script
     print("🚀 Starting Layout Skill script generation...")
-    skill_commands = []
+    emitter = SkillEmitter(output_file, preamble=["cv = geGetWindowCellView()"],
+                           max_chunk_bytes=max_chunk_bytes, on_chunk=on_chunk, compact=compact)
+    
+    emitter.emit("; Generated Layout Script with Dual Ring Support")
+    emitter.emit("")
     
-    skill_commands.append("cv = geGetWindowCellView()")
-    skill_commands.append("; Generated Layout Script with Dual Ring Support")
-    skill_commands.append("")
+    # Components in placement order
+    sorted_components = topology.sorted_components
     
-    # Sort components
-    placement_order = ring_config.get("placement_order", "counterclockwise")
-    all_components = outer_pads + corners
-    sorted_components = generator.position_calculator.sort_components_by_position(all_components, placement_order)
+    # Instances as placed in the SKILL script, rendered by the visualizer without re-parsing the file
+    placed_components = []
+    
+    # In hierarchical mode the outer ring instances are collected into sub-cells, written after the fillers
+    hierarchy = RingHierarchy() if hierarchical else None
+    
+    def emit_instance(library, device, view, name, x, y, orientation, side_orientation=None, starts_group=False):
+        if hierarchy is None or not hierarchy.add(library, device, view, name, x, y, orientation,
+                                                  side_orientation, starts_group):
+            emitter.emit(f'dbCreateParamInstByMasterName(cv "{library}" "{device}" "{view}" "{name}" list({x} {y}) "{orientation}")')
     
     # 1. Generate all components
-    skill_commands.append("; ==================== All Components (Sorted by Placement Order) ====================")
+    emitter.emit("; ==================== All Components (Sorted by Placement Order) ====================")
     for component in sorted_components:
         x, y = component["position"]
         orientation = component["orientation"]
@@ -309,7 +366,11 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
         position_str = component.get('position_str', 'abs')
         
         sanitized_name = generator.sanitize_skill_instance_name(f"{name}_{position_str}")
-        skill_commands.append(f'dbCreateParamInstByMasterName(cv "{ring_config.get("library_name", "tphn28hpcpgv18")}" "{device}" "{ring_config.get("view_name", "layout")}" "{sanitized_name}" list({x} {y}) "{orientation}")')
+        side_orientation = orientation if component_type != "corner" else None
+        emit_instance(ring_config.get("library_name", "tphn28hpcpgv18"), device, ring_config.get("view_name", "layout"),
+                      sanitized_name, x, y, orientation, side_orientation, component_type == "pad")
+        placed_components.append(LayoutComponent({"name": sanitized_name, "device": device, "position": [x, y],
+                                                  "orientation": orientation, "type": component_type}))
         
         # Add PAD60GU for pad components (28nm specific)
         if component_type == "pad":
@@ -317,19 +378,24 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
             pad_library = device_masters.get("pad_library", "PAD")
             pad_master = device_masters.get("pad60_master", "PAD60GU")
             sanitized_pad_name = generator.sanitize_skill_instance_name(f"pad60gu_{name}_{position_str}")
-            skill_commands.append(f'dbCreateParamInstByMasterName(cv "{pad_library}" "{pad_master}" "layout" "{sanitized_pad_name}" list({x} {y}) "{orientation}")')
+            emit_instance(pad_library, pad_master, "layout", sanitized_pad_name, x, y, orientation, side_orientation)
     
-    skill_commands.append("")
+    emitter.emit("")
     
     # 2. Inner Ring Pads
     if inner_pads:
-        skill_commands.append("; ==================== Inner Ring Pads ====================")
-        inner_pad_commands = generator.inner_pad_handler.generate_inner_pad_skill_commands(inner_pads, outer_pads, ring_config)
-        skill_commands.extend(inner_pad_commands)
-        skill_commands.append("")
+        emitter.emit("; ==================== Inner Ring Pads ====================")
+        inner_pad_commands = generator.inner_pad_handler.generate_inner_pad_skill_commands(inner_pads, outer_pads, ring_config, topology)
+        emitter.emit_all(inner_pad_commands)
+        for inner_pad in inner_pads:
+            position, orientation = generator.inner_pad_handler.resolve_inner_pad_placement(inner_pad, outer_pads, ring_config, topology)
+            sanitized_name = generator.sanitize_skill_instance_name(f"inner_pad_{inner_pad['name']}_{inner_pad['position_str']}")
+            placed_components.append(LayoutComponent({"name": sanitized_name, "device": inner_pad["device"], "position": list(position),
+                                                      "orientation": orientation, "type": "inner_pad"}))
+        emitter.emit("")
     
     # 3. Filler components
-    skill_commands.append("; ==================== Filler Components ====================")
+    emitter.emit("; ==================== Filler Components ====================")
     
     if existing_fillers or existing_separators:
         for instance in all_instances:
@@ -341,7 +407,10 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
                 name = instance.get("name", "")
                 x, y = position
                 sanitized_name = generator.sanitize_skill_instance_name(name)
-                skill_commands.append(f'dbCreateParamInstByMasterName(cv "{ring_config.get("library_name", "tphn28hpcpgv18")}" "{device}" "{ring_config.get("view_name", "layout")}" "{sanitized_name}" list({x} {y}) "{orientation}")')
+                emit_instance(ring_config.get("library_name", "tphn28hpcpgv18"), device, ring_config.get("view_name", "layout"),
+                              sanitized_name, x, y, orientation, orientation)
+                placed_components.append(LayoutComponent({"name": sanitized_name, "device": device, "position": [x, y],
+                                                          "orientation": orientation, "type": "filler"}))
     else:
         for filler in all_components_with_fillers[len(validation_components):]:
             x, y = filler["position"]
@@ -349,37 +418,49 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
             device = filler["device"]
             name = filler["name"]
             sanitized_name = generator.sanitize_skill_instance_name(name)
-            skill_commands.append(f'dbCreateParamInstByMasterName(cv "{ring_config.get("library_name", "tphn28hpcpgv18")}" "{device}" "{ring_config.get("view_name", "layout")}" "{sanitized_name}" list({x} {y}) "{orientation}")')
-    
-    skill_commands.append("")
+            emit_instance(ring_config.get("library_name", "tphn28hpcpgv18"), device, ring_config.get("view_name", "layout"),
+                          sanitized_name, x, y, orientation, orientation)
+            placed_components.append(LayoutComponent({"name": sanitized_name, "device": device, "position": [x, y],
+                                                      "orientation": orientation, "type": filler.get("type", "filler")}))
+    
+    hierarchy_manifest = None
+    if hierarchy is not None:
+        emitter.emit("")
+        emitter.emit("; ==================== Ring Sub-cells (Hierarchical) ====================")
+        hierarchy_layout = hierarchy.build()
+        emitter.emit_all(hierarchy.skill_commands(hierarchy_layout))
+        hierarchy_manifest = hierarchy.manifest(hierarchy_layout)
+        print(f"🧩 Hierarchical ring: {hierarchy.instance_count} instances in {len(hierarchy_layout['slot_cells'])} slot "
+              f"and {len(hierarchy_layout['side_cells'])} side cell(s)")
+    
+    emitter.emit("")
     
     # 4. Digital IO features
-    skill_commands.append("; ==================== Digital IO Features (with Inner Pad Support) ====================")
-    digital_io_commands = generator.skill_generator.generate_digital_io_features_with_inner(outer_pads, inner_pads, ring_config)
-    skill_commands.extend(digital_io_commands)
-    skill_commands.append("")
+    emitter.emit("; ==================== Digital IO Features (with Inner Pad Support) ====================")
+    digital_io_commands = generator.skill_generator.generate_digital_io_features_with_inner(outer_pads, inner_pads, ring_config, topology)
+    emitter.emit_all(digital_io_commands)
+    emitter.emit("")
     
     # 5. Pin labels
-    skill_commands.append("; ==================== Pin Labels (with Inner Pad Support) ====================")
-    pin_label_commands = generator.skill_generator.generate_pin_labels_with_inner(outer_pads, inner_pads, ring_config)
-    skill_commands.extend(pin_label_commands)
-    skill_commands.append("")
-    skill_commands.append("dbSave(cv)")
-    skill_commands.append("t")
-    
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(skill_commands))
-    
-    # Generate visualization (28nm uses layout_visualizer)
+    emitter.emit("; ==================== Pin Labels (with Inner Pad Support) ====================")
+    pin_label_commands = generator.skill_generator.generate_pin_labels_with_inner(outer_pads, inner_pads, ring_config, topology)
+    emitter.emit_all(pin_label_commands)
+    emitter.emit("")
+    emitter.emit("dbSave(cv)")
+    emitter.emit("t")
+    chunk_files = emitter.close()
+    
+    # Generate visualization from the placed components (28nm uses layout_visualizer)
+    visualization_path = None
     try:
         output_dir = os.path.dirname(output_file) or "output"
         vis_name = os.path.splitext(os.path.basename(output_file))[0] + "_visualization.png"
         visualization_path = os.path.join(output_dir, vis_name)
         os.makedirs(output_dir, exist_ok=True)
-        visualize_layout(output_file, visualization_path)
+        visualize_layout_from_components(placed_components, visualization_path)
         print(f"📊 Visualization generated: {visualization_path}")
     except Exception as e:
+        visualization_path = None
         print(f"⚠️  Visualization generation failed: {e}")
     
     # Calculate chip size
@@ -391,6 +472,9 @@ def generate_layout_from_json(json_file: str, output_file: str = "generated_layo
     if inner_pads:
         print(f"📊 Inner ring pads: {len(inner_pads)}")
     print(f"✅ Layout Skill script generated: {output_file}")
+    if max_chunk_bytes is not None:
+        print(f"📦 Split into {len(chunk_files)} chunk(s) loaded by {output_file}")
     
-    return output_file
+    return {"output_file": output_file, "chunk_files": chunk_files, "components": placed_components,
+            "visualization_file": visualization_path, "hierarchy": hierarchy_manifest}
 
@@ -6,28 +6,18 @@ Converts SKILL dbCreateParamInstByMasterName calls to visual representation
 """
 
 import re
-import json
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Mapping, Tuple, Optional
 from collections import defaultdict
+from functools import lru_cache
 
-# Get config directory path
-# layout_visualizer.py is in src/app/layout/T28/
-# config files are in src/app/layout/config/
-_CONFIG_DIR = Path(__file__).parent.parent / "config"
-
-def _load_28nm_config() -> Dict:
-    """Load 28nm device configuration from JSON file"""
-    config_file = _CONFIG_DIR / "lydevices_28.json"
-    if config_file.exists():
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {}
+from ..device_classifier import CLASSIFICATION_CACHE_SIZE, get_classification_table
+from ..layout_renderer import render_layout_items
+from ..process_node_config import get_process_node_registry
+
+def _load_28nm_config() -> Mapping:
+    """Load 28nm device configuration from the shared process node registry"""
+    return get_process_node_registry().get_device_config("T28") or {}
 
 # Load 28nm configuration
 _28NM_CONFIG = _load_28nm_config()
@@ -150,6 +140,7 @@ def parse_skill_layout(il_file_path: str) -> List[Dict]:
     - rotation: rotation angle (R0, R90, R180, R270)
     - device_type: extracted device type for coloring
     """
+    device_table = get_classification_table("T28")
     devices = []
     
     with open(il_file_path, 'r', encoding='utf-8') as f:
@@ -178,21 +169,14 @@ def parse_skill_layout(il_file_path: str) -> List[Dict]:
         # Inner pads have instance names starting with "inner_pad_"
         is_inner_pad = inst_name.startswith('inner_pad_')
         
-        # Use configuration file to classify devices
-        digital_devices = _28NM_CONFIG.get("digital_devices", [])
-        analog_devices = _28NM_CONFIG.get("analog_devices", [])
-        corner_devices = _28NM_CONFIG.get("corner_devices", [])
-        filler_devices = _28NM_CONFIG.get("filler_devices", [])
-        cut_devices = _28NM_CONFIG.get("cut_devices", [])
-        
-        # Check device type using config
-        if any(dev in cell_name for dev in corner_devices):
+        # Check device type using the compiled config classification table
+        if device_table.contains(cell_name, "corner_devices"):
             device_type = cell_name
             device_category = 'corner'
-        elif any(dev in cell_name for dev in filler_devices) or any(dev in cell_name for dev in cut_devices):
+        elif device_table.contains(cell_name, "filler_devices", "cut_devices"):
             device_type = cell_name
             device_category = 'filler'
-        elif any(dev in cell_name for dev in digital_devices) or any(dev in cell_name for dev in analog_devices):
+        elif device_table.contains(cell_name, "digital_devices", "analog_devices"):
             device_type = cell_name
             if is_inner_pad:
                 device_category = 'inner_pad'  # Inner pad (dual ring pad)
@@ -236,42 +220,35 @@ def parse_skill_layout(il_file_path: str) -> List[Dict]:
     return devices
 
 
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
 def get_device_color(device_type: str) -> str:
     """Get color for device type using config"""
+    device_table = get_classification_table("T28")
     # Try exact match first
     if device_type in DEVICE_COLORS:
         return DEVICE_COLORS[device_type]
     
-    # Use config to determine color based on device category
-    digital_io = _28NM_CONFIG.get("digital_io", [])
-    analog_io = _28NM_CONFIG.get("analog_io", [])
-    digital_vol = _28NM_CONFIG.get("digital_vol", [])
-    analog_vol = _28NM_CONFIG.get("analog_vol", [])
-    corner_devices = _28NM_CONFIG.get("corner_devices", [])
-    filler_devices = _28NM_CONFIG.get("filler_devices", [])
-    cut_devices = _28NM_CONFIG.get("cut_devices", [])
-    
     # Check if device matches any in config lists
-    if any(dev in device_type for dev in digital_io):
+    if device_table.contains(device_type, "digital_io"):
         return '#32CD32'  # Medium green - Digital IO
-    elif any(dev in device_type for dev in digital_vol):
+    elif device_table.contains(device_type, "digital_vol"):
         if 'PVDD' in device_type:
             return '#90EE90'  # Light green - Digital power
         else:
             return '#228B22'  # Dark green - Digital ground
-    elif any(dev in device_type for dev in analog_io):
+    elif device_table.contains(device_type, "analog_io"):
         return '#4A90E2'  # Medium blue - Analog IO
-    elif any(dev in device_type for dev in analog_vol):
+    elif device_table.contains(device_type, "analog_vol"):
         if 'PVDD1AC' in device_type or 'PVDD3AC' in device_type or 'PVDD3A' in device_type:
             return '#5BA0F2' if 'PVDD1AC' in device_type else '#87CEEB' if 'PVDD3AC' in device_type else '#7EC8E3'  # Analog power
         else:
             return '#3A80D2' if 'PVSS1AC' in device_type else '#4682B4' if 'PVSS3AC' in device_type else '#3E7AB0'  # Analog ground
-    elif any(dev in device_type for dev in corner_devices):
+    elif device_table.contains(device_type, "corner_devices"):
         if 'PCORNERA' in device_type:
             return '#FF6B6B'  # Medium red - Analog corner
         else:
             return '#FF8888'  # Slightly lighter red - Digital corner
-    elif any(dev in device_type for dev in filler_devices + cut_devices):
+    elif device_table.contains(device_type, "filler_devices", "cut_devices"):
         if 'A_G' in device_type:
             return '#D8D8D8'  # Very light gray - Analog filler
         elif 'RCUT' in device_type:
@@ -286,6 +263,10 @@ def get_device_color(device_type: str) -> str:
     
     return DEVICE_COLORS['default']
 
+# Colors depend on the device lists, recompute them after a config reload
+get_process_node_registry().add_reload_listener(
+    lambda process_node: process_node == "T28" and get_device_color.cache_clear())
+
 
 def get_rectangle_for_rotation(x: float, y: float, rotation: str, width: float, height: float) -> Tuple[float, float, float, float]:
     """
@@ -438,184 +419,109 @@ def convert_components_to_devices(layout_components: List[Dict]) -> List[Dict]:
     return devices
 
 
-def visualize_layout_from_components(layout_components: List[Dict], output_path: str) -> str:
-    """
-    Generate visual diagram directly from layout components (without SKILL file)
-    
-    Args:
-        layout_components: List of layout component dictionaries
-        output_path: Output path for image file
-    
-    Returns:
-        Path to generated image file
-    """
-    # Convert components to device format
-    devices = convert_components_to_devices(layout_components)
-    
-    if not devices:
-        raise ValueError("No devices found in layout components")
-    
-    # Use the same visualization logic as visualize_layout
-    all_devices = devices
-    
-    # Calculate bounds from all devices
-    all_x = [d['x'] for d in all_devices]
-    all_y = [d['y'] for d in all_devices]
-    min_x, max_x = min(all_x), max(all_x)
-    min_y, max_y = min(all_y), max(all_y)
-    
-    # Add padding for visualization
-    padding = 50
-    fig_width = max(max_x - min_x + 2 * padding, 400)
-    fig_height = max(max_y - min_y + 2 * padding, 400)
-    
-    # Create figure
-    fig, ax = plt.subplots(1, 1, figsize=(fig_width/50, fig_height/50))
-    ax.set_xlim(min_x - padding, max_x + padding)
-    ax.set_ylim(min_y - padding, max_y + padding)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    
-    # Sort devices by position
-    def get_sort_key(device):
-        x, y = device['x'], device['y']
-        rotation = device['rotation']
-        if rotation == 'R270':
-            return (0, y)
-        elif rotation == 'R0':
-            return (1, x)
-        elif rotation == 'R90':
-            return (2, -y)
-        elif rotation == 'R180':
-            return (3, -x)
-        else:
-            return (4, 0)
-    
-    all_devices_sorted = sorted(all_devices, key=get_sort_key)
-    
-    # Draw each device
-    for device in all_devices_sorted:
+def _device_sort_key(device: Dict) -> Tuple:
+    """Sort by side first (left, bottom, right, top), then by position along that side"""
+    x, y = device['x'], device['y']
+    rotation = device['rotation']
+    if rotation == 'R270':  # Left side
+        return (0, y)
+    elif rotation == 'R0':  # Bottom side
+        return (1, x)
+    elif rotation == 'R90':  # Right side
+        return (2, -y)
+    elif rotation == 'R180':  # Top side
+        return (3, -x)
+    else:
+        return (4, 0)
+
+
+def _build_render_items(devices: List[Dict]) -> List[Dict]:
+    """Convert devices to renderer items (rectangle, colors and label per device)"""
+    items = []
+    for device in sorted(devices, key=_device_sort_key):
         x, y = device['x'], device['y']
         rotation = device['rotation']
         device_type = device['device_type']
         device_category = device.get('device_category', 'io')
         inst_name = device['inst_name']
-        
-        # Get color
-        color = get_device_color(device_type)
-        
-        # Get device dimensions
+
+        # Get device dimensions based on category
         if device_category == 'corner':
             width = CORNER_SIZE
             height = CORNER_SIZE
         elif device_category == 'inner_pad':
+            # Inner pad (dual ring pad): 20×110 (fills gap left by 10×110 filler)
             width = INNER_PAD_WIDTH
             height = INNER_PAD_HEIGHT
         elif device_category == 'filler':
+            # Filler size depends on type: PFILLER10/PFILLER10A are 10×110, PFILLER20/PFILLER20A are 20×110
             if 'PFILLER10' in device_type:
                 width = FILLER10_WIDTH
                 height = FILLER10_HEIGHT
             else:
                 width = FILLER_WIDTH
                 height = FILLER_HEIGHT
-        else:
+        else:  # io (IO devices like PDB3AC, PVDD, PVSS): 20×110
             width = PAD_WIDTH
             height = PAD_HEIGHT
-        
-        # Calculate rectangle based on rotation
-        rect_x, rect_y, rect_w, rect_h = get_rectangle_for_rotation(
-            x, y, rotation, width, height
-        )
-        
-        # Create rectangle
-        if device_category == 'inner_pad':
-            rect = patches.FancyBboxPatch(
-                (rect_x, rect_y), rect_w, rect_h,
-                boxstyle='round,pad=0',
-                linewidth=2, edgecolor='black', facecolor=color, alpha=0.8,
-                linestyle='--'
-            )
-        else:
-            rect = patches.Rectangle(
-                (rect_x, rect_y), rect_w, rect_h,
-                linewidth=2, edgecolor='black', facecolor=color, alpha=0.8
-            )
-        ax.add_patch(rect)
-        
-        # Add text label
+
+        # Label format: "signal_name:device_type" for IO devices, full cell name otherwise
         if device_category == 'io' or device_category == 'inner_pad':
             signal_name = inst_name
             if device_category == 'inner_pad':
+                # Remove "inner_pad_" prefix and position indicators like _left_0_1, _right_6_7
                 signal_name = re.sub(r'^inner_pad_', '', signal_name)
                 signal_name = re.sub(r'_(left|right|top|bottom)_\d+_\d+$', '', signal_name)
             else:
                 signal_name = re.sub(r'_(left|right|top|bottom)_\d+$', '', signal_name)
-            device_type_label = device['cell_name']
-            label = f"{signal_name}:{device_type_label}"
-        elif device_category == 'corner':
-            label = device['cell_name']
-        elif device_category == 'filler':
+            label = f"{signal_name}:{device['cell_name']}"
+        elif device_category == 'corner' or device_category == 'filler':
             label = device['cell_name']
         else:
-            label = inst_name
-            label = re.sub(r'_(left|right|top|bottom)_\d+$', '', label)
-        
-        # Calculate center
-        center_x = rect_x + rect_w / 2
-        center_y = rect_y + rect_h / 2
-        
-        # Font size
+            label = re.sub(r'_(left|right|top|bottom)_\d+$', '', inst_name)
+
         if device_category == 'corner':
             font_size = 8
         elif device_category == 'filler':
             font_size = 6
-        elif device_category == 'inner_pad':
-            font_size = 7
-        else:
+        else:  # io and inner_pad
             font_size = 7
-        
-        # Text rotation
-        if rotation == 'R0' or rotation == 'R180':
-            text_rotation = 90
-        elif rotation == 'R90' or rotation == 'R270':
-            text_rotation = 0
-        else:
-            text_rotation = 0
-        
-        # Add text
-        ax.text(center_x, center_y, label,
-                ha='center', va='center',
-                rotation=text_rotation,
-                fontsize=font_size, fontweight='bold',
-                color='black',
-                bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8, edgecolor='none'))
-    
-    # Add title
-    ax.set_title('IO Ring Layout Visualization', fontsize=14, fontweight='bold', pad=20)
-    
-    # Add legend
-    device_types_found = set(d['device_type'] for d in all_devices)
-    
-    # Categorize devices using config
-    digital_io = _28NM_CONFIG.get("digital_io", [])
-    analog_io = _28NM_CONFIG.get("analog_io", [])
-    digital_vol = _28NM_CONFIG.get("digital_vol", [])
-    analog_vol = _28NM_CONFIG.get("analog_vol", [])
-    corner_devices = _28NM_CONFIG.get("corner_devices", [])
-    filler_devices = _28NM_CONFIG.get("filler_devices", [])
-    cut_devices = _28NM_CONFIG.get("cut_devices", [])
-    
+
+        # Align text with the rectangle's long edge:
+        # R0/R180 rectangles are 20 wide x 110 high -> vertical text, R90/R270 -> horizontal text
+        text_rotation = 90 if rotation in ('R0', 'R180') else 0
+
+        items.append({
+            'rect': get_rectangle_for_rotation(x, y, rotation, width, height),
+            'facecolor': get_device_color(device_type),
+            'alpha': 0.8,
+            # Inner pads use a dashed border to distinguish them from regular IO devices
+            'linestyle': '--' if device_category == 'inner_pad' else '-',
+            'label': label,
+            'fontsize': font_size,
+            'rotation': text_rotation,
+            'fontweight': 'bold',
+            'label_box': True,
+        })
+    return items
+
+
+def _build_legend_entries(devices: List[Dict]) -> List[Dict]:
+    """Group device types found in the layout into digital IO, analog IO and other legend rows"""
+    device_table = get_classification_table("T28")
+    device_types_found = set(d['device_type'] for d in devices)
+
     digital_io_types = []
     analog_io_types = []
     other_types = []
-    
+
     for dev_type in sorted(device_types_found):
         # Check using config lists
-        if any(dev in dev_type for dev in digital_io + digital_vol):
+        if device_table.contains(dev_type, "digital_io", "digital_vol"):
             digital_io_types.append(dev_type)
-        elif any(dev in dev_type for dev in analog_io + analog_vol):
+        elif device_table.contains(dev_type, "analog_io", "analog_vol"):
             analog_io_types.append(dev_type)
-        elif any(dev in dev_type for dev in corner_devices + filler_devices + cut_devices):
+        elif device_table.contains(dev_type, "corner_devices", "filler_devices", "cut_devices"):
             other_types.append(dev_type)
         else:
             # Fallback to pattern matching
@@ -627,330 +533,84 @@ def visualize_layout_from_components(layout_components: List[Dict], output_path:
                 analog_io_types.append(dev_type)
             else:
                 other_types.append(dev_type)
-    
-    legend_elements = []
-    
-    if digital_io_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Digital IO (Green Shades)'))
-        for dev_type in sorted(digital_io_types):
-            color = get_device_color(dev_type)
-            legend_label = re.sub(r'_V_G$', '', dev_type)
-            legend_label = re.sub(r'_H_G$', '', legend_label)
-            legend_label = re.sub(r'_V$', '', legend_label)
-            legend_label = re.sub(r'_H$', '', legend_label)
-            legend_label = re.sub(r'_G$', '', legend_label)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=legend_label))
-    
-    if analog_io_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Analog IO (Blue Shades)'))
-        for dev_type in sorted(analog_io_types):
-            color = get_device_color(dev_type)
-            legend_label = re.sub(r'_V_G$', '', dev_type)
-            legend_label = re.sub(r'_H_G$', '', legend_label)
-            legend_label = re.sub(r'_V$', '', legend_label)
-            legend_label = re.sub(r'_H$', '', legend_label)
-            legend_label = re.sub(r'_G$', '', legend_label)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=legend_label))
-    
-    if other_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Other Components'))
-        for dev_type in sorted(other_types):
-            color = get_device_color(dev_type)
+
+    legend_entries = []
+    for header, group in (('Digital IO (Green Shades)', digital_io_types),
+                          ('Analog IO (Blue Shades)', analog_io_types),
+                          ('Other Components', other_types)):
+        if not group:
+            continue
+        legend_entries.append({'facecolor': 'none', 'edgecolor': 'none', 'label': header})
+        for dev_type in group:
+            # Drop orientation / variant suffixes from the legend label
             legend_label = re.sub(r'_V_G$', '', dev_type)
             legend_label = re.sub(r'_H_G$', '', legend_label)
             legend_label = re.sub(r'_V$', '', legend_label)
             legend_label = re.sub(r'_H$', '', legend_label)
             legend_label = re.sub(r'_G$', '', legend_label)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=legend_label))
-    
-    if legend_elements:
-        ax.legend(handles=legend_elements,
-                 loc='upper left',
-                 bbox_to_anchor=(1.02, 1.0),
-                 fontsize=8,
-                 frameon=True,
-                 fancybox=True,
-                 shadow=False,
-                 handlelength=1.5)
-    
-    # Save figure
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    plt.tight_layout(rect=[0, 0, 0.85, 1])
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    
-    return str(output_path)
+            legend_entries.append({'facecolor': get_device_color(dev_type), 'label': legend_label})
+    return legend_entries
+
+
+def _render_devices(devices: List[Dict], output_path, backend: Optional[str]) -> str:
+    """Render parsed or converted devices (pads, corners, fillers, inner pads) to an image"""
+    # Calculate bounds from all devices and add padding for visualization
+    all_x = [d['x'] for d in devices]
+    all_y = [d['y'] for d in devices]
+    min_x, max_x = min(all_x), max(all_x)
+    min_y, max_y = min(all_y), max(all_y)
+    padding = 50
+    fig_width = max(max_x - min_x + 2 * padding, 400)
+    fig_height = max(max_y - min_y + 2 * padding, 400)
+    bounds = (min_x - padding, min_x - padding + fig_width, min_y - padding, min_y - padding + fig_height)
 
+    return render_layout_items(_build_render_items(devices), bounds, 'IO Ring Layout Visualization',
+                               _build_legend_entries(devices), output_path, backend)
 
-def visualize_layout(il_file_path: str, output_path: Optional[str] = None) -> str:
+
+def visualize_layout_from_components(layout_components: List[Dict], output_path: str,
+                                     backend: Optional[str] = None) -> str:
+    """
+    Generate visual diagram directly from layout components (without SKILL file)
+
+    Args:
+        layout_components: List of layout component dictionaries
+        output_path: Output path for image file
+        backend: Render backend, "collection" (default) or "artist" (see layout_renderer.py)
+
+    Returns:
+        Path to generated image file
+    """
+    devices = convert_components_to_devices(layout_components)
+
+    if not devices:
+        raise ValueError("No devices found in layout components")
+
+    return _render_devices(devices, output_path, backend)
+
+
+def visualize_layout(il_file_path: str, output_path: Optional[str] = None, backend: Optional[str] = None) -> str:
     """
     Generate visual diagram from SKILL layout file
-    
+
     Args:
         il_file_path: Path to SKILL layout file
         output_path: Optional output path for image (default: same directory as input with .png extension)
-    
+        backend: Render backend, "collection" (default) or "artist" (see layout_renderer.py)
+
     Returns:
         Path to generated image file
     """
-    # Parse SKILL file
     devices = parse_skill_layout(il_file_path)
-    
+
     if not devices:
         raise ValueError(f"No devices found in {il_file_path}")
-    
-    # Include all devices: pads, corners, and fillers
-    all_devices = devices
-    
-    # Calculate bounds from all devices
-    all_x = [d['x'] for d in all_devices]
-    all_y = [d['y'] for d in all_devices]
-    min_x, max_x = min(all_x), max(all_x)
-    min_y, max_y = min(all_y), max(all_y)
-    
-    # Add padding for visualization
-    padding = 50
-    fig_width = max(max_x - min_x + 2 * padding, 400)
-    fig_height = max(max_y - min_y + 2 * padding, 400)
-    
-    # Create figure
-    fig, ax = plt.subplots(1, 1, figsize=(fig_width/50, fig_height/50))
-    ax.set_xlim(min_x - padding, max_x + padding)
-    ax.set_ylim(min_y - padding, max_y + padding)
-    ax.set_aspect('equal')
-    # SKILL coordinates: x increases RIGHT, y increases UP (no inversion needed)
-    ax.axis('off')
-    
-    # Sort pad devices by position to ensure proper ordering
-    # Sort by side first (left, bottom, right, top), then by position along that side
-    def get_sort_key(device):
-        x, y = device['x'], device['y']
-        rotation = device['rotation']
-        # Determine which side based on rotation and position
-        if rotation == 'R270':  # Left side
-            return (0, y)  # Sort by y coordinate
-        elif rotation == 'R0':  # Bottom side
-            return (1, x)  # Sort by x coordinate
-        elif rotation == 'R90':  # Right side
-            return (2, -y)  # Sort by y coordinate (descending)
-        elif rotation == 'R180':  # Top side
-            return (3, -x)  # Sort by x coordinate (descending)
-        else:
-            return (4, 0)
-    
-    all_devices_sorted = sorted(all_devices, key=get_sort_key)
-    
-    # Draw each device (pads, corners, fillers)
-    for device in all_devices_sorted:
-        x, y = device['x'], device['y']
-        rotation = device['rotation']
-        device_type = device['device_type']
-        device_category = device.get('device_category', 'pad')
-        inst_name = device['inst_name']
-        
-        # Get color
-        color = get_device_color(device_type)
-        
-        # Get device dimensions based on category
-        if device_category == 'corner':
-            width = CORNER_SIZE
-            height = CORNER_SIZE
-        elif device_category == 'inner_pad':
-            # Inner pad (dual ring pad): 20×110 (fills gap left by 10×110 filler)
-            width = INNER_PAD_WIDTH
-            height = INNER_PAD_HEIGHT
-        elif device_category == 'filler':
-            # Filler size depends on type: PFILLER10/PFILLER10A are 10×110, PFILLER20/PFILLER20A are 20×110
-            if 'PFILLER10' in device_type:
-                width = FILLER10_WIDTH
-                height = FILLER10_HEIGHT
-            else:
-                # PFILLER20 or default
-                width = FILLER_WIDTH
-                height = FILLER_HEIGHT
-        else:  # io (IO devices like PDB3AC, PVDD, PVSS)
-            # IO devices: 20×110
-            width = PAD_WIDTH
-            height = PAD_HEIGHT
-        
-        # Calculate rectangle based on rotation
-        rect_x, rect_y, rect_w, rect_h = get_rectangle_for_rotation(
-            x, y, rotation, width, height
-        )
-        
-        # Create rectangle with thicker border for better visibility
-        # Inner pads use dashed border to distinguish from regular IO devices
-        if device_category == 'inner_pad':
-            # Inner pad: dashed border using FancyBboxPatch for better style support
-            rect = patches.FancyBboxPatch(
-                (rect_x, rect_y), rect_w, rect_h,
-                boxstyle='round,pad=0',
-                linewidth=2, edgecolor='black', facecolor=color, alpha=0.8,
-                linestyle='--'  # Dashed border for inner pad
-            )
-        else:
-            rect = patches.Rectangle(
-                (rect_x, rect_y), rect_w, rect_h,
-                linewidth=2, edgecolor='black', facecolor=color, alpha=0.8
-            )
-        ax.add_patch(rect)
-        
-        # Add text label in center
-        # Format: "signal_name:device_type" for IO devices, with full device type including suffixes
-        if device_category == 'io' or device_category == 'inner_pad':
-            # Extract signal name from instance name
-            signal_name = inst_name
-            # Clean up: remove side and position indicators if present
-            # For regular IO: remove _(left|right|top|bottom)_\d+$
-            # For inner pad: remove _(left|right|top|bottom)_\d+_\d+ (e.g., _left_0_1, _right_6_7)
-            if device_category == 'inner_pad':
-                # Remove "inner_pad_" prefix first
-                signal_name = re.sub(r'^inner_pad_', '', signal_name)
-                # Remove position indicators like _left_0_1, _right_6_7
-                signal_name = re.sub(r'_(left|right|top|bottom)_\d+_\d+$', '', signal_name)
-            else:
-                # Regular IO: remove _(left|right|top|bottom)_\d+$
-                signal_name = re.sub(r'_(left|right|top|bottom)_\d+$', '', signal_name)
-            
-            # Get device type (cell_name) - keep full format including suffixes for labels
-            device_type_label = device['cell_name']
-            
-            # Format: "signal_name:device_type" (full format, including suffixes)
-            label = f"{signal_name}:{device_type_label}"
-        elif device_category == 'corner':
-            # For corner devices, use the full cell name including suffixes (e.g., PCORNERA_G, PCORNER_G)
-            label = device['cell_name']
-        elif device_category == 'filler':
-            # For fillers, use the full cell name including suffixes (e.g., PFILLER20A_G, PFILLER20_G, PRCUTA_G)
-            label = device['cell_name']
-        else:
-            label = inst_name
-            # Clean up label: remove side indicators if present
-            label = re.sub(r'_(left|right|top|bottom)_\d+$', '', label)
-        
-        # Calculate center of rectangle
-        center_x = rect_x + rect_w / 2
-        center_y = rect_y + rect_h / 2
-        
-        # Adjust font size based on device size
-        if device_category == 'corner':
-            font_size = 8
-        elif device_category == 'filler':
-            font_size = 6
-        elif device_category == 'inner_pad':
-            font_size = 7  # Same as IO devices
-        else:  # io (IO devices)
-            font_size = 7
-        
-        # Determine text rotation to align with rectangle's long edge
-        # In R0 state: rectangle is 20 wide x 110 high (long edge is vertical)
-        # After rotation, we need to check the actual displayed dimensions
-        # R0, R180: rectangle is horizontal (20 wide), long edge vertical -> text should be vertical (90 degrees)
-        # R90, R270: rectangle is vertical (110 wide), long edge horizontal -> text should be horizontal (0 degrees)
-        if rotation == 'R0' or rotation == 'R180':
-            # Horizontal rectangle: long edge is vertical, text should be vertical
-            text_rotation = 90
-        elif rotation == 'R90' or rotation == 'R270':
-            # Vertical rectangle: long edge is horizontal, text should be horizontal
-            text_rotation = 0
-        else:
-            text_rotation = 0
-        
-        # Add text with better contrast and rotation aligned with long edge
-        # Use single text label for all devices (simple and no overlap)
-        ax.text(center_x, center_y, label, 
-                ha='center', va='center', 
-                rotation=text_rotation,
-                fontsize=font_size, fontweight='bold',
-                color='black', 
-                bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8, edgecolor='none'))
-    
-    # Add title
-    ax.set_title('IO Ring Layout Visualization', fontsize=14, fontweight='bold', pad=20)
-    
-    # Add legend - separate digital and analog IO devices
-    device_types_found = set(d['device_type'] for d in all_devices)
-    
-    # Categorize devices
-    digital_io_types = []
-    analog_io_types = []
-    other_types = []
-    
-    for dev_type in sorted(device_types_found):
-        # Check if it's a digital IO device
-        if 'PDDW16SDGZ' in dev_type or 'PVDD1DGZ' in dev_type or 'PVSS1DGZ' in dev_type or 'PVSS2DGZ' in dev_type or 'PVDD2POC' in dev_type:
-            digital_io_types.append(dev_type)
-        # Check if it's an analog IO device
-        elif 'PDB3AC' in dev_type or 'PVDD1AC' in dev_type or 'PVSS1AC' in dev_type or 'PVDD3AC' in dev_type or 'PVSS3AC' in dev_type or 'PVDD3A' in dev_type or 'PVSS3A' in dev_type:
-            analog_io_types.append(dev_type)
-        else:
-            other_types.append(dev_type)
-    
-    # Build legend elements with grouping
-    legend_elements = []
-    
-    # Add header for digital IO (green shades)
-    if digital_io_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Digital IO (Green Shades)'))
-        for dev_type in sorted(digital_io_types):
-            color = get_device_color(dev_type)
-            legend_label = re.sub(r'_V_G$', '', dev_type)
-            legend_label = re.sub(r'_H_G$', '', legend_label)
-            legend_label = re.sub(r'_V$', '', legend_label)
-            legend_label = re.sub(r'_H$', '', legend_label)
-            legend_label = re.sub(r'_G$', '', legend_label)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=legend_label))
-    
-    # Add header for analog IO (blue shades)
-    if analog_io_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Analog IO (Blue Shades)'))
-        for dev_type in sorted(analog_io_types):
-            color = get_device_color(dev_type)
-            legend_label = re.sub(r'_V_G$', '', dev_type)
-            legend_label = re.sub(r'_H_G$', '', legend_label)
-            legend_label = re.sub(r'_V$', '', legend_label)
-            legend_label = re.sub(r'_H$', '', legend_label)
-            legend_label = re.sub(r'_G$', '', legend_label)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=legend_label))
-    
-    # Add other devices (corners, fillers, etc.) with header
-    if other_types:
-        legend_elements.append(patches.Patch(facecolor='none', edgecolor='none', label='Other Components'))
-        for dev_type in sorted(other_types):
-            color = get_device_color(dev_type)
-            legend_label = re.sub(r'_V_G$', '', dev_type)
-            legend_label = re.sub(r'_H_G$', '', legend_label)
-            legend_label = re.sub(r'_V$', '', legend_label)
-            legend_label = re.sub(r'_H$', '', legend_label)
-            legend_label = re.sub(r'_G$', '', legend_label)
-            legend_elements.append(patches.Patch(facecolor=color, edgecolor='black', label=legend_label))
-    
-    if legend_elements:
-        # Position legend in upper right, but outside the plot area to avoid overlap
-        ax.legend(handles=legend_elements, 
-                 loc='upper left',
-                 bbox_to_anchor=(1.02, 1.0),
-                 fontsize=8,
-                 frameon=True,
-                 fancybox=True,
-                 shadow=False,
-                 handlelength=1.5)
-    
-    # Save figure
+
     if output_path is None:
         il_path = Path(il_file_path)
         output_path = il_path.parent / f"{il_path.stem}_visualization.png"
-    else:
-        output_path = Path(output_path)
-    
-    # Adjust layout to make room for legend
-    plt.tight_layout(rect=[0, 0, 0.85, 1])  # Leave 15% space on the right for legend
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    
-    return str(output_path)
+
+    return _render_devices(devices, output_path, backend)
 
 
 if __name__ == '__main__':
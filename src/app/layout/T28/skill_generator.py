@@ -4,11 +4,12 @@
 SKILL Script Generation Module for T28
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from ..device_classifier import DeviceClassifier
 from ..voltage_domain import VoltageDomainHandler
 from .inner_pad_handler import InnerPadHandler
 from ..position_calculator import PositionCalculator
+from ..ring_topology import RingTopology
 from .auto_filler import get_corner_domain
 from ..process_node_config import get_process_node_config
 
@@ -94,7 +95,8 @@ class SkillGeneratorT28:
         
         return result
     
-    def generate_digital_io_features_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict) -> List[str]:
+    def generate_digital_io_features_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict,
+                                                topology: Optional[RingTopology] = None) -> List[str]:
         """Generate digital IO features (configuration lines + secondary lines + pin labels), supporting inner pads. Configuration lines cover all digital pads, secondary lines and pins only for digital IO."""
         skill_commands = []
         # Get process_node to determine layer names
@@ -112,9 +114,9 @@ class SkillGeneratorT28:
         secondary_width = skill_params["wire_widths"]["secondary_width"]
         
         # Get all digital pads (not distinguishing IO)
-        all_digital_pads = self.inner_pad_handler.get_all_digital_pads_with_inner_any(outer_pads, inner_pads, ring_config)
+        all_digital_pads = self.inner_pad_handler.get_all_digital_pads_with_inner_any(outer_pads, inner_pads, ring_config, topology)
         # Get all digital IO pads
-        digital_io_pads = self.inner_pad_handler.get_all_digital_pads_with_inner(outer_pads, inner_pads, ring_config)
+        digital_io_pads = self.inner_pad_handler.get_all_digital_pads_with_inner(outer_pads, inner_pads, ring_config, topology)
         if not all_digital_pads:
             return skill_commands
         
@@ -449,7 +451,8 @@ class SkillGeneratorT28:
         
         return skill_commands
     
-    def generate_pin_labels_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict) -> List[str]:
+    def generate_pin_labels_with_inner(self, outer_pads: List[dict], inner_pads: List[dict], ring_config: dict,
+                                       topology: Optional[RingTopology] = None) -> List[str]:
         """Generate main pin labels, supporting inner pads"""
         skill_commands = []
         
@@ -503,6 +506,7 @@ class SkillGeneratorT28:
                 skill_commands.append(f'dbCreateLabel(cv list("M2" "pin") {core_pos} "{core_label}" "{core_just}" "{core_orient}" "roman" 2)')
         
         # Main pin labels for inner pads (move 152 units inward, opposite direction)
+        topology = self.inner_pad_handler.ensure_ring_topology(inner_pads, outer_pads, ring_config, topology)
         for inner_pad in inner_pads:
             # If position is already absolute coordinates, use directly
             if isinstance(inner_pad["position"], list):
@@ -510,7 +514,7 @@ class SkillGeneratorT28:
                 orient = inner_pad["orientation"]
             else:
                 # Otherwise, recalculate position
-                position, orient = self.inner_pad_handler.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config)
+                position, orient = self.inner_pad_handler.calculate_inner_pad_position(inner_pad["position"], outer_pads, ring_config, topology)
             
             x, y = position
             name = inner_pad["name"]
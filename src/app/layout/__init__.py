@@ -19,9 +19,15 @@ from .T180 import LayoutGeneratorT180, SkillGeneratorT180, AutoFillerGeneratorT1
 from .device_classifier import DeviceClassifier
 from .voltage_domain import VoltageDomainHandler
 from .position_calculator import PositionCalculator
+from .layout_component import LayoutComponent
 from .filler_generator import FillerGenerator
 from .layout_validator import LayoutValidator
-from .process_node_config import get_process_node_config, get_template_file_paths, list_supported_process_nodes
+from .geometry_checker import RingGeometryChecker, check_ring_geometry
+from .ring_topology import RingTopology
+from .ring_hierarchy import RingHierarchy
+from .process_node_config import (
+    get_process_node_config, get_process_node_registry, get_template_file_paths, list_supported_process_nodes,
+)
 
 # InnerPadHandler is T28-specific (T180 implementation pending)
 from .T28.inner_pad_handler import InnerPadHandler
@@ -55,10 +61,16 @@ __all__ = [
     'DeviceClassifier',
     'VoltageDomainHandler',
     'PositionCalculator',
+    'LayoutComponent',
     'FillerGenerator',
     'LayoutValidator',
+    'RingGeometryChecker',
+    'check_ring_geometry',
+    'RingTopology',
+    'RingHierarchy',
     'InnerPadHandler',
     'get_process_node_config',
+    'get_process_node_registry',
     'get_template_file_paths',
     'list_supported_process_nodes',
     # Visualizers
@@ -2,15 +2,18 @@
 # -*- coding: utf-8 -*-
 """
 Device Type Classification Module
-Loads device lists from process node configuration files
+Loads device lists from process node configuration files and compiles them into
+per process node classification tables (exact-match sets plus a substring matcher)
+
+Configurations come from the shared process node registry; when it reloads a changed
+config file, the tables and device lists of that process node are rebuilt on next use.
 """
 
-import json
-from pathlib import Path
-from typing import Dict
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Tuple
 
-# Get config directory path
-_CONFIG_DIR = Path(__file__).parent / "config"
+from .process_node_config import get_process_node_registry
 
 # Supported process nodes
 SUPPORTED_PROCESS_NODES = {"T28", "T180"}
@@ -61,12 +64,145 @@ def _process_node_to_config_file(process_node: str) -> str:
         raise ValueError(f"Invalid process node: {process_node}")
 
 
+# Device list keys of lydevices_*.json compiled into the classification tables
+DEVICE_CATEGORIES = (
+    "digital_devices", "digital_io", "digital_vol", "digital_corner", "digital_filler",
+    "analog_devices", "analog_io", "analog_vol", "analog_corner", "analog_filler",
+    "corner_devices", "filler_devices", "cut_devices",
+)
+
+# Size of the per table caches of classification results
+CLASSIFICATION_CACHE_SIZE = 4096
+
+
+class _SubstringMatcher:
+    """Aho-Corasick automaton over device names, finds every name contained in a cell name in one pass"""
+    
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[str]] = [frozenset()]
+        
+        for pattern in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(frozenset())
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state] = self._output[state] | {pattern}
+        
+        # Breadth-first failure links; outputs of the failure state are inherited
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] | self._output[self._fail[next_state]]
+    
+    def find_all(self, text: str) -> FrozenSet[str]:
+        """Get all patterns that occur in text"""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found |= self._output[state]
+        return frozenset(found)
+
+
+class DeviceClassificationTable:
+    """Compiled device classification for one process node
+    
+    Built once per process node from lydevices_*.json:
+    - exact-match frozensets per device category (is_a)
+    - one substring matcher over all device names, for cell names that carry the
+      configured name plus a variant prefix/suffix (contains)
+    Results per cell name are kept in LRU caches, so repeated instances cost one lookup.
+    """
+    
+    def __init__(self, process_node: str, config: Dict):
+        self.process_node = process_node
+        self.categories: Dict[str, FrozenSet[str]] = {
+            category: frozenset(config.get(category, []) or []) for category in DEVICE_CATEGORIES
+        }
+        
+        # Device name -> categories listing it
+        self._name_categories: Dict[str, FrozenSet[str]] = {}
+        for category, names in self.categories.items():
+            for name in names:
+                self._name_categories[name] = self._name_categories.get(name, frozenset()) | {category}
+        self._matcher = _SubstringMatcher(sorted(self._name_categories))
+        
+        self.exact_categories = lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)(self._exact_categories)
+        self.contained_categories = lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)(self._contained_categories)
+    
+    def _exact_categories(self, device_type: str) -> FrozenSet[str]:
+        """Get the categories that list device_type exactly"""
+        return self._name_categories.get(device_type, frozenset())
+    
+    def _contained_categories(self, cell_name: str) -> FrozenSet[str]:
+        """Get the categories with at least one device name contained in cell_name"""
+        categories = frozenset()
+        for name in self._matcher.find_all(cell_name):
+            categories |= self._name_categories[name]
+        return categories
+    
+    def is_a(self, device_type: str, *categories: str) -> bool:
+        """Check if device_type is listed in any of the categories (exact match)"""
+        found = self.exact_categories(device_type)
+        return any(category in found for category in categories)
+    
+    def contains(self, cell_name: str, *categories: str) -> bool:
+        """Check if cell_name contains a device name of any of the categories
+        
+        Same result as any(dev in cell_name for dev in <category list>) over the categories.
+        """
+        found = self.contained_categories(cell_name)
+        return any(category in found for category in categories)
+    
+    def cache_info(self) -> Dict[str, Tuple]:
+        """Get the LRU cache statistics of both lookups"""
+        return {"exact": self.exact_categories.cache_info(), "contains": self.contained_categories.cache_info()}
+
+
+def get_classification_table(process_node: str) -> DeviceClassificationTable:
+    """Get the compiled classification table of a process node (built on first use)
+    
+    Args:
+        process_node: Process node string in any format accepted by _normalize_process_node
+    
+    Returns:
+        DeviceClassificationTable shared by all callers
+    """
+    normalized_node = _normalize_process_node(process_node)
+    table = DeviceClassifier._tables.get(normalized_node)
+    if table is None:
+        config = DeviceClassifier._load_device_config_from_file(normalized_node)
+        table = DeviceClassificationTable(normalized_node, config)
+        DeviceClassifier._tables[normalized_node] = table
+    return table
+
+
 class DeviceClassifier:
     """Device Type Classifier - Loads device lists from configuration files"""
     
     # Cache for device lists per process node
     _device_lists_cache = {}
     
+    # Compiled classification tables per process node (see get_classification_table)
+    _tables = {}
+    
     def __init__(self, process_node: str):
         """Initialize classifier with process node
         
@@ -85,31 +221,25 @@ class DeviceClassifier:
         self.process_node = process_node
         # Load device lists for this instance
         self._data = self._get_device_lists(self.process_node)
+        self._table = get_classification_table(self.process_node)
     
     @classmethod
-    def _load_device_config_from_file(cls, process_node: str) -> Dict:
-        """Load device configuration from JSON file in config directory"""
-        # Config file names are lydevices_28.json and lydevices_180.json
-        config_num = _process_node_to_config_file(process_node)
-        config_file = _CONFIG_DIR / f"lydevices_{config_num}.json"
+    def _load_device_config_from_file(cls, process_node: str) -> Mapping:
+        """Load device configuration from the shared process node registry (read-only view)
         
-        if not config_file.exists():
-            raise FileNotFoundError(
-                f"Device configuration file not found: {config_file}. "
-                f"Please ensure the config file exists for process node {process_node}."
-            )
-        
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Failed to parse device configuration file {config_file}: {e}"
-            )
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to load device configuration file {config_file}: {e}"
-            )
+        Raises:
+            FileNotFoundError: If the config file does not exist
+            ValueError: If the config file is not valid JSON
+            RuntimeError: If the config file cannot be read
+        """
+        _process_node_to_config_file(process_node)
+        return get_process_node_registry().get_device_config(process_node, required=True)
+    
+    @classmethod
+    def _drop_cached_node(cls, process_node: str):
+        """Drop the device lists and classification table of a process node (config file changed)"""
+        cls._device_lists_cache.pop(process_node, None)
+        cls._tables.pop(process_node, None)
     
     @classmethod
     def _get_device_lists(cls, process_node: str) -> dict:
@@ -151,62 +281,54 @@ class DeviceClassifier:
     @staticmethod
     def is_digital_device(device_type: str, process_node: str = "T28") -> bool:
         """Check if it's a digital device"""
-        normalized_node = _normalize_process_node(process_node)
-        device_lists = DeviceClassifier._get_device_lists(normalized_node)
-        return device_type in device_lists.get("digital_devices", [])
+        return get_classification_table(process_node).is_a(device_type, "digital_devices")
     
     @staticmethod
     def is_analog_device(device_type: str, process_node: str = "T28") -> bool:
         """Check if it's an analog device"""
-        normalized_node = _normalize_process_node(process_node)
-        device_lists = DeviceClassifier._get_device_lists(normalized_node)
-        return device_type in device_lists.get("analog_devices", [])
+        return get_classification_table(process_node).is_a(device_type, "analog_devices")
     
     @staticmethod
     def is_digital_io_device(device_type: str, process_node: str = "T28") -> bool:
         """Check if it's a digital IO device"""
-        normalized_node = _normalize_process_node(process_node)
-        device_lists = DeviceClassifier._get_device_lists(normalized_node)
-        return device_type in device_lists.get("digital_io", [])
+        return get_classification_table(process_node).is_a(device_type, "digital_io")
     
     @staticmethod
     def is_corner_device(device_type: str, process_node: str = "T28") -> bool:
         """Check if it's a corner component"""
-        normalized_node = _normalize_process_node(process_node)
-        device_lists = DeviceClassifier._get_device_lists(normalized_node)
-        return device_type in device_lists.get("corner_devices", [])
+        return get_classification_table(process_node).is_a(device_type, "corner_devices")
     
     @staticmethod
     def is_filler_device(device_type: str, process_node: str = "T28") -> bool:
         """Check if it's a filler component"""
-        normalized_node = _normalize_process_node(process_node)
-        device_lists = DeviceClassifier._get_device_lists(normalized_node)
-        return device_type in device_lists.get("filler_devices", [])
+        return get_classification_table(process_node).is_a(device_type, "filler_devices")
     
     @staticmethod
     def is_separator_device(device_type: str, process_node: str = "T28") -> bool:
         """Check if it's a separator component"""
-        normalized_node = _normalize_process_node(process_node)
-        device_lists = DeviceClassifier._get_device_lists(normalized_node)
-        return device_type in device_lists.get("cut_devices", [])
+        return get_classification_table(process_node).is_a(device_type, "cut_devices")
     
     # Instance methods (matching merge_source interface)
     def is_filler(self, device_type: str) -> bool:
         """Check if it's a filler component (instance method, matching merge_source)"""
-        return device_type in set(self._data.get('filler_devices', []))
+        return self._table.is_a(device_type, "filler_devices")
     
     def is_corner(self, device_type: str) -> bool:
         """Check if it's a corner component (instance method, matching merge_source)"""
-        return device_type in set(self._data.get('corner_devices', []))
+        return self._table.is_a(device_type, "corner_devices")
     
     def is_digital_device_instance(self, device_type: str) -> bool:
         """Check if it's a digital device (instance method)"""
-        return device_type in set(self._data.get('digital_devices', []))
+        return self._table.is_a(device_type, "digital_devices")
     
     def is_analog_device_instance(self, device_type: str) -> bool:
         """Check if it's an analog device (instance method)"""
-        return device_type in set(self._data.get('analog_devices', []))
+        return self._table.is_a(device_type, "analog_devices")
     
     def is_digital_io_instance(self, device_type: str) -> bool:
         """Check if it's a digital IO device (instance method)"""
-        return device_type in set(self._data.get('digital_io', []))
+        return self._table.is_a(device_type, "digital_io")
+
+
+# Rebuild tables and device lists when the registry reloads a config file
+get_process_node_registry().add_reload_listener(DeviceClassifier._drop_cached_node)
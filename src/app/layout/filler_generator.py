@@ -7,15 +7,15 @@ Loads filler device names from process node configuration
 
 from typing import List, Optional
 from .voltage_domain import VoltageDomainHandler
-from .process_node_config import get_process_node_config
+from .process_node_config import get_process_node_registry
 
 class FillerGenerator:
     """Filler Component Generator"""
     
     @staticmethod
     def _get_filler_devices(process_node: str = "T28") -> dict:
-        """Get filler device names from configuration"""
-        config = get_process_node_config(process_node)
+        """Get filler device names from configuration (shared registry view, no per-call copy)"""
+        config = get_process_node_registry().get_node_config(process_node)
         return config.get("filler_components", {
             "analog_20": "PFILLER20A_G",
             "digital_20": "PFILLER20_G",
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ring Geometry Checker - Local pre-DRC check of the placed IO ring instances
+
+Every placed instance (pad, corner, filler, separator, inner pad) gets a bounding box from
+its device size in the process node configuration (layout_params.device_sizes, else the
+corner size or pad width/height), rotated about the placement point like Virtuoso does:
+
+    R0    [x, x+w] x [y, y+h]          w: width along the ring edge
+    R90   [x-h, x] x [y, y+w]          h: depth into the chip
+    R180  [x-w, x] x [y-h, y]
+    R270  [x, x+h] x [y-w, y]
+
+Checks, all O(n log n) in the number of instances:
+- overlaps:     sweep over x; the boxes crossing the sweep line are kept sorted by y, so
+                each new box is compared only with the boxes within one box height of
+                it (bisect), overlapping ones included
+- out-of-ring:  boxes outside the chip outline spanned by the four corners, or reaching
+                into the core inside the corners
+- gaps:         per side, the parts of the edge between the corners no instance covers
+
+Overlaps and out-of-ring placements fail Calibre DRC and are errors. Gaps are warnings:
+T180 leaves blanks between voltage domains on purpose (they count as covered here), and a
+gap breaks the ring supply rather than a DRC rule. PAD60GU/PAD60NU bond pads share the
+origin and orientation of their IO pad, so the pad boxes cover them.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .device_classifier import get_classification_table
+from .process_node_config import get_process_node_registry
+
+# Coordinates closer than this are considered equal (abutting instances do not overlap)
+EPSILON = 1e-6
+
+_SIDES = ("bottom", "right", "top", "left")
+
+Box = Tuple[float, float, float, float]
+
+
+def instance_bbox(x: float, y: float, orientation: str, width: float, height: float) -> Optional[Box]:
+    """Get the (x0, y0, x1, y1) bounding box of an instance, None for unsupported orientations"""
+    if orientation == "R0":
+        return (x, y, x + width, y + height)
+    if orientation == "R90":
+        return (x - height, y, x, y + width)
+    if orientation == "R180":
+        return (x - width, y - height, x, y)
+    if orientation == "R270":
+        return (x, y - width, x + height, y)
+    return None
+
+
+def _fmt(value: float) -> str:
+    return f"{value:g}"
+
+
+class RingGeometryChecker:
+    """Bounding-box overlap, out-of-ring and gap checker for one process node"""
+
+    def __init__(self, process_node: str = "T28"):
+        config = get_process_node_registry().get_node_config(process_node)
+        self.process_node = process_node
+        self.pad_width = float(config["pad_width"])
+        self.pad_height = float(config["pad_height"])
+        self.corner_size = float(config["corner_size"])
+        self.device_sizes: Dict[str, Tuple[float, float]] = {
+            device: (float(size[0]), float(size[1]))
+            for device, size in config.get("layout_params", {}).get("device_sizes", {}).items()
+        }
+        # Blanks (T180 domain breaks) take the slot of the narrowest filler
+        narrow_filler = config.get("filler_components", {}).get("analog_10")
+        self.blank_size = self.device_sizes.get(narrow_filler, (10.0, self.pad_height))
+        self._table = get_classification_table(process_node)
+
+    def device_size(self, component: Mapping) -> Tuple[float, float]:
+        """Get the (width along the edge, depth) of a placed component in R0"""
+        if component.get("type") == "blank":
+            return self.blank_size
+        device = component.get("device") or ""
+        size = self.device_sizes.get(device)
+        if size is not None:
+            return size
+        if component.get("type") == "corner" or self._table.is_a(device, "corner_devices"):
+            return (self.corner_size, self.corner_size)
+        return (float(component.get("pad_width") or self.pad_width),
+                float(component.get("pad_height") or self.pad_height))
+
+    def check(self, components: Iterable[Mapping]) -> dict:
+        """Check placed components (generate_layout_from_json()["components"])
+
+        Returns:
+            Dict with 'valid' (no errors), 'message', 'errors' and 'warnings' (lists of
+            messages) and 'stats' (instance, overlap, out-of-ring and gap counts, outline)
+        """
+        boxes: List[Box] = []
+        names: List[str] = []
+        corners: List[Box] = []
+        errors: List[str] = []
+        for component in components:
+            position = component.get("position") or [0, 0]
+            name = component.get("name") or f"{component.get('type', 'instance')}@{list(position)}"
+            orientation = component.get("orientation", "R0")
+            width, height = self.device_size(component)
+            box = instance_bbox(float(position[0]), float(position[1]), orientation, width, height)
+            if box is None:
+                errors.append(f"{name}: unsupported orientation {orientation}")
+                continue
+            boxes.append(box)
+            names.append(name)
+            if component.get("type") == "corner":
+                corners.append(box)
+
+        if len(corners) == 4:
+            outline = (min(b[0] for b in corners), min(b[1] for b in corners),
+                       max(b[2] for b in corners), max(b[3] for b in corners))
+            depth = min(min(b[2] - b[0], b[3] - b[1]) for b in corners)
+        else:
+            errors.append(f"Ring has {len(corners)} corners, expected 4")
+            outline = (min((b[0] for b in boxes), default=0.0), min((b[1] for b in boxes), default=0.0),
+                       max((b[2] for b in boxes), default=0.0), max((b[3] for b in boxes), default=0.0))
+            depth = self.pad_height
+
+        overlaps = self._find_overlaps(boxes, names)
+        out_of_ring = self._find_out_of_ring(boxes, names, outline, depth)
+        gaps = self._find_gaps(boxes, outline, depth)
+        errors.extend(overlaps)
+        errors.extend(out_of_ring)
+
+        if errors:
+            parts = []
+            if overlaps:
+                parts.append(f"{len(overlaps)} overlap(s)")
+            if out_of_ring:
+                parts.append(f"{len(out_of_ring)} out-of-ring placement(s)")
+            if len(errors) > len(overlaps) + len(out_of_ring):
+                parts.append(f"{len(errors) - len(overlaps) - len(out_of_ring)} other error(s)")
+            message = "Geometry check failed: " + ", ".join(parts)
+        else:
+            message = f"Geometry check passed: {len(boxes)} instances, no overlaps or out-of-ring placements"
+        if gaps:
+            message += f" ({len(gaps)} gap(s) in the ring)"
+
+        return {
+            "valid": not errors,
+            "message": message,
+            "errors": errors,
+            "warnings": gaps,
+            "stats": {
+                "instances": len(boxes),
+                "overlaps": len(overlaps),
+                "out_of_ring": len(out_of_ring),
+                "gaps": len(gaps),
+                "outline": list(outline),
+            },
+        }
+
+    @staticmethod
+    def _find_overlaps(boxes: List[Box], names: List[str]) -> List[str]:
+        """Sweep over x; active boxes are kept sorted by y0 and may overlap each other in y"""
+        overlaps = []
+        active_y0: List[float] = []
+        active_y1: List[float] = []
+        active_ids: List[int] = []
+        expiry: List[Tuple[float, int]] = []
+        # Tallest box ever made active: no active box starting lower can reach y0
+        max_height = 0.0
+        for index in sorted(range(len(boxes)), key=lambda i: boxes[i][0]):
+            x0, y0, x1, y1 = boxes[index]
+            # Boxes ending at or before this x only abut it
+            while expiry and expiry[0][0] <= x0 + EPSILON:
+                _, done = heapq.heappop(expiry)
+                slot = bisect_left(active_y0, boxes[done][1])
+                while active_ids[slot] != done:
+                    slot += 1
+                del active_y0[slot], active_y1[slot], active_ids[slot]
+
+            first = bisect_left(active_y0, y0 - max_height - EPSILON)
+            last = bisect_left(active_y0, y1 - EPSILON)
+            for slot in range(first, last):
+                if active_y1[slot] <= y0 + EPSILON:
+                    continue
+                other = boxes[active_ids[slot]]
+                dx = min(x1, other[2]) - max(x0, other[0])
+                dy = min(y1, other[3]) - max(y0, other[1])
+                overlaps.append(f"{names[index]} overlaps {names[active_ids[slot]]} by {_fmt(dx)} x {_fmt(dy)}")
+
+            # Every box stays in the sweep, so overlaps chained through an overlapping box are found
+            if x1 - x0 > EPSILON and y1 - y0 > EPSILON:
+                slot = bisect_right(active_y0, y0)
+                active_y0.insert(slot, y0)
+                active_y1.insert(slot, y1)
+                active_ids.insert(slot, index)
+                heapq.heappush(expiry, (x1, index))
+                max_height = max(max_height, y1 - y0)
+        return overlaps
+
+    @staticmethod
+    def _find_out_of_ring(boxes: List[Box], names: List[str], outline: Box, depth: float) -> List[str]:
+        """Boxes outside the chip outline or reaching into the core"""
+        out_of_ring = []
+        core = (outline[0] + depth, outline[1] + depth, outline[2] - depth, outline[3] - depth)
+        for (x0, y0, x1, y1), name in zip(boxes, names):
+            if (x0 < outline[0] - EPSILON or y0 < outline[1] - EPSILON
+                    or x1 > outline[2] + EPSILON or y1 > outline[3] + EPSILON):
+                out_of_ring.append(f"{name} at ({_fmt(x0)}, {_fmt(y0)})-({_fmt(x1)}, {_fmt(y1)}) "
+                                   f"extends outside the chip outline")
+            elif (x0 < core[2] - EPSILON and x1 > core[0] + EPSILON
+                    and y0 < core[3] - EPSILON and y1 > core[1] + EPSILON):
+                out_of_ring.append(f"{name} at ({_fmt(x0)}, {_fmt(y0)})-({_fmt(x1)}, {_fmt(y1)}) "
+                                   f"reaches into the core")
+        return out_of_ring
+
+    @staticmethod
+    def _find_gaps(boxes: List[Box], outline: Box, depth: float) -> List[str]:
+        """Parts of each side between the corners that no instance covers"""
+        ox0, oy0, ox1, oy1 = outline
+        bands = {
+            "bottom": lambda b: b[1] < oy0 + depth - EPSILON and b[3] > oy0 + EPSILON,
+            "right": lambda b: b[2] > ox1 - depth + EPSILON and b[0] < ox1 - EPSILON,
+            "top": lambda b: b[3] > oy1 - depth + EPSILON and b[1] < oy1 - EPSILON,
+            "left": lambda b: b[0] < ox0 + depth - EPSILON and b[2] > ox0 + EPSILON,
+        }
+        gaps = []
+        for side in _SIDES:
+            horizontal = side in ("bottom", "top")
+            start, end = (ox0, ox1) if horizontal else (oy0, oy1)
+            spans = sorted((b[0], b[2]) if horizontal else (b[1], b[3]) for b in boxes if bands[side](b))
+            covered = start
+            axis = "x" if horizontal else "y"
+            for span_start, span_end in spans:
+                if span_start > covered + EPSILON:
+                    gaps.append(f"Gap on the {side} side from {axis}={_fmt(covered)} to {axis}={_fmt(span_start)} "
+                                f"({_fmt(span_start - covered)} wide)")
+                covered = max(covered, span_end)
+            if end > covered + EPSILON:
+                gaps.append(f"Gap on the {side} side from {axis}={_fmt(covered)} to {axis}={_fmt(end)} "
+                            f"({_fmt(end - covered)} wide)")
+        return gaps
+
+
+def check_ring_geometry(components: Iterable[Mapping], process_node: str = "T28") -> dict:
+    """Check placed ring components for overlaps, out-of-ring placements and gaps (see RingGeometryChecker.check)"""
+    return RingGeometryChecker(process_node).check(components)
+
+
+def format_geometry_report(report: dict, max_items: int = 10) -> str:
+    """Format a check_ring_geometry() result, listing at most max_items errors and warnings each"""
+    lines = [("✅ " if report["valid"] else "❌ ") + report["message"]]
+    for title, items in (("Errors", report["errors"]), ("Warnings", report["warnings"])):
+        if items:
+            lines.append(f"  {title}:")
+            lines.extend(f"    - {item}" for item in items[:max_items])
+            if len(items) > max_items:
+                lines.append(f"    ... {len(items) - max_items} more")
+    return "\n".join(lines)
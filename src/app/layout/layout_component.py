@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Layout Component - Compact record for pads, corners, fillers and inner pads
+
+The layout pipeline used to build a fresh dict for every component at every stage.
+LayoutComponent stores the known fields in __slots__ (no per-object dict) and interns
+the strings repeated across a ring (type, device, orientation, domain, view name, IO
+direction), so a ring of thousands of pads shares one string object per device name.
+
+It behaves as a mutable mapping, so code written for the intent-graph dicts
+(component["position"], component.get("type"), "pin_connection" in component) works
+unchanged, and converting from and to the JSON intent-graph form is a field copy:
+
+    component = LayoutComponent.from_dict(instance)
+    instance = component.to_dict()
+
+Keys outside the known fields are kept in a small side dict, so nothing is lost on a
+round trip. A field that was never set is missing, exactly like an absent dict key.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Mapping
+
+_FIELDS = (
+    "type",
+    "name",
+    "device",
+    "position",
+    "orientation",
+    "position_str",
+    "io_direction",
+    "domain",
+    "view_name",
+    "pad_width",
+    "pad_height",
+    "voltage_domain",
+    "pin_connection",
+    "pin_config",
+)
+_FIELD_SET = frozenset(_FIELDS)
+
+# Fields whose values repeat across a ring
+_INTERNED_FIELDS = frozenset(("type", "device", "orientation", "domain", "view_name", "io_direction"))
+
+
+class LayoutComponent(MutableMapping):
+    """Slotted, dict-compatible layout component"""
+
+    __slots__ = _FIELDS + ("_extra",)
+
+    def __init__(self, fields: Mapping[str, Any] = None, **kwargs):
+        self._extra = None
+        if fields:
+            for key, value in fields.items():
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "LayoutComponent":
+        """Build a component from an intent-graph instance or component dict"""
+        return cls(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the component as a plain (JSON-serializable) dict"""
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _FIELD_SET:
+            if key in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _FIELD_SET:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in _FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for key in _FIELDS if hasattr(self, key)) + len(self._extra or ())
+
+    # Fast paths for the lookups the generators do on every component
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra else default
+
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return bool(self._extra) and key in self._extra
+
+    def copy(self) -> "LayoutComponent":
+        """Shallow copy, like dict.copy()"""
+        return LayoutComponent(self)
+
+    def __repr__(self) -> str:
+        return f"LayoutComponent({self.to_dict()!r})"
+
+
+def components_from_dicts(instances: Iterable[Mapping[str, Any]]) -> List[LayoutComponent]:
+    """Convert intent-graph instances to components (components are passed through as-is)"""
+    return [instance if isinstance(instance, LayoutComponent) else LayoutComponent(instance)
+            for instance in instances]
+
+
+def components_to_dicts(components: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert components to plain dicts, e.g. for json.dump"""
+    return [component.to_dict() if isinstance(component, LayoutComponent) else dict(component)
+            for component in components]
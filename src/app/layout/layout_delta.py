@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Layout Delta - Incremental regeneration of IO ring layout scripts
+
+Every layout generated through the factory leaves a pending manifest next to the script
+(<stem>_manifest.pending.json) listing the objects the script creates: instances, paths,
+rects, polygons, vias (with the tech/viaParams/viaDefId statements they depend on) and
+labels. Generating a script does not change what is loaded in Virtuoso, so the pending
+manifest only becomes the manifest of the loaded layout (<stem>_manifest.json) when the
+il runner tools load the script successfully (promote_layout_manifest).
+
+In delta mode the new script is generated as usual, its objects are diffed against the
+manifest of the loaded layout, and a delta script is written that deletes only the objects
+that disappeared or changed and creates only the new ones, so an edit of a few pads (which
+moves their fillers, digital IO wires and labels along) reloads a handful of statements
+instead of clearing the window and loading the whole ring. Loading either the delta or
+the full script promotes the new manifest.
+
+Objects are matched by their SKILL statement, so anything the generators change is
+picked up without per-feature bookkeeping. Instances are deleted by name; anonymous
+shapes, vias and labels are looked up by layer, geometry (0.5 nm tolerance) and text
+through small SKILL helpers defined at the top of the delta script.
+"""
+
+import os
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils.il_differ import parse_il
+from ..utils.skill_compact import expand_compact_lines
+from ..utils.skill_emitter import SkillEmitter
+
+MANIFEST_VERSION = 1
+
+# Above this share of changed objects a full reload is cheaper than a delta
+DEFAULT_MAX_DELTA_RATIO = 0.5
+
+# (setup statements, creating statement)
+LayoutObject = Tuple[Tuple[str, ...], str]
+
+# Statements that are part of every script, not objects
+_FRAME_STATEMENTS = ("cv = geGetWindowCellView()", "dbSave(cv)", "t")
+
+_DELTA_HELPERS = [
+    "procedure(ioDeltaNear(a b) abs(a - b) < 0.0005)",
+    "procedure(ioDeltaSamePoints(points ref) let((same) same = length(points) == length(ref) "
+    "when(same foreach((p r) points ref unless(ioDeltaNear(xCoord(p) xCoord(r)) && ioDeltaNear(yCoord(p) yCoord(r)) same = nil))) same))",
+    "procedure(ioDeltaBBox(points) let((xs ys) xs = mapcar('xCoord points) ys = mapcar('yCoord points) "
+    "list(list(apply('min xs) apply('min ys)) list(apply('max xs) apply('max ys)))))",
+    "procedure(ioDeltaDeleteInst(cv name) let((inst) inst = dbFindAnyInstByName(cv name) when(inst dbDeleteObject(inst))))",
+    "procedure(ioDeltaDeleteShape(cv objType lpp points) let((found) foreach(shape cv~>shapes "
+    "when(!found && shape~>objType == objType && shape~>lpp == lpp && "
+    "if(objType == \"path\" ioDeltaSamePoints(shape~>points points) ioDeltaSamePoints(shape~>bBox ioDeltaBBox(points))) "
+    "found = shape)) when(found dbDeleteObject(found))))",
+    "procedure(ioDeltaDeleteLabel(cv lpp xy text) let((found) foreach(shape cv~>shapes "
+    "when(!found && shape~>objType == \"label\" && shape~>lpp == lpp && shape~>theLabel == text && "
+    "ioDeltaSamePoints(list(shape~>xy) list(xy)) found = shape)) when(found dbDeleteObject(found))))",
+    "procedure(ioDeltaDeleteVia(cv viaDefName xy) let((found) foreach(via cv~>vias "
+    "when(!found && via~>viaHeader~>viaDefName == viaDefName && ioDeltaSamePoints(list(via~>origin) list(xy)) "
+    "found = via)) when(found dbDeleteObject(found))))",
+]
+
+
+def manifest_path_for(output_file: str) -> str:
+    """Get the manifest path of a loaded layout script (<stem>_manifest.json next to it)"""
+    output_path = Path(output_file)
+    return str(output_path.parent / f"{output_path.stem}_manifest.json")
+
+
+def pending_manifest_path_for(script_file: str) -> str:
+    """Get the pending manifest path of a script not loaded yet (<stem>_manifest.pending.json next to it)"""
+    script_path = Path(script_file)
+    return str(script_path.parent / f"{script_path.stem}_manifest.pending.json")
+
+
+def collect_layout_objects(lines: Iterable[str]) -> List[LayoutObject]:
+    """Group the statements of a layout script into objects
+
+    Assignments ("tech = ...", "viaParams = ...") are setup of the next statement that
+    creates an object; comments, blank lines and the cv/dbSave/t frame are skipped.
+    """
+    objects = []
+    setup = []
+    for line in lines:
+        statement = line.strip()
+        if not statement or statement.startswith(";") or statement in _FRAME_STATEMENTS:
+            continue
+        name, sep, _ = statement.partition("=")
+        if sep and name.strip().isidentifier() and not statement.startswith("newVia"):
+            setup.append(statement)
+            continue
+        objects.append((tuple(setup), statement))
+        setup = []
+    return objects
+
+
+def _read_script_objects(script_files: List[str]) -> List[LayoutObject]:
+    lines = []
+    for script_file in script_files:
+        with open(script_file, 'r', encoding='utf-8') as f:
+            lines.extend(f.read().splitlines())
+    # Compact scripts are listed by the statements their placement tables stand for
+    return collect_layout_objects(expand_compact_lines(lines))
+
+
+def write_layout_manifest(output_file: str, script_files: List[str], process_node: str,
+                          hierarchical: bool = False) -> str:
+    """Write the pending manifest of a generated layout script
+
+    Args:
+        output_file: Layout script path (the manifest is written next to it)
+        script_files: Files holding the statements, in load order
+        process_node: Process node of the layout
+        hierarchical: The script places the outer ring through sub-cells (see ring_hierarchy.py)
+
+    Returns:
+        Pending manifest path
+    """
+    manifest_file = pending_manifest_path_for(output_file)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "process_node": process_node,
+        "objects": [[list(setup), statement] for setup, statement in _read_script_objects(script_files)],
+    }
+    if hierarchical:
+        manifest["hierarchical"] = True
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    return manifest_file
+
+
+def write_delta_manifest(delta_file: str, output_file: str) -> str:
+    """Pend the manifest of output_file on its delta script as well
+
+    Loading the delta into the previously loaded layout gives the same objects as loading
+    output_file, so promoting either pending manifest records the new layout as loaded.
+
+    Returns:
+        Pending manifest path of the delta script
+    """
+    with open(pending_manifest_path_for(output_file), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    delta_manifest_file = pending_manifest_path_for(delta_file)
+    # Relative to the pending manifest, so the pair can be moved together
+    manifest["loaded_manifest"] = os.path.relpath(manifest_path_for(output_file), Path(delta_manifest_file).parent)
+    with open(delta_manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    return delta_manifest_file
+
+
+def promote_layout_manifest(script_file: str) -> Optional[str]:
+    """Record the pending manifest of a script loaded into Virtuoso as the loaded layout
+
+    Args:
+        script_file: Full or delta layout script that was loaded successfully
+
+    Returns:
+        Path of the manifest of the loaded layout, None if the script has no pending manifest
+    """
+    pending_file = pending_manifest_path_for(script_file)
+    try:
+        with open(pending_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    loaded_manifest = manifest.pop("loaded_manifest", None)
+    if loaded_manifest is None:
+        manifest_file = manifest_path_for(script_file)
+    else:
+        manifest_file = str(Path(pending_file).parent / loaded_manifest)
+    # Write then rename, so an interrupted promotion never leaves a truncated manifest
+    staging_file = f"{manifest_file}.tmp"
+    with open(staging_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(staging_file, manifest_file)
+    return manifest_file
+
+
+def load_layout_manifest(manifest_file: str) -> Optional[Dict]:
+    """Load a manifest, None if it is missing, unreadable or from another manifest version"""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    manifest["objects"] = [(tuple(setup), statement) for setup, statement in manifest.get("objects", [])]
+    return manifest
+
+
+def diff_layout_objects(old_objects: List[LayoutObject], new_objects: List[LayoutObject]) -> Tuple[List[LayoutObject], List[LayoutObject]]:
+    """Diff two object lists as multisets
+
+    Returns:
+        (removed, added), each in script order
+    """
+    remaining_new = Counter(new_objects)
+    removed = []
+    for obj in old_objects:
+        if remaining_new[obj]:
+            remaining_new[obj] -= 1
+        else:
+            removed.append(obj)
+    remaining_old = Counter(old_objects)
+    added = []
+    for obj in new_objects:
+        if remaining_old[obj]:
+            remaining_old[obj] -= 1
+        else:
+            added.append(obj)
+    return removed, added
+
+
+def _skill_points(values: List[float]) -> str:
+    return "list(" + " ".join(f"list({x:g} {y:g})" for x, y in zip(values[0::2], values[1::2])) + ")"
+
+
+def delete_statement(obj: LayoutObject) -> Optional[str]:
+    """Build the SKILL statement deleting the object created by obj (None if it creates nothing known)"""
+    setup, statement = obj
+    records = parse_il("\n".join(setup + (statement,)))
+    if not records:
+        return None
+    record = records[0]
+    kind = record["kind"]
+    if kind == "instance":
+        return f'ioDeltaDeleteInst(cv "{record["name"]}")'
+    if kind == "label":
+        layer, purpose = record["master"].split("/")
+        x, y = record["position"]
+        return f'ioDeltaDeleteLabel(cv list("{layer}" "{purpose}") list({x:g} {y:g}) "{record["name"]}")'
+    if kind == "via":
+        x, y, _ = record["geometry"]
+        return f'ioDeltaDeleteVia(cv "{record["master"]}" list({x:g} {y:g}))'
+    if kind in ("path", "rect", "polygon"):
+        layer, purpose = record["master"].split("/")
+        numbers = [v for v in record["geometry"] if not isinstance(v, str)]
+        if kind == "path":
+            numbers = numbers[:-1]  # trailing width
+        return f'ioDeltaDeleteShape(cv "{kind}" list("{layer}" "{purpose}") {_skill_points(numbers)})'
+    return None
+
+
+def write_delta_script(removed: List[LayoutObject], added: List[LayoutObject], delta_file: str) -> Dict[str, int]:
+    """Write the SKILL script turning the previous layout into the new one
+
+    Returns:
+        Dict with 'deleted' and 'created' object counts
+    """
+    with SkillEmitter(delta_file, preamble=["cv = geGetWindowCellView()"]) as emitter:
+        emitter.emit(f"; Incremental layout update: {len(removed)} objects deleted, {len(added)} created")
+        emitter.emit_all(_DELTA_HELPERS)
+        emitter.emit("")
+        emitter.emit("; ==================== Deleted Objects ====================")
+        deleted = 0
+        for obj in removed:
+            statement = delete_statement(obj)
+            if statement:
+                emitter.emit(statement)
+                deleted += 1
+        emitter.emit("")
+        emitter.emit("; ==================== Created Objects ====================")
+        previous_setup = ()
+        for setup, statement in added:
+            # Consecutive vias share their setup statements
+            if setup and setup != previous_setup:
+                emitter.emit_all(setup)
+            previous_setup = setup or previous_setup
+            emitter.emit(statement)
+        emitter.emit("")
+        emitter.emit("dbSave(cv)")
+        emitter.emit("t")
+    return {"deleted": deleted, "created": len(added)}
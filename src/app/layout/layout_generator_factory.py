@@ -4,8 +4,15 @@
 Layout Generator Factory - Creates process node-specific generators
 """
 
+from pathlib import Path
+from typing import Callable, Optional
+
 from .T28.layout_generator import LayoutGeneratorT28, generate_layout_from_json as generate_T28
 from .T180.layout_generator import LayoutGeneratorT180, generate_layout_from_json as generate_T180
+from .layout_validator import LayoutValidator
+from .layout_delta import (DEFAULT_MAX_DELTA_RATIO, diff_layout_objects, load_layout_manifest, manifest_path_for,
+                           pending_manifest_path_for, write_delta_manifest, write_delta_script, write_layout_manifest)
+from .ring_hierarchy import write_hierarchy_manifest
 
 
 def create_layout_generator(process_node: str = "T28"):
@@ -23,18 +30,113 @@ def create_layout_generator(process_node: str = "T28"):
         return LayoutGeneratorT28()
 
 
-def generate_layout_from_json(json_file: str, output_file: str = "generated_layout.il", process_node: str = "T28"):
+def generate_layout_from_json(json_file: str, output_file: str = "generated_layout.il", process_node: str = "T28",
+                              max_chunk_bytes: Optional[int] = None,
+                              on_chunk: Optional[Callable[[str], None]] = None,
+                              compact: bool = False, hierarchical: bool = False):
     """Generate layout from JSON file using process node-specific generator
     
     Args:
         json_file: Path to intent graph JSON file
         output_file: Path to output SKILL file
         process_node: Process node to use ("T28" or "T180", default: "T28")
+        max_chunk_bytes: Split the SKILL script into chunks of about this size (default: single file)
+        on_chunk: Called with each finished chunk path while the script is being generated
+        compact: Write instances, paths and labels as placement tables with one foreach
+            loop per batch (see src/app/utils/skill_compact.py)
+        hierarchical: Write pads, bond pads and fillers into generated per-side sub-cells
+            (see ring_hierarchy.py)
+    
+    Returns:
+        Dict with 'output_file', 'chunk_files', 'components', 'visualization_file',
+        'manifest_file' (pending manifest of the objects created by the script, promoted
+        when the script is loaded, see layout_delta.py),
+        'hierarchy_file' (flat instance name -> hierarchical path, None unless hierarchical)
+        and 'geometry_check' (pre-DRC overlap/gap check, see geometry_checker.py), or None if
+        layout rule validation failed
     """
     if process_node == "T180":
-        return generate_T180(json_file, output_file)
+        result = generate_T180(json_file, output_file, max_chunk_bytes=max_chunk_bytes, on_chunk=on_chunk,
+                               compact=compact, hierarchical=hierarchical)
     else:
-        return generate_T28(json_file, output_file)
+        result = generate_T28(json_file, output_file, max_chunk_bytes=max_chunk_bytes, on_chunk=on_chunk,
+                              compact=compact, hierarchical=hierarchical)
+    if result is not None:
+        result["manifest_file"] = write_layout_manifest(output_file, result["chunk_files"], process_node,
+                                                        hierarchical=hierarchical)
+        result["hierarchy_file"] = None
+        if result.get("hierarchy") is not None:
+            result["hierarchy_file"] = write_hierarchy_manifest(output_file, result["hierarchy"])
+        result["geometry_check"] = LayoutValidator.validate_geometry(result["components"], process_node)
+        print(("📐 " if result["geometry_check"]["valid"] else "❌ ") + result["geometry_check"]["message"])
+    return result
+
+
+def generate_layout_delta(json_file: str, output_file: str = "generated_layout.il", process_node: str = "T28",
+                          delta_file: Optional[str] = None, max_delta_ratio: float = DEFAULT_MAX_DELTA_RATIO,
+                          compact: bool = False, hierarchical: bool = False):
+    """Regenerate a layout and write a delta script against the loaded layout
+    
+    The full script, visualization and pending manifest at output_file are regenerated as
+    usual; the delta script only deletes and recreates the objects that changed since the
+    layout of output_file that was last loaded into Virtuoso (its promoted manifest).
+    Loading either script promotes the new manifest.
+    
+    Args:
+        json_file: Path to intent graph JSON file
+        output_file: Path to output SKILL file (same path as the loaded generation)
+        process_node: Process node to use ("T28" or "T180", default: "T28")
+        delta_file: Path to delta SKILL file (default: <stem>_delta.il next to output_file)
+        max_delta_ratio: Fall back to a full reload when more than this share of the
+            objects changed
+        compact: Write the full script in compact mode (the delta script is always spelled out)
+        hierarchical: Write the full script with per-side sub-cells; hierarchical layouts
+            (now or in the loaded layout) are always reloaded in full
+    
+    Returns:
+        Dict as returned by generate_layout_from_json, plus 'delta_file' (None when a full
+        reload is needed), 'deleted', 'created', 'unchanged' and 'full_reload_reason', or
+        None if layout rule validation failed
+    """
+    if delta_file is None:
+        output_path = Path(output_file)
+        delta_file = str(output_path.parent / f"{output_path.stem}_delta.il")
+    # A delta left by an earlier call no longer applies, whichever script gets loaded next
+    Path(pending_manifest_path_for(delta_file)).unlink(missing_ok=True)
+    previous = load_layout_manifest(manifest_path_for(output_file))
+    
+    result = generate_layout_from_json(json_file, output_file, process_node, compact=compact,
+                                       hierarchical=hierarchical)
+    if result is None:
+        return None
+    
+    current = load_layout_manifest(result["manifest_file"])
+    result.update({"delta_file": None, "deleted": 0, "created": len(current["objects"]), "unchanged": 0,
+                   "full_reload_reason": None})
+    if previous is None:
+        result["full_reload_reason"] = "no manifest of a loaded layout"
+        return result
+    if previous.get("process_node") != process_node:
+        result["full_reload_reason"] = f"loaded layout used {previous.get('process_node')}"
+        return result
+    if hierarchical or previous.get("hierarchical"):
+        # Deltas delete and create top cell objects, the sub-cells are regenerated as a whole
+        result["full_reload_reason"] = "hierarchical layout"
+        return result
+    
+    removed, added = diff_layout_objects(previous["objects"], current["objects"])
+    unchanged = len(current["objects"]) - len(added)
+    result.update({"deleted": len(removed), "created": len(added), "unchanged": unchanged})
+    if len(removed) + len(added) > max_delta_ratio * max(len(current["objects"]), 1):
+        result["full_reload_reason"] = f"{len(removed)} deleted and {len(added)} created of {len(current['objects'])} objects"
+        return result
+    
+    counts = write_delta_script(removed, added, delta_file)
+    write_delta_manifest(delta_file, output_file)
+    result.update({"delta_file": delta_file, "deleted": counts["deleted"]})
+    print(f"⚡ Delta script generated: {delta_file} ({counts['deleted']} deleted, {counts['created']} created, "
+          f"{unchanged} unchanged)")
+    return result
 
 
 def validate_layout_config(json_file: str, process_node: str = "T28") -> dict:
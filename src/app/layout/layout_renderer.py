@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Layout Renderer - Shared drawing backends for the T28 and T180 layout visualizers
+
+The visualizers describe what to draw as a list of items (one rectangle plus its label per
+device) and a legend; this module turns them into a PNG. matplotlib is only imported when
+a render is actually requested, so importing the layout generators and tools stays cheap.
+
+Backends:
+- "collection" (default): all device rectangles and label backgrounds are drawn through
+  batched PatchCollections, labels are plain text, the figure layout is fixed up front and
+  the canvas is drawn exactly once before being written as an RGB PNG with fast compression
+- "artist": one matplotlib patch and one boxed text artist per device, tight_layout and
+  bbox_inches='tight' (the original per-artist rendering, kept for comparison)
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+RENDER_BACKENDS = ("collection", "artist")
+DEFAULT_RENDER_BACKEND = "collection"
+
+# Figure scale shared by both backends: 50 layout units per inch, saved at 150 dpi
+UNITS_PER_INCH = 50
+RENDER_DPI = 150
+
+# zlib level used by the collection backend (1 = fastest, still lossless)
+PNG_COMPRESS_LEVEL = 1
+
+_pyplot = None
+
+
+def _import_pyplot():
+    """Import matplotlib.pyplot on first use"""
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+
+def _legend_handles(legend_entries: List[Dict]) -> List:
+    """Build legend patches from (facecolor, edgecolor, label, linestyle) entries"""
+    from matplotlib.patches import Patch
+    return [Patch(facecolor=entry["facecolor"], edgecolor=entry.get("edgecolor", "black"),
+                  linestyle=entry.get("linestyle", "-"), label=entry["label"])
+            for entry in legend_entries]
+
+
+def render_layout_items(items: List[Dict], bounds: Tuple[float, float, float, float], title: str,
+                        legend_entries: List[Dict], output_path: str,
+                        backend: Optional[str] = None) -> str:
+    """
+    Render layout items to a PNG file
+
+    Args:
+        items: Items to draw, each a dictionary with:
+            - rect: (x, y, width, height) in layout units
+            - facecolor: fill color
+            - alpha: fill and border opacity
+            - linestyle: '-' or '--' (dashed border)
+            - label: text drawn at the rectangle center
+            - fontsize, rotation, fontweight: label style
+            - label_box: draw a white background behind the label
+        bounds: Visible area (min_x, max_x, min_y, max_y) in layout units
+        title: Figure title
+        legend_entries: Legend rows, each with facecolor, label and optional edgecolor, linestyle
+        output_path: Output path for the image
+        backend: "collection" or "artist" (default: DEFAULT_RENDER_BACKEND)
+
+    Returns:
+        Path to generated image file
+    """
+    backend = backend or DEFAULT_RENDER_BACKEND
+    if backend not in RENDER_BACKENDS:
+        raise ValueError(f"Unknown render backend '{backend}', expected one of {', '.join(RENDER_BACKENDS)}")
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if backend == "artist":
+        _render_artists(items, bounds, title, legend_entries, output_path)
+    else:
+        _render_collections(items, bounds, title, legend_entries, output_path)
+    return str(output_path)
+
+
+def _render_artists(items: List[Dict], bounds: Tuple[float, float, float, float], title: str,
+                    legend_entries: List[Dict], output_path: Path):
+    """Draw one patch and one text artist per item"""
+    plt = _import_pyplot()
+    from matplotlib.patches import Rectangle
+
+    min_x, max_x, min_y, max_y = bounds
+    fig, ax = plt.subplots(1, 1, figsize=((max_x - min_x) / UNITS_PER_INCH, (max_y - min_y) / UNITS_PER_INCH))
+    ax.set_xlim(min_x, max_x)
+    ax.set_ylim(min_y, max_y)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    for item in items:
+        rect_x, rect_y, rect_w, rect_h = item["rect"]
+        ax.add_patch(Rectangle((rect_x, rect_y), rect_w, rect_h,
+                               linewidth=2, edgecolor='black', facecolor=item["facecolor"],
+                               alpha=item["alpha"], linestyle=item["linestyle"]))
+        text_kwargs = {}
+        if item["label_box"]:
+            text_kwargs["bbox"] = dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8, edgecolor='none')
+        ax.text(rect_x + rect_w / 2, rect_y + rect_h / 2, item["label"],
+                ha='center', va='center', rotation=item["rotation"], rotation_mode='anchor',
+                fontsize=item["fontsize"], fontweight=item["fontweight"], color='black', **text_kwargs)
+
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+    if legend_entries:
+        ax.legend(handles=_legend_handles(legend_entries), loc='upper left', bbox_to_anchor=(1.02, 1.0),
+                  fontsize=8, frameon=True, fancybox=True, shadow=False, handlelength=1.5)
+
+    plt.tight_layout(rect=[0, 0, 0.85, 1])
+    plt.savefig(output_path, dpi=RENDER_DPI, bbox_inches='tight')
+    plt.close(fig)
+
+
+def _render_collections(items: List[Dict], bounds: Tuple[float, float, float, float], title: str,
+                        legend_entries: List[Dict], output_path: Path):
+    """Draw all items through batched collections with a fixed layout and a single canvas draw"""
+    from PIL import Image
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import PatchCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.patches import Rectangle
+
+    min_x, max_x, min_y, max_y = bounds
+    nominal_w = (max_x - min_x) / UNITS_PER_INCH
+    nominal_h = (max_y - min_y) / UNITS_PER_INCH
+
+    # Fixed layout in inches: margin | ring | gap | legend | margin, title strip on top.
+    # The ring is scaled the way tight_layout(rect=[0, 0, 0.85, 1]) scales it in the artist
+    # backend, so both backends produce images of about the same size; the legend size is
+    # estimated from its rows instead of measured by a layout pass.
+    margin, gap, title_h = 0.2, 0.2, 0.6
+    scale = min((0.85 * nominal_w - margin) / nominal_w, (nominal_h - title_h - margin) / nominal_h)
+    axes_w = nominal_w * scale
+    axes_h = nominal_h * scale
+    longest = max((len(entry["label"]) for entry in legend_entries), default=0)
+    legend_w = 0.8 + longest * 8 * 0.6 / 72 if legend_entries else 0.0
+    legend_h = 0.3 + len(legend_entries) * 8 * 1.75 / 72 if legend_entries else 0.0
+    fig_w = margin + axes_w + gap + legend_w + margin
+    fig_h = max(margin + axes_h + title_h, margin + legend_h + title_h)
+
+    fig = Figure(figsize=(fig_w, fig_h), dpi=RENDER_DPI)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes([margin / fig_w, (fig_h - title_h - axes_h) / fig_h, axes_w / fig_w, axes_h / fig_h])
+    ax.set_xlim(min_x, max_x)
+    ax.set_ylim(min_y, max_y)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    # Device rectangles: one collection, per-item colors and border styles
+    ax.add_collection(PatchCollection(
+        [Rectangle(item["rect"][:2], item["rect"][2], item["rect"][3]) for item in items],
+        facecolors=[to_rgba(item["facecolor"], item["alpha"]) for item in items],
+        edgecolors=[(0.0, 0.0, 0.0, item["alpha"]) for item in items],
+        linestyles=[item["linestyle"] for item in items],
+        linewidths=2, zorder=1))
+
+    # Label backgrounds: size estimated from the label length and font size in points
+    points_per_unit = 72 * axes_w / (max_x - min_x)
+    boxes = []
+    for item in items:
+        if not item["label_box"]:
+            continue
+        rect_x, rect_y, rect_w, rect_h = item["rect"]
+        text_w = (len(item["label"]) * 0.7 + 0.4) * item["fontsize"] / points_per_unit
+        text_h = 1.6 * item["fontsize"] / points_per_unit
+        if item["rotation"] == 90:
+            text_w, text_h = text_h, text_w
+        boxes.append(Rectangle((rect_x + (rect_w - text_w) / 2, rect_y + (rect_h - text_h) / 2), text_w, text_h))
+    if boxes:
+        ax.add_collection(PatchCollection(boxes, facecolors=(1.0, 1.0, 1.0, 0.8), edgecolors='none', zorder=2))
+
+    for item in items:
+        rect_x, rect_y, rect_w, rect_h = item["rect"]
+        ax.text(rect_x + rect_w / 2, rect_y + rect_h / 2, item["label"],
+                ha='center', va='center', rotation=item["rotation"], rotation_mode='anchor',
+                fontsize=item["fontsize"], fontweight=item["fontweight"], color='black', zorder=3)
+
+    fig.suptitle(title, fontsize=14, fontweight='bold', x=(margin + axes_w / 2) / fig_w, y=1 - 0.1 / fig_h, va='top')
+    if legend_entries:
+        fig.legend(handles=_legend_handles(legend_entries), loc='upper left',
+                   bbox_to_anchor=((margin + axes_w + gap) / fig_w, 1 - title_h / fig_h),
+                   fontsize=8, frameon=True, fancybox=True, shadow=False, handlelength=1.5)
+
+    # The figure background is opaque, so dropping alpha loses nothing and shrinks the PNG
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    image = Image.frombuffer("RGBA", (width, height), canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+    image.convert("RGB").save(output_path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
@@ -6,6 +6,8 @@ Layout Validation Module
 
 from typing import List, Dict
 
+from .geometry_checker import check_ring_geometry
+
 class LayoutValidator:
     """Layout Validator"""
     
@@ -84,4 +86,17 @@ class LayoutValidator:
                 "bottom_count": bottom_count,
                 "total_components": len(layout_components)
             }
-        } 
\ No newline at end of file
+        } 
+
+    @staticmethod
+    def validate_geometry(layout_components: List[dict], process_node: str = "T28") -> dict:
+        """Check placed components for overlapping, out-of-ring and missing instances
+
+        Args:
+            layout_components: Placed components with absolute positions and orientations
+            process_node: Process node whose device sizes are used ("T28" or "T180")
+
+        Returns:
+            Dict with 'valid', 'message', 'errors', 'warnings' and 'stats' (see geometry_checker.py)
+        """
+        return check_ring_geometry(layout_components, process_node)
@@ -4,7 +4,21 @@
 Position Calculation Module
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+_EDGE_SIDES = ("top", "bottom", "left", "right")
+
+# Pad orientation on each edge
+_EDGE_ORIENTATIONS = {"top": "R180", "bottom": "R0", "left": "R270", "right": "R90"}
+
+# Corner position -> (at chip_width, at chip_height, orientation)
+_CORNER_POSITIONS = {
+    "top_left": (False, True, "R270"),
+    "top_right": (True, True, "R180"),
+    "bottom_left": (False, False, "R0"),
+    "bottom_right": (True, False, "R90"),
+}
+
 
 class PositionCalculator:
     """Position Calculator"""
@@ -43,83 +57,115 @@ class PositionCalculator:
         
         return width, height
     
-    def calculate_position_from_relative(self, relative_position: str, ring_config: dict, instance: dict = None) -> tuple:
-        """Calculate actual coordinates and orientation based on relative position, supporting clockwise/counterclockwise"""
-        # Use fixed technology parameters from default configuration (matching merge_source)
-        if instance:
-            pad_width = instance.get("pad_width", 80)
-            pad_height = instance.get("pad_height", 120)
-            corner_size = instance.get("corner_size", 130)
-        else:
-            pad_width = self.config.get("pad_width", 80)
-            pad_height = self.config.get("pad_height", 120)
-            corner_size = self.config.get("corner_size", 130)
-        
-        # Get chip dimensions and counts from ring_config (matching merge_source)
-        chip_width = ring_config.get("chip_width", 2250)
-        chip_height = ring_config.get("chip_height", 2160)
-        pad_spacing = ring_config.get("pad_spacing", 90)
-        placement_order = ring_config.get("placement_order", "counterclockwise")
-        top_count = ring_config.get("top_count", 12)
-        bottom_count = ring_config.get("bottom_count", 12)
-        left_count = ring_config.get("left_count", 12)
-        right_count = ring_config.get("right_count", 12)
-        
+    def _ring_parameters(self, ring_config: dict) -> dict:
+        """Read the ring_config keys used by the position engine (defaults matching merge_source)"""
         # Get process_node to determine offset from config
         process_node = ring_config.get("process_node", self.config.get("process_node", "T28"))
         layout_params = ring_config.get("layout_params", {})
-        offset = layout_params.get("pad_offset", 20 if process_node == "T28" else 10)
-
-        # Parse relative positions
-        if relative_position == "top_left":
-            return ([0, chip_height], "R270")
-        elif relative_position == "top_right":
-            return ([chip_width, chip_height], "R180")
-        elif relative_position == "bottom_left":
-            return ([0, 0], "R0")
-        elif relative_position == "bottom_right":
-            return ([chip_width, 0], "R90")
-
-        # Parse edge positions (28nm: no offset, 180nm: +10 offset)
-        if relative_position.startswith("top_"):
-            index = int(relative_position.split("_")[1])
-            if placement_order == "clockwise":
-                real_index = index
+        return {
+            "chip_width": ring_config.get("chip_width", 2250),
+            "chip_height": ring_config.get("chip_height", 2160),
+            "pad_spacing": ring_config.get("pad_spacing", 90),
+            "clockwise": ring_config.get("placement_order", "counterclockwise") == "clockwise",
+            "counts": {side: ring_config.get(f"{side}_count", 12) for side in _EDGE_SIDES},
+            "offset": layout_params.get("pad_offset", 20 if process_node == "T28" else 10),
+        }
+    
+    def calculate_positions_from_relative(self, relative_positions: List[str], ring_config: dict,
+                                          instances: Optional[List[dict]] = None) -> List[tuple]:
+        """Calculate actual coordinates and orientations of a whole ring at once
+        
+        Positions are grouped by side and each side is computed with NumPy arrays; the ring
+        parameters are read once per call.
+        
+        Args:
+            relative_positions: "side_index" or corner positions ("top_left", ...)
+            ring_config: Ring configuration (chip size, pad counts, spacing, placement order)
+            instances: Instances parallel to relative_positions; their pad_width and corner_size
+                override the configuration (180nm), None uses the configuration for all (28nm)
+        
+        Returns:
+            List of ([x, y], orientation), parallel to relative_positions
+        """
+        # numpy is imported on first use so that importing the layout package stays cheap
+        import numpy as np
+        
+        params = self._ring_parameters(ring_config)
+        chip_width = params["chip_width"]
+        chip_height = params["chip_height"]
+        
+        results = [None] * len(relative_positions)
+        side_slots = {side: [] for side in _EDGE_SIDES}
+        side_indices = {side: [] for side in _EDGE_SIDES}
+        for slot, relative_position in enumerate(relative_positions):
+            corner = _CORNER_POSITIONS.get(relative_position)
+            if corner:
+                at_width, at_height, orientation = corner
+                results[slot] = ([chip_width if at_width else 0, chip_height if at_height else 0], orientation)
+                continue
+            side, separator, rest = relative_position.partition("_")
+            if separator and side in side_slots:
+                side_slots[side].append(slot)
+                side_indices[side].append(int(rest.partition("_")[0]))
             else:
-                real_index = (top_count - 1) - index
-            x = corner_size + real_index * pad_spacing + pad_width + offset
-            y = chip_height
-            return ([x, y], "R180")
-        elif relative_position.startswith("bottom_"):
-            index = int(relative_position.split("_")[1])
-            if placement_order == "clockwise":
-                real_index = index
+                # Default return to origin
+                results[slot] = ([0, 0], "R0")
+        
+        # A coordinate is a float if any of its operands is one, as with the scalar formulas
+        shared_float = isinstance(params["pad_spacing"], float) or isinstance(params["offset"], float)
+        for side in _EDGE_SIDES:
+            slots = side_slots[side]
+            if not slots:
+                continue
+            count = params["counts"][side]
+            index = np.array(side_indices[side], dtype=np.float64)
+            real_index = index if params["clockwise"] else (count - 1) - index
+            is_float = shared_float or (not params["clockwise"] and isinstance(count, float))
+            
+            if instances:
+                sources = [instances[slot] or self.config for slot in slots]
+                pad_width = [source.get("pad_width", 80) for source in sources]
+                corner_size = [source.get("corner_size", 130) for source in sources]
+                element_float = np.array([isinstance(w, float) or isinstance(c, float)
+                                          for w, c in zip(pad_width, corner_size)])
+                pad_width = np.array(pad_width, dtype=np.float64)
+                corner_size = np.array(corner_size, dtype=np.float64)
             else:
-                real_index = (bottom_count - 1) - index
-            x = chip_width - corner_size - real_index * pad_spacing - pad_width - offset
-            y = 0
-            return ([x, y], "R0")
-        elif relative_position.startswith("left_"):
-            index = int(relative_position.split("_")[1])
-            if placement_order == "clockwise":
-                real_index = index
+                pad_width = self.config.get("pad_width", 80)
+                corner_size = self.config.get("corner_size", 130)
+                element_float = np.array(isinstance(pad_width, float) or isinstance(corner_size, float))
+            
+            # Same operand order as the scalar formulas, so float results are bit-identical
+            if side in ("top", "left"):
+                along = corner_size + real_index * params["pad_spacing"] + pad_width + params["offset"]
+                fixed = chip_height if side == "top" else 0
             else:
-                real_index = (left_count - 1) - index
-            x = 0
-            y = corner_size + real_index * pad_spacing + pad_width + offset
-            return ([x, y], "R270")
-        elif relative_position.startswith("right_"):
-            index = int(relative_position.split("_")[1])
-            if placement_order == "clockwise":
-                real_index = index
+                extent = chip_width if side == "bottom" else chip_height
+                along = extent - corner_size - real_index * params["pad_spacing"] - pad_width - params["offset"]
+                fixed = 0 if side == "bottom" else chip_width
+                is_float = is_float or isinstance(extent, float)
+            
+            if is_float or element_float.all():
+                values = along.tolist()
+            elif not element_float.any():
+                values = along.astype(np.int64).tolist()
             else:
-                real_index = (right_count - 1) - index
-            x = chip_width
-            y = chip_height - corner_size - real_index * pad_spacing - pad_width - offset
-            return ([x, y], "R90")
-
-        # Default return to origin
-        return ([0, 0], "R0")
+                values = [value if value_is_float else int(value)
+                          for value, value_is_float in zip(along.tolist(), element_float.tolist())]
+            
+            orientation = _EDGE_ORIENTATIONS[side]
+            if side in ("top", "bottom"):
+                for slot, value in zip(slots, values):
+                    results[slot] = ([value, fixed], orientation)
+            else:
+                for slot, value in zip(slots, values):
+                    results[slot] = ([fixed, value], orientation)
+        
+        return results
+    
+    def calculate_position_from_relative(self, relative_position: str, ring_config: dict, instance: dict = None) -> tuple:
+        """Calculate actual coordinates and orientation based on relative position, supporting clockwise/counterclockwise"""
+        return self.calculate_positions_from_relative([relative_position], ring_config, [instance])[0]
     
     def calculate_filler_position(self, pos1: list, pos2: list, orientation: str, filler_index: int = 0) -> list:
         """Calculate filler position"""
@@ -3,12 +3,22 @@
 """
 Process Node Configuration - Support multiple process nodes (28nm and 180nm)
 Loads configuration from JSON files for better maintainability
+
+Each node's lydevices_*.json is parsed once into a process-wide registry
+(get_process_node_registry) that hands out read-only views. The registry checks the
+file's mtime and size on every lookup and reloads it when it changed, so editing a
+config file takes effect without restarting the agent.
+
+get_process_node_config returns a mutable copy (plain dicts and lists) as before;
+internal hot paths read the registry views directly.
 """
 
 import os
 import json
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
 
 # Get config directory path
 # process_node_config.py is in src/app/layout/
@@ -32,20 +42,9 @@ def _process_node_to_config_file(process_node: str) -> str:
         raise ValueError(f"Invalid process node: {process_node}")
 
 
-def _load_device_config(process_node: str) -> Optional[Dict[str, Any]]:
-    """Load device configuration from JSON file"""
-    # Config file names are lydevices_28.json and lydevices_180.json
-    config_num = _process_node_to_config_file(process_node)
-    config_file = _CONFIG_DIR / f"lydevices_{config_num}.json"
-    
-    if not config_file.exists():
-        return None
-    
-    try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return None
+def _load_device_config(process_node: str) -> Optional[Mapping[str, Any]]:
+    """Load device configuration from JSON file (read-only view, None if missing or invalid)"""
+    return get_process_node_registry().get_device_config(process_node)
 
 
 # Base configuration (fallback if JSON files not found)
@@ -119,18 +118,15 @@ def get_process_node_config(process_node: str = "T28") -> Dict[str, Any]:
     Raises:
         ValueError: If process node is not supported
     """
-    if process_node not in PROCESS_NODE_CONFIGS:
-        supported = list(PROCESS_NODE_CONFIGS.keys())
-        raise ValueError(
-            f"Unsupported process node: {process_node}. "
-            f"Supported nodes: {', '.join(supported)}"
-        )
-    
+    # Callers may mutate, extend or serialize it, so it is built from the parsed view, not shared
+    return _thaw(get_process_node_registry().get_node_config(process_node))
+
+
+def _merge_node_config(process_node: str, device_config: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Merge the device configuration of a process node into its base configuration"""
     # Start with base config
     config = PROCESS_NODE_CONFIGS[process_node].copy()
     
-    # Try to load from JSON file and merge
-    device_config = _load_device_config(process_node)
     if device_config:
         # Merge layout_params if present
         if "layout_params" in device_config:
@@ -185,6 +181,152 @@ def get_process_node_config(process_node: str = "T28") -> Dict[str, Any]:
     return config
 
 
+def _freeze(value: Any) -> Any:
+    """Get a read-only copy of a JSON value (dicts become mapping proxies, lists tuples)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Get a mutable copy of a read-only value (mapping proxies become dicts, tuples lists)"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class ProcessNodeRegistry:
+    """Process-wide, mtime-invalidated cache of process node configurations
+    
+    Per process node it keeps the parsed lydevices_*.json and the configuration merged
+    into PROCESS_NODE_CONFIGS, both as read-only views. Every lookup compares the
+    file's (mtime, size) with the loaded one and reloads on change; reload listeners
+    are then called with the process node, so derived caches (classification tables,
+    device lists) can be dropped.
+    """
+    
+    def __init__(self, config_dir: Path = _CONFIG_DIR):
+        self.config_dir = Path(config_dir)
+        self._lock = threading.Lock()
+        # process node -> (file stamp, device config view or None, load error or None, merged config view)
+        self._entries: Dict[str, Tuple] = {}
+        self._files: Dict[str, Path] = {}
+        self._versions: Dict[str, int] = {}
+        self._listeners: List[Callable[[str], None]] = []
+    
+    def config_file(self, process_node: str) -> Path:
+        """Get the lydevices_*.json path of a process node"""
+        return self.config_dir / f"lydevices_{_process_node_to_config_file(process_node)}.json"
+    
+    @staticmethod
+    def _file_stamp(config_file: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(config_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _read(self, config_file: Path) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        if not config_file.exists():
+            return None, FileNotFoundError(f"Device configuration file not found: {config_file}")
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                return json.load(f), None
+        except json.JSONDecodeError as e:
+            return None, ValueError(f"Failed to parse device configuration file {config_file}: {e}")
+        except Exception as e:
+            return None, RuntimeError(f"Failed to load device configuration file {config_file}: {e}")
+    
+    def _entry(self, process_node: str) -> Tuple:
+        if process_node not in PROCESS_NODE_CONFIGS:
+            supported = list(PROCESS_NODE_CONFIGS.keys())
+            raise ValueError(
+                f"Unsupported process node: {process_node}. "
+                f"Supported nodes: {', '.join(supported)}"
+            )
+        
+        config_file = self._files.get(process_node)
+        if config_file is None:
+            config_file = self._files[process_node] = self.config_file(process_node)
+        stamp = self._file_stamp(config_file)
+        entry = self._entries.get(process_node)
+        if entry is not None and entry[0] == stamp:
+            return entry
+        
+        with self._lock:
+            entry = self._entries.get(process_node)
+            if entry is not None and entry[0] == stamp:
+                return entry
+            reloaded = process_node in self._versions
+            device_config, error = self._read(config_file)
+            entry = (
+                stamp,
+                _freeze(device_config) if device_config is not None else None,
+                error,
+                _freeze(_merge_node_config(process_node, device_config)),
+            )
+            self._entries[process_node] = entry
+            self._versions[process_node] = self._versions.get(process_node, 0) + 1
+            listeners = list(self._listeners)
+        
+        if reloaded:
+            print(f"🔄 Reloaded {process_node} device configuration: {config_file.name}")
+            for listener in listeners:
+                listener(process_node)
+        return entry
+    
+    def get_device_config(self, process_node: str, required: bool = False) -> Optional[Mapping[str, Any]]:
+        """Get the parsed lydevices_*.json of a process node as a read-only view
+        
+        Args:
+            process_node: Process node name ("T28" or "T180")
+            required: Raise the load error instead of returning None if the file is missing or invalid
+        
+        Raises:
+            FileNotFoundError, ValueError, RuntimeError: If required and the file could not be loaded
+        """
+        entry = self._entry(process_node)
+        if entry[1] is None and required:
+            raise entry[2]
+        return entry[1]
+    
+    def get_node_config(self, process_node: str) -> Mapping[str, Any]:
+        """Get the merged configuration of a process node as a read-only view"""
+        return self._entry(process_node)[3]
+    
+    def version(self, process_node: str) -> int:
+        """Get how many times the configuration of a process node has been loaded"""
+        self._entry(process_node)
+        return self._versions[process_node]
+    
+    def add_reload_listener(self, listener: Callable[[str], None]):
+        """Register listener(process_node), called after a changed config file was reloaded"""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+    
+    def clear(self):
+        """Drop all loaded configurations (the next lookup loads them again)"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global registry instance
+_registry = None
+
+
+def get_process_node_registry() -> ProcessNodeRegistry:
+    """Get the global process node configuration registry"""
+    global _registry
+    if _registry is None:
+        _registry = ProcessNodeRegistry()
+    return _registry
+
+
 def get_device_offset(process_node: str, device_type: str) -> float:
     """
     Get device offset based on process node and device type
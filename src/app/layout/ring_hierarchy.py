@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ring Hierarchy - Outer ring emitted as reusable sub-cells
+
+By default every pad, bond pad and filler is an instance of the top cell. In hierarchical
+mode the layout generators hand these instances to a RingHierarchy, which writes them as
+generated sub-cellviews instead:
+
+    slot cells   a pad with its bond pad and the fillers up to the next pad; one cell per
+                 group that occurs at least twice in the ring
+    side cells   the slot instances and remaining instances of one side, in the frame of
+                 the bottom side (rotated back by the side orientation); sides with the
+                 same content share a cell
+    top cell     one instance per side (IO_SIDE_BOTTOM, ...), rotated to its side; corners,
+                 inner pads, wires, vias and labels stay flat in the top cell
+
+Sub-cells are created in the library of the window's cellview and named after its cell
+(<cell>_io_slot<k>, <cell>_io_side<k>). Instances inside sub-cells have generic names;
+the hierarchy manifest (<stem>_hierarchy.json) maps every flat instance name to its
+hierarchical path (IO_SIDE_BOTTOM/G3/I0), so LVS labels and intent graph names still
+resolve.
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+HIERARCHY_VERSION = 1
+
+# Ring side of each pad orientation, in the order the side cells are numbered
+SIDE_NAMES = {"R0": "bottom", "R90": "right", "R180": "top", "R270": "left"}
+_ANGLES = {"R0": 0, "R90": 90, "R180": 180, "R270": 270}
+_ORIENTATIONS = {angle: orientation for orientation, angle in _ANGLES.items()}
+
+# Opens (creating if needed) a sub-cellview next to the window's cellview and clears the
+# instances of a previous generation
+_OPEN_HELPER = ("procedure(ioRingOpenSubCell(cv suffix) let((sub) "
+                "sub = dbOpenCellViewByType(cv~>libName strcat(cv~>cellName suffix) \"layout\" \"maskLayout\" \"a\") "
+                "foreach(inst sub~>instances dbDeleteObject(inst)) sub))")
+
+
+class RingInstance(NamedTuple):
+    """Instance of the outer ring in the frame of its side cell"""
+    library: str
+    cell: str
+    view: str
+    name: str
+    x: float
+    y: float
+    orientation: str
+    starts_group: bool
+
+
+def rotate(x, y, angle: int):
+    """Rotate a point counterclockwise by a multiple of 90 degrees"""
+    angle %= 360
+    if angle == 90:
+        return -y, x
+    if angle == 180:
+        return -x, -y
+    if angle == 270:
+        return y, -x
+    return x, y
+
+
+def _number(value):
+    """Round away the float noise of translations, keep integers integral"""
+    value = round(value, 6)
+    return int(value) if value == int(value) else value
+
+
+def _instance_statement(cellview: str, instance: RingInstance, name: str, x, y) -> str:
+    return (f'dbCreateParamInstByMasterName({cellview} "{instance.library}" "{instance.cell}" "{instance.view}" '
+            f'"{name}" list({_number(x)} {_number(y)}) "{instance.orientation}")')
+
+
+class RingHierarchy:
+    """Collects the outer ring instances of one generation and writes them as sub-cells"""
+
+    def __init__(self):
+        # Side orientation -> instances in the side frame, in the order they were added
+        self._sides: Dict[str, List[RingInstance]] = {}
+
+    def add(self, library: str, cell: str, view: str, name: str, x, y, orientation: str,
+            side_orientation: str, starts_group: bool = False) -> bool:
+        """Add an outer ring instance
+
+        Args:
+            library, cell, view: Master of the instance
+            name: Instance name in the flat layout
+            x, y, orientation: Placement in the top cell
+            side_orientation: Orientation of the ring component the instance belongs to
+                (a bond pad belongs to the side of its pad, whatever its own orientation)
+            starts_group: The instance is a pad, it starts a slot group
+
+        Returns:
+            False if the instance is not on a side; write it to the top cell instead
+        """
+        if side_orientation not in SIDE_NAMES or orientation not in _ANGLES:
+            return False
+        side_angle = _ANGLES[side_orientation]
+        local_x, local_y = rotate(x, y, -side_angle)
+        local_orientation = _ORIENTATIONS[(_ANGLES[orientation] - side_angle) % 360]
+        self._sides.setdefault(side_orientation, []).append(
+            RingInstance(library, cell, view, name, local_x, local_y, local_orientation, starts_group))
+        return True
+
+    @property
+    def instance_count(self) -> int:
+        return sum(len(instances) for instances in self._sides.values())
+
+    @staticmethod
+    def _groups(instances: List[RingInstance]) -> List[List[RingInstance]]:
+        """Split the instances of a side along the side into groups starting at each pad"""
+        groups = []
+        for instance in sorted(instances, key=lambda inst: inst.x):
+            if instance.starts_group or not groups:
+                groups.append([])
+            groups[-1].append(instance)
+        return groups
+
+    @staticmethod
+    def _signature(instances: List[RingInstance], origin_x, origin_y) -> Tuple:
+        return tuple((inst.library, inst.cell, inst.view, _number(inst.x - origin_x), _number(inst.y - origin_y),
+                      inst.orientation) for inst in instances)
+
+    def build(self) -> Dict:
+        """Group the collected instances into slot and side cells
+
+        Returns:
+            Dict with 'slot_cells' (signatures), 'side_cells' (item lists), 'sides'
+            (side orientation -> (side cell index, origin)) and 'paths' (flat instance
+            name -> hierarchical path)
+        """
+        side_groups = {side: self._groups(instances) for side, instances in self._sides.items()}
+        signatures = {}
+        for groups in side_groups.values():
+            for group in groups:
+                signatures[id(group)] = self._signature(group, group[0].x, group[0].y)
+        counts = Counter(signature for signature in signatures.values() if len(signature) > 1)
+        slot_index = {}
+        for signature in signatures.values():
+            if counts.get(signature, 0) > 1 and signature not in slot_index:
+                slot_index[signature] = len(slot_index)
+
+        side_cells: List[Tuple] = []
+        side_cell_index: Dict[Tuple, int] = {}
+        sides = {}
+        paths = {}
+        for side in SIDE_NAMES:
+            if side not in side_groups:
+                continue
+            instances = self._sides[side]
+            origin_x = min(inst.x for inst in instances)
+            origin_y = min(inst.y for inst in instances)
+            items = []
+            side_paths = []
+            for group in side_groups[side]:
+                slot = slot_index.get(signatures[id(group)])
+                if slot is not None:
+                    item_name = f"G{len(items)}"
+                    items.append(("slot", slot, item_name, _number(group[0].x - origin_x), _number(group[0].y - origin_y)))
+                    side_paths.extend((inst.name, f"{item_name}/I{k}") for k, inst in enumerate(group))
+                else:
+                    for inst in group:
+                        item_name = f"I{len(items)}"
+                        items.append(("inst", inst, item_name, _number(inst.x - origin_x), _number(inst.y - origin_y)))
+                        side_paths.append((inst.name, item_name))
+            key = tuple((kind, value if kind == "slot" else value[:3] + (value.orientation,), name, x, y)
+                        for kind, value, name, x, y in items)
+            if key not in side_cell_index:
+                side_cell_index[key] = len(side_cells)
+                side_cells.append(items)
+            side_instance = f"IO_SIDE_{SIDE_NAMES[side].upper()}"
+            # Side cell origin in the top cell
+            top_x, top_y = rotate(origin_x, origin_y, _ANGLES[side])
+            sides[side] = (side_cell_index[key], side_instance, _number(top_x), _number(top_y))
+            paths.update((name, f"{side_instance}/{path}") for name, path in side_paths)
+
+        slot_cells = [None] * len(slot_index)
+        for signature, index in slot_index.items():
+            slot_cells[index] = signature
+        return {"slot_cells": slot_cells, "side_cells": side_cells, "sides": sides, "paths": paths}
+
+    def skill_commands(self, layout: Dict = None) -> List[str]:
+        """SKILL statements creating the sub-cells and placing the sides in the top cell (cv)"""
+        layout = layout or self.build()
+        if not layout["sides"]:
+            return []
+        commands = [_OPEN_HELPER]
+        for index, signature in enumerate(layout["slot_cells"]):
+            slot_cv = f"ioRingSlot{index}"
+            commands.append(f'{slot_cv} = ioRingOpenSubCell(cv "_io_slot{index}")')
+            for k, (library, cell, view, x, y, orientation) in enumerate(signature):
+                instance = RingInstance(library, cell, view, "", x, y, orientation, False)
+                commands.append(_instance_statement(slot_cv, instance, f"I{k}", x, y))
+            commands.append(f"dbSave({slot_cv})")
+        for index, items in enumerate(layout["side_cells"]):
+            side_cv = f"ioRingSide{index}"
+            commands.append(f'{side_cv} = ioRingOpenSubCell(cv "_io_side{index}")')
+            for kind, value, name, x, y in items:
+                if kind == "slot":
+                    commands.append(f'dbCreateInst({side_cv} ioRingSlot{value} "{name}" list({x} {y}) "R0")')
+                else:
+                    commands.append(_instance_statement(side_cv, value, name, x, y))
+            commands.append(f"dbSave({side_cv})")
+        for side, (cell_index, side_instance, x, y) in layout["sides"].items():
+            commands.append(f'dbCreateInst(cv ioRingSide{cell_index} "{side_instance}" list({x} {y}) "{side}")')
+        return commands
+
+    def manifest(self, layout: Dict = None) -> Dict:
+        """Cells and flat name -> hierarchical path map of the hierarchy manifest"""
+        layout = layout or self.build()
+        return {
+            "version": HIERARCHY_VERSION,
+            "slot_cells": [{"suffix": f"_io_slot{index}", "instances": len(signature)}
+                           for index, signature in enumerate(layout["slot_cells"])],
+            "side_cells": [{"suffix": f"_io_side{index}", "instances": len(items)}
+                           for index, items in enumerate(layout["side_cells"])],
+            "sides": {SIDE_NAMES[side]: {"instance": side_instance, "cell": f"_io_side{cell_index}",
+                                         "origin": [x, y], "orientation": side}
+                      for side, (cell_index, side_instance, x, y) in layout["sides"].items()},
+            "instances": layout["paths"],
+        }
+
+
+def hierarchy_path_for(output_file: str) -> str:
+    """Get the hierarchy manifest path of a layout script (<stem>_hierarchy.json next to it)"""
+    output_path = Path(output_file)
+    return str(output_path.parent / f"{output_path.stem}_hierarchy.json")
+
+
+def write_hierarchy_manifest(output_file: str, manifest: Dict) -> str:
+    """Write the hierarchy manifest of a layout script, return its path"""
+    manifest_file = hierarchy_path_for(output_file)
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest_file
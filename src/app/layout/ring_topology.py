@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ring Topology - Outer ring of one layout generation in placement order
+
+Inner pads are placed between two outer pads ("side_i_j" positions) and the auto-filler
+reserves their slot between those pads. Both need the outer ring sorted in placement
+order and the index of the first pad of each side. RingTopology computes this once per
+generation and is shared by the inner pad handler, the auto-filler and the skill generator:
+
+    sorted_components      outer pads and corners in placement order (auto-filler index space)
+    sorted_pads            the same without corners (inner pad position index space)
+    side_starts            first index of each side, per index space
+    index_by_name          component name -> index in sorted_components
+    index_by_position      (x, y, orientation) -> index in sorted_components
+    gap_pairs / gap_set    sorted_components index pairs reserved for inner pads
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .position_calculator import PositionCalculator
+
+ORIENTATIONS = ("R0", "R90", "R180", "R270")
+
+
+def count_pads_per_side(sorted_outer_pads: Iterable[dict]) -> Dict[str, int]:
+    """Count outer pads per orientation in a single pass"""
+    counts = {orientation: 0 for orientation in ORIENTATIONS}
+    for pad in sorted_outer_pads:
+        orientation = pad["orientation"]
+        if orientation in counts:
+            counts[orientation] += 1
+    return counts
+
+
+def side_start_indices(counts: Dict[str, int], placement_order: str) -> Dict[str, int]:
+    """Get the index of the first pad of each side from the per-orientation pad counts"""
+    if placement_order == "clockwise":
+        # Clockwise: Top-left -> Top edge -> Top-right -> Right edge -> Bottom-right -> Bottom edge -> Bottom-left -> Left edge
+        return {
+            "top": 0,
+            "right": counts["R180"],
+            "bottom": counts["R180"] + counts["R90"],
+            "left": counts["R180"] + counts["R90"] + counts["R0"]
+        }
+    # Counterclockwise: Top-left -> Left edge -> Bottom-left -> Bottom edge -> Bottom-right -> Right edge -> Top-right -> Top edge
+    return {
+        "left": 0,
+        "bottom": counts["R270"],
+        "right": counts["R270"] + counts["R0"],
+        "top": counts["R270"] + counts["R0"] + counts["R90"]
+    }
+
+
+def parse_inner_pad_position(position_str: str) -> Tuple[str, int, int]:
+    """Split an inner pad position "side_i_j" into (side, i, j)"""
+    parts = position_str.split('_')
+    if len(parts) != 3:
+        raise ValueError(f"Invalid inner pad position format: {position_str}")
+    return parts[0], int(parts[1]), int(parts[2])
+
+
+class RingTopology:
+    """Outer pads and corners of a ring in placement order, with per-side offsets and lookups"""
+
+    def __init__(self, components: Iterable[dict], placement_order: str = "counterclockwise",
+                 width: int = 3, height: int = 3, inner_pads: Iterable[dict] = (),
+                 position_calculator: Optional[PositionCalculator] = None):
+        """
+        Args:
+            components: Placed outer ring components (pads, optionally corners)
+            placement_order: "clockwise" or "counterclockwise"
+            width: Pads on the top and bottom sides (ring_config width)
+            height: Pads on the left and right sides (ring_config height)
+            inner_pads: Inner pads whose gaps are reserved (see gap_pairs)
+            position_calculator: Calculator used for sorting (a default one if None)
+        """
+        self.placement_order = placement_order
+        self.side_pad_count = {"top": width, "bottom": width, "left": height, "right": height}
+        calculator = position_calculator or PositionCalculator({"placement_order": placement_order})
+        self.sorted_components: List[dict] = calculator.sort_components_by_position(list(components), placement_order)
+        self.sorted_pads: List[dict] = [comp for comp in self.sorted_components if comp.get("type") != "corner"]
+        self.side_starts = side_start_indices(count_pads_per_side(self.sorted_components), placement_order)
+        self.pad_side_starts = side_start_indices(count_pads_per_side(self.sorted_pads), placement_order)
+
+        self._index_by_id: Dict[int, int] = {}
+        self.index_by_name: Dict[str, int] = {}
+        self.index_by_position: Dict[Tuple, int] = {}
+        for index, component in enumerate(self.sorted_components):
+            self._index_by_id[id(component)] = index
+            self.index_by_name.setdefault(component.get("name"), index)
+            self.index_by_position.setdefault(self._position_key(component), index)
+
+        self.gap_pairs: List[Tuple[int, int]] = self.find_gap_pairs(inner_pads)
+        self.gap_set: Set[Tuple[int, int]] = set()
+        for index1, index2 in self.gap_pairs:
+            self.gap_set.add((index1, index2))
+            self.gap_set.add((index2, index1))
+
+    @staticmethod
+    def _position_key(component: dict) -> Tuple:
+        position = component.get("position") or [0, 0]
+        return (position[0], position[1], component.get("orientation"))
+
+    def index_of(self, component: dict) -> Optional[int]:
+        """Get the placement-order index of a component (the same object, or one at the same place)"""
+        index = self._index_by_id.get(id(component))
+        if index is None:
+            index = self.index_by_position.get(self._position_key(component))
+        return index
+
+    def _global_indices(self, side: str, pad1_index: int, pad2_index: int,
+                        starts: Dict[str, int]) -> Optional[Tuple[int, int]]:
+        """Map the side-local pad indices of a "side_i_j" position to ring indices"""
+        if side not in starts:
+            return None
+        if self.placement_order == "clockwise":
+            real_pad1_index, real_pad2_index = pad1_index, pad2_index
+        else:
+            # Counterclockwise positions count from the other end of the side
+            last = self.side_pad_count.get(side, 0) - 1
+            real_pad1_index, real_pad2_index = last - pad1_index, last - pad2_index
+        return starts[side] + real_pad1_index, starts[side] + real_pad2_index
+
+    def inner_pad_position(self, position_str: str) -> Tuple[List, str]:
+        """Get the position and orientation of an inner pad between two outer pads"""
+        side, pad1_index, pad2_index = parse_inner_pad_position(position_str)
+        indices = self._global_indices(side, pad1_index, pad2_index, self.pad_side_starts)
+        if indices is None:
+            raise ValueError(f"Invalid side: {side}")
+
+        # Get positions of two outer pads
+        pad1 = self.sorted_pads[indices[0]]
+        pad2 = self.sorted_pads[indices[1]]
+        x1, y1 = pad1["position"]
+        x2, y2 = pad2["position"]
+        orientation = pad1["orientation"]
+
+        # Middle position along the edge of the pads
+        if orientation in ("R0", "R180"):  # Bottom / top edge
+            x = (x1 + x2) // 2
+            y = y1
+        elif orientation in ("R90", "R270"):  # Right / left edge
+            x = x1
+            y = (y1 + y2) // 2
+        else:
+            raise ValueError(f"Invalid orientation: {orientation}")
+
+        return ([x, y], orientation)
+
+    def find_gap_pairs(self, inner_pads: Iterable[dict]) -> List[Tuple[int, int]]:
+        """Get the sorted_components index pairs that reserve space for inner pads"""
+        gap_pairs = []
+        for inner_pad in inner_pads:
+            # Placed inner pads keep their original position in position_str
+            position_str = inner_pad.get("position_str", "")
+            if not position_str and isinstance(inner_pad.get("position"), str):
+                position_str = inner_pad.get("position")
+
+            # Inner pads given in absolute coordinates do not reserve a gap
+            if not position_str or not isinstance(position_str, str):
+                continue
+            if len(position_str.split('_')) != 3:
+                continue
+
+            indices = self._global_indices(*parse_inner_pad_position(position_str), self.side_starts)
+            if indices is not None:
+                gap_pairs.append(indices)
+        return gap_pairs
@@ -6,6 +6,67 @@ Voltage Domain Processing Module
 
 from .device_classifier import DeviceClassifier
 
+# Device type fallbacks of get_voltage_domain, built once at import
+# Digital voltage domain
+_DIGITAL_DOMAIN_DEVICES = frozenset([
+    "PDDW16SDGZ_V_G", "PDDW16SDGZ_H_G", "PDDW16SDGZ",
+    "PVDD1DGZ_V_G", "PVDD1DGZ_H_G",
+    "PVSS1DGZ_V_G", "PVSS1DGZ_H_G",
+    "PVDD2POC_V_G", "PVDD2POC_H_G", "PVDD2POC",
+    "PVSS2DGZ_V_G", "PVSS2DGZ_H_G", "PVSS2DGZ",
+    "PCORNER_G"  # Digital corner
+])
+
+# Analog voltage domain
+_ANALOG_DOMAIN_DEVICES = frozenset([
+    "PDB3AC_V_G", "PDB3AC_H_G", "PDB3AC",
+    "PVDD1AC_V_G", "PVDD1AC_H_G", "PVDD1AC",
+    "PVSS1AC_V_G", "PVSS1AC_H_G", "PVSS1AC",
+    "PVDD3A_V_G", "PVDD3A_H_G",
+    "PVSS3A_V_G", "PVSS3A_H_G",
+    "PVDD3AC_V_G", "PVDD3AC_H_G",
+    "PVSS3AC_V_G", "PVSS3AC_H_G",
+    "PCORNERA_G"  # Analog corner
+])
+
+# Device type to voltage domain key mapping (fallback when no configuration is given)
+_DEVICE_TO_VOLTAGE_DOMAIN = {
+    # Digital domain devices - determine digital domain based on device type
+    "PDDW16SDGZ_V_G": "DIGITAL_IO",  # Digital IO domain
+    "PDDW16SDGZ_H_G": "DIGITAL_IO",
+    "PDDW16SDGZ": "DIGITAL_IO",
+    "PVDD1DGZ_V_G": "DIGITAL_1",     # Digital domain 1
+    "PVDD1DGZ_H_G": "DIGITAL_1",
+    "PVSS1DGZ_V_G": "DIGITAL_1",
+    "PVSS1DGZ_H_G": "DIGITAL_1",
+    "PVDD2POC_V_G": "DIGITAL_2",     # Digital domain 2
+    "PVDD2POC_H_G": "DIGITAL_2",
+    "PVDD2POC": "DIGITAL_2",
+    "PVSS2DGZ_V_G": "DIGITAL_2",
+    "PVSS2DGZ_H_G": "DIGITAL_2",
+    "PVSS2DGZ": "DIGITAL_2",
+
+    # Analog domain devices
+    "PDB3AC_V_G": "VDD3AC_VSS3AC",
+    "PDB3AC_H_G": "VDD3AC_VSS3AC",
+    "PDB3AC": "VDD3AC_VSS3AC",
+    "PVDD1AC_V_G": "VDD1AC_VSS1AC",
+    "PVDD1AC_H_G": "VDD1AC_VSS1AC",
+    "PVDD1AC": "VDD1AC_VSS1AC",
+    "PVSS1AC_V_G": "VDD1AC_VSS1AC",
+    "PVSS1AC_H_G": "VDD1AC_VSS1AC",
+    "PVSS1AC": "VDD1AC_VSS1AC",
+    "PVDD3A_V_G": "VDD3A_VSS3A",
+    "PVDD3A_H_G": "VDD3A_VSS3A",
+    "PVSS3A_V_G": "VDD3A_VSS3A",
+    "PVSS3A_H_G": "VDD3A_VSS3A",
+    "PVDD3AC_V_G": "VDD3AC_VSS3AC",
+    "PVDD3AC_H_G": "VDD3AC_VSS3AC",
+    "PVSS3AC_V_G": "VDD3AC_VSS3AC",
+    "PVSS3AC_H_G": "VDD3AC_VSS3AC",
+}
+
+
 class VoltageDomainHandler:
     """Voltage Domain Handler"""
     
@@ -53,31 +114,9 @@ class VoltageDomainHandler:
         # If no configuration, use device type to determine (backward compatibility)
         device = component.get("device", "")
         
-        # Digital voltage domain
-        digital_devices = [
-            "PDDW16SDGZ_V_G", "PDDW16SDGZ_H_G", "PDDW16SDGZ",
-            "PVDD1DGZ_V_G", "PVDD1DGZ_H_G",
-            "PVSS1DGZ_V_G", "PVSS1DGZ_H_G",
-            "PVDD2POC_V_G", "PVDD2POC_H_G", "PVDD2POC",
-            "PVSS2DGZ_V_G", "PVSS2DGZ_H_G", "PVSS2DGZ",
-            "PCORNER_G"  # Digital corner
-        ]
-        
-        # Analog voltage domain
-        analog_devices = [
-            "PDB3AC_V_G", "PDB3AC_H_G", "PDB3AC",
-            "PVDD1AC_V_G", "PVDD1AC_H_G", "PVDD1AC",
-            "PVSS1AC_V_G", "PVSS1AC_H_G", "PVSS1AC",
-            "PVDD3A_V_G", "PVDD3A_H_G",
-            "PVSS3A_V_G", "PVSS3A_H_G",
-            "PVDD3AC_V_G", "PVDD3AC_H_G",
-            "PVSS3AC_V_G", "PVSS3AC_H_G",
-            "PCORNERA_G"  # Analog corner
-        ]
-        
-        if device in digital_devices:
+        if device in _DIGITAL_DOMAIN_DEVICES:
             return "digital"
-        elif device in analog_devices:
+        elif device in _ANALOG_DOMAIN_DEVICES:
             return "analog"
         else:
             return "unknown"
@@ -128,44 +167,7 @@ class VoltageDomainHandler:
         # If no configuration, use device type to determine (backward compatibility)
         device = component.get("device", "")
         
-        # Define device type to voltage domain mapping
-        device_to_voltage_domain = {
-            # Digital domain devices - determine digital domain based on device type
-            "PDDW16SDGZ_V_G": "DIGITAL_IO",  # Digital IO domain
-            "PDDW16SDGZ_H_G": "DIGITAL_IO",
-            "PDDW16SDGZ": "DIGITAL_IO",
-            "PVDD1DGZ_V_G": "DIGITAL_1",     # Digital domain 1
-            "PVDD1DGZ_H_G": "DIGITAL_1",
-            "PVSS1DGZ_V_G": "DIGITAL_1",
-            "PVSS1DGZ_H_G": "DIGITAL_1",
-            "PVDD2POC_V_G": "DIGITAL_2",     # Digital domain 2
-            "PVDD2POC_H_G": "DIGITAL_2",
-            "PVDD2POC": "DIGITAL_2",
-            "PVSS2DGZ_V_G": "DIGITAL_2",
-            "PVSS2DGZ_H_G": "DIGITAL_2",
-            "PVSS2DGZ": "DIGITAL_2",
-            
-            # Analog domain devices
-            "PDB3AC_V_G": "VDD3AC_VSS3AC",
-            "PDB3AC_H_G": "VDD3AC_VSS3AC",
-            "PDB3AC": "VDD3AC_VSS3AC",
-            "PVDD1AC_V_G": "VDD1AC_VSS1AC",
-            "PVDD1AC_H_G": "VDD1AC_VSS1AC",
-            "PVDD1AC": "VDD1AC_VSS1AC",
-            "PVSS1AC_V_G": "VDD1AC_VSS1AC",
-            "PVSS1AC_H_G": "VDD1AC_VSS1AC",
-            "PVSS1AC": "VDD1AC_VSS1AC",
-            "PVDD3A_V_G": "VDD3A_VSS3A",
-            "PVDD3A_H_G": "VDD3A_VSS3A",
-            "PVSS3A_V_G": "VDD3A_VSS3A",
-            "PVSS3A_H_G": "VDD3A_VSS3A",
-            "PVDD3AC_V_G": "VDD3AC_VSS3AC",
-            "PVDD3AC_H_G": "VDD3AC_VSS3AC",
-            "PVSS3AC_V_G": "VDD3AC_VSS3AC",
-            "PVSS3AC_H_G": "VDD3AC_VSS3AC",
-        }
-        
-        return device_to_voltage_domain.get(device, "unknown")
+        return _DEVICE_TO_VOLTAGE_DOMAIN.get(device, "unknown")
     
     @staticmethod
     def is_same_digital_domain(component1: dict, component2: dict) -> bool:
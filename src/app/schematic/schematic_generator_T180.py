@@ -15,10 +15,51 @@ from typing import Dict, Any
 # Import device template parser from the correct location (180nm)
 from src.scripts.devices.IO_decive_info_T180_parser import DeviceTemplate, DeviceTemplateManager
 from src.app.intent_graph.json_validator import validate_config, convert_config_to_list, get_config_statistics
+from src.app.utils.skill_emitter import SkillEmitter
+from src.app.schematic.template_registry import TemplateRegistry, rotate_point
+
+# Devices whose auxiliary pin labels follow the IO direction and power labels (see DeviceTemplateManager.get_pin_config)
+DYNAMIC_PIN_DEVICES = ('PDDW0412SCDG',)
+
+# Bus net label with a suffix after the index: word<characters>_suffix
+_NET_LABEL_BUS_SUFFIX_RE = re.compile(r'(\w+)<([^>]+)>_(\w+)')
+
+# Wire, label and pin geometry of a pin connection, by the side the pin faces
+PIN_SIDE_CONFIGS = {
+    'right': {
+        'extend_x': 0.750, 'extend_y': 0.0,
+        'label_offset_x': 0.25, 'label_offset_y': 0.0,
+        'label_align': 'lowerLeft', 'label_rotation': 'R0',
+        'pin_orientation': 'R180'
+    },
+    'left': {
+        'extend_x': -0.750, 'extend_y': 0.0,
+        'label_offset_x': -0.25, 'label_offset_y': 0.0,
+        'label_align': 'lowerRight', 'label_rotation': 'R0',
+        'pin_orientation': 'R0'
+    },
+    'top': {
+        'extend_x': 0.0, 'extend_y': 0.750,
+        'label_offset_x': 0.0, 'label_offset_y': 0.25,
+        'label_align': 'lowerLeft', 'label_rotation': 'R90',
+        'pin_orientation': 'R270'
+    },
+    'bottom': {
+        'extend_x': 0.0, 'extend_y': -0.750,
+        'label_offset_x': 0.0, 'label_offset_y': -0.25,
+        'label_align': 'lowerRight', 'label_rotation': 'R90',
+        'pin_orientation': 'R90'
+    }
+}
+
+_template_registry = None
 
 class SchematicGenerator:
-    def __init__(self, template_manager):
+    def __init__(self, template_manager, template_registry=None):
         self.template_manager = template_manager
+        # Pin placements per (device, orientation); get_template_registry() shares one across calls
+        self.template_registry = template_registry or TemplateRegistry(
+            template_manager, self.get_pin_side_from_center, DYNAMIC_PIN_DEVICES)
     
     def sanitize_skill_instance_name(self, name: str) -> str:
         """
@@ -51,8 +92,7 @@ class SchematicGenerator:
         """
         # Check if label contains < > pattern like D<0>_CORE
         # Pattern: word<characters>_suffix -> word_suffix<characters>
-        pattern = r'(\w+)<([^>]+)>_(\w+)'
-        match = re.match(pattern, label)
+        match = _NET_LABEL_BUS_SUFFIX_RE.match(label)
         if match:
             prefix = match.group(1)  # e.g., "D"
             index = match.group(2)   # e.g., "0"
@@ -336,18 +376,10 @@ class SchematicGenerator:
     
     def rotate_point(self, x, y, orientation):
         """Rotate coordinate point"""
-        if orientation == 'R0':
-            return x, y
-        elif orientation == 'R90':
-            return -y, x
-        elif orientation == 'R180':
-            return -x, -y
-        elif orientation == 'R270':
-            return y, -x
-        else:
-            return x, y
+        return rotate_point(x, y, orientation)
     
-    def get_pin_side_from_center(self, pin_x, pin_y, center_x, center_y, orientation):
+    @staticmethod
+    def get_pin_side_from_center(pin_x, pin_y, center_x, center_y, orientation):
         """Determine pin position based on rotation direction (180nm specific logic)"""
         # For 180nm, orientation mapping is different:
         # left->R180, right->R0, top->R90, bottom->R270
@@ -375,34 +407,7 @@ class SchematicGenerator:
         # Format label_text for SKILL net label compatibility (convert D<0>_CORE to D_CORE<0>)
         label_text = self.format_skill_net_label(label_text)
         
-        pin_configs = {
-            'right': {
-                'extend_x': 0.750, 'extend_y': 0.0,
-                'label_offset_x': 0.25, 'label_offset_y': 0.0,
-                'label_align': 'lowerLeft', 'label_rotation': 'R0',
-                'pin_orientation': 'R180'
-            },
-            'left': {
-                'extend_x': -0.750, 'extend_y': 0.0,
-                'label_offset_x': -0.25, 'label_offset_y': 0.0,
-                'label_align': 'lowerRight', 'label_rotation': 'R0',
-                'pin_orientation': 'R0'
-            },
-            'top': {
-                'extend_x': 0.0, 'extend_y': 0.750,
-                'label_offset_x': 0.0, 'label_offset_y': 0.25,
-                'label_align': 'lowerLeft', 'label_rotation': 'R90',
-                'pin_orientation': 'R270'
-            },
-            'bottom': {
-                'extend_x': 0.0, 'extend_y': -0.750,
-                'label_offset_x': 0.0, 'label_offset_y': -0.25,
-                'label_align': 'lowerRight', 'label_rotation': 'R90',
-                'pin_orientation': 'R90'
-            }
-        }
-        
-        config = pin_configs[side]
+        config = PIN_SIDE_CONFIGS[side]
         end_x = pin_x + config['extend_x']
         end_y = pin_y + config['extend_y']
         label_x = pin_x + config['label_offset_x']
@@ -441,8 +446,18 @@ class SchematicGenerator:
         commands.append(f'dbCreateInst(cv noConnMaster "noConn_{pin_x:.3f}_{pin_y:.3f}" \'({pin_x:.3f} {pin_y:.3f}) "{orientation}")')
         return commands
     
-    def generate_schematic(self, config_list, output_file="generated_schematic.il", clockwise=False):
-        """Generate schematic SKILL code - handle unified configuration list"""
+    def generate_schematic(self, config_list, output_file="generated_schematic.il", clockwise=False,
+                           max_chunk_bytes=None, on_chunk=None, compact=False):
+        """Generate schematic SKILL code - handle unified configuration list
+        
+        Statements are streamed to output_file while they are generated; with max_chunk_bytes
+        they are split into chunks loaded in order by output_file (see src/app/utils/skill_emitter.py);
+        with compact, runs of instances, wires, labels and pins are written as placement tables
+        (see src/app/utils/skill_compact.py)
+        
+        Returns:
+            List of files holding the SKILL statements, in load order
+        """
         
         # Ensure output directory exists
         output_dir = Path("output")
@@ -491,8 +506,8 @@ class SchematicGenerator:
         # Get outer ring pad position information for inner ring pad position calculation
         outer_pads = self.get_outer_pad_positions(normalized_instances, ring_config)
         
-        commands = []
-        commands.append("cv = geGetWindowCellView()")
+        emitter = SkillEmitter(output_file, preamble=["cv = geGetWindowCellView()"], trailing_newline=True,
+                               max_chunk_bytes=max_chunk_bytes, on_chunk=on_chunk, compact=compact)
         
         loaded_devices = set()
         noConn_loaded = False  # Mark whether noConn component has been loaded
@@ -503,25 +518,25 @@ class SchematicGenerator:
                 continue
                 
             device = inst['device']
-            template = self.template_manager.get_template(device)
+            orientation = inst['orientation']
+            placement = self.template_registry.placement(device, orientation)
             
-            if not template:
+            if not placement:
                 print(f"⚠️  Warning: Template not found for device type {device}, skipping {inst['name']}")
                 continue
             
             # Load device library (if not loaded yet)
             if device not in loaded_devices:
-                commands.append(f'{device.lower()}Master = dbOpenCellView("{template.device_lib}" "{template.device_cell}" "{template.device_view}")')
+                emitter.emit(placement.open_statement)
                 loaded_devices.add(device)
             
             # Calculate position coordinates
             position_desc = inst['position']
             is_inner_ring = inst.get('is_inner_ring', False)  # Get inner ring pad identifier
             x_pos, y_pos = self.calculate_position_from_description(
-                position_desc, ring_config, device, inst['orientation'], 
+                position_desc, ring_config, device, orientation, 
                 is_inner_ring, clockwise, outer_pads if is_inner_ring else None
             )
-            orientation = inst['orientation']
             
             # Create device instance
             # Combine name and position to ensure instance name uniqueness
@@ -544,12 +559,7 @@ class SchematicGenerator:
                     instance_name = f"{inst['name']}_{position_desc.replace('_', '')}"
             # Sanitize instance name for SKILL compatibility (replace < > with _)
             instance_name = self.sanitize_skill_instance_name(instance_name)
-            commands.append(f'dbCreateInst(cv {device.lower()}Master "{instance_name}" \'({x_pos} {y_pos}) "{orientation}")')
-            
-            # Calculate rotated center point
-            rotated_center_x, rotated_center_y = self.rotate_point(template.center_x, template.center_y, orientation)
-            final_center_x = x_pos + rotated_center_x
-            final_center_y = y_pos + rotated_center_y
+            emitter.emit(f'dbCreateInst(cv {placement.master} "{instance_name}" \'({x_pos} {y_pos}) "{orientation}")')
             
             # Generate pin connections
             # First collect main power/ground labels
@@ -558,34 +568,33 @@ class SchematicGenerator:
             vss_label = pin_connection_dict.get('VSS', {}).get('label')
             vddpst_label = pin_connection_dict.get('VDDPST', {}).get('label')
             vsspst_label = pin_connection_dict.get('VSSPST', {}).get('label')
+            direction = inst.get('direction', 'input')  # Default to input IO
 
-            for pin in template.pins:
-                rotated_pin_x, rotated_pin_y = self.rotate_point(pin['x'], pin['y'], orientation)
-                final_pin_x = x_pos + rotated_pin_x
-                final_pin_y = y_pos + rotated_pin_y
-                side = self.get_pin_side_from_center(final_pin_x, final_pin_y, final_center_x, final_center_y, orientation)
+            # Rotated pin offsets and sides are precomputed per (device, orientation)
+            for pin in placement.pins:
+                final_pin_x = x_pos + pin.dx
+                final_pin_y = y_pos + pin.dy
+                side = pin.side
                 
                 # Get default configuration, pass main power/ground labels
-                direction = inst.get('direction', 'input')  # Default to input IO
-                pin_cfg = pin_connection_dict.get(pin['name'], {})
-                pin_label = pin_cfg.get('label')
-                default_config = self.template_manager.get_pin_config(
-                    device, pin['name'], inst['name'], direction,
-                    pin_label=pin_label,
+                # (user-provided label takes priority, then the default label)
+                pin_cfg = pin_connection_dict.get(pin.name, {})
+                label, default_wire, default_label, default_pin = self.template_registry.pin_config(
+                    device, pin, inst['name'], direction,
+                    pin_label=pin_cfg.get('label'),
                     vdd_label=vdd_label,
                     vss_label=vss_label,
                     vddpst_label=vddpst_label,
                     vsspst_label=vsspst_label
                 )
                 
-                # Mixed configuration: user-provided configuration takes priority, use default configuration for unspecified ones
-                label = pin_label if pin_label is not None else default_config['label']
                 # Format label for SKILL net label compatibility (convert D<0>_CORE to D_CORE<0>)
                 # Note: label formatting is done in generate_pin_commands, but we also format here for consistency
                 label = self.format_skill_net_label(label)
-                create_wire = pin_cfg.get('create_wire', default_config['create_wire'])
-                create_label = pin_cfg.get('create_label', default_config['create_label'])
-                create_pin = pin_cfg.get('create_pin', default_config['create_pin'])
+                # Mixed configuration: user-provided configuration takes priority, use default configuration for unspecified ones
+                create_wire = pin_cfg.get('create_wire', default_wire)
+                create_label = pin_cfg.get('create_label', default_label)
+                create_pin = pin_cfg.get('create_pin', default_pin)
                 
                 if not (create_wire or create_label or create_pin):
                     continue
@@ -595,53 +604,45 @@ class SchematicGenerator:
                     label == 'noConn'):
                     # Create noConn component
                     if not noConn_loaded:
-                        commands.append('noConnMaster = dbOpenCellView("basic" "noConn" "symbol")')
+                        emitter.emit('noConnMaster = dbOpenCellView("basic" "noConn" "symbol")')
                         noConn_loaded = True
                     # Get noConn orientation
                     noConn_orientation = self.get_noconn_orientation(orientation)
                     # Calculate wire end position
-                    pin_configs = {
-                        'right': {'extend_x': 0.750, 'extend_y': 0.0},
-                        'left': {'extend_x': -0.750, 'extend_y': 0.0},
-                        'top': {'extend_x': 0.0, 'extend_y': 0.750},
-                        'bottom': {'extend_x': 0.0, 'extend_y': -0.750}
-                    }
-                    config = pin_configs[side]
+                    config = PIN_SIDE_CONFIGS[side]
                     end_x = final_pin_x + config['extend_x']
                     end_y = final_pin_y + config['extend_y']
                     # Generate wire command (don't generate label and pin)
                     pin_cmds = self.generate_pin_commands(label, label, final_pin_x, final_pin_y, side,
                                                          create_wire=True, create_label=False, create_pin=False)
-                    commands.extend(pin_cmds)
+                    emitter.emit_all(pin_cmds)
                     # Place noConn component at wire end
-                    # instance_name is already sanitized, pin['name'] should be safe (standard pin names)
-                    noConn_name = f"noConn_{instance_name}_{pin['name']}"
-                    commands.append(f'dbCreateInst(cv noConnMaster "{noConn_name}" ' +
+                    # instance_name is already sanitized, pin.name should be safe (standard pin names)
+                    noConn_name = f"noConn_{instance_name}_{pin.name}"
+                    emitter.emit(f'dbCreateInst(cv noConnMaster "{noConn_name}" ' +
                                      f'\'({end_x:.3f} {end_y:.3f}) "{noConn_orientation}")')
                     continue  # Skip normal pin generation
                 
                 pin_cmds = self.generate_pin_commands(label, label, final_pin_x, final_pin_y, side,
                                                      create_wire, create_label, create_pin)
-                commands.extend(pin_cmds)
-        commands.append('schCheck(cv)')
-        commands.append('dbSave(cv)')
-        commands.append('t')  # End command
-        
-        # Write to file
-        with open(output_file, 'w') as f:
-            for cmd in commands:
-                f.write(cmd + '\n')
+                emitter.emit_all(pin_cmds)
+        emitter.emit('schCheck(cv)')
+        emitter.emit('dbSave(cv)')
+        emitter.emit('t')  # End command
+        chunk_files = emitter.close()
         
         print(f"✅ Successfully generated schematic file: {output_file}")
         print(f"📊 Statistics:")
         print(f"  - Device instance count: {len(normalized_instances)}")
         print(f"  - Device types used: {', '.join(loaded_devices)}")
-        print(f"  - SKILL command count: {len(commands)}")
+        print(f"  - SKILL command count: {emitter.statement_count}")
+        if max_chunk_bytes is not None:
+            print(f"  - Chunks: {len(chunk_files)} (loaded by {output_file})")
         
-        return commands
+        return chunk_files
 
-def load_templates_from_json(json_file=None):
-    """Load device templates from JSON file for 180nm process node
+def find_template_file(json_file=None):
+    """Find the device template JSON file for 180nm process node
     
     Args:
         json_file: Optional specific JSON file path. If None, will search for 180nm template files
@@ -676,12 +677,31 @@ def load_templates_from_json(json_file=None):
         raise FileNotFoundError(
             f"Device template file not found for 180nm process node. Tried: {', '.join(possible_files)}"
         )
+    return json_file
+
+def load_templates_from_json(json_file=None):
+    """Load device templates from JSON file for 180nm process node
     
+    Args:
+        json_file: Optional specific JSON file path. If None, will search for 180nm template files
+    """
     template_manager = DeviceTemplateManager()
-    template_manager.load_templates_from_json(json_file)
+    template_manager.load_templates_from_json(find_template_file(json_file))
     return template_manager
 
-def generate_multi_device_schematic(config_list, output_file="multi_device_schematic.il", voltage_config=None, clockwise=False):
+def get_template_registry():
+    """Get the 180nm template registry, loaded once per process and reloaded when the template file changes"""
+    global _template_registry
+    if _template_registry is None or _template_registry.is_stale():
+        template_file = os.path.abspath(find_template_file())
+        template_manager = DeviceTemplateManager()
+        template_manager.load_templates_from_json(template_file)
+        _template_registry = TemplateRegistry(template_manager, SchematicGenerator.get_pin_side_from_center,
+                                              DYNAMIC_PIN_DEVICES, source_file=template_file)
+    return _template_registry
+
+def generate_multi_device_schematic(config_list, output_file="multi_device_schematic.il", voltage_config=None, clockwise=False,
+                                    max_chunk_bytes=None, on_chunk=None, compact=False):
     """Main function for generating multi-device schematic for 180nm process node - supports unified configuration list and old format
     
     Args:
@@ -689,6 +709,12 @@ def generate_multi_device_schematic(config_list, output_file="multi_device_schem
         output_file: Output file path
         voltage_config: Voltage configuration (deprecated, kept for compatibility)
         clockwise: Whether to place devices clockwise
+        max_chunk_bytes: Split the SKILL script into chunks of about this size (default: single file)
+        on_chunk: Called with each finished chunk path while the script is being generated
+        compact: Write runs of instances, wires, labels and pins as placement tables
+    
+    Returns:
+        List of files holding the SKILL statements, in load order
     """
     
     # Ensure output directory exists
@@ -700,16 +726,16 @@ def generate_multi_device_schematic(config_list, output_file="multi_device_schem
     if not output_path.is_absolute() and "output" not in output_path.parts:
         output_file = output_dir / output_file
     
-    # Load device templates for 180nm
-    template_manager = load_templates_from_json()
+    # Device templates for 180nm, loaded once per process with precomputed pin placements
+    template_registry = get_template_registry()
     
     # Create generator and generate schematic
-    generator = SchematicGenerator(template_manager)
+    generator = SchematicGenerator(template_registry.template_manager, template_registry)
     
     # Check if it's old format (instances list)
     if config_list and isinstance(config_list[0], dict) and 'device' in config_list[0]:
         # Old format: directly pass instances list
-        return generator.generate_schematic(config_list, output_file, clockwise)
+        return generator.generate_schematic(config_list, output_file, clockwise, max_chunk_bytes, on_chunk, compact)
     else:
         # New format: unified configuration list
         # Extract ring_config from configuration to get clockwise parameter
@@ -723,4 +749,4 @@ def generate_multi_device_schematic(config_list, output_file="multi_device_schem
         if ring_config and 'clockwise' in ring_config:
             clockwise = ring_config['clockwise']
         
-        return generator.generate_schematic(config_list, output_file, clockwise)
\ No newline at end of file
+        return generator.generate_schematic(config_list, output_file, clockwise, max_chunk_bytes, on_chunk, compact)
\ No newline at end of file
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Device Template Registry - Load device templates once and precompute pin placements
+
+generate_schematic() places every pin of every instance: it rotates the pin and the
+device center by the instance orientation, decides the pin side from them and looks up
+the default pin configuration. None of this depends on where the instance is placed, so
+the registry computes it once per (device, orientation):
+
+    DevicePlacement   master variable, dbOpenCellView statement and the pins
+    PinPlacement      pin name, rotated offset from the origin, side and default config
+
+Placing an instance is then a table lookup plus a translation of the pin offsets.
+
+Default pin configs are precomputed for pins whose label only depends on the pad name
+(label_pattern) or that have no rule. Pins of devices whose auxiliary labels follow the
+instance direction and power labels (dynamic_devices, e.g. the digital IO) are resolved
+per instance by the template manager.
+
+The generator modules keep one registry per process (get_template_registry()), reloaded
+when the template file changes.
+"""
+
+import os
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+
+class PinDefault(NamedTuple):
+    """Default configuration of a pin that does not depend on the instance direction"""
+    label: str
+    create_wire: bool
+    create_label: bool
+    create_pin: bool
+    is_pattern: bool  # label is a label_pattern formatted with the pad name
+
+    def label_for(self, pad_name: str) -> str:
+        return self.label.format(pad_name=pad_name) if self.is_pattern else self.label
+
+
+class PinPlacement(NamedTuple):
+    """Pin of a device in one orientation"""
+    name: str
+    dx: float
+    dy: float
+    side: str
+    default: Optional[PinDefault]
+
+
+class DevicePlacement(NamedTuple):
+    """Device template in one orientation"""
+    master: str
+    open_statement: str
+    pins: Tuple[PinPlacement, ...]
+
+
+def rotate_point(x, y, orientation):
+    """Rotate coordinate point"""
+    if orientation == 'R0':
+        return x, y
+    elif orientation == 'R90':
+        return -y, x
+    elif orientation == 'R180':
+        return -x, -y
+    elif orientation == 'R270':
+        return y, -x
+    else:
+        return x, y
+
+
+def file_stamp(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) of a file, None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class TemplateRegistry:
+    """Device templates of one process node with per-(device, orientation) pin placements"""
+
+    def __init__(self, template_manager, pin_side: Callable, dynamic_devices: Iterable[str] = (),
+                 source_file: Optional[str] = None):
+        """
+        Args:
+            template_manager: DeviceTemplateManager with the templates and pin rules loaded
+            pin_side: (pin_x, pin_y, center_x, center_y, orientation) -> 'left'/'right'/'top'/'bottom'
+            dynamic_devices: Devices whose default pin configs depend on the instance
+            source_file: Template file the manager was loaded from (for stale checks)
+        """
+        self.template_manager = template_manager
+        self.pin_side = pin_side
+        self.dynamic_devices = frozenset(dynamic_devices)
+        self.source_file = source_file
+        self.stamp = file_stamp(source_file)
+        self._placements: Dict[Tuple[str, str], Optional[DevicePlacement]] = {}
+
+    def is_stale(self) -> bool:
+        """Check whether the template file changed since it was loaded"""
+        return self.source_file is not None and file_stamp(self.source_file) != self.stamp
+
+    def get_template(self, device: str):
+        return self.template_manager.get_template(device)
+
+    def placement(self, device: str, orientation: str) -> Optional[DevicePlacement]:
+        """Get the placement table of a device in an orientation, None if there is no template"""
+        key = (device, orientation)
+        if key not in self._placements:
+            self._placements[key] = self._build_placement(device, orientation)
+        return self._placements[key]
+
+    def _build_placement(self, device: str, orientation: str) -> Optional[DevicePlacement]:
+        template = self.template_manager.get_template(device)
+        if not template:
+            return None
+        center_dx, center_dy = rotate_point(template.center_x, template.center_y, orientation)
+        pins = []
+        for pin in template.pins:
+            dx, dy = rotate_point(pin['x'], pin['y'], orientation)
+            side = self.pin_side(dx, dy, center_dx, center_dy, orientation)
+            pins.append(PinPlacement(pin['name'], dx, dy, side, self._pin_default(device, pin['name'])))
+        master = f'{device.lower()}Master'
+        open_statement = f'{master} = dbOpenCellView("{template.device_lib}" "{template.device_cell}" "{template.device_view}")'
+        return DevicePlacement(master, open_statement, tuple(pins))
+
+    def _pin_default(self, device: str, pin_name: str) -> Optional[PinDefault]:
+        """Precompute the default config of a pin, None if it has to be resolved per instance"""
+        if device in self.dynamic_devices:
+            return None
+        rule = self.template_manager.device_pin_rules.get(device, {}).get(pin_name)
+        if rule is None:
+            return PinDefault(pin_name, True, True, True, False)
+        if not all(key in rule for key in ('label_pattern', 'create_wire', 'create_label', 'create_pin')):
+            return None
+        return PinDefault(rule['label_pattern'], rule['create_wire'], rule['create_label'], rule['create_pin'], True)
+
+    def pin_config(self, device: str, pin: PinPlacement, pad_name: str, io_type: str = 'input',
+                   pin_label: Optional[str] = None, **power_labels) -> Tuple[str, bool, bool, bool]:
+        """Get (label, create_wire, create_label, create_pin) of a pin of an instance
+
+        pin_label (the user-provided label) takes priority over the default label. power_labels
+        (vdd_label, vss_label, vddpst_label, vsspst_label) are only used by dynamic devices.
+        """
+        default = pin.default
+        if default is None:
+            config = self.template_manager.get_pin_config(device, pin.name, pad_name, io_type,
+                                                          pin_label=pin_label, **power_labels)
+            return config['label'], config['create_wire'], config['create_label'], config['create_pin']
+        label = pin_label if pin_label is not None else default.label_for(pad_name)
+        return label, default.create_wire, default.create_label, default.create_pin
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Artifact Cache - Content-addressed on-disk cache for generated IO ring artifacts
+
+generate_io_ring_schematic and generate_io_ring_layout are often called again on an
+identical intent graph while the agent iterates. Their outputs (.il script, visualization
+PNG) are stored under a key that hashes everything the generators read:
+
+- the intent graph, canonicalized (sorted keys, no whitespace)
+- the merged get_process_node_config() of the process node and the device template files
+- the generator version: GENERATOR_VERSION plus a digest of the generator sources, so
+  editing a generator never serves artifacts produced by the old code
+
+A hit copies the cached files to the requested output paths instead of regenerating
+them. Entries are evicted least-recently-used once the cache exceeds its size or entry
+bound; hits, misses, stores and evictions are counted per session.
+
+Layout:
+    output/cache/artifacts/<key>/meta.json      roles, file names, sizes, last use
+    output/cache/artifacts/<key>/<role files>   e.g. io_ring_layout.il, visualization.png
+"""
+
+import json
+import time
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+# Bump when generated output changes in a way the source digest would not catch
+GENERATOR_VERSION = "1"
+
+DEFAULT_CACHE_DIR = "output/cache/artifacts"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 512
+
+# Sources whose content is part of the generator version
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+_GENERATOR_SOURCE_DIRS = ("src/app/layout", "src/app/schematic", "src/app/intent_graph")
+
+_META_FILE = "meta.json"
+
+_generator_digest = None
+
+
+def generator_version() -> str:
+    """Get GENERATOR_VERSION combined with a digest of the generator sources (computed once)"""
+    global _generator_digest
+    if _generator_digest is None:
+        digest = hashlib.sha256()
+        for source_dir in _GENERATOR_SOURCE_DIRS:
+            for source in sorted((_PROJECT_ROOT / source_dir).rglob("*")):
+                if source.suffix in (".py", ".json") and source.is_file() and "__pycache__" not in source.parts:
+                    digest.update(source.relative_to(_PROJECT_ROOT).as_posix().encode("utf-8"))
+                    digest.update(source.read_bytes())
+        _generator_digest = digest.hexdigest()[:16]
+    return f"{GENERATOR_VERSION}-{_generator_digest}"
+
+
+def _json_default(value: Any) -> Any:
+    # Read-only config views (mapping proxies) hash like the dicts they wrap
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _canonical_json(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+                      default=_json_default).encode("utf-8")
+
+
+def compute_artifact_key(kind: str, intent_graph: Any, process_node: str, node_config: Dict[str, Any],
+                         template_files: Iterable[str] = ()) -> str:
+    """
+    Compute the cache key of one generation
+
+    Args:
+        kind: Artifact kind ("layout" or "schematic")
+        intent_graph: Loaded intent graph JSON
+        process_node: Process node ("T28" or "T180")
+        node_config: Merged get_process_node_config(process_node)
+        template_files: Device template files read by the generator
+
+    Returns:
+        Hex SHA-256 key
+    """
+    digest = hashlib.sha256()
+    for part in (kind, process_node, generator_version()):
+        digest.update(part.encode("utf-8") + b"\0")
+    digest.update(_canonical_json(intent_graph) + b"\0")
+    digest.update(_canonical_json(node_config) + b"\0")
+    for template_file in template_files:
+        digest.update(hashlib.sha256(Path(template_file).read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """Size-bounded LRU cache of generated files, shared by all tool calls of a session"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._session_stats = {}
+        # key -> entry size in bytes, least recently used first
+        self._index = OrderedDict()
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU order from the entries left by earlier sessions"""
+        entries = []
+        if self.cache_dir.exists():
+            for meta_file in self.cache_dir.glob(f"*/{_META_FILE}"):
+                try:
+                    with open(meta_file, 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                    entries.append((meta.get("last_used", 0), meta_file.parent.name, meta.get("size", 0)))
+                except Exception:
+                    shutil.rmtree(meta_file.parent, ignore_errors=True)
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+
+    def _stats_for(self, kind: str) -> Dict[str, int]:
+        return self._session_stats.setdefault(kind, {"hits": 0, "misses": 0, "stores": 0, "evictions": 0})
+
+    def get(self, kind: str, key: str, outputs: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        Restore a cached entry to the requested output paths
+
+        Args:
+            kind: Artifact kind, for the statistics
+            key: Key from compute_artifact_key()
+            outputs: Role -> destination path; on a hit, the destination of a role missing
+                from the entry is deleted, so no stale file of an earlier generation is left
+
+        Returns:
+            Role -> restored path on a hit, None on a miss
+        """
+        with self._lock:
+            entry_dir = self.cache_dir / key
+            meta = self._read_meta(entry_dir) if key in self._index else None
+            if meta is None:
+                self._index.pop(key, None)
+                self._stats_for(kind)["misses"] += 1
+                return None
+
+            restored = {}
+            for role, destination in outputs.items():
+                file_name = meta["files"].get(role)
+                if file_name is None:
+                    Path(destination).unlink(missing_ok=True)
+                    continue
+                Path(destination).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(entry_dir / file_name, destination)
+                restored[role] = str(destination)
+
+            meta["last_used"] = time.time()
+            self._write_meta(entry_dir, meta)
+            self._index.move_to_end(key)
+            self._stats_for(kind)["hits"] += 1
+            return restored
+
+    def put(self, kind: str, key: str, files: Dict[str, Optional[str]]):
+        """
+        Store generated files
+
+        Args:
+            kind: Artifact kind
+            key: Key from compute_artifact_key()
+            files: Role -> generated file path (None or missing files are not stored)
+        """
+        with self._lock:
+            entry_dir = self.cache_dir / key
+            staging_dir = self.cache_dir / f".{key}.tmp"
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            staging_dir.mkdir(parents=True)
+
+            stored = {}
+            size = 0
+            for role, path in files.items():
+                if path is None or not Path(path).exists():
+                    continue
+                file_name = f"{role}{Path(path).suffix}"
+                shutil.copyfile(path, staging_dir / file_name)
+                stored[role] = file_name
+                size += (staging_dir / file_name).stat().st_size
+
+            self._write_meta(staging_dir, {"kind": kind, "files": stored, "size": size,
+                                           "created": time.time(), "last_used": time.time()})
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            staging_dir.rename(entry_dir)
+            self._index[key] = size
+            self._index.move_to_end(key)
+            self._stats_for(kind)["stores"] += 1
+            self._evict(kind)
+
+    def _evict(self, kind: str):
+        """Drop least recently used entries until both bounds hold (the newest entry is kept)"""
+        while len(self._index) > 1 and (len(self._index) > self.max_entries
+                                         or sum(self._index.values()) > self.max_bytes):
+            key, _ = self._index.popitem(last=False)
+            shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+            self._stats_for(kind)["evictions"] += 1
+
+    def clear(self):
+        """Remove every entry (session statistics are kept)"""
+        with self._lock:
+            for key in list(self._index):
+                shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+            self._index.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get session statistics
+
+        Returns:
+            Dict with per-kind 'kinds' counters (hits, misses, stores, evictions, hit_rate)
+            plus totals, 'entries' and 'total_bytes'
+        """
+        with self._lock:
+            kinds = {}
+            totals = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+            for kind, counters in sorted(self._session_stats.items()):
+                lookups = counters["hits"] + counters["misses"]
+                kinds[kind] = dict(counters, hit_rate=counters["hits"] / lookups if lookups else 0.0)
+                for name in totals:
+                    totals[name] += counters[name]
+            lookups = totals["hits"] + totals["misses"]
+            return {
+                "kinds": kinds,
+                **totals,
+                "hit_rate": totals["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._index),
+                "total_bytes": sum(self._index.values()),
+                "max_bytes": self.max_bytes,
+            }
+
+    @staticmethod
+    def _read_meta(entry_dir: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(entry_dir / _META_FILE, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except Exception:
+            return None
+        if not all((entry_dir / file_name).exists() for file_name in meta.get("files", {}).values()):
+            return None
+        return meta
+
+    @staticmethod
+    def _write_meta(entry_dir: Path, meta: Dict[str, Any]):
+        with open(entry_dir / _META_FILE, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+
+# Global cache instance
+_cache_instance = None
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Get global artifact cache instance"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = ArtifactCache()
+    return _cache_instance
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch Generator - Regenerate every intent graph of a directory on all cores
+
+After a PDK device-list update every intent graph of a project (or the AMS-IO-Bench
+golden outputs) has to be regenerated. run_batch() finds the intent graphs under a
+directory (or matching a glob), and runs the layout generator (which also renders the
+visualization) and the schematic generator for each file in a ProcessPoolExecutor
+worker. Files are independent, so the work scales with the number of cores.
+
+- Per-file error isolation: a failing view is recorded, the other files and views go on
+- Pre-DRC gate: layouts failing the geometry check (overlaps, out-of-ring instances) are
+  recorded as failed under 'geometry'
+- Progress: one line per finished file (or a custom callback)
+- Summary manifest: batch_manifest.json in the output directory, one entry per file
+
+Outputs mirror the source tree:
+    <output_dir>/<graph dir relative to the source>/<stem>_layout.il
+    <output_dir>/<graph dir relative to the source>/<stem>_layout_visualization.png
+    <output_dir>/<graph dir relative to the source>/<stem>_schematic.il
+
+Usage:
+    from src.app.utils.batch_generator import run_batch
+    manifest = run_batch("AMS-IO-Bench", "output/batch", max_workers=8)
+"""
+
+import io
+import os
+import re
+import json
+import glob
+import time
+import contextlib
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.app.intent_graph.json_validator import convert_config_to_list
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from src.app.layout.device_classifier import _normalize_process_node
+from src.app.schematic.schematic_generator_T28 import generate_multi_device_schematic as generate_multi_device_schematic_28nm
+from src.app.schematic.schematic_generator_T180 import generate_multi_device_schematic as generate_multi_device_schematic_180nm
+
+BATCH_VIEWS = ("layout", "schematic")
+MANIFEST_FILE = "batch_manifest.json"
+
+# Process node named by a directory of the graph path (e.g. AMS-IO-Bench/180nm_wirebonding/...)
+_NODE_DIR_RE = re.compile(r"(?<![0-9])(28|180)nm", re.IGNORECASE)
+
+
+def discover_intent_graphs(source: str) -> List[Path]:
+    """Find the intent graphs under a directory (recursively) or matching a glob pattern
+
+    Only JSON files with "ring_config" and "instances" are returned (other JSON files,
+    e.g. batch manifests or device lists, are skipped).
+    """
+    source_path = Path(source)
+    if source_path.is_dir():
+        candidates = source_path.rglob("*.json")
+    elif source_path.is_file():
+        candidates = [source_path]
+    else:
+        candidates = (Path(match) for match in glob.glob(source, recursive=True))
+
+    graphs = []
+    for candidate in candidates:
+        if not candidate.is_file() or candidate.suffix.lower() != ".json":
+            continue
+        try:
+            with open(candidate, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except Exception:
+            continue
+        if isinstance(config, dict) and "ring_config" in config and "instances" in config:
+            graphs.append(candidate.resolve())
+    return sorted(graphs)
+
+
+def _source_root(source: str, graphs: List[Path]) -> Path:
+    """Get the directory output paths are made relative to"""
+    source_path = Path(source)
+    if source_path.is_dir():
+        return source_path.resolve()
+    return Path(os.path.commonpath([str(graph.parent) for graph in graphs])) if graphs else Path.cwd()
+
+
+def infer_process_node(graph_file: Path, config: Dict[str, Any], default: str = "T28") -> str:
+    """Get the process node of an intent graph
+
+    ring_config.process_node wins, then a "28nm"/"180nm" directory in the path, then default.
+    """
+    ring_config = config.get("ring_config", {}) if isinstance(config, dict) else {}
+    if ring_config.get("process_node"):
+        return _normalize_process_node(str(ring_config["process_node"]))
+    for part in reversed(graph_file.parent.parts):
+        match = _NODE_DIR_RE.search(part)
+        if match:
+            return f"T{match.group(1)}"
+    return _normalize_process_node(default)
+
+
+def generate_intent_graph(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate the views of one intent graph (runs in a worker process)
+
+    Args:
+        job: Dict with 'intent_graph', 'output_dir', 'process_node' (None to infer) and 'views'
+
+    Returns:
+        Manifest entry: 'intent_graph', 'process_node', 'status' ("success" or "failed"),
+        'outputs' (role -> file), 'errors' (view -> message) and 'elapsed_s'
+    """
+    start = time.perf_counter()
+    graph_file = Path(job["intent_graph"])
+    output_dir = Path(job["output_dir"])
+    entry = {"intent_graph": str(graph_file), "process_node": job.get("process_node"),
+             "status": "success", "outputs": {}, "errors": {}, "elapsed_s": 0.0}
+
+    try:
+        with open(graph_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        process_node = job.get("process_node") or infer_process_node(graph_file, config)
+        entry["process_node"] = process_node
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        entry["errors"]["intent_graph"] = f"{type(e).__name__}: {e}"
+        views = []
+    else:
+        views = job["views"]
+
+    # Generators print progress per statement group; keep worker output off the terminal
+    for view in views:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                if view == "layout":
+                    layout_file = output_dir / f"{graph_file.stem}_layout.il"
+                    result = generate_layout_from_json(str(graph_file), str(layout_file), process_node)
+                    if result is None:
+                        raise ValueError("layout rule validation failed")
+                    entry["outputs"]["layout"] = str(layout_file)
+                    if result.get("visualization_file"):
+                        entry["outputs"]["visualization"] = result["visualization_file"]
+                    if not result["geometry_check"]["valid"]:
+                        entry["errors"]["geometry"] = "; ".join(result["geometry_check"]["errors"])
+                elif view == "schematic":
+                    schematic_file = output_dir / f"{graph_file.stem}_schematic.il"
+                    config_list = convert_config_to_list(config)
+                    if process_node == "T180":
+                        generate_multi_device_schematic_180nm(config_list, str(schematic_file))
+                    else:
+                        generate_multi_device_schematic_28nm(config_list, str(schematic_file))
+                    entry["outputs"]["schematic"] = str(schematic_file)
+                else:
+                    raise ValueError(f"Unknown view: {view}")
+        except Exception as e:
+            entry["errors"][view] = f"{type(e).__name__}: {e}"
+
+    if entry["errors"]:
+        entry["status"] = "failed"
+    entry["elapsed_s"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def _print_progress(done: int, total: int, entry: Dict[str, Any]):
+    status = "✅" if entry["status"] == "success" else "❌"
+    line = f"[{done}/{total}] {status} {entry['process_node'] or '?'} {entry['intent_graph']} ({entry['elapsed_s']:.2f}s)"
+    if entry["errors"]:
+        line += " - " + "; ".join(f"{view}: {message}" for view, message in entry["errors"].items())
+    print(line)
+
+
+def run_batch(source: str, output_dir: str = "output/batch", process_node: Optional[str] = None,
+              views: Iterable[str] = BATCH_VIEWS, max_workers: Optional[int] = None,
+              progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = _print_progress) -> Dict[str, Any]:
+    """Generate every intent graph under source in parallel and write a summary manifest
+
+    Args:
+        source: Directory (searched recursively), single intent graph or glob pattern
+        output_dir: Directory for the generated files and batch_manifest.json
+        process_node: Process node for all files ("T28" or "T180"), None to infer it per file
+        views: Views to generate ("layout" includes the visualization, "schematic")
+        max_workers: Worker processes (default: number of CPUs); 1 runs in this process
+        progress: Called with (files done, total files, manifest entry) as files finish
+
+    Returns:
+        Manifest dict ('files' is one entry per intent graph, sorted by path), also
+        written to <output_dir>/batch_manifest.json
+
+    Raises:
+        ValueError: If a view or the process node is not supported
+    """
+    views = list(views)
+    unknown = [view for view in views if view not in BATCH_VIEWS]
+    if unknown:
+        raise ValueError(f"Unsupported views: {', '.join(unknown)}. Supported views: {', '.join(BATCH_VIEWS)}")
+    if process_node is not None:
+        process_node = _normalize_process_node(process_node)
+
+    start = time.perf_counter()
+    output_root = Path(output_dir).resolve()
+    graphs = [graph for graph in discover_intent_graphs(source) if output_root not in graph.parents]
+    source_root = _source_root(source, graphs)
+    jobs = [{"intent_graph": str(graph), "output_dir": str(output_root / graph.parent.relative_to(source_root)),
+             "process_node": process_node, "views": views}
+            for graph in graphs]
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs) or 1))
+    entries = []
+    if workers == 1:
+        for job in jobs:
+            entries.append(generate_intent_graph(job))
+            if progress:
+                progress(len(entries), len(jobs), entries[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(generate_intent_graph, job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. killed), the pool reports it per pending file
+                    job = futures[future]
+                    entry = {"intent_graph": job["intent_graph"], "process_node": job["process_node"],
+                             "status": "failed", "outputs": {}, "errors": {"worker": f"{type(e).__name__}: {e}"},
+                             "elapsed_s": 0.0}
+                entries.append(entry)
+                if progress:
+                    progress(len(entries), len(jobs), entry)
+
+    entries.sort(key=lambda entry: entry["intent_graph"])
+    succeeded = sum(1 for entry in entries if entry["status"] == "success")
+    manifest = {
+        "source": source,
+        "output_dir": str(output_root),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "views": views,
+        "workers": workers,
+        "total": len(entries),
+        "succeeded": succeeded,
+        "failed": len(entries) - succeeded,
+        "wall_time_s": round(time.perf_counter() - start, 3),
+        "generation_time_s": round(sum(entry["elapsed_s"] for entry in entries), 3),
+        "files": entries,
+    }
+    output_root.mkdir(parents=True, exist_ok=True)
+    manifest["manifest_file"] = str(output_root / MANIFEST_FILE)
+    with open(manifest["manifest_file"], 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Structural Differ for Generated SKILL (.il) Files
+
+Parses the layout and schematic SKILL scripts written by the generators into records
+and compares a generated script against a golden one, without Virtuoso:
+
+    instance    dbCreateParamInstByMasterName, dbCreateInst (schematic, master resolved
+                from the "<var> = dbOpenCellView(...)" it references)
+    label       dbCreateLabel, schCreateWireLabel
+    pin         schCreatePin
+    path/rect/polygon/wire/via
+                dbCreatePath, dbCreateRect, dbCreatePolygon, schCreateWire, dbCreateVia
+
+Instances, labels and pins are placed objects, keyed by (kind, name, master); the same
+key found at a different position or orientation is reported as moved. Shapes are
+anonymous, their geometry is part of the key, so they can only be added or removed.
+Records are indexed by key in one pass, which keeps a diff O(n) in the number of
+statements.
+
+Usage:
+    python -m src.app.utils.il_differ golden.il generated.il
+"""
+
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .skill_compact import expand_compact_line, is_compact_statement
+
+_NUM = r"(-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+
+_PARAM_INST_RE = re.compile(
+    r'dbCreateParamInstByMasterName\s*\(\s*\w+\s+"([^"]*)"\s+"([^"]*)"\s+"([^"]*)"\s+"([^"]*)"\s+'
+    r'list\s*\(\s*' + _NUM + r'\s+' + _NUM + r'\s*\)\s+"([^"]*)"'
+)
+_SCH_MASTER_RE = re.compile(r'^\s*(\w+)\s*=\s*dbOpenCellView\s*\(\s*"([^"]*)"\s+"([^"]*)"\s+"([^"]*)"')
+_SCH_INST_RE = re.compile(
+    r'dbCreateInst\s*\(\s*\w+\s+(\w+)\s+"([^"]*)"\s+\'?\(\s*' + _NUM + r'\s+' + _NUM + r'\s*\)\s+"([^"]*)"'
+)
+_LABEL_RE = re.compile(
+    r'dbCreateLabel\s*\(\s*\w+\s+list\s*\(\s*"([^"]*)"\s+"([^"]*)"\s*\)\s+'
+    r'list\s*\(\s*' + _NUM + r'\s+' + _NUM + r'\s*\)\s+"([^"]*)"\s+"([^"]*)"\s+"([^"]*)"'
+)
+_WIRE_LABEL_RE = re.compile(
+    r'schCreateWireLabel\s*\(\s*\w+\s+\w+\s+\'\(\s*' + _NUM + r'\s+' + _NUM + r'\s*\)\s+"([^"]*)"\s+"([^"]*)"\s+"([^"]*)"'
+)
+_SCH_PIN_RE = re.compile(
+    r'schCreatePin\s*\(\s*\w+\s+\w+\s+"([^"]*)"\s+"([^"]*)"\s+\w+\s+\'\(\s*' + _NUM + r'\s+' + _NUM + r'\s*\)\s+"([^"]*)"'
+)
+_SHAPE_RE = re.compile(r'\b(dbCreatePath|dbCreateRect|dbCreatePolygon)\s*\(\s*\w+\s+list\s*\(\s*"([^"]*)"\s+"([^"]*)"\s*\)(.*)$')
+_WIRE_RE = re.compile(r'schCreateWire\s*\(\s*\w+\s+"([^"]*)"\s+"([^"]*)"(.*)$')
+_VIA_DEF_RE = re.compile(r'techFindViaDefByName\s*\(\s*\w+\s+"([^"]*)"')
+_VIA_RE = re.compile(r'dbCreateVia\s*\(\s*\w+\s+\w+\s+list\s*\(\s*' + _NUM + r'\s+' + _NUM + r'\s*\)\s+"([^"]*)"')
+_TOKEN_RE = re.compile(r'"[^"]*"|' + _NUM)
+
+_SHAPE_KINDS = {"dbCreatePath": "path", "dbCreateRect": "rect", "dbCreatePolygon": "polygon"}
+PLACED_KINDS = ("instance", "label", "pin")
+
+
+def _coord(value: str) -> float:
+    """Normalize a coordinate so that "150", "150.0" and "150.000" compare equal"""
+    return round(float(value), 6)
+
+
+def _geometry(text: str) -> Tuple:
+    """Normalize the argument tail of a shape call into a tuple of numbers and strings"""
+    tokens = (match.group(0) for match in _TOKEN_RE.finditer(text))
+    return tuple(token if token.startswith('"') else _coord(token) for token in tokens)
+
+
+def _record(kind: str, name: Optional[str], master: str, line: int, position: Tuple = None,
+            orientation: str = None, geometry: Tuple = None) -> dict:
+    return {"kind": kind, "name": name, "master": master, "position": position,
+            "orientation": orientation, "geometry": geometry, "line": line}
+
+
+def _numbered_statements(text: str):
+    """Yield (line number, statement), statements of compact placement tables with the table's line"""
+    for line_no, line in enumerate(text.splitlines(), 1):
+        if is_compact_statement(line.strip()):
+            for statement in expand_compact_line(line):
+                yield line_no, statement
+        else:
+            yield line_no, line
+
+
+def parse_il(text: str) -> List[dict]:
+    """Parse a generated SKILL script into instance, label, pin and shape records
+
+    Args:
+        text: SKILL source, one statement per line as written by the generators
+
+    Returns:
+        List of record dicts with 'kind', 'name', 'master', 'position', 'orientation',
+        'geometry' and 'line' (1-based source line)
+    """
+    records = []
+    masters = {}
+    via_def = ""
+    for line_no, line in _numbered_statements(text):
+        stripped = line.strip()
+        if not stripped or stripped.startswith(";"):
+            continue
+
+        match = _PARAM_INST_RE.search(stripped)
+        if match:
+            lib, cell, view, name, x, y, orient = match.groups()
+            records.append(_record("instance", name, f"{lib}/{cell}/{view}", line_no, (_coord(x), _coord(y)), orient))
+            continue
+        match = _SCH_MASTER_RE.match(stripped)
+        if match:
+            var, lib, cell, view = match.groups()
+            masters[var] = f"{lib}/{cell}/{view}"
+            continue
+        match = _SCH_INST_RE.search(stripped)
+        if match:
+            var, name, x, y, orient = match.groups()
+            records.append(_record("instance", name, masters.get(var, var), line_no, (_coord(x), _coord(y)), orient))
+            continue
+        match = _LABEL_RE.search(stripped)
+        if match:
+            layer, purpose, x, y, text_value, _, orient = match.groups()
+            records.append(_record("label", text_value, f"{layer}/{purpose}", line_no, (_coord(x), _coord(y)), orient))
+            continue
+        match = _WIRE_LABEL_RE.search(stripped)
+        if match:
+            x, y, text_value, _, orient = match.groups()
+            records.append(_record("label", text_value, "wire", line_no, (_coord(x), _coord(y)), orient))
+            continue
+        match = _SCH_PIN_RE.search(stripped)
+        if match:
+            name, direction, x, y, orient = match.groups()
+            records.append(_record("pin", name, direction, line_no, (_coord(x), _coord(y)), orient))
+            continue
+        match = _SHAPE_RE.search(stripped)
+        if match:
+            func, layer, purpose, tail = match.groups()
+            records.append(_record(_SHAPE_KINDS[func], None, f"{layer}/{purpose}", line_no, geometry=_geometry(tail)))
+            continue
+        match = _WIRE_RE.search(stripped)
+        if match:
+            style, mode, tail = match.groups()
+            records.append(_record("wire", None, f"{style}/{mode}", line_no, geometry=_geometry(tail)))
+            continue
+        match = _VIA_DEF_RE.search(stripped)
+        if match:
+            via_def = match.group(1)
+            continue
+        match = _VIA_RE.search(stripped)
+        if match:
+            x, y, orient = match.groups()
+            records.append(_record("via", None, via_def, line_no, geometry=(_coord(x), _coord(y), orient)))
+    return records
+
+
+def parse_il_file(path: str) -> List[dict]:
+    """Parse a SKILL file, see parse_il"""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_il(f.read())
+
+
+def record_key(record: dict) -> Tuple:
+    """Index key of a record: (kind, name, master), plus the geometry for anonymous shapes"""
+    if record["kind"] in PLACED_KINDS:
+        return (record["kind"], record["name"], record["master"])
+    return (record["kind"], None, record["master"], record["geometry"])
+
+
+def index_il_records(records: List[dict]) -> Dict[Tuple, List[dict]]:
+    """Group records by record_key, keeping source order within a key"""
+    index = defaultdict(list)
+    for record in records:
+        index[record_key(record)].append(record)
+    return index
+
+
+def _placement(record: dict) -> Tuple:
+    return (record["position"], record["orientation"])
+
+
+def diff_il_records(golden: List[dict], generated: List[dict]) -> dict:
+    """Compare generated records against golden records
+
+    Records with the same key are matched on identical placement first; the remaining
+    placed records of a key are paired in source order and reported as moved.
+
+    Returns:
+        Dict with 'added', 'removed' (record lists), 'moved' (list of (golden, generated)
+        record pairs), 'unchanged' (count), 'counts' (kind -> [golden, generated]) and
+        'identical'
+    """
+    golden_index = index_il_records(golden)
+    generated_index = index_il_records(generated)
+    added, removed, moved = [], [], []
+    unchanged = 0
+
+    for key, golden_records in golden_index.items():
+        generated_records = generated_index.get(key, [])
+        if not generated_records:
+            removed.extend(golden_records)
+            continue
+        available = Counter(_placement(r) for r in generated_records)
+        golden_left = []
+        for record in golden_records:
+            placement = _placement(record)
+            if available[placement]:
+                available[placement] -= 1
+                unchanged += 1
+            else:
+                golden_left.append(record)
+        generated_left = []
+        for record in generated_records:
+            placement = _placement(record)
+            if available[placement]:
+                available[placement] -= 1
+                generated_left.append(record)
+        pairs = min(len(golden_left), len(generated_left))
+        moved.extend(zip(golden_left[:pairs], generated_left[:pairs]))
+        removed.extend(golden_left[pairs:])
+        added.extend(generated_left[pairs:])
+
+    for key, generated_records in generated_index.items():
+        if key not in golden_index:
+            added.extend(generated_records)
+
+    counts = defaultdict(lambda: [0, 0])
+    for record in golden:
+        counts[record["kind"]][0] += 1
+    for record in generated:
+        counts[record["kind"]][1] += 1
+
+    added.sort(key=lambda r: r["line"])
+    removed.sort(key=lambda r: r["line"])
+    moved.sort(key=lambda pair: pair[1]["line"])
+    return {
+        "added": added,
+        "removed": removed,
+        "moved": moved,
+        "unchanged": unchanged,
+        "counts": dict(counts),
+        "identical": not (added or removed or moved),
+    }
+
+
+def diff_il_files(golden_path: str, generated_path: str) -> dict:
+    """Compare a generated SKILL file against a golden one, see diff_il_records"""
+    return diff_il_records(parse_il_file(golden_path), parse_il_file(generated_path))
+
+
+def describe_record(record: dict) -> str:
+    """One-line description of a record"""
+    if record["kind"] in PLACED_KINDS:
+        x, y = record["position"]
+        return f"{record['kind']} {record['name']} ({record['master']}) at ({x:g}, {y:g}) {record['orientation']}"
+    geometry = " ".join(str(v) if isinstance(v, str) else f"{v:g}" for v in record["geometry"])
+    return f"{record['kind']} {record['master']} {geometry}"
+
+
+def format_il_diff(diff: dict, max_items: int = 20) -> str:
+    """Format a diff as a readable report, listing at most max_items entries per section"""
+    lines = []
+    counts = ", ".join(f"{kind} {g}→{n}" for kind, (g, n) in sorted(diff["counts"].items()))
+    if diff["identical"]:
+        lines.append(f"✅ Structurally identical ({diff['unchanged']} records: {counts})")
+        return "\n".join(lines)
+
+    lines.append(f"❌ {len(diff['added'])} added, {len(diff['removed'])} removed, {len(diff['moved'])} moved, "
+                 f"{diff['unchanged']} unchanged ({counts})")
+    for title, records, sign in (("Removed", diff["removed"], "-"), ("Added", diff["added"], "+")):
+        if records:
+            lines.append(f"{title}:")
+            lines.extend(f"  {sign} L{r['line']}: {describe_record(r)}" for r in records[:max_items])
+            if len(records) > max_items:
+                lines.append(f"  ... {len(records) - max_items} more")
+    if diff["moved"]:
+        lines.append("Moved:")
+        for old, new in diff["moved"][:max_items]:
+            lines.append(f"  ~ L{new['line']}: {describe_record(new)} (golden L{old['line']}: "
+                         f"({old['position'][0]:g}, {old['position'][1]:g}) {old['orientation']})")
+        if len(diff["moved"]) > max_items:
+            lines.append(f"  ... {len(diff['moved']) - max_items} more")
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Structural diff of a generated SKILL file against a golden one")
+    parser.add_argument("golden", type=Path, help="Golden .il file")
+    parser.add_argument("generated", type=Path, help="Generated .il file")
+    parser.add_argument("--max-items", type=int, default=20, help="Entries listed per section")
+    args = parser.parse_args()
+
+    diff = diff_il_files(str(args.golden), str(args.generated))
+    print(format_il_diff(diff, args.max_items))
+    sys.exit(0 if diff["identical"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Incremental Parser for Layout Object Dumps (src/skill/dumpAllLayoutObjects.il)
+
+The dump lists every shape, label and instance of a layout cellview, one line each:
+
+    SHAPE rect LAYER=M1 BBOX=((0.0 0.0) (1.5 2.0))
+    SHAPE_LABEL LAYER=M2 BBOX=((0.0 0.0) (1.0 1.0)) CENTER=(0.5 0.5)
+    TEXT_LABEL NAME="VDD" LAYER=M7 AT=(10.0 20.0)
+    INST I0 LIB=tphn28hpcpgv18 CELL=PVDD1DGZ_H_G XY=(0.0 350.0) ORIENT=R0
+
+dumpAllLayoutObjects_string returns the dump as one SKILL string, which the bridge prints
+quoted ("..." with \\n and \\" escapes). Both stages work on chunks as they arrive from
+RBExcStream, keeping only the unfinished line (and escape) between chunks:
+
+    SkillStringDecoder      undoes the quoting of a printed string result
+    LayoutDumpParser        turns complete lines into records
+
+Records are dicts with "type" (the line tag) and the parsed fields; points are [x, y]
+and boxes [[x1, y1], [x2, y2]]. Lines in another format are counted as skipped.
+
+Usage:
+    for record in parse_layout_dump(RBExcStream('dumpAllLayoutObjects_string("LIB" "TOP" "layout")')):
+        ...
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_NUMBER = r"([-+0-9.eE]+)"
+_POINT = r"\(\s*" + _NUMBER + r"\s+" + _NUMBER + r"\s*\)"
+_BBOX = r"\(\s*" + _POINT + r"\s*" + _POINT + r"\s*\)"
+
+_LINE_PATTERNS = {
+    "SHAPE": re.compile(r"^SHAPE (\S+) LAYER=(\S+) BBOX=" + _BBOX + r"$"),
+    "SHAPE_LABEL": re.compile(r"^SHAPE_LABEL LAYER=(\S+) BBOX=" + _BBOX + r" CENTER=" + _POINT + r"$"),
+    "TEXT_LABEL": re.compile(r'^TEXT_LABEL NAME="(.*)" LAYER=(\S+) AT=' + _POINT + r"$"),
+    "INST": re.compile(r"^INST (\S+) LIB=(\S+) CELL=(\S+) XY=" + _POINT + r" ORIENT=(\S+)$"),
+}
+
+# Escapes of SKILL's printed strings (others stand for the character itself)
+_ESCAPES = {"n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+_SPECIAL = re.compile(r'[\\"]')
+
+
+class LayoutDumpError(ValueError):
+    """Raised when a streamed result is not a complete SKILL string."""
+
+
+class SkillStringDecoder:
+    """Undo SKILL's printed string quoting of a result that arrives in chunks."""
+
+    def __init__(self):
+        self._state = "start"  # start -> body -> end
+        self._escape = False
+        self._head = ""
+
+    def decode(self, chunk: str) -> str:
+        """Return the string content carried by chunk (possibly empty)."""
+        if self._state == "start":
+            self._head += chunk
+            stripped = self._head.lstrip()
+            if not stripped:
+                return ""
+            if not stripped.startswith('"'):
+                raise LayoutDumpError(f"Result is not a SKILL string: {stripped[:80]}")
+            self._state = "body"
+            chunk, self._head = stripped[1:], ""
+        if self._state == "end":
+            return ""
+        # Fast path: only newline and tab escapes, no quote and no pending escape
+        if not self._escape and '"' not in chunk and "\\\\" not in chunk:
+            text = chunk.replace("\\n", "\n").replace("\\t", "\t")
+            if "\\" not in text:
+                return text
+
+        out = []
+        pos = 0
+        if self._escape and chunk:
+            out.append(_ESCAPES.get(chunk[0], chunk[0]))
+            self._escape = False
+            pos = 1
+        while True:
+            match = _SPECIAL.search(chunk, pos)
+            if match is None:
+                out.append(chunk[pos:])
+                break
+            out.append(chunk[pos:match.start()])
+            if match.group() == '"':
+                self._state = "end"
+                break
+            if match.end() == len(chunk):
+                self._escape = True  # The escaped character is in the next chunk
+                break
+            escaped = chunk[match.end()]
+            out.append(_ESCAPES.get(escaped, escaped))
+            pos = match.end() + 1
+        return "".join(out)
+
+    def close(self) -> None:
+        """Check that the closing quote was seen."""
+        if self._state != "end":
+            raise LayoutDumpError("Result ended inside the SKILL string" if self._state == "body"
+                                  else "Empty result")
+
+
+def _point(x: str, y: str) -> List[float]:
+    return [float(x), float(y)]
+
+
+def parse_dump_line(line: str) -> Optional[Dict[str, Any]]:
+    """Parse one dump line into a record, None if it is not in the dump format."""
+    tag = line.split(" ", 1)[0]
+    pattern = _LINE_PATTERNS.get(tag)
+    match = pattern.match(line) if pattern else None
+    if match is None:
+        return None
+    g = match.groups()
+    try:
+        if tag == "SHAPE":
+            return {"type": tag, "obj_type": g[0], "layer": g[1], "bbox": [_point(g[2], g[3]), _point(g[4], g[5])]}
+        if tag == "SHAPE_LABEL":
+            return {"type": tag, "layer": g[0], "bbox": [_point(g[1], g[2]), _point(g[3], g[4])],
+                    "center": _point(g[5], g[6])}
+        if tag == "TEXT_LABEL":
+            return {"type": tag, "name": g[0], "layer": g[1], "xy": _point(g[2], g[3])}
+        return {"type": tag, "name": g[0], "lib": g[1], "cell": g[2], "xy": _point(g[3], g[4]), "orient": g[5]}
+    except ValueError:
+        return None
+
+
+class LayoutDumpParser:
+    """Parse dump text fed in arbitrary chunks; lines split across chunks are joined."""
+
+    def __init__(self):
+        self._partial = ""
+        self.lines = 0
+        self.skipped = 0
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Parse the lines completed by text and return their records."""
+        if "\n" not in text:
+            self._partial += text
+            return []
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        return self._parse(lines)
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Parse the last line if the dump did not end with a newline."""
+        lines, self._partial = [self._partial], ""
+        return self._parse(lines)
+
+    def _parse(self, lines: List[str]) -> List[Dict[str, Any]]:
+        records = []
+        for line in lines:
+            line = line.rstrip("\r")
+            if not line.strip():
+                continue
+            self.lines += 1
+            record = parse_dump_line(line)
+            if record is None:
+                self.skipped += 1
+            else:
+                records.append(record)
+        return records
+
+
+def parse_layout_dump(chunks: Iterable[str], quoted: bool = True,
+                      parser: Optional[LayoutDumpParser] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a dump while its chunks arrive.
+
+    Args:
+        chunks: Dump text in chunks (e.g. RBExcStream output or lines of a dump file)
+        quoted: True when the chunks carry the printed SKILL string, False for plain text
+        parser: Parser to use, e.g. to read its line counts afterwards
+    """
+    parser = parser or LayoutDumpParser()
+    decoder = SkillStringDecoder() if quoted else None
+    for chunk in chunks:
+        yield from parser.feed(decoder.decode(chunk) if decoder else chunk)
+    if decoder:
+        decoder.close()
+    yield from parser.close()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact SKILL Emission - Placement tables with one foreach loop instead of one call per object
+
+Generated scripts spell out every instance, path and label, e.g.
+
+    dbCreateParamInstByMasterName(cv "tphn28hpcpgv18" "PDB3AC_H_G" "layout" "VINP_left0" list(0 24.8) "R270")
+
+which repeats the library, cell, view and call for every pad, PAD60GU and filler, and makes
+Virtuoso read and evaluate one top-level form per object. In compact mode, runs of such
+statements are collected into SKILL list data, grouped by the arguments they share (the
+master, the layer and style, ...), and written as one loop per batch that opens each master
+once:
+
+    foreach(ioCompactInst list(list("tphn28hpcpgv18" "PDB3AC_H_G" "layout" '(("VINP_left0" (0 24.8) "R270") ...)) ...)
+        let((master) master = dbOpenCellViewByType(nth(0 ioCompactInst) nth(1 ioCompactInst) nth(2 ioCompactInst))
+            foreach(row nth(3 ioCompactInst) dbCreateInst(cv master nth(0 row) nth(1 row) nth(2 row)))))
+
+(one line per batch in the script). Covered statements (see COMPACT_FORMS): layout
+instances, paths, rects and labels, schematic instances, wires, wire labels and pins.
+Everything else is written as is. Assignments that only open masters or set up vias
+(INDEPENDENT_CALLS, e.g. "pvdd1dgz_v_gMaster = dbOpenCellView(...)", "newVia =
+dbCreateVia(...)") are written immediately without ending the current run, unless they
+rebind a variable the pending rows use. Any other statement (comments, dbSave, schCheck)
+ends the run first, so objects are created in the same order relative to it; only objects
+within one run are reordered (grouped), which does not change the resulting cellview.
+
+Compact statements expand back into the statements they replace (expand_compact_line),
+so layout manifests, delta scripts and the .il differ work on compact scripts unchanged.
+
+Usage:
+    with SkillEmitter("io_ring_layout.il", preamble=["cv = geGetWindowCellView()"], compact=True) as emitter:
+        emitter.emit('dbCreateParamInstByMasterName(cv ...)')
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Batches are written once their table reaches this size
+DEFAULT_BATCH_BYTES = 16 * 1024
+
+_STR = r'("[^"\\]*")'
+_NUM = r'(-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+_LIT = r'("[^"\\]*"|-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|nil|t)'
+_SYM = r'([A-Za-z_]\w*)'
+_POINT = r'list\([^()"]*\)'
+_QPOINT = r"'(\([^()\"]*\))"
+
+
+class CompactForm(NamedTuple):
+    """A statement that can be written as rows of a placement table
+
+    The statement pattern has one group per argument. Key groups are shared by the rows of a
+    table group (evaluated once, may be variables); row groups are stored as quoted SKILL
+    data, so they must be literals. list(...) arguments are stored as (...) data; for '(...)
+    arguments the quote is part of the template, not of the group.
+    """
+    var: str                    # Loop variable, identifies the form in a script
+    pattern: "re.Pattern"
+    statement: str              # Statement template over the groups ({0}, {1}, ...)
+    keys: Tuple[int, ...]
+    rows: Tuple[int, ...]
+    list_groups: FrozenSet[int]
+    body: str                   # Loop body over the keys ({k0}, ...) and row fields ({r0}, ...)
+    setup: str = ""             # let() binding evaluated once per table group, as "var = expr"
+
+    def loop(self) -> str:
+        """The loop code following the table in a compact statement"""
+        fields = {f"k{i}": f"nth({i} {self.var})" for i in range(len(self.keys))}
+        fields.update({f"r{i}": f"nth({i} row)" for i in range(len(self.rows))})
+        inner = f"foreach(row nth({len(self.keys)} {self.var}) {self.body.format(**fields)})"
+        if self.setup:
+            name, _, expr = self.setup.partition(" = ")
+            return f"let(({name}) {name} = {expr.format(**fields)} {inner})"
+        return inner
+
+
+def _form(var, pattern, statement, keys, rows, body, setup="", list_groups=()):
+    return CompactForm(var, re.compile(pattern), statement, tuple(keys), tuple(rows),
+                       frozenset(list_groups), body, setup)
+
+
+COMPACT_FORMS: Tuple[CompactForm, ...] = (
+    # Layout
+    _form("ioCompactInst",
+          rf'dbCreateParamInstByMasterName\(cv {_STR} {_STR} {_STR} {_STR} ({_POINT}) {_STR}\)',
+          "dbCreateParamInstByMasterName(cv {0} {1} {2} {3} {4} {5})",
+          keys=(0, 1, 2), rows=(3, 4, 5), list_groups=(4,),
+          setup="master = dbOpenCellViewByType({k0} {k1} {k2})",
+          body="dbCreateInst(cv master {r0} {r1} {r2})"),
+    _form("ioCompactPath",
+          rf'dbCreatePath\(cv list\({_STR} {_STR}\) (list\((?:{_POINT} ?)+\)) {_NUM}\)',
+          "dbCreatePath(cv list({0} {1}) {2} {3})",
+          keys=(0, 1, 3), rows=(2,), list_groups=(2,),
+          body="dbCreatePath(cv list({k0} {k1}) {r0} {k2})"),
+    _form("ioCompactStyledPath",
+          rf'dbCreatePath\(cv list\({_STR} {_STR}\) (list\((?:{_POINT} ?)+\)) {_NUM} {_STR}\)',
+          "dbCreatePath(cv list({0} {1}) {2} {3} {4})",
+          keys=(0, 1, 3, 4), rows=(2,), list_groups=(2,),
+          body="dbCreatePath(cv list({k0} {k1}) {r0} {k2} {k3})"),
+    _form("ioCompactRect",
+          rf'dbCreateRect\(cv list\({_STR} {_STR}\) (list\({_POINT} {_POINT}\))\)',
+          "dbCreateRect(cv list({0} {1}) {2})",
+          keys=(0, 1), rows=(2,), list_groups=(2,),
+          body="dbCreateRect(cv list({k0} {k1}) {r0})"),
+    _form("ioCompactLabel",
+          rf'dbCreateLabel\(cv list\({_STR} {_STR}\) ({_POINT}) {_STR} {_STR} {_STR} {_STR} {_NUM}\)',
+          "dbCreateLabel(cv list({0} {1}) {2} {3} {4} {5} {6} {7})",
+          keys=(0, 1, 4, 5, 6, 7), rows=(2, 3), list_groups=(2,),
+          body="dbCreateLabel(cv list({k0} {k1}) {r0} {r1} {k2} {k3} {k4} {k5})"),
+    # Schematic
+    _form("ioCompactSchInst",
+          rf"dbCreateInst\(cv {_SYM} {_STR} {_QPOINT} {_STR}\)",
+          "dbCreateInst(cv {0} {1} '{2} {3})",
+          keys=(0,), rows=(1, 2, 3),
+          body="dbCreateInst(cv {k0} {r0} {r1} {r2})"),
+    _form("ioCompactWire",
+          rf"schCreateWire\(cv {_STR} {_STR} '(\((?:\([^()\"]*\) ?)+\)) {_LIT} {_LIT} {_LIT} {_LIT} {_LIT}\)",
+          "schCreateWire(cv {0} {1} '{2} {3} {4} {5} {6} {7})",
+          keys=(0, 1, 3, 4, 5, 6, 7), rows=(2,),
+          body="schCreateWire(cv {k0} {k1} {r0} {k2} {k3} {k4} {k5} {k6})"),
+    _form("ioCompactWireLabel",
+          rf"schCreateWireLabel\(cv {_LIT} {_QPOINT} {_STR} {_STR} {_STR} {_STR} {_NUM} {_LIT}\)",
+          "schCreateWireLabel(cv {0} '{1} {2} {3} {4} {5} {6} {7})",
+          keys=(0, 3, 4, 5, 6, 7), rows=(1, 2),
+          body="schCreateWireLabel(cv {k0} {r0} {r1} {k1} {k2} {k3} {k4} {k5})"),
+    _form("ioCompactPin",
+          rf"schCreatePin\(cv {_LIT} {_STR} {_STR} {_LIT} {_QPOINT} {_STR}\)",
+          "schCreatePin(cv {0} {1} {2} {3} '{4} {5})",
+          keys=(0, 2, 3, 5), rows=(1, 4),
+          body="schCreatePin(cv {k0} {r0} {k1} {k2} {r1} {k3})"),
+)
+
+# Assignments of these calls neither read nor depend on the objects of the current run
+INDEPENDENT_CALLS = frozenset({"dbOpenCellView", "dbOpenCellViewByType", "techGetTechFile",
+                               "techFindViaDefByName", "list", "dbCreateVia"})
+
+_ASSIGNMENT_RE = re.compile(r"([A-Za-z_]\w*) = (\w+)\(")
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+
+_FORMS_BY_VAR: Dict[str, CompactForm] = {form.var: form for form in COMPACT_FORMS}
+_LOOPS: Dict[str, str] = {form.var: form.loop() for form in COMPACT_FORMS}
+_COMPACT_PREFIX_RE = re.compile(r"foreach\((ioCompact\w+) list\(")
+
+
+def _to_data(form: CompactForm, index: int, value: str) -> str:
+    if index in form.list_groups:
+        return value.replace("list(", "(")
+    return value
+
+
+def _from_data(form: CompactForm, index: int, value: str) -> str:
+    if index in form.list_groups:
+        return value.replace("(", "list(")
+    return value
+
+
+class SkillCompactor:
+    """Collects compactable statements into tables and writes them as compact statements"""
+
+    def __init__(self, batch_bytes: int = DEFAULT_BATCH_BYTES):
+        self.batch_bytes = batch_bytes
+        # form var -> key tuple -> row texts (insertion ordered)
+        self._pending: Dict[str, Dict[Tuple[str, ...], List[str]]] = {}
+        self._pending_bytes: Dict[str, int] = {}
+        # Variables the pending rows use (e.g. schematic master cellviews)
+        self._pending_symbols = set()
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def add(self, statement: str) -> Optional[List[str]]:
+        """Add a statement to the current run
+
+        Returns:
+            None if the statement cannot be compacted (flush() and write it as is), else the
+            compact statements of any batch that became full (usually empty)
+        """
+        for form in COMPACT_FORMS:
+            match = form.pattern.fullmatch(statement)
+            if match:
+                break
+        else:
+            return None
+        groups = match.groups()
+        key = tuple(groups[i] for i in form.keys)
+        self._pending_symbols.update(value for value in key if _IDENTIFIER_RE.fullmatch(value)
+                                     and value not in ("nil", "t"))
+        row = "(" + " ".join(_to_data(form, i, groups[i]) for i in form.rows) + ")"
+        self._pending.setdefault(form.var, {}).setdefault(key, []).append(row)
+        size = self._pending_bytes.get(form.var, 0) + len(row) + 1
+        self._pending_bytes[form.var] = size
+        if size >= self.batch_bytes:
+            return [self._write(form.var)]
+        return []
+
+    def is_independent(self, statement: str) -> bool:
+        """Check whether a statement can be written ahead of the pending rows without ending the run"""
+        match = _ASSIGNMENT_RE.match(statement)
+        return bool(match) and match.group(2) in INDEPENDENT_CALLS and match.group(1) not in self._pending_symbols
+
+    def _write(self, var: str) -> str:
+        tables = self._pending.pop(var)
+        del self._pending_bytes[var]
+        groups = " ".join(f"list({' '.join(key)} '({' '.join(rows)}))" for key, rows in tables.items())
+        return f"foreach({var} list({groups}) {_LOOPS[var]})"
+
+    def flush(self) -> List[str]:
+        """Compact statements of all pending tables, ending the current run"""
+        self._pending_symbols.clear()
+        return [self._write(var) for var in list(self._pending)]
+
+
+def _split_elements(text: str) -> List[str]:
+    """Split SKILL data into its top-level elements (strings, atoms, (...) and '(...) lists)"""
+    elements = []
+    depth = 0
+    start = None
+    in_string = False
+    for index, char in enumerate(text):
+        if in_string:
+            if char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char.isspace() and depth == 0:
+            if start is not None:
+                elements.append(text[start:index])
+                start = None
+        elif start is None:
+            start = index
+    if start is not None:
+        elements.append(text[start:])
+    return elements
+
+
+def _inner(element: str) -> str:
+    """Contents of a (...), '(...) or list(...) element"""
+    return element[element.index("(") + 1:-1]
+
+
+def is_compact_statement(line: str) -> bool:
+    """Check whether a script line is a compact statement"""
+    match = _COMPACT_PREFIX_RE.match(line)
+    return bool(match) and match.group(1) in _FORMS_BY_VAR
+
+
+def expand_compact_line(line: str) -> List[str]:
+    """Expand a compact statement into the statements it replaces ([line] for any other line)"""
+    stripped = line.strip()
+    match = _COMPACT_PREFIX_RE.match(stripped)
+    form = _FORMS_BY_VAR.get(match.group(1)) if match else None
+    if form is None:
+        return [line]
+    suffix = f") {_LOOPS[form.var]})"
+    if not stripped.endswith(suffix):
+        return [line]
+    tables = stripped[match.end():-len(suffix)]
+    statements = []
+    group_count = max(form.keys + form.rows) + 1
+    for group in _split_elements(tables):
+        parts = _split_elements(_inner(group))
+        key_values, rows = parts[:-1], parts[-1]
+        for row in _split_elements(_inner(rows)):
+            values = [""] * group_count
+            for index, value in zip(form.keys, key_values):
+                values[index] = value
+            for index, value in zip(form.rows, _split_elements(_inner(row))):
+                values[index] = _from_data(form, index, value)
+            statements.append(form.statement.format(*values))
+    return statements
+
+
+def expand_compact_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Expand the compact statements of a script, other lines are passed through"""
+    for line in lines:
+        if is_compact_statement(line.strip()):
+            yield from expand_compact_line(line)
+        else:
+            yield line
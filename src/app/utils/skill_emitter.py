@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming SKILL Emitter - Buffered writer for generated layout and schematic scripts
+
+The generators emit each SKILL statement as soon as it is built instead of collecting the
+whole script in a list, so the script reaches disk while later sections are still being
+generated and is never held in memory as a whole.
+
+With max_chunk_bytes set, the script is split at statement boundaries into
+<stem>_part001.il, <stem>_part002.il, ... and output_file becomes a loader that load()s the
+chunks in order. Every chunk starts with the preamble (e.g. "cv = geGetWindowCellView()");
+variables defined in earlier chunks (such as schematic master cellviews) stay defined in
+the Virtuoso session, so chunks must be loaded in order - which the loader does. on_chunk
+is called with each chunk path as soon as it is complete, e.g. to start loading it
+through the bridge while the next one is being written.
+
+With compact=True, runs of instance, shape, wire, label and pin statements are written as
+placement tables with one foreach loop per batch (see src/app/utils/skill_compact.py).
+
+Usage:
+    with SkillEmitter("io_ring_layout.il", preamble=["cv = geGetWindowCellView()"]) as emitter:
+        emitter.emit('dbCreateParamInstByMasterName(cv ...)')
+        emitter.emit_all(pin_label_commands)
+    emitter.files   # ["io_ring_layout.il"] or the chunk files
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+from .skill_compact import DEFAULT_BATCH_BYTES, SkillCompactor
+
+# Write buffer of each open file
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class SkillEmitter:
+    """Buffered, optionally chunked writer for SKILL statements"""
+
+    def __init__(self, output_file: str, preamble: Optional[Iterable[str]] = None,
+                 max_chunk_bytes: Optional[int] = None, on_chunk: Optional[Callable[[str], None]] = None,
+                 trailing_newline: bool = False, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 compact: bool = False):
+        """
+        Args:
+            output_file: Script path; becomes the chunk loader when the script is split
+            preamble: Statements written at the start of the script (and of every chunk)
+            max_chunk_bytes: Split into chunks of about this size (None: single file). A single
+                statement larger than the limit gets a chunk of its own.
+            on_chunk: Called with the path of every finished chunk (or of the single file on close)
+            trailing_newline: End files with a newline after the last statement
+            buffer_size: Write buffer size in bytes
+            compact: Write compactable statements as placement tables (batches stay below
+                half of max_chunk_bytes)
+        """
+        if max_chunk_bytes is not None and max_chunk_bytes <= 0:
+            raise ValueError(f"max_chunk_bytes must be positive, got {max_chunk_bytes}")
+
+        self.output_file = Path(output_file)
+        self.preamble = list(preamble or [])
+        self.max_chunk_bytes = max_chunk_bytes
+        self.on_chunk = on_chunk
+        self.trailing_newline = trailing_newline
+        self.buffer_size = buffer_size
+        self.compactor = None
+        if compact:
+            batch_bytes = DEFAULT_BATCH_BYTES
+            if max_chunk_bytes is not None:
+                batch_bytes = min(batch_bytes, max_chunk_bytes // 2)
+            self.compactor = SkillCompactor(batch_bytes)
+
+        self.files: List[str] = []
+        self.statement_count = 0
+        self.bytes_written = 0
+        self._file = None
+        self._file_bytes = 0
+        self._file_has_body = False
+        self._closed = False
+
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._open_next_file()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @property
+    def chunked(self) -> bool:
+        """Whether the script is split into chunks"""
+        return self.max_chunk_bytes is not None
+
+    def _chunk_path(self, index: int) -> Path:
+        return self.output_file.with_name(f"{self.output_file.stem}_part{index:03d}{self.output_file.suffix}")
+
+    def _open_next_file(self):
+        """Open the single output file or the next chunk, and write the preamble"""
+        path = self._chunk_path(len(self.files) + 1) if self.chunked else self.output_file
+        self._file = open(path, 'w', encoding='utf-8', buffering=self.buffer_size)
+        self.files.append(str(path))
+        self._file_bytes = 0
+        self._file_has_body = False
+        for line in self.preamble:
+            self._write(line)
+            self.statement_count += 1
+
+    def _finish_file(self):
+        """Close the current file and report it"""
+        if self.trailing_newline and self._file_bytes:
+            self._file.write("\n")
+            self.bytes_written += 1
+        self._file.close()
+        self._file = None
+        if self.on_chunk:
+            self.on_chunk(self.files[-1])
+
+    def _write(self, line: str):
+        text = line if not self._file_bytes else "\n" + line
+        self._file.write(text)
+        size = len(text.encode('utf-8')) if not text.isascii() else len(text)
+        self._file_bytes += size
+        self.bytes_written += size
+
+    def emit(self, line: str):
+        """Write one SKILL statement (or comment / blank line)"""
+        if self._closed:
+            raise ValueError("SkillEmitter is closed")
+        if self.compactor is not None:
+            batches = self.compactor.add(line)
+            if batches is not None:
+                for batch in batches:
+                    self._emit_statement(batch)
+                return
+            if not self.compactor.is_independent(line):
+                self._flush_compact()
+        self._emit_statement(line)
+
+    def _flush_compact(self):
+        """Write the pending placement tables"""
+        if self.compactor is not None and self.compactor.pending:
+            for batch in self.compactor.flush():
+                self._emit_statement(batch)
+
+    def _emit_statement(self, line: str):
+        if self.chunked and self._file_has_body and self._file_bytes + len(line) + 1 > self.max_chunk_bytes:
+            self._finish_file()
+            self._open_next_file()
+        self._write(line)
+        self._file_has_body = True
+        self.statement_count += 1
+
+    def emit_all(self, lines: Iterable[str]):
+        """Write statements from a list or generator"""
+        for line in lines:
+            self.emit(line)
+
+    def close(self) -> List[str]:
+        """Flush and close, write the chunk loader if split
+
+        Returns:
+            Files holding the statements, in load order
+        """
+        if self._closed:
+            return self.files
+        self._flush_compact()
+        self._closed = True
+        self._finish_file()
+        if self.chunked:
+            with open(self.output_file, 'w', encoding='utf-8') as f:
+                for chunk in self.files:
+                    f.write(f'load("{Path(chunk).resolve().as_posix()}")\n')
+                f.write("t\n")
+        return self.files
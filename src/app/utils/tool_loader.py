@@ -30,6 +30,8 @@ TOOL_REGISTRY = {
     "run_il_with_screenshot": ("src.tools.il_runner_tool", "run_il_with_screenshot"),
     "clear_all_figures_in_window": ("src.tools.il_runner_tool", "clear_all_figures_in_window"),
     "screenshot_current_window": ("src.tools.il_runner_tool", "screenshot_current_window"),
+    "dump_layout_objects": ("src.tools.il_runner_tool", "dump_layout_objects"),
+    "run_on_sessions": ("src.tools.session_runner_tool", "run_on_sessions"),
     
     # SKILL tools management (small utility scripts)
     "list_skill_tools": ("src.tools.skill_tools_manager", "list_skill_tools"),
@@ -54,6 +56,8 @@ TOOL_REGISTRY = {
     "generate_io_ring_schematic": ("src.tools.io_ring_generator_tool", "generate_io_ring_schematic"),
     "validate_intent_graph": ("src.tools.io_ring_generator_tool", "validate_intent_graph"),
     "generate_io_ring_layout": ("src.tools.io_ring_generator_tool", "generate_io_ring_layout"),
+    "get_artifact_cache_stats": ("src.tools.io_ring_generator_tool", "get_artifact_cache_stats"),
+    "generate_io_ring_batch": ("src.tools.io_ring_generator_tool", "generate_io_ring_batch"),
     
     # Image Vision
     "analyze_image_path": ("src.tools.image_vision_tool", "analyze_image_path"),
@@ -147,6 +151,8 @@ def get_default_config() -> Dict[str, Any]:
                 "run_il_with_screenshot",
                 "clear_all_figures_in_window",
                 "screenshot_current_window",
+                "dump_layout_objects",
+                "run_on_sessions",
             ]
         },
         "skill_tools": {
@@ -183,6 +189,8 @@ def get_default_config() -> Dict[str, Any]:
                 "generate_io_ring_schematic",
                 "validate_intent_graph",
                 "generate_io_ring_layout",
+                "get_artifact_cache_stats",
+                "generate_io_ring_batch",
             ]
         },
         "image_vision": {
@@ -5,8 +5,16 @@ This module provides a Python interface to execute Skill commands in Virtuoso
 through the RAMIC Bridge daemon, allowing Python applications to communicate
 with Virtuoso's Skill interpreter via TCP socket connection.
 
+Two client styles are available:
+    - RBExc: one TCP connection per call (works with every daemon version)
+    - RBExcPersistent: reuses pooled connections with the framed protocol
+      (length-prefixed frames with request ids); falls back to RBExc when the
+      daemon only speaks the one-shot protocol
+    - RBExcStream: iterates over a large result in chunks while the daemon
+      forwards it, instead of returning it as one string
+
 Usage:
-    from ramic_bridge import RBExc
+    from ramic_bridge import RBExc, RBExcPersistent
     
     # Execute a simple Skill command (uses .env settings automatically)
     result = RBExc('1+2', timeout=10)
@@ -25,21 +33,104 @@ Usage:
     # Override host/port if needed
     result = RBExc('1+2', host='101.6.68.224', port=65432)
 
+    # Reuse a pooled connection for many small calls
+    for i in range(100):
+        result = RBExcPersistent(f'{i}+1', timeout=10)
+
+    # Consume a large result while it is transferred
+    for chunk in RBExcStream('dumpAllLayoutObjects_string("LIB" "TOP" "layout")', timeout=300):
+        parser.feed(chunk)
+
 Dependencies:
     - socket: For TCP communication
     - json: For request serialization
     - os: For environment variables
+    - struct/threading: For framing and the connection pool
     - dotenv: For .env file loading
 """
 
+import atexit
+import codecs
+import itertools
 import socket
 import json
 import os
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Framed protocol constants (must match ramic_bridge_daemon_27.py)
+FRAME_MAGIC = b'RBF1'
+FRAME_HEADER = struct.Struct('!II')  # request_id, payload length
+
+# Request id flags of streamed replies (must match ramic_bridge_daemon_27.py)
+STREAM_REQUEST = 0x80000000  # set by the client on the request frame
+STREAM_CHUNK = 0x40000000    # set by the daemon on every chunk frame of the reply
+REQUEST_ID_MASK = 0x3FFFFFFF
+
+# Markers of Virtuoso responses
+STX = b'\x02'
+NAK = b'\x15'
+
+# Size of each socket read
+RECV_CHUNK_SIZE = 65536
+
+# Extra seconds the client waits beyond the Virtuoso timeout (the daemon's watchdog fires first)
+SOCKET_TIMEOUT_GRACE = 5.0
+
+# Maximum idle connections kept per (host, port)
+DEFAULT_POOL_SIZE = 4
+
+
+class RBProtocolError(Exception):
+    """Raised when the daemon sends data that does not follow the framed protocol."""
+
+
+class RBLegacyDaemonError(RBProtocolError):
+    """Raised when the daemon does not support the framed protocol."""
+
+
+class RBRequestNotSentError(ConnectionError):
+    """Raised when a connection fails before the request frame was fully sent (it never ran)."""
+
+
+class RBStreamError(Exception):
+    """Raised when a streamed call fails in Virtuoso (NAK response or timeout)."""
+
+
+def _resolve_endpoint(host: Optional[str] = None, port: Optional[int] = None) -> Tuple[str, int]:
+    """
+    Resolve host and port, falling back to RB_HOST/RB_PORT and then 127.0.0.1:65432.
+    """
+    # Get host and port from environment variables if not provided
+    if host is None:
+        host = os.getenv("RB_HOST", "127.0.0.1")
+    
+    if port is None:
+        try:
+            port = int(os.getenv("RB_PORT", "65432"))
+        except (ValueError, TypeError):
+            port = 65432
+    return host, port
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """
+    Receive exactly size bytes, raising ConnectionError if the peer closes early.
+    """
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(min(RECV_CHUNK_SIZE, size - len(buf)))
+        if not chunk:
+            raise ConnectionError(f"Connection closed after {len(buf)} of {size} bytes")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
 def RBExc(skill: str, host: str = None, port: int = None, timeout: int = 30) -> str:
     """
     Executes Skill code in Virtuoso through the RAMIC Bridge.
@@ -59,15 +150,7 @@ def RBExc(skill: str, host: str = None, port: int = None, timeout: int = 30) ->
         result = RBExc('1+2', timeout=10)  # Uses .env settings automatically
         result = RBExc('1+2', host='101.6.68.224', port=65432)  # Override settings
     """
-    # Get host and port from environment variables if not provided
-    if host is None:
-        host = os.getenv("RB_HOST", "127.0.0.1")
-    
-    if port is None:
-        try:
-            port = int(os.getenv("RB_PORT", "65432"))
-        except (ValueError, TypeError):
-            port = 65432
+    host, port = _resolve_endpoint(host, port)
     
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -78,13 +161,347 @@ def RBExc(skill: str, host: str = None, port: int = None, timeout: int = 30) ->
                 "timeout": timeout
             }
             s.sendall(json.dumps(request_data).encode('utf-8'))
-            ret = s.recv(1024*1024).decode('utf-8', errors='ignore')
-            s.shutdown(socket.SHUT_RDWR)
+            # The daemon closes the connection after the reply, so read until EOF
+            chunks = []
+            while True:
+                chunk = s.recv(RECV_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            ret = b"".join(chunks).decode('utf-8', errors='ignore')
+            try:
+                s.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             s.close()
             return ret
     except Exception as e:
         print(f"RBExc ERROR: {e}\n",e)
         return ""
+
+
+class RBConnection:
+    """A persistent framed-protocol connection to one bridge daemon."""
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self._ids = itertools.count(1)
+        self.sock = socket.create_connection((host, port), timeout=connect_timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            self.sock.sendall(FRAME_MAGIC)
+            ack = self.sock.recv(len(FRAME_MAGIC))
+            while ack and len(ack) < len(FRAME_MAGIC) and FRAME_MAGIC.startswith(ack):
+                more = self.sock.recv(len(FRAME_MAGIC) - len(ack))
+                if not more:
+                    break
+                ack += more
+        except Exception:
+            self.close()
+            raise
+        if ack != FRAME_MAGIC:
+            self.close()
+            raise RBLegacyDaemonError(f"Daemon at {host}:{port} does not support the framed protocol")
+
+    def execute(self, skill: str, timeout: int = 30) -> str:
+        """
+        Send one request frame and wait for the reply frame with the same request id.
+        """
+        request_id = next(self._ids) & REQUEST_ID_MASK
+        self._send_request(request_id, skill, timeout)
+        reply_id, length = FRAME_HEADER.unpack(_recv_exact(self.sock, FRAME_HEADER.size))
+        if reply_id != request_id:
+            raise RBProtocolError(f"Expected reply for request {request_id}, got {reply_id}")
+        return _recv_exact(self.sock, length).decode('utf-8', errors='ignore')
+
+    def execute_stream(self, skill: str, timeout: int = 30) -> Iterator[bytes]:
+        """
+        Send one request frame asking for a streamed reply and yield the raw response
+        in chunks as the daemon forwards them. A daemon without streaming support
+        answers with a single frame, which is yielded as one chunk.
+
+        The generator must be consumed to the end before the connection is reused.
+
+        Raises:
+            RBStreamError: the call failed after part of the response was yielded
+        """
+        request_id = (next(self._ids) & REQUEST_ID_MASK) | STREAM_REQUEST
+        self._send_request(request_id, skill, timeout)
+        streamed = False
+        while True:
+            reply_id, length = FRAME_HEADER.unpack(_recv_exact(self.sock, FRAME_HEADER.size))
+            data = _recv_exact(self.sock, length)
+            if reply_id == request_id | STREAM_CHUNK:
+                streamed = True
+                if data:
+                    yield data
+            elif reply_id == request_id:
+                # Final frame: the whole reply, or the rest after the chunks (empty or an error)
+                if streamed and data:
+                    raise RBStreamError(data.lstrip(NAK).decode('utf-8', errors='ignore'))
+                if data:
+                    yield data
+                return
+            else:
+                raise RBProtocolError(f"Expected reply for request {request_id}, got {reply_id}")
+
+    def _send_request(self, request_id: int, skill: str, timeout: int) -> None:
+        payload = json.dumps({"skill": skill, "timeout": timeout}).encode('utf-8')
+        self.sock.settimeout(timeout + SOCKET_TIMEOUT_GRACE)
+        try:
+            self.sock.sendall(FRAME_HEADER.pack(request_id, len(payload)) + payload)
+        except OSError as e:
+            # The daemon only executes complete frames
+            raise RBRequestNotSentError(f"Request to {self.host}:{self.port} not sent: {e}") from e
+
+    def is_stale(self) -> bool:
+        """
+        Check an idle connection without blocking: closed or reset by the daemon, or
+        with unexpected data pending (out of sync).
+        """
+        try:
+            self.sock.setblocking(False)
+            try:
+                self.sock.recv(1, socket.MSG_PEEK)
+            finally:
+                self.sock.setblocking(True)
+        except (BlockingIOError, InterruptedError):
+            return False
+        except OSError:
+            return True
+        return True
+
+    def close(self) -> None:
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class RBConnectionPool:
+    """Thread-safe pool of persistent connections to one bridge daemon."""
+
+    def __init__(self, host: str, port: int, max_size: int = DEFAULT_POOL_SIZE):
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self._idle: List[RBConnection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Tuple[RBConnection, bool]:
+        """
+        Get an idle connection or open a new one.
+
+        Returns:
+            (connection, reused) where reused tells whether it came from the pool
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            # Drop connections the daemon closed in the meantime (e.g. Virtuoso restarted)
+            if not conn.is_stale():
+                return conn, True
+            conn.close()
+        return RBConnection(self.host, self.port), False
+
+    def release(self, conn: RBConnection) -> None:
+        """Return a healthy connection to the pool (closed if the pool is full)."""
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def execute(self, skill: str, timeout: int = 30) -> str:
+        """
+        Execute skill code on a pooled connection.
+
+        Idle connections closed by the daemon are replaced before the request goes
+        out. A reused connection that fails while the request is being sent is
+        retried once on a fresh connection; once the request was sent it may have
+        run, so later errors are raised instead of executing it twice (a load() or
+        dbSave must not repeat). Connections are never reused after an error.
+        """
+        conn, reused = self.acquire()
+        try:
+            result = conn.execute(skill, timeout)
+        except RBRequestNotSentError:
+            conn.close()
+            if not reused:
+                raise
+            conn, _ = self.acquire_new()
+            try:
+                result = conn.execute(skill, timeout)
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+        self.release(conn)
+        return result
+
+    def acquire_new(self) -> Tuple[RBConnection, bool]:
+        """Open a new connection, bypassing idle ones (they may be stale as well)."""
+        self.close()
+        return RBConnection(self.host, self.port), False
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+# Connection pools and endpoints known to only speak the one-shot protocol
+_pools: Dict[Tuple[str, int], RBConnectionPool] = {}
+_legacy_endpoints: Set[Tuple[str, int]] = set()
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(host: Optional[str] = None, port: Optional[int] = None) -> RBConnectionPool:
+    """
+    Get the shared connection pool for a daemon endpoint, creating it on first use.
+    """
+    endpoint = _resolve_endpoint(host, port)
+    with _pools_lock:
+        pool = _pools.get(endpoint)
+        if pool is None:
+            pool = RBConnectionPool(*endpoint)
+            _pools[endpoint] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close every pooled connection and forget endpoints detected as legacy."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        _legacy_endpoints.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
+
+
+def RBExcPersistent(skill: str, host: str = None, port: int = None, timeout: int = 30) -> str:
+    """
+    Executes Skill code in Virtuoso over a pooled persistent connection.
+
+    Same arguments and return value as RBExc. Daemons without framed protocol
+    support are detected on the first call and served through RBExc afterwards.
+    
+    Example:
+        result = RBExcPersistent('1+2', timeout=10)
+    """
+    endpoint = _resolve_endpoint(host, port)
+    if endpoint in _legacy_endpoints:
+        return RBExc(skill, host=endpoint[0], port=endpoint[1], timeout=timeout)
+
+    try:
+        return get_connection_pool(*endpoint).execute(skill, timeout)
+    except RBLegacyDaemonError:
+        with _pools_lock:
+            _legacy_endpoints.add(endpoint)
+        return RBExc(skill, host=endpoint[0], port=endpoint[1], timeout=timeout)
+    except Exception as e:
+        print(f"RBExcPersistent ERROR: {e}\n",e)
+        return ""
+
+
+def _stream_on_pool(pool: RBConnectionPool, conn: RBConnection, reused: bool,
+                    skill: str, timeout: int) -> Iterator[bytes]:
+    """
+    Raw response chunks of a streamed call on a connection acquired from pool.
+
+    A reused connection that fails while the request is being sent is replaced and
+    the call retried once, as in RBConnectionPool.execute. A stream abandoned before
+    its end leaves unread frames behind, so its connection is closed instead of
+    returned to the pool.
+    """
+    try:
+        try:
+            for chunk in conn.execute_stream(skill, timeout):
+                yield chunk
+        except RBRequestNotSentError:
+            conn.close()
+            if not reused:
+                raise
+            conn, _ = pool.acquire_new()
+            for chunk in conn.execute_stream(skill, timeout):
+                yield chunk
+    except RBStreamError:
+        # The final frame was read: the connection is still in sync
+        pool.release(conn)
+        raise
+    except BaseException:
+        conn.close()
+        raise
+    pool.release(conn)
+
+
+def RBExcStream(skill: str, host: str = None, port: int = None, timeout: int = 30) -> Iterator[str]:
+    """
+    Executes Skill code in Virtuoso and yields the result text in chunks while the
+    daemon forwards it, so a large result is never held in memory as a whole.
+
+    The concatenated chunks are the text RBExc returns without its leading STX
+    marker. Daemons without streaming support answer in one piece (yielded as a
+    single chunk); one-shot daemons are served through RBExc.
+
+    Raises:
+        RBStreamError: Virtuoso reported an error (NAK), the call timed out or no reply arrived
+        OSError: the daemon could not be reached
+
+    Example:
+        for chunk in RBExcStream('dumpAllLayoutObjects_string("LIB" "TOP" "layout")', timeout=300):
+            parser.feed(chunk)
+    """
+    endpoint = _resolve_endpoint(host, port)
+    chunks: Optional[Iterator[bytes]] = None
+    if endpoint not in _legacy_endpoints:
+        pool = get_connection_pool(*endpoint)
+        try:
+            # Connect up front to detect one-shot daemons
+            conn, reused = pool.acquire()
+            chunks = _stream_on_pool(pool, conn, reused, skill, timeout)
+        except RBLegacyDaemonError:
+            with _pools_lock:
+                _legacy_endpoints.add(endpoint)
+    if chunks is None:
+        reply = RBExc(skill, host=endpoint[0], port=endpoint[1], timeout=timeout)
+        chunks = iter([reply.encode('utf-8')] if reply else [])
+
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    marker = None
+    error = []
+    try:
+        for chunk in chunks:
+            if marker is None:
+                marker, chunk = chunk[:1], chunk[1:]
+            if marker != STX:
+                error.append(chunk)
+                continue
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+    finally:
+        # Release (or close, when abandoned) the connection now rather than on garbage collection
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    if marker != STX:
+        message = b"".join(error).decode('utf-8', errors='ignore')
+        raise RBStreamError(message or f"No reply from {endpoint[0]}:{endpoint[1]}")
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
         
 
 
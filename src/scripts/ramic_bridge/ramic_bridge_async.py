@@ -0,0 +1,289 @@
+"""
+RAMIC Bridge asyncio Client Library
+
+Asyncio counterpart of RBExcPersistent for driving several Virtuoso sessions
+(one bridge daemon per RB_PORT) from one event loop. Each daemon endpoint gets
+one framed-protocol connection; concurrent requests to it are pipelined on that
+connection and their replies are matched back by request id, while requests to
+different daemons run in parallel.
+
+    - Per-request timeout: Virtuoso evaluates one request at a time, so a
+      pipelined request first waits for the ones sent before it. Its deadline,
+      counted from the write, is the sum of the Virtuoso timeouts of every
+      request still unanswered on the connection (its own included) plus
+      SOCKET_TIMEOUT_GRACE; a TimeoutError is raised when no reply arrives by then
+    - Cancellation: cancelling an awaiting task forgets its request; the late
+      reply is read and discarded so the connection stays usable
+    - Retries: a connection the daemon closed is replaced before the next request;
+      a request is resent on a new connection only if it failed while being sent,
+      never once it may have run in Virtuoso
+    - Daemons without framed protocol support are served one connection per
+      request (like RBExc)
+
+Usage:
+    import asyncio
+    from ramic_bridge_async import RBExcAsync
+
+    async def main():
+        layout, schematic = await asyncio.gather(
+            RBExcAsync('load("io_ring_layout.il")', port=65432, timeout=120),
+            RBExcAsync('load("io_ring_schematic.il")', port=65433, timeout=120),
+        )
+
+    asyncio.run(main())
+
+Dependencies:
+    - asyncio: For the streams, tasks and timeouts
+    - ramic_bridge: For the protocol constants and endpoint defaults
+"""
+
+import asyncio
+import itertools
+import json
+import weakref
+from typing import Dict, Optional, Set, Tuple
+
+try:
+    from .ramic_bridge import (
+        FRAME_HEADER, FRAME_MAGIC, REQUEST_ID_MASK, SOCKET_TIMEOUT_GRACE, RBLegacyDaemonError, RBRequestNotSentError,
+        _resolve_endpoint,
+    )
+except ImportError:
+    from ramic_bridge import (  # type: ignore
+        FRAME_HEADER, FRAME_MAGIC, REQUEST_ID_MASK, SOCKET_TIMEOUT_GRACE, RBLegacyDaemonError, RBRequestNotSentError,
+        _resolve_endpoint,
+    )
+
+# Seconds allowed for the TCP connect and the framed protocol handshake
+CONNECT_TIMEOUT = 10.0
+
+
+class AsyncRBConnection:
+    """A framed-protocol connection to one bridge daemon, shared by concurrent requests."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._ids = itertools.count(1)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        # request id -> Virtuoso timeout of every request sent and not yet answered,
+        # including timed-out and cancelled ones Virtuoso still evaluates
+        self._unanswered: Dict[int, int] = {}
+        self._write_lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
+        self.closed = False
+
+    @classmethod
+    async def open(cls, host: str, port: int, connect_timeout: float = CONNECT_TIMEOUT) -> "AsyncRBConnection":
+        """
+        Connect and perform the framed protocol handshake.
+
+        Raises:
+            RBLegacyDaemonError: the daemon only speaks the one-shot protocol
+        """
+        conn = cls(host, port)
+        conn._reader, conn._writer = await asyncio.wait_for(asyncio.open_connection(host, port), connect_timeout)
+        try:
+            conn._writer.write(FRAME_MAGIC)
+            await conn._writer.drain()
+            try:
+                ack = await asyncio.wait_for(conn._reader.readexactly(len(FRAME_MAGIC)), connect_timeout)
+            except asyncio.IncompleteReadError as e:
+                ack = e.partial
+        except BaseException:
+            await conn.close()
+            raise
+        if ack != FRAME_MAGIC:
+            await conn.close()
+            raise RBLegacyDaemonError(f"Daemon at {host}:{port} does not support the framed protocol")
+        conn._reader_task = asyncio.get_running_loop().create_task(conn._read_replies())
+        return conn
+
+    async def _read_replies(self) -> None:
+        """Dispatch reply frames to the waiting requests until the connection closes."""
+        error: BaseException = ConnectionError(f"Connection to {self.host}:{self.port} was closed")
+        try:
+            while True:
+                header = await self._reader.readexactly(FRAME_HEADER.size)
+                request_id, length = FRAME_HEADER.unpack(header)
+                payload = await self._reader.readexactly(length)
+                self._unanswered.pop(request_id, None)
+                future = self._pending.pop(request_id, None)
+                # No waiter: the request timed out or was cancelled, drop the late reply
+                if future is not None and not future.done():
+                    future.set_result(payload.decode('utf-8', errors='ignore'))
+        except asyncio.IncompleteReadError:
+            pass
+        except OSError as e:
+            error = ConnectionError(f"Connection to {self.host}:{self.port} failed: {e}")
+        finally:
+            self.closed = True
+            self._unanswered.clear()
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def execute(self, skill: str, timeout: int = 30, timeout_grace: float = SOCKET_TIMEOUT_GRACE) -> str:
+        """
+        Send one request frame and wait for the reply frame with the same request id.
+
+        Raises:
+            TimeoutError: no reply within the timeouts of the requests queued ahead of
+                this one, plus timeout + timeout_grace seconds
+            RBRequestNotSentError: the connection was closed or failed before the request was sent
+            ConnectionError: the connection closed after the request was sent, before the reply arrived
+        """
+        if self.closed:
+            raise RBRequestNotSentError(f"Connection to {self.host}:{self.port} is closed")
+        request_id = next(self._ids) & REQUEST_ID_MASK
+        payload = json.dumps({"skill": skill, "timeout": timeout}).encode('utf-8')
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            async with self._write_lock:
+                self._unanswered[request_id] = timeout
+                deadline = sum(self._unanswered.values()) + timeout_grace
+                try:
+                    self._writer.write(FRAME_HEADER.pack(request_id, len(payload)) + payload)
+                    await self._writer.drain()
+                except OSError as e:
+                    self._unanswered.pop(request_id, None)
+                    raise RBRequestNotSentError(f"Request to {self.host}:{self.port} not sent: {e}") from e
+            try:
+                return await asyncio.wait_for(future, deadline)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"No reply from {self.host}:{self.port} within {deadline:g}s") from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        self.closed = True
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except BaseException:
+                pass
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+
+
+class AsyncRBClient:
+    """Sends requests to any number of daemons over one shared connection per (host, port)."""
+
+    def __init__(self, timeout_grace: float = SOCKET_TIMEOUT_GRACE, connect_timeout: float = CONNECT_TIMEOUT):
+        self.timeout_grace = timeout_grace
+        self.connect_timeout = connect_timeout
+        self._connections: Dict[Tuple[str, int], AsyncRBConnection] = {}
+        self._connect_locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+        self._legacy_endpoints: Set[Tuple[str, int]] = set()
+
+    async def _connection(self, endpoint: Tuple[str, int]) -> Tuple[AsyncRBConnection, bool]:
+        """
+        Get the open connection to an endpoint, connecting on first use.
+
+        Returns:
+            (connection, reused) where reused tells whether it was already open
+        """
+        conn = self._connections.get(endpoint)
+        if conn is not None and not conn.closed:
+            return conn, True
+        # Concurrent first requests to one endpoint share a single connect
+        lock = self._connect_locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            conn = self._connections.get(endpoint)
+            if conn is not None and not conn.closed:
+                return conn, True
+            conn = await AsyncRBConnection.open(*endpoint, connect_timeout=self.connect_timeout)
+            self._connections[endpoint] = conn
+            return conn, False
+
+    async def execute(self, skill: str, host: Optional[str] = None, port: Optional[int] = None, timeout: int = 30) -> str:
+        """
+        Execute skill code on the daemon at host:port (RB_HOST/RB_PORT when omitted).
+
+        A connection found closed by the daemon in the meantime (e.g. Virtuoso
+        restarted) is replaced, and a request that failed while being sent is retried
+        once, like RBConnectionPool. Failures after the request was sent are raised.
+        """
+        endpoint = _resolve_endpoint(host, port)
+        if endpoint in self._legacy_endpoints:
+            return await self._execute_oneshot(endpoint, skill, timeout)
+        try:
+            conn, reused = await self._connection(endpoint)
+        except RBLegacyDaemonError:
+            self._legacy_endpoints.add(endpoint)
+            return await self._execute_oneshot(endpoint, skill, timeout)
+        try:
+            return await conn.execute(skill, timeout, self.timeout_grace)
+        except RBRequestNotSentError:
+            if not reused:
+                raise
+            conn, _ = await self._connection(endpoint)
+            return await conn.execute(skill, timeout, self.timeout_grace)
+
+    async def _execute_oneshot(self, endpoint: Tuple[str, int], skill: str, timeout: int) -> str:
+        """One connection per request; the daemon closes it after the reply."""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(*endpoint), self.connect_timeout)
+        try:
+            writer.write(json.dumps({"skill": skill, "timeout": timeout}).encode('utf-8'))
+            await writer.drain()
+            try:
+                data = await asyncio.wait_for(reader.read(), timeout + self.timeout_grace)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"No reply from {endpoint[0]}:{endpoint[1]} within {timeout + self.timeout_grace:g}s") from None
+            return data.decode('utf-8', errors='ignore')
+        finally:
+            writer.close()
+
+    async def close(self) -> None:
+        """Close every connection and forget endpoints detected as legacy."""
+        connections, self._connections = list(self._connections.values()), {}
+        self._legacy_endpoints.clear()
+        for conn in connections:
+            await conn.close()
+
+
+# Default client of each running event loop (connections cannot be shared across loops)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncRBClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> AsyncRBClient:
+    """Get the default client of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = AsyncRBClient()
+        _clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the default client of the running event loop."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+async def RBExcAsync(skill: str, host: str = None, port: int = None, timeout: int = 30) -> str:
+    """
+    Executes Skill code in Virtuoso without blocking the event loop.
+
+    Same arguments and return value as RBExcPersistent: errors and timeouts are
+    printed and return "". Cancelling the awaiting task raises CancelledError as usual.
+
+    Example:
+        results = await asyncio.gather(RBExcAsync('1+2', port=65432), RBExcAsync('3+4', port=65433))
+    """
+    try:
+        return await get_async_client().execute(skill, host=host, port=port, timeout=timeout)
+    except Exception as e:
+        print(f"RBExcAsync ERROR: {e}\n",e)
+        return ""
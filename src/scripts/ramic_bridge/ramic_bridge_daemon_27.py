@@ -10,6 +10,24 @@ Architecture:
 - The daemon runs as a child process of Virtuoso and communicates via stdin/stdout
 - External clients connect via TCP socket to send Skill commands
 
+Client Protocols (both are served on the same port):
+- One-shot (legacy): the client sends a single JSON request {"skill", "timeout"},
+  the daemon replies with the raw Virtuoso response and closes the connection.
+- Framed (persistent): the client sends the FRAME_MAGIC handshake and the daemon
+  acknowledges with FRAME_MAGIC. Afterwards each request is a frame
+  [request_id:uint32][length:uint32][JSON {"skill", "timeout"}] and each reply is a
+  frame [request_id:uint32][length:uint32][raw Virtuoso response]. The connection
+  stays open until the client closes it, so replies of any size are delivered intact.
+- Streamed (framed): a request frame whose id has STREAM_REQUEST set asks for the
+  response to be forwarded while Virtuoso writes it. Each piece read from Virtuoso
+  is sent as a frame with id | STREAM_CHUNK, followed by a final frame with the
+  request id carrying the rest of the response: empty on success, a NAK error when
+  the evaluation timed out. The daemon never holds more than one pipe read of a
+  streamed response. Older daemons ignore the flag and answer with a single frame.
+
+Requests from all connections are executed one at a time, because Virtuoso's
+Skill interpreter is single threaded.
+
 Usage: python ramic_bridge_daemon_27.py <host> <port>
 Example: python ramic_bridge_daemon_27.py 127.0.0.1 65432
 
@@ -18,19 +36,28 @@ Python 2.7 Compatibility Notes:
 - Uses 'except Exception, e' instead of 'except Exception as e'
 - Uses 'unicode' type for string handling
 - Uses 'range()' instead of 'xrange()' for small ranges
+- Protocol handling only uses bytes/bytearray, struct and select, so the server
+  loop can also be imported from Python 3 (see ramic_bridge_echo_daemon.py)
 """
 
 import sys
 import socket
 import os
-import fcntl
 import json
+import select
 import signal
+import struct
 import threading
 import time
 import errno
 import traceback
 
+# fcntl is only needed when running as Virtuoso's child process
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Python 2.7 compatibility: try to import psutil, fallback to manual PID detection
 try:
     import psutil
@@ -38,64 +65,86 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
-# Command line arguments for host and port
-HOST = sys.argv[1]
-PORT = int(sys.argv[2])
+# Framed protocol constants (must match ramic_bridge.py)
+FRAME_MAGIC = b'RBF1'
+FRAME_HEADER = struct.Struct('!II')  # request_id, payload length
+
+# Request id flags of streamed replies (must match ramic_bridge.py)
+STREAM_REQUEST = 0x80000000  # set by the client on the request frame
+STREAM_CHUNK = 0x40000000    # set by the daemon on every chunk frame of the reply
+
+# Size of each socket read
+RECV_CHUNK_SIZE = 65536
+
+# Size of each read from Virtuoso's output pipe
+STDIN_CHUNK_SIZE = 65536
+
+# Seconds between timeout_flag checks while waiting for Virtuoso output
+STDIN_POLL_INTERVAL = 0.01
+
+# Virtuoso output received but not yet consumed (bytes after the last RS)
+_stdin_buffer = bytearray()
+
+# Seconds a one-shot client may stay idle with an unparsable request before it is rejected
+ONESHOT_IDLE_TIMEOUT = 1.0
 
 # Global timeout control flag
 timeout_flag = False
 
-# Get Virtuoso's PID - this is the process we need to send signals to
-if PSUTIL_AVAILABLE:
-    # Use psutil if available
-    current_process = psutil.Process()
-    parent_process = current_process.parent()
-    # Python 2.7 compatibility: handle None case
-    if parent_process and parent_process.parent():
-        virtuoso_pid = parent_process.parent().pid
-    else:
-        virtuoso_pid = os.getppid()
-else:
-    # Fallback: use /proc filesystem to get parent process info
-    def get_grandparent_pid():
-        try:
-            # Read current process info from /proc
-            with open('/proc/self/stat', 'r') as f:
-                stat_data = f.read().split()
-                # Parent PID is the 4th field (index 3)
-                parent_pid = int(stat_data[3])
-                
-                # Now get the parent's parent PID (grandparent)
-                with open('/proc/{0}/stat'.format(parent_pid), 'r') as f2:
-                    stat_data2 = f2.read().split()
-                    # Grandparent PID is the 4th field (index 3) of parent's stat
-                    grandparent_pid = int(stat_data2[3])
-                    return grandparent_pid
-        except:
-            # If /proc is not available, raise an error
-            raise Exception("Failed to get Virtuoso PID")
-    
-    virtuoso_pid = get_grandparent_pid()
-
-
-# Python 2.7 compatibility: print statement instead of print() function
-# print("Virtuoso PID: {0}".format(virtuoso_pid))
-
-# Set stdin to non-blocking mode for reading Virtuoso responses
-# Note: Only stdin needs to be non-blocking, stdout should remain blocking
-stdin_fd = sys.stdin.fileno()
-stdin_fl = fcntl.fcntl(stdin_fd, fcntl.F_GETFL)
-fcntl.fcntl(stdin_fd, fcntl.F_SETFL, stdin_fl | os.O_NONBLOCK)
-
-# Keep stdout blocking for reliable writes
-stdout_fd = sys.stdout.fileno()
-stdout_fl = fcntl.fcntl(stdout_fd, fcntl.F_GETFL)
-fcntl.fcntl(stdout_fd, fcntl.F_SETFL, stdout_fl & ~os.O_NONBLOCK)  # Ensure blocking
+# Virtuoso's PID - this is the process we need to send signals to (set in main)
+virtuoso_pid = None
 
 # Global watchdog timer reference
 watchdog_timer = None
 
 
+def get_virtuoso_pid():
+    """
+    Get Virtuoso's PID (the grandparent of this daemon process).
+    """
+    if PSUTIL_AVAILABLE:
+        # Use psutil if available
+        current_process = psutil.Process()
+        parent_process = current_process.parent()
+        # Python 2.7 compatibility: handle None case
+        if parent_process and parent_process.parent():
+            return parent_process.parent().pid
+        return os.getppid()
+
+    # Fallback: use /proc filesystem to get parent process info
+    try:
+        # Read current process info from /proc
+        with open('/proc/self/stat', 'r') as f:
+            stat_data = f.read().split()
+            # Parent PID is the 4th field (index 3)
+            parent_pid = int(stat_data[3])
+
+            # Now get the parent's parent PID (grandparent)
+            with open('/proc/{0}/stat'.format(parent_pid), 'r') as f2:
+                stat_data2 = f2.read().split()
+                # Grandparent PID is the 4th field (index 3) of parent's stat
+                grandparent_pid = int(stat_data2[3])
+                return grandparent_pid
+    except:
+        # If /proc is not available, raise an error
+        raise Exception("Failed to get Virtuoso PID")
+
+
+def setup_virtuoso_pipes(in_fd=None, out_fd=None):
+    """
+    Set stdin to non-blocking mode for reading Virtuoso responses.
+    Note: Only stdin needs to be non-blocking, stdout should remain blocking.
+    """
+    stdin_fd = sys.stdin.fileno() if in_fd is None else in_fd
+    stdin_fl = fcntl.fcntl(stdin_fd, fcntl.F_GETFL)
+    fcntl.fcntl(stdin_fd, fcntl.F_SETFL, stdin_fl | os.O_NONBLOCK)
+
+    # Keep stdout blocking for reliable writes
+    stdout_fd = sys.stdout.fileno() if out_fd is None else out_fd
+    stdout_fl = fcntl.fcntl(stdout_fd, fcntl.F_GETFL)
+    fcntl.fcntl(stdout_fd, fcntl.F_SETFL, stdout_fl & ~os.O_NONBLOCK)  # Ensure blocking
+
+
 def watchdog_callback():
     """
     Watchdog callback function that sends SIGINT signal to Virtuoso process when timeout occurs.
@@ -109,191 +158,431 @@ def watchdog_callback():
         except Exception:
             pass
 
-def read_until_delimiter(start_ok=b'\x02', start_err=b'\x15', end=b'\x1e'):
+def _read_available(fd, wait):
+    """
+    Wait up to `wait` seconds for data on fd and append one chunk to the stdin buffer.
+
+    Returns:
+        False if the pipe reached EOF, True otherwise
+    """
+    try:
+        readable, _, _ = select.select([fd], [], [], wait)
+    except select.error as e:
+        if e.args[0] == errno.EINTR:
+            return True
+        raise
+    if not readable:
+        return True
+    try:
+        chunk = os.read(fd, STDIN_CHUNK_SIZE)
+    except OSError as e:
+        if e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK or e.errno == errno.EINTR:
+            return True
+        raise
+    if not chunk:
+        return False
+    _stdin_buffer.extend(chunk)
+    return True
+
+
+def drain_stdin(fd=None):
+    """
+    Discard stale Virtuoso output (buffered and pending) before sending a new request.
+    """
+    fd = sys.stdin.fileno() if fd is None else fd
+    del _stdin_buffer[:]
+    while True:
+        try:
+            readable, _, _ = select.select([fd], [], [], 0)
+            if not readable or not os.read(fd, STDIN_CHUNK_SIZE):
+                break
+        except (OSError, select.error):
+            break  # No data available or other error, stop clearing
+    del _stdin_buffer[:]
+
+
+def _wait_for_start(start_ok, start_err, fd):
+    """
+    Discard Virtuoso output up to the next STX/NAK start marker.
+
+    Returns:
+        True with the buffer starting at the marker, False if the watchdog fired first
+    """
+    buf = _stdin_buffer
+    while True:
+        if timeout_flag:
+            return False
+        ok_pos = buf.find(start_ok)
+        err_pos = buf.find(start_err)
+        positions = [pos for pos in (ok_pos, err_pos) if pos >= 0]
+        if positions:
+            del buf[:min(positions)]
+            return True
+        del buf[:]
+        if not _read_available(fd, STDIN_POLL_INTERVAL):
+            time.sleep(STDIN_POLL_INTERVAL)  # EOF: wait for the watchdog like the byte-wise reader did
+
+
+def read_until_delimiter(start_ok=b'\x02', start_err=b'\x15', end=b'\x1e', fd=None):
     """
     Read data from Virtuoso's stdout until specific delimiters are found.
-    
+
     Args:
         start_ok: Byte marker for successful response start (STX - Start of Text)
-        start_err: Byte marker for error response start (NAK - Negative Acknowledgment)  
+        start_err: Byte marker for error response start (NAK - Negative Acknowledgment)
         end: Byte marker for response end (RS - Record Separator)
-    
+        fd: File descriptor to read from (default: stdin)
+
     Returns:
         Bytearray containing the response from Virtuoso
-        
+
     Protocol:
         - Virtuoso responses start with STX (0x02) for success or NAK (0x15) for error
         - Responses end with RS (0x1E)
         - This function handles the binary protocol between daemon and Virtuoso
+
+    Implementation:
+        Output is read in chunks with select/os.read into a module-level buffer and
+        scanned for the delimiters, so bytes after RS are kept for the next reply.
+        The watchdog's timeout_flag is checked at least every STDIN_POLL_INTERVAL.
     """
-    result = bytearray()
-    
-    # Wait for start marker
+    fd = sys.stdin.fileno() if fd is None else fd
+    buf = _stdin_buffer
+
+    if not _wait_for_start(start_ok, start_err, fd):
+        # Python 2.7 compatibility: return string directly
+        return "\x15TimeoutError"
+
+    # Read content until end marker, scanning only newly received bytes
+    scan_pos = 1
     while True:
-        try:
-            ch = sys.stdin.read(1)
-            if ch in [start_ok, start_err]:
-                break
-        except IOError as e:
-            if e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK:
-                # No data available, check timeout and continue
-                if timeout_flag:
-                    return "\x15TimeoutError"
-                time.sleep(0.001)  # Short sleep to avoid busy waiting
-                continue
-            else:
-                raise
+        end_pos = buf.find(end, scan_pos)
+        if end_pos >= 0:
+            result = buf[:end_pos]
+            del buf[:end_pos + 1]
+            return result
+        scan_pos = len(buf)
         if timeout_flag:
             # Python 2.7 compatibility: return string directly
             return "\x15TimeoutError"
-    
-    # Python 2.7 compatibility: convert string to bytes for bytearray
-    if isinstance(ch, str):
-        result.extend(ch.encode('latin1'))
-    else:
-        result.extend(ch)
-    
-    # Read content until end marker
+        if not _read_available(fd, STDIN_POLL_INTERVAL):
+            time.sleep(STDIN_POLL_INTERVAL)
+
+
+def stream_until_delimiter(emit, start_ok=b'\x02', start_err=b'\x15', end=b'\x1e', fd=None):
+    """
+    Read a response like read_until_delimiter, but pass it to emit in chunks as it
+    arrives instead of collecting it.
+
+    Args:
+        emit: Callable receiving each chunk (bytes) of the response, the first one
+              starting with the STX/NAK marker
+        start_ok, start_err, end, fd: As for read_until_delimiter
+
+    Returns:
+        Empty string once the end marker was read, "\x15TimeoutError" if the watchdog
+        fired first (the chunks emitted so far are then an incomplete response)
+    """
+    fd = sys.stdin.fileno() if fd is None else fd
+    buf = _stdin_buffer
+
+    if not _wait_for_start(start_ok, start_err, fd):
+        return "\x15TimeoutError"
+
+    # Forward everything up to the end marker; bytes after it stay buffered
     while True:
-        try:
-            ch = sys.stdin.read(1)
-            if timeout_flag:
-                # Python 2.7 compatibility: return string directly
-                return "\x15TimeoutError"
-            if not ch:  # Python 2.7: empty string means no data
-                continue
-            if ch == end:
-                break
-            # Python 2.7 compatibility: convert string to bytes for bytearray
-            if isinstance(ch, str):
-                result.extend(ch.encode('latin1'))
-            else:
-                result.extend(ch)
-        except IOError as e:
-            if e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK:
-                # No data available, check timeout and continue
-                if timeout_flag:
-                    return "\x15TimeoutError"
-                time.sleep(0.001)  # Short sleep to avoid busy waiting
-                continue
-            else:
-                raise
-    
-    return result
+        end_pos = buf.find(end)
+        if end_pos >= 0:
+            if end_pos:
+                emit(bytes(buf[:end_pos]))
+            del buf[:end_pos + 1]
+            return ""
+        if buf:
+            emit(bytes(buf))
+            del buf[:]
+        if timeout_flag:
+            return "\x15TimeoutError"
+        if not _read_available(fd, STDIN_POLL_INTERVAL):
+            time.sleep(STDIN_POLL_INTERVAL)
+
+
+def _to_bytes(data):
+    """
+    Convert a reply (bytearray, unicode or str) to bytes for sending over the socket.
+    """
+    if isinstance(data, bytearray):
+        return bytes(data)
+    if isinstance(data, bytes):
+        return data
+    return data.encode('utf-8')
+
+
+def _write_all(fd, data):
+    """
+    Write all of data to a blocking file descriptor.
+    """
+    view = memoryview(data)
+    while len(view):
+        written = os.write(fd, view)
+        view = view[written:]
+
 
-def handle_external_connection(conn, addr):
+def execute_in_virtuoso(skill_code, timeout_seconds, in_fd=None, out_fd=None, emit=None):
     """
-    Handle incoming TCP connections from Python clients.
-    
+    Send skill code to Virtuoso via stdout and wait for its response on stdin.
+
     Args:
-        conn: TCP socket connection object
-        addr: Client address tuple (host, port)
-    
-    Protocol:
-        1. Receive JSON request with 'skill' code and 'timeout' value
-        2. Send skill code to Virtuoso via stdout
-        3. Start watchdog timer for timeout protection
-        4. Wait for Virtuoso response
-        5. Send response back to client
+        skill_code: Skill code to evaluate
+        timeout_seconds: Watchdog timeout; Virtuoso is interrupted with SIGINT when exceeded
+        in_fd: File descriptor carrying Virtuoso's output (default: stdin)
+        out_fd: File descriptor carrying requests to Virtuoso (default: stdout)
+        emit: Optional callable receiving the response in chunks as it arrives
+              (see stream_until_delimiter)
+
+    Returns:
+        Raw response bytes, starting with STX (success) or NAK (error); with emit,
+        only the rest after the emitted chunks (empty, or a NAK timeout error)
     """
     global watchdog_timer, timeout_flag
-    
+
     try:
-        # Receive JSON formatted request data
-        data = conn.recv(1024*1024)
-        # Python 2.7 compatibility: data is already string, no need to decode
-        request_data = json.loads(data)
-        
-        skill_code = request_data["skill"]
-        timeout_seconds = request_data["timeout"]
-        
         # Reset timeout flag
         timeout_flag = False
-        
+
         # Send skill script to Virtuoso
         # Python 2.7 compatibility: ensure skill_code is string
         if hasattr(skill_code, 'encode'):  # Check if it's unicode
             skill_code = skill_code.encode('utf-8')
-        
-        # Clear stdin buffer before writing (non-blocking read until empty)
-  
-        while True:
-            try:
-                ch = sys.stdin.read(1)
-                if not ch:  # No more data
-                    break
-            except IOError as e:
-                if e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK:
-                    break  # No data available
-                else:
-                    break  # Other error, stop clearing
-        
-        sys.stdout.write(skill_code)
-        sys.stdout.flush()
-        
+
+        # Clear stdin buffer before writing
+        drain_stdin(in_fd)
+
+        _write_all(sys.stdout.fileno() if out_fd is None else out_fd, skill_code)
+
         # Start watchdog timer
         watchdog_timer = threading.Timer(timeout_seconds, watchdog_callback)
         watchdog_timer.daemon = True
         watchdog_timer.start()
-        
+
         # Wait for Virtuoso response
-        returnData = read_until_delimiter()
-        
+        if emit is None:
+            returnData = read_until_delimiter(fd=in_fd)
+        else:
+            returnData = stream_until_delimiter(emit, fd=in_fd)
+
         # If normal return, set timeout flag to True to stop watchdog
         if not timeout_flag:
             timeout_flag = True
-        
+
         # Cancel watchdog timer
         watchdog_timer.cancel()
-        
-        # Python 2.7 compatibility: handle returnData properly
-        if isinstance(returnData, bytearray):
-            conn.sendall(str(returnData))
-        elif hasattr(returnData, 'encode'):  # Check if it's unicode
-            conn.sendall(returnData.encode('utf-8'))
-        else:
-            conn.sendall(returnData)
-            
-    except ValueError as e:
-        # Python 2.7 compatibility: handle JSON decode errors
-        error_msg = "\x15JSONDecodeError: {0}".format(str(e))
-        if hasattr(error_msg, 'encode'):  # Check if it's unicode
-            error_msg = error_msg.encode('utf-8')
-        conn.sendall(error_msg)
-    except Exception as e:
-        # Python 2.7 compatibility: except Exception, e syntax
-        traceback.print_exc()
-        error_msg = "\x15{0}".format(str(e))
-        if hasattr(error_msg, 'encode'):  # Check if it's unicode
-            error_msg = error_msg.encode('utf-8')
-        conn.sendall(error_msg)
+
+        return _to_bytes(returnData)
     finally:
         # Ensure watchdog timer is cleaned up
         timeout_flag = True
         if watchdog_timer:
             watchdog_timer.cancel()
+
+
+def run_request(execute, payload, emit=None):
+    """
+    Decode a JSON request payload and execute it.
+
+    Args:
+        execute: Callable (skill_code, timeout_seconds) -> raw response bytes
+        payload: JSON request bytes with 'skill' and 'timeout'
+        emit: Optional chunk callable, passed on as execute(..., emit=emit)
+
+    Returns:
+        Raw response bytes; errors are reported with the NAK (0x15) marker
+    """
+    try:
+        # Python 2.7 compatibility: data is already string, no need to decode
+        if isinstance(payload, bytearray):
+            payload = bytes(payload)
+        if not isinstance(payload, str):
+            payload = payload.decode('utf-8')
+        request_data = json.loads(payload)
+        if emit is not None:
+            return _to_bytes(execute(request_data["skill"], request_data["timeout"], emit=emit))
+        return _to_bytes(execute(request_data["skill"], request_data["timeout"]))
+    except ValueError as e:
+        # Python 2.7 compatibility: handle JSON decode errors
+        return _to_bytes("\x15JSONDecodeError: {0}".format(str(e)))
+    except Exception as e:
+        traceback.print_exc()
+        return _to_bytes("\x15{0}".format(str(e)))
+
+
+def _close_connection(conn):
+    """
+    Shut down and close a client connection, ignoring errors from already-closed peers.
+    """
+    try:
         conn.shutdown(socket.SHUT_RDWR)
-        conn.close()
+    except Exception:
+        pass
+    conn.close()
 
-def start_server():
+
+def handle_client_data(conn, state, execute, execute_stream=None):
     """
-    Start the TCP server to accept client connections.
-    The server runs indefinitely, handling one connection at a time.
+    Process buffered data of one client connection.
+
+    Args:
+        conn: TCP socket connection object
+        state: Per-connection state dict with 'buffer' (bytearray) and 'mode'
+        execute: Callable (skill_code, timeout_seconds) -> raw response bytes
+        execute_stream: Optional callable (skill_code, timeout_seconds, emit=...) for
+                        streamed requests (see execute_in_virtuoso); without it they
+                        are answered with a single frame
+
+    Returns:
+        True to keep the connection open, False to close it
+
+    Protocol:
+        1. Detect the protocol from the first bytes (FRAME_MAGIC or a JSON object)
+        2. One-shot: wait for a complete JSON request, execute it, reply and close
+        3. Framed: execute every complete frame in order and reply with a frame
+           carrying the same request id
+        4. Streamed: send the response as STREAM_CHUNK frames while it is read,
+           then the final frame carrying the request id
+    """
+    buf = state['buffer']
+
+    if state['mode'] is None:
+        if len(buf) < len(FRAME_MAGIC) and FRAME_MAGIC.startswith(bytes(buf)):
+            return True  # Wait for the rest of the handshake
+        if bytes(buf[:len(FRAME_MAGIC)]) == FRAME_MAGIC:
+            state['mode'] = 'framed'
+            del buf[:len(FRAME_MAGIC)]
+            conn.sendall(FRAME_MAGIC)
+        else:
+            state['mode'] = 'oneshot'
+
+    if state['mode'] == 'oneshot':
+        # A complete JSON object ends with '}', so skip parsing partial requests
+        if not bytes(buf[-16:]).rstrip().endswith(b'}'):
+            return True
+        try:
+            json.loads(bytes(buf).decode('utf-8'))
+        except ValueError:
+            # Incomplete request: keep reading (malformed requests are answered
+            # by serve_forever once the client goes idle)
+            return True
+        conn.sendall(run_request(execute, buf))
+        return False
+
+    # Framed mode: process every complete frame in the buffer
+    while len(buf) >= FRAME_HEADER.size:
+        request_id, length = FRAME_HEADER.unpack(bytes(buf[:FRAME_HEADER.size]))
+        if len(buf) < FRAME_HEADER.size + length:
+            break
+        payload = bytes(buf[FRAME_HEADER.size:FRAME_HEADER.size + length])
+        del buf[:FRAME_HEADER.size + length]
+        if request_id & STREAM_REQUEST and execute_stream is not None:
+            def emit(chunk, chunk_id=request_id | STREAM_CHUNK):
+                conn.sendall(FRAME_HEADER.pack(chunk_id, len(chunk)) + chunk)
+            reply = run_request(execute_stream, payload, emit)
+        else:
+            reply = run_request(execute, payload)
+        conn.sendall(FRAME_HEADER.pack(request_id, len(reply)) + reply)
+    return True
+
+
+def create_server_socket(host, port):
+    """
+    Create the listening TCP socket.
     """
     # Python 2.7 compatibility: don't use context manager for socket
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    try:
-        # Socket options for address reuse
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # Socket options for address reuse
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, 'SO_REUSEPORT'):
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-        s.bind((HOST, PORT))
-        s.listen(1)
-        while True:
-            conn, addr = s.accept()
-            handle_external_connection(conn, addr)
+    s.bind((host, port))
+    s.listen(16)
+    return s
+
+
+def serve_forever(server_socket, execute, stop_event=None, poll_interval=0.5, execute_stream=None):
+    """
+    Accept client connections and serve requests until stop_event is set.
+
+    Persistent (framed) and one-shot connections are multiplexed with select,
+    so an idle persistent connection never blocks other clients.
+
+    Args:
+        server_socket: Listening socket from create_server_socket()
+        execute: Callable (skill_code, timeout_seconds) -> raw response bytes
+        stop_event: Optional threading.Event to stop the loop
+        poll_interval: Seconds between stop_event checks
+        execute_stream: Optional executor of streamed requests (see handle_client_data)
+    """
+    clients = {}  # socket -> state dict
+    try:
+        while stop_event is None or not stop_event.is_set():
+            try:
+                readable, _, _ = select.select([server_socket] + list(clients.keys()), [], [], poll_interval)
+            except select.error as e:
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+
+            for sock in readable:
+                if sock is server_socket:
+                    conn, addr = server_socket.accept()
+                    clients[conn] = {'buffer': bytearray(), 'mode': None, 'last_data': time.time()}
+                    continue
+
+                state = clients[sock]
+                keep_open = False
+                try:
+                    data = sock.recv(RECV_CHUNK_SIZE)
+                    if data:
+                        state['buffer'].extend(data)
+                        state['last_data'] = time.time()
+                        keep_open = handle_client_data(sock, state, execute, execute_stream)
+                except socket.error:
+                    keep_open = False
+                except Exception:
+                    traceback.print_exc()
+                    keep_open = False
+
+                if not keep_open:
+                    del clients[sock]
+                    _close_connection(sock)
+
+            # Reject one-shot requests that never became valid JSON
+            now = time.time()
+            for sock, state in list(clients.items()):
+                if state['mode'] == 'oneshot' and now - state['last_data'] > ONESHOT_IDLE_TIMEOUT:
+                    try:
+                        sock.sendall(run_request(execute, state['buffer']))
+                    except socket.error:
+                        pass
+                    del clients[sock]
+                    _close_connection(sock)
     finally:
-        s.close()
+        for sock in list(clients.keys()):
+            _close_connection(sock)
+        server_socket.close()
+
+
+def start_server(host, port):
+    """
+    Start the TCP server to accept client connections.
+    The server runs indefinitely, executing one request at a time in Virtuoso.
+    """
+    serve_forever(create_server_socket(host, port), execute_in_virtuoso, execute_stream=execute_in_virtuoso)
 
 # Start the server
 if __name__ == "__main__":
-    start_server() 
\ No newline at end of file
+    # Command line arguments for host and port
+    HOST = sys.argv[1]
+    PORT = int(sys.argv[2])
+
+    virtuoso_pid = get_virtuoso_pid()
+    setup_virtuoso_pipes()
+    start_server(HOST, PORT)
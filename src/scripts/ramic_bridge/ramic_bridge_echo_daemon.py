@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+RAMIC Bridge Echo Daemon - Local stand-in for the Virtuoso bridge daemon
+
+Serves the same TCP protocols as ramic_bridge_daemon_27.py (one-shot, framed and
+streamed) without Virtuoso: every request is answered with STX followed by the skill code,
+optionally after a fixed delay to mimic Skill evaluation time. Streamed replies are
+sent in ECHO_STREAM_CHUNK_SIZE pieces. Used by the bridge
+tests and latency benchmarks.
+
+Usage: python ramic_bridge_echo_daemon.py <host> <port> [--latency SECONDS] [--oneshot-only] [--fleet N]
+Example: python ramic_bridge_echo_daemon.py 127.0.0.1 65432 --latency 0.002
+         python ramic_bridge_echo_daemon.py 127.0.0.1 65432 --fleet 4    # Pool of 4 daemons on 65432-65435
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ramic_bridge_daemon_27 as daemon  # noqa: E402
+
+# Size of the chunks a streamed echo reply is split into
+ECHO_STREAM_CHUNK_SIZE = 4096
+
+
+def make_echo_executor(latency: float = 0.0) -> Callable[[str, float], bytes]:
+    """
+    Build an executor that replies like a successful Virtuoso evaluation of the skill code.
+    """
+    lock = threading.Lock()
+
+    def execute(skill_code: str, timeout_seconds: float) -> bytes:
+        # Serialize like the real daemon, where only one Skill call runs at a time
+        with lock:
+            if latency:
+                time.sleep(latency)
+            return b"\x02" + skill_code.encode("utf-8")
+
+    return execute
+
+
+def make_echo_stream_executor(latency: float = 0.0, chunk_size: int = ECHO_STREAM_CHUNK_SIZE) -> Callable[..., bytes]:
+    """
+    Build the streaming counterpart of make_echo_executor: the echo reply is passed to
+    emit in chunk_size pieces, as the daemon forwards a response read from Virtuoso.
+    """
+    lock = threading.Lock()
+
+    def execute(skill_code: str, timeout_seconds: float, emit: Callable[[bytes], None]) -> bytes:
+        with lock:
+            if latency:
+                time.sleep(latency)
+            reply = b"\x02" + skill_code.encode("utf-8")
+            for offset in range(0, len(reply), chunk_size):
+                emit(reply[offset:offset + chunk_size])
+            return b""
+
+    return execute
+
+
+class EchoDaemon:
+    """Echo daemon running in a background thread (port 0 picks a free port)."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 oneshot_only: bool = False, executor: Optional[Callable[[str, float], bytes]] = None,
+                 stream_executor: Optional[Callable[..., bytes]] = None):
+        """
+        A custom executor without a stream_executor answers streamed requests with a
+        single frame, like a daemon without streaming support.
+        """
+        self.host = host
+        self.latency = latency
+        self.oneshot_only = oneshot_only
+        self.executor = executor or make_echo_executor(latency)
+        self.stream_executor = stream_executor or (None if executor else make_echo_stream_executor(latency))
+        self._server_socket = daemon.create_server_socket(host, port)
+        self.port = self._server_socket.getsockname()[1]
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "EchoDaemon":
+        self._thread = threading.Thread(target=self.serve, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve(self) -> None:
+        if self.oneshot_only:
+            serve_oneshot_only(self._server_socket, self.executor, self._stop_event)
+        else:
+            daemon.serve_forever(self._server_socket, self.executor, self._stop_event, poll_interval=0.05,
+                                 execute_stream=self.stream_executor)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "EchoDaemon":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class EchoDaemonFleet:
+    """Several echo daemons on free ports, a stand-in for a farm of Virtuoso instances."""
+
+    def __init__(self, count: int, host: str = "127.0.0.1", latency: float = 0.0):
+        self.daemons = [EchoDaemon(host, 0, latency=latency) for _ in range(count)]
+
+    @property
+    def endpoints(self):
+        return [(echo.host, echo.port) for echo in self.daemons]
+
+    @property
+    def pool(self):
+        """Pool entries for configure_bridge_pool() or the ramic_bridge.pool section of config.yaml."""
+        return [{"host": echo.host, "port": echo.port} for echo in self.daemons]
+
+    def start(self) -> "EchoDaemonFleet":
+        for echo in self.daemons:
+            echo.start()
+        return self
+
+    def stop(self, index: Optional[int] = None) -> None:
+        """Stop one daemon (e.g. to test failover) or, without index, all of them."""
+        for echo in self.daemons if index is None else [self.daemons[index]]:
+            echo.stop()
+
+    def __enter__(self) -> "EchoDaemonFleet":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def serve_oneshot_only(server_socket, execute, stop_event: threading.Event) -> None:
+    """
+    Mimic the original daemon: one recv per connection, reply, close.
+    Framed handshakes get a JSON decode error, exactly as an old daemon would answer.
+    """
+    server_socket.settimeout(0.05)
+    try:
+        while not stop_event.is_set():
+            try:
+                conn, _ = server_socket.accept()
+            except OSError:
+                continue
+            with conn:
+                conn.settimeout(None)
+                data = conn.recv(1024 * 1024)
+                conn.sendall(daemon.run_request(execute, data))
+    finally:
+        server_socket.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Echo stand-in for the RAMIC bridge daemon")
+    parser.add_argument("host")
+    parser.add_argument("port", type=int)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated Skill evaluation time in seconds")
+    parser.add_argument("--oneshot-only", action="store_true", help="Behave like a daemon without framed protocol support")
+    parser.add_argument("--fleet", type=int, default=1, help="Number of daemons, on consecutive ports from <port>")
+    args = parser.parse_args()
+
+    if args.fleet > 1:
+        daemons = [EchoDaemon(args.host, args.port + index, latency=args.latency, oneshot_only=args.oneshot_only)
+                   for index in range(args.fleet)]
+        print(f"🔁 Echo daemon fleet listening on {args.host}:{args.port}-{args.port + args.fleet - 1}")
+        print("ramic_bridge:\n  pool:")
+        for echo in daemons:
+            print(f"    - {{host: {echo.host}, port: {echo.port}}}")
+        for echo in daemons:
+            echo.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            for echo in daemons:
+                echo.stop()
+        return
+
+    echo = EchoDaemon(args.host, args.port, latency=args.latency, oneshot_only=args.oneshot_only)
+    print(f"🔁 Echo daemon listening on {echo.host}:{echo.port}")
+    try:
+        echo.serve()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Bridge scheduler - route bridge calls across a pool of Virtuoso daemons
+
+Each Virtuoso instance of a farm runs its own ramic_bridge daemon. Instead of pinning
+the agent to one RB_HOST/RB_PORT, bridge_utils hands every unpinned call to a
+BridgeScheduler built from the `ramic_bridge.pool` section of config.yaml:
+
+    health      every daemon is probed with `1+1` on first use and again once its last
+                probe is older than probe_interval; daemons failing the probe are skipped
+                until a later probe succeeds
+    load        queue depth (calls of this process waiting on the daemon) first, then the
+                number of sessions bound to the daemon, then the smoothed probe latency,
+                which also grows when other processes keep the daemon busy
+    affinity    calls are grouped into sessions by the cellview they work on (the last
+                cellview opened in the calling thread or task); a session stays on the
+                daemon it was first routed to, so `cv` and open windows are where the
+                following calls expect them, and moves only when that daemon fails
+    failure     a call without reply takes its daemon out of rotation (mark_failed) but
+                is not run again elsewhere: it may have executed, or still be executing.
+                The next call of the session moves; the daemon returns after a later
+                probe succeeds
+"""
+
+import re
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROBE_SKILL = "1+1"
+DEFAULT_PROBE_INTERVAL = 30.0
+DEFAULT_PROBE_TIMEOUT = 5
+# Weight of the newest probe in the smoothed latency
+LATENCY_SMOOTHING = 0.3
+# Session of calls made before any cellview was opened in the calling context
+DEFAULT_SESSION = "default"
+
+_CELLVIEW_PATTERNS = [
+    re.compile(r'dbOpenCellView(?:ByType)?\(\s*"([^"]*)"\s+"([^"]*)"\s+"([^"]*)"'),
+    re.compile(r'geOpen\(\s*\?lib\s+"([^"]*)"\s+\?cell\s+"([^"]*)"\s+\?view\s+"([^"]*)"'),
+]
+
+
+class BridgePoolUnavailableError(ConnectionError):
+    """Raised when no daemon of the pool passes the health probe."""
+
+
+def cellview_session_key(skill: str) -> Optional[str]:
+    """
+    Session key ("lib/cell/view") of the first cellview a SKILL snippet opens, None if it opens none.
+    """
+    for pattern in _CELLVIEW_PATTERNS:
+        match = pattern.search(skill)
+        if match:
+            return "/".join(match.groups())
+    return None
+
+
+def parse_pool_entry(entry: Any) -> Tuple[str, int]:
+    """
+    Parse one pool entry: {"host": ..., "port": ...}, "host:port" or a port (host 127.0.0.1).
+    """
+    if isinstance(entry, dict):
+        return str(entry.get("host") or "127.0.0.1"), int(entry["port"])
+    if isinstance(entry, int):
+        return "127.0.0.1", entry
+    host, _, port = str(entry).rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+class BridgeDaemon:
+    """Health and load of one daemon of the pool."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.healthy: Optional[bool] = None  # None until the first probe
+        self.last_probe = 0.0
+        self.latency_ms: Optional[float] = None
+        self.in_flight = 0
+        self.calls = 0
+        self.failed_probes = 0
+        self.last_error = ""
+
+    @property
+    def endpoint(self) -> Tuple[str, int]:
+        return self.host, self.port
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoint": f"{self.host}:{self.port}",
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "latency_ms": None if self.latency_ms is None else round(self.latency_ms, 2),
+            "calls": self.calls,
+            "failed_probes": self.failed_probes,
+            "last_error": self.last_error,
+        }
+
+
+class BridgeScheduler:
+    """Routes bridge calls to the least-loaded healthy daemon of a pool, sticky per session."""
+
+    def __init__(self, endpoints: List[Tuple[str, int]], executor: Callable[..., str],
+                 probe_interval: float = DEFAULT_PROBE_INTERVAL, probe_timeout: int = DEFAULT_PROBE_TIMEOUT):
+        """
+        Args:
+            endpoints: (host, port) of every daemon, in order of preference for ties
+            executor: Blocking bridge call with the signature of RBExc, used for probes
+            probe_interval: Seconds after which a daemon is probed again
+            probe_timeout: Virtuoso timeout of a probe in seconds
+        """
+        if not endpoints:
+            raise ValueError("A bridge pool needs at least one daemon")
+        self.daemons: Dict[Tuple[str, int], BridgeDaemon] = {}
+        for host, port in endpoints:
+            self.daemons.setdefault((host, port), BridgeDaemon(host, port))
+        self.executor = executor
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self._affinity: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def probe(self, endpoint: Tuple[str, int]) -> bool:
+        """Probe one daemon with a cheap call, update its health and latency."""
+        daemon = self.daemons[endpoint]
+        start = time.perf_counter()
+        try:
+            ret = self.executor(PROBE_SKILL, host=daemon.host, port=daemon.port, timeout=self.probe_timeout) or ""
+            reply = "".join(ch for ch in str(ret) if ord(ch) >= 32).strip()
+            error = "" if reply else "no reply to probe"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        with self._lock:
+            daemon.last_probe = time.monotonic()
+            daemon.healthy = not error
+            daemon.last_error = error
+            if error:
+                daemon.failed_probes += 1
+            else:
+                daemon.latency_ms = elapsed_ms if daemon.latency_ms is None else \
+                    (1 - LATENCY_SMOOTHING) * daemon.latency_ms + LATENCY_SMOOTHING * elapsed_ms
+        return not error
+
+    def mark_failed(self, endpoint: Tuple[str, int], error: str) -> None:
+        """
+        Take a daemon out of rotation after a call got no reply, without probing it: it
+        may still be evaluating that call, so a probe would only queue behind it and fail.
+        """
+        with self._lock:
+            daemon = self.daemons[endpoint]
+            daemon.healthy = False
+            daemon.last_error = error
+            daemon.last_probe = time.monotonic()
+
+    def probe_stale(self, force: bool = False, unhealthy_only: bool = False) -> None:
+        """
+        Probe (in parallel) the daemons whose last probe is older than probe_interval.
+        Daemons with calls in flight are skipped: a probe would only queue behind them.
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = [daemon.endpoint for daemon in self.daemons.values()
+                     if (force or daemon.healthy is None or now - daemon.last_probe >= self.probe_interval)
+                     and daemon.in_flight == 0 and not (unhealthy_only and daemon.healthy)]
+        if len(stale) == 1:
+            self.probe(stale[0])
+        elif stale:
+            with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+                list(pool.map(self.probe, stale))
+
+    def acquire(self, session: Optional[str] = None) -> Tuple[str, int]:
+        """
+        Pick the daemon for one call of a session and count the call as in flight.
+        Release it with release() when the call returns.
+
+        Raises:
+            BridgePoolUnavailableError: no daemon of the pool is healthy
+        """
+        self.probe_stale()
+        with self._lock:
+            any_healthy = any(daemon.healthy for daemon in self.daemons.values())
+        if not any_healthy:
+            # Give failed daemons that are idle by now another chance before giving up
+            self.probe_stale(force=True, unhealthy_only=True)
+        session = session or DEFAULT_SESSION
+        with self._lock:
+            endpoint = self._affinity.get(session)
+            daemon = self.daemons.get(endpoint) if endpoint else None
+            if daemon is None or not daemon.healthy:
+                candidates = [d for d in self.daemons.values() if d.healthy]
+                if not candidates:
+                    errors = "; ".join(f"{d.host}:{d.port} {d.last_error}" for d in self.daemons.values())
+                    raise BridgePoolUnavailableError(f"No healthy bridge daemon in the pool ({errors})")
+                sessions = self._session_counts()
+                order = list(self.daemons)
+                daemon = min(candidates, key=lambda d: (d.in_flight, sessions.get(d.endpoint, 0),
+                                                        d.latency_ms if d.latency_ms is not None else float("inf"),
+                                                        order.index(d.endpoint)))
+                if endpoint is not None:
+                    print(f"⚠️  Bridge daemon {endpoint[0]}:{endpoint[1]} is unavailable, "
+                          f"moving session {session} to {daemon.host}:{daemon.port}")
+                self._affinity[session] = daemon.endpoint
+            daemon.in_flight += 1
+            return daemon.endpoint
+
+    def release(self, endpoint: Tuple[str, int]) -> None:
+        """Count a call as finished."""
+        with self._lock:
+            daemon = self.daemons[endpoint]
+            daemon.in_flight = max(0, daemon.in_flight - 1)
+            daemon.calls += 1
+
+    def session_endpoint(self, session: Optional[str] = None) -> Optional[Tuple[str, int]]:
+        """Daemon a session is bound to, None if it has not been routed yet."""
+        with self._lock:
+            return self._affinity.get(session or DEFAULT_SESSION)
+
+    def _session_counts(self) -> Dict[Tuple[str, int], int]:
+        """Number of sessions bound to each daemon (call with the lock held)."""
+        sessions: Dict[Tuple[str, int], int] = {}
+        for endpoint in self._affinity.values():
+            sessions[endpoint] = sessions.get(endpoint, 0) + 1
+        return sessions
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Health, queue depth, latency, call and session counts of every daemon."""
+        with self._lock:
+            sessions = self._session_counts()
+            return [dict(daemon.to_dict(), sessions=sessions.get(endpoint, 0))
+                    for endpoint, daemon in self.daemons.items()]
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Tuple
 import os
 import json
+import time
+import asyncio
+import threading
+import contextlib
+import contextvars
 
 from dotenv import load_dotenv
 load_dotenv()
 
+from .bridge_scheduler import (
+    BridgeScheduler, DEFAULT_PROBE_INTERVAL, DEFAULT_PROBE_TIMEOUT, DEFAULT_SESSION,
+    cellview_session_key, parse_pool_entry,
+)
+
 
 def use_ramic_bridge() -> bool:
     """
@@ -42,6 +52,233 @@ def _import_rbexc():
     raise ImportError("Could not import RBExc from any known location. Please ensure ramic_bridge is installed or available in the project.")
 
 
+def use_persistent_bridge() -> bool:
+    """
+    Decide whether ramic_bridge calls reuse pooled persistent connections.
+    Enabled by default; set RB_PERSISTENT to one of {"0","false","no"} to open one connection per call.
+    """
+    return os.getenv("RB_PERSISTENT", "1").strip().lower() not in {"0", "false", "no"}
+
+
+def _import_rb_executor():
+    """
+    Import the bridge executor: RBExcPersistent when persistent connections are enabled
+    and available, RBExc otherwise. Both share the same call signature.
+    """
+    if use_persistent_bridge():
+        for module_name in ("src.scripts.ramic_bridge.ramic_bridge", "src.tools.ramic_bridge.ramic_bridge", "ramic_bridge"):
+            try:
+                module = __import__(module_name, fromlist=["RBExcPersistent"])
+                return module.RBExcPersistent
+            except Exception:
+                pass
+    return _import_rbexc()
+
+
+def _import_rb_async(name: str = "RBExcAsync"):
+    """
+    Import RBExcAsync (asyncio client multiplexing requests over framed connections),
+    or another name of the ramic_bridge_async module.
+    """
+    for module_name in ("src.scripts.ramic_bridge.ramic_bridge_async", "src.tools.ramic_bridge.ramic_bridge_async", "ramic_bridge_async"):
+        try:
+            module = __import__(module_name, fromlist=[name])
+            return getattr(module, name)
+        except Exception:
+            pass
+    raise ImportError(f"Could not import {name} from any known location. Please ensure ramic_bridge is installed or available in the project.")
+
+
+def _import_rb_stream():
+    """
+    Import RBExcStream (yields large results in chunks while they are transferred).
+    """
+    for module_name in ("src.scripts.ramic_bridge.ramic_bridge", "src.tools.ramic_bridge.ramic_bridge", "ramic_bridge"):
+        try:
+            module = __import__(module_name, fromlist=["RBExcStream"])
+            return module.RBExcStream
+        except Exception:
+            pass
+    raise ImportError("Could not import RBExcStream from any known location. Please ensure ramic_bridge is installed or available in the project.")
+
+
+# (host, port) set by bridge_endpoint() for the calls of the current thread or task
+_endpoint_override: contextvars.ContextVar = contextvars.ContextVar("rb_endpoint_override", default=(None, None))
+
+
+@contextlib.contextmanager
+def bridge_endpoint(host: Optional[str] = None, port: Optional[int] = None) -> Iterator[None]:
+    """
+    Route the bridge calls made inside the block to the daemon at host:port,
+    i.e. to one specific Virtuoso session, without passing host/port down.
+
+    The endpoint is bound to the current context, so concurrent asyncio tasks (and the
+    threads they start with asyncio.to_thread) can each target a different session.
+    """
+    token = _endpoint_override.set((host, port))
+    try:
+        yield
+    finally:
+        _endpoint_override.reset(token)
+
+
+def _resolve_rb_endpoint(host: Optional[str] = None, port: Optional[int] = None) -> Tuple[str, int]:
+    """
+    Resolve host/port: explicit arguments, then bridge_endpoint(), then RB_HOST/RB_PORT
+    (default 127.0.0.1:65432).
+    """
+    override_host, override_port = _endpoint_override.get()
+    if host is None:
+        host = override_host
+    if port is None:
+        port = override_port
+    rb_host = host if host is not None else os.getenv("RB_HOST", "127.0.0.1")
+    if port is not None:
+        rb_port = port
+    else:
+        try:
+            rb_port = int(os.getenv("RB_PORT", "65432"))
+        except Exception:
+            rb_port = 65432
+    return rb_host, rb_port
+
+
+# ===================== Daemon pool =====================
+_scheduler: Optional[BridgeScheduler] = None
+_scheduler_loaded = False
+_scheduler_lock = threading.RLock()
+
+# Session (cellview last opened) of the bridge calls of the current thread or task
+_bridge_session: contextvars.ContextVar = contextvars.ContextVar("rb_bridge_session", default=None)
+
+
+def configure_bridge_pool(pool: Optional[List[Any]], probe_interval: float = DEFAULT_PROBE_INTERVAL,
+                          probe_timeout: int = DEFAULT_PROBE_TIMEOUT) -> Optional[BridgeScheduler]:
+    """
+    Schedule bridge calls across a pool of daemons (see bridge_scheduler.py).
+
+    Args:
+        pool: Daemon entries ({"host", "port"}, "host:port" or port); None or [] pins
+            calls to RB_HOST/RB_PORT again
+        probe_interval: Seconds after which a daemon is health-probed again
+        probe_timeout: Virtuoso timeout of a health probe in seconds
+
+    Returns:
+        The scheduler, None without a pool
+    """
+    global _scheduler, _scheduler_loaded
+    scheduler = None
+    if pool:
+        scheduler = BridgeScheduler([parse_pool_entry(entry) for entry in pool], _import_rb_executor(),
+                                    probe_interval=probe_interval, probe_timeout=probe_timeout)
+    with _scheduler_lock:
+        _scheduler = scheduler
+        _scheduler_loaded = True
+    return scheduler
+
+
+def get_bridge_scheduler() -> Optional[BridgeScheduler]:
+    """
+    Get the scheduler of the ramic_bridge.pool section of config.yaml (read on first use),
+    None when no pool is configured.
+    """
+    with _scheduler_lock:
+        if not _scheduler_loaded:
+            settings: Dict[str, Any] = {}
+            try:
+                from src.app.utils.config_utils import load_config_from_yaml
+                settings = (load_config_from_yaml() or {}).get("ramic_bridge") or {}
+            except Exception:
+                pass
+            configure_bridge_pool(settings.get("pool"),
+                                  probe_interval=settings.get("probe_interval") or DEFAULT_PROBE_INTERVAL,
+                                  probe_timeout=settings.get("probe_timeout") or DEFAULT_PROBE_TIMEOUT)
+        return _scheduler
+
+
+@contextlib.contextmanager
+def bridge_session(name: str) -> Iterator[None]:
+    """
+    Group the bridge calls made inside the block into one scheduling session, so they
+    run on the same daemon of the pool (calls are otherwise grouped by the cellview
+    they open).
+    """
+    token = _bridge_session.set(name)
+    try:
+        yield
+    finally:
+        _bridge_session.reset(token)
+
+
+def _pool_scheduler(host: Optional[str] = None, port: Optional[int] = None) -> Optional[BridgeScheduler]:
+    """
+    Scheduler for a call, None when the call is pinned (host/port or bridge_endpoint()) or there is no pool.
+    """
+    if host is not None or port is not None or _endpoint_override.get() != (None, None):
+        return None
+    return get_bridge_scheduler()
+
+
+def _call_session(skill: str) -> str:
+    """
+    Session of a call: the cellview it opens (which becomes the session of the following
+    calls in this thread or task), else the current session.
+    """
+    session = cellview_session_key(skill)
+    if session:
+        _bridge_session.set(session)
+        return session
+    return _bridge_session.get() or DEFAULT_SESSION
+
+
+def _rb_exec_pooled(scheduler: BridgeScheduler, RBExc, skill: str, timeout: int) -> str:
+    """
+    Run a call on the daemon of its session. A call without reply (the daemon failed,
+    or is still busy with it) is not run again, it may already have executed: it fails,
+    and its daemon is taken out of rotation so the next call of the session moves.
+    """
+    session = _call_session(skill)
+    endpoint = scheduler.acquire(session)
+    try:
+        ret = RBExc(skill, host=endpoint[0], port=endpoint[1], timeout=timeout) or ""
+    finally:
+        scheduler.release(endpoint)
+    if not ret:
+        scheduler.mark_failed(endpoint, "no reply to a call")
+    return _clean_bridge_output(ret)
+
+
+async def _rb_exec_pooled_async(scheduler: BridgeScheduler, skill: str, timeout: int) -> str:
+    """
+    Coroutine variant of _rb_exec_pooled (probes run in a worker thread).
+    """
+    RBExcAsync = _import_rb_async()
+    session = _call_session(skill)
+    endpoint = await asyncio.to_thread(scheduler.acquire, session)
+    try:
+        ret = await RBExcAsync(skill, host=endpoint[0], port=endpoint[1], timeout=timeout) or ""
+    finally:
+        scheduler.release(endpoint)
+    if not ret:
+        scheduler.mark_failed(endpoint, "no reply to a call")
+    return _clean_bridge_output(ret)
+
+
+def get_bridge_pool_status() -> List[Dict[str, Any]]:
+    """
+    Health, queue depth, latency and session count of every pooled daemon ([] without a pool).
+    """
+    scheduler = get_bridge_scheduler()
+    return scheduler.status() if scheduler is not None else []
+
+
+def _clean_bridge_output(ret: Any) -> str:
+    """
+    Remove protocol control chars (STX/NAK/RS) and other non-printables.
+    """
+    return "".join(ch for ch in str(ret) if ord(ch) >= 32).strip()
+
+
 def rb_exec(skill: str, timeout: int = 30, host: Optional[str] = None, port: Optional[int] = None) -> str:
     """
     Execute SKILL code via ramic_bridge.
@@ -55,20 +292,14 @@ def rb_exec(skill: str, timeout: int = 30, host: Optional[str] = None, port: Opt
         host: Optional host override (if None, uses RB_HOST env var)
         port: Optional port override (if None, uses RB_PORT env var)
     """
-    RBExc = _import_rbexc()
-    rb_host = host if host is not None else os.getenv("RB_HOST", "127.0.0.1")
-    if port is not None:
-        rb_port = port
-    else:
-        try:
-            rb_port = int(os.getenv("RB_PORT", "65432"))
-        except Exception:
-            rb_port = 65432
+    RBExc = _import_rb_executor()
+    scheduler = _pool_scheduler(host, port)
+    rb_host, rb_port = _resolve_rb_endpoint(host, port)
     try:
+        if scheduler is not None:
+            return _rb_exec_pooled(scheduler, RBExc, skill, timeout)
         ret = RBExc(skill, host=rb_host, port=rb_port, timeout=timeout) or ""
-        # Remove protocol control chars (STX/NAK/RS) and other non-printables
-        cleaned = "".join(ch for ch in str(ret) if ord(ch) >= 32).strip()
-        return cleaned
+        return _clean_bridge_output(ret)
     except json.JSONDecodeError as e:
         # If JSON parsing fails in bridge communication, raise it so caller can handle
         raise
@@ -77,6 +308,58 @@ def rb_exec(skill: str, timeout: int = 30, host: Optional[str] = None, port: Opt
         return f"Bridge execution error: {str(e)}"
 
 
+async def rb_exec_async(skill: str, timeout: int = 30, host: Optional[str] = None, port: Optional[int] = None) -> str:
+    """
+    Execute SKILL code via ramic_bridge without blocking the event loop.
+
+    Same arguments and return value as rb_exec. Calls to different host/port (Virtuoso
+    sessions) run in parallel under asyncio.gather(); calls to one session are pipelined
+    on its connection. Cancelling the awaiting task abandons the request.
+    """
+    if not use_persistent_bridge():
+        # One connection per call was requested: keep the blocking client, off the loop
+        return await asyncio.to_thread(rb_exec, skill, timeout, host, port)
+    scheduler = _pool_scheduler(host, port)
+    rb_host, rb_port = _resolve_rb_endpoint(host, port)
+    try:
+        if scheduler is not None:
+            return await _rb_exec_pooled_async(scheduler, skill, timeout)
+        RBExcAsync = _import_rb_async()
+        ret = await RBExcAsync(skill, host=rb_host, port=rb_port, timeout=timeout) or ""
+        return _clean_bridge_output(ret)
+    except json.JSONDecodeError as e:
+        raise
+    except Exception as e:
+        return f"Bridge execution error: {str(e)}"
+
+
+def rb_exec_stream(skill: str, timeout: int = 30, host: Optional[str] = None, port: Optional[int] = None) -> Iterator[str]:
+    """
+    Execute SKILL code via ramic_bridge and yield its result in chunks while the daemon
+    forwards it, for results too large to handle as one string (layout dumps).
+
+    Unlike rb_exec the text is not cleaned: the chunks join to the printed result, so a
+    string result keeps its quotes and escapes (see layout_dump_parser.SkillStringDecoder).
+    Calls without host/port are scheduled on the daemon pool like rb_exec, but are not
+    retried on another daemon, since part of the result may already have been consumed.
+
+    Raises:
+        RBStreamError: Virtuoso reported an error or the call timed out
+        OSError: the daemon could not be reached (BridgePoolUnavailableError for the pool)
+    """
+    RBExcStream = _import_rb_stream()
+    scheduler = _pool_scheduler(host, port)
+    if scheduler is None:
+        rb_host, rb_port = _resolve_rb_endpoint(host, port)
+        yield from RBExcStream(skill, host=rb_host, port=rb_port, timeout=timeout)
+        return
+    endpoint = scheduler.acquire(_call_session(skill))
+    try:
+        yield from RBExcStream(skill, host=endpoint[0], port=endpoint[1], timeout=timeout)
+    finally:
+        scheduler.release(endpoint)
+
+
 def get_current_design() -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Get (lib, cell, view) for current edit cellView using either ramic_bridge or skillbridge.
@@ -123,6 +406,21 @@ def _escape_path_for_skill(path: str) -> str:
     return path.replace("\\", "\\\\").replace('"', '\\"')
 
 
+def _is_load_success(ret: str) -> bool:
+    """
+    load returns t on success; rb_exec stringifies: check empty as success fallback.
+    """
+    return ret == '' or ret.lower() in {'t', 't\n'}
+
+
+def _is_non_nil(ret: str) -> bool:
+    """
+    Check that a cellView/window was returned (a nil result prints as "nil").
+    """
+    cleaned = (ret or "").strip().lower()
+    return cleaned != "nil" and len(cleaned) > 0
+
+
 def load_skill_file(file_path: str, timeout: int = 60) -> bool:
     """
     Load a .il/.skill file in Virtuoso via the active bridge.
@@ -131,8 +429,7 @@ def load_skill_file(file_path: str, timeout: int = 60) -> bool:
     abs_path = _escape_path_for_skill(file_path)
     if use_ramic_bridge():
         ret = rb_exec(f'load("{abs_path}")', timeout=timeout)
-        # load returns t on success; rb_exec stringifies: check empty as success fallback
-        return ret == '' or ret.lower() in {'t', 't\n'}
+        return _is_load_success(ret)
     else:
         try:
             from skillbridge import Workspace  # type: ignore
@@ -215,6 +512,34 @@ def _default_view_type_for(view: str) -> str:
     return view
 
 
+def _open_cell_view_by_type_skill(lib: str, cell: str, view: str, view_type: str, mode: str = "w") -> str:
+    """
+    Build the SKILL snippet that opens a cellView into the global `cv`.
+    """
+    # Build SKILL snippet
+    lib_s = lib.replace('"', '\\"')
+    cell_s = cell.replace('"', '\\"')
+    view_s = view.replace('"', '\\"')
+    vtype_s = (view_type or "").replace('"', '\\"')
+    mode_s = (mode or "w").replace('"', '\\"')
+    # Only open and return cv (no side effects like setting edit view)
+    return f'cv = dbOpenCellViewByType("{lib_s}" "{cell_s}" "{view_s}" "{vtype_s}" "{mode_s}")'
+
+
+def _ge_open_window_skill(lib: str, cell: str, view: str, view_type: str, mode: str = "a") -> str:
+    """
+    Build the SKILL snippet that opens a window for a cellView into the global `window`.
+    """
+    # Build SKILL snippet with named parameters
+    lib_s = lib.replace('"', '\\"')
+    cell_s = cell.replace('"', '\\"')
+    view_s = view.replace('"', '\\"')
+    vtype_s = (view_type or "").replace('"', '\\"')
+    mode_s = (mode or "a").replace('"', '\\"')
+    # Use geOpen with named parameters
+    return f'window = geOpen(?lib "{lib_s}" ?cell "{cell_s}" ?view "{view_s}" ?viewType "{vtype_s}" ?mode "{mode_s}")'
+
+
 def open_cell_view_by_type(
     lib: str,
     cell: str,
@@ -240,21 +565,10 @@ def open_cell_view_by_type(
     if not view_type:
         view_type = _default_view_type_for(view)
     if use_ramic_bridge():
-        # Build SKILL snippet
-        lib_s = lib.replace('"', '\\"')
-        cell_s = cell.replace('"', '\\"')
-        view_s = view.replace('"', '\\"')
-        vtype_s = (view_type or "").replace('"', '\\"')
-        mode_s = (mode or "w").replace('"', '\\"')
-        # Only open and return cv (no side effects like setting edit view)
-        skill = (
-            f'cv = dbOpenCellViewByType("{lib_s}" "{cell_s}" "{view_s}" "{vtype_s}" "{mode_s}")'
-        )
+        skill = _open_cell_view_by_type_skill(lib, cell, view, view_type, mode)
         try:
             ret = rb_exec(skill, timeout=timeout)
-            # If cv is nil, the return will likely contain "nil"; success returns a db object printed string
-            cleaned = (ret or "").strip().lower()
-            return cleaned != "nil" and len(cleaned) > 0
+            return _is_non_nil(ret)
         except Exception:
             return False
     else:
@@ -296,16 +610,7 @@ def ge_open_window(
     if not view_type:
         view_type = _default_view_type_for(view)
     if use_ramic_bridge():
-        # Build SKILL snippet with named parameters
-        lib_s = lib.replace('"', '\\"')
-        cell_s = cell.replace('"', '\\"')
-        view_s = view.replace('"', '\\"')
-        vtype_s = (view_type or "").replace('"', '\\"')
-        mode_s = (mode or "a").replace('"', '\\"')
-        # Use geOpen with named parameters
-        skill = (
-            f'window = geOpen(?lib "{lib_s}" ?cell "{cell_s}" ?view "{view_s}" ?viewType "{vtype_s}" ?mode "{mode_s}")'
-        )
+        skill = _ge_open_window_skill(lib, cell, view, view_type, mode)
         try:
             ret = rb_exec(skill, timeout=timeout)
             # Check if window was opened successfully (geOpen returns window object or nil)
@@ -375,6 +680,23 @@ def open_cell_view(
         except Exception:
             return False
 
+def _is_screenshot_load_success(load_ret: str) -> bool:
+    return load_ret == '' or load_ret.strip().lower() in {'t', 't\n'}
+
+
+def _screenshot_result(take_ret: str, save_path: str) -> tuple[bool, str]:
+    """
+    Check the takeScreenshot reply and the screenshot file, as (success, error_message).
+    """
+    # Treat any non-empty error-ish output as failure
+    if take_ret and ('error' in take_ret.lower() or 'undefined function' in take_ret.lower()):
+        return False, f"takeScreenshot failed: {take_ret}"
+    # Verify that the file was actually created
+    if not os.path.exists(save_path):
+        return False, "screenshot file not created"
+    return True, ""
+
+
 def load_script_and_take_screenshot_verbose(screenshot_script_path: str, save_path: str, timeout: int = 20) -> tuple[bool, str]:
     """
     Load a screenshot SKILL script and take screenshot to save_path.
@@ -385,16 +707,10 @@ def load_script_and_take_screenshot_verbose(screenshot_script_path: str, save_pa
     if use_ramic_bridge():
         # Load the screenshot script; success is empty or 't'
         load_ret = rb_exec(f'load("{scr}")', timeout=timeout)
-        if not (load_ret == '' or load_ret.strip().lower() in {'t', 't\n'}):
+        if not _is_screenshot_load_success(load_ret):
             return False, f"load failed: {load_ret}"
-        # Invoke takeScreenshot; treat any non-empty error-ish output as failure
         take_ret = rb_exec(f'takeScreenshot("{out}")', timeout=timeout)
-        if take_ret and ('error' in take_ret.lower() or 'undefined function' in take_ret.lower()):
-            return False, f"takeScreenshot failed: {take_ret}"
-        # Verify that the file was actually created
-        if not os.path.exists(save_path):
-            return False, "screenshot file not created"
-        return True, ""
+        return _screenshot_result(take_ret, save_path)
     else:
         try:
             from skillbridge import Workspace  # type: ignore
@@ -419,6 +735,272 @@ def load_script_and_take_screenshot(screenshot_script_path: str, save_path: str,
     return ok
 
 
+# ===================== Batched execution =====================
+_BATCH_STEP_SEPARATOR = "@@RBSTEP@@"
+
+
+def skill_step(name: str, skill: str, require_non_nil: bool = False, stop_on_failure: bool = True) -> Dict[str, Any]:
+    """
+    Describe one step of a SKILL batch.
+
+    Args:
+        name: Step name used in results and timing reports
+        skill: SKILL expression to evaluate
+        require_non_nil: Treat a nil return value as failure
+        stop_on_failure: Skip the remaining steps when this step fails
+    """
+    return {"name": name, "skill": skill, "require_non_nil": require_non_nil, "stop_on_failure": stop_on_failure}
+
+
+def open_cell_view_steps(lib: str, cell: str, view: str = "layout", view_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Steps that open a cellView, show it in a window and bind `cv` to the edit cellView,
+    like open_cell_view_by_type + ge_open_window + ui_redraw + `cv = geGetEditCellView()`.
+    """
+    if not view_type:
+        view_type = _default_view_type_for(view)
+    return [
+        skill_step("open_cell_view", _open_cell_view_by_type_skill(lib, cell, view, view_type, "w"), require_non_nil=True),
+        skill_step("open_window", _ge_open_window_skill(lib, cell, view, view_type, "a"), require_non_nil=True),
+        skill_step("redraw", "hiRedraw()", stop_on_failure=False),
+        skill_step("edit_cell_view", "cv = geGetEditCellView()", require_non_nil=True),
+    ]
+
+
+def compose_skill_batch(steps: List[Dict[str, Any]]) -> str:
+    """
+    Compose steps into one SKILL expression.
+
+    Each step runs inside errset() and measureTime(); the expression returns one
+    string with a "<index>|<status>|<elapsed seconds>|<value>" record per executed
+    step, where status is ok, nil (nil returned but required non-nil) or error.
+    """
+    lines = ["let((rbBatchOut rbBatchRes rbBatchTime rbBatchStatus rbBatchStop)"]
+    for index, step in enumerate(steps):
+        require = "t" if step.get("require_non_nil") else "nil"
+        stop = "t" if step.get("stop_on_failure", True) else "nil"
+        lines.append(f"  unless(rbBatchStop")
+        lines.append(f"    rbBatchTime = measureTime(rbBatchRes = errset(progn({step['skill']}) nil))")
+        lines.append(f'    rbBatchStatus = cond((!rbBatchRes "error") ({require} && !car(rbBatchRes) "nil") (t "ok"))')
+        lines.append(f'    rbBatchOut = cons(sprintf(nil "{index}|%s|%g|%L" rbBatchStatus nth(2 rbBatchTime) '
+                     f'if(rbBatchRes car(rbBatchRes) errset.errset)) rbBatchOut)')
+        lines.append(f'    when({stop} && rbBatchStatus != "ok" rbBatchStop = t)')
+        lines.append("  )")
+    lines.append(f'  buildString(reverse(rbBatchOut) "{_BATCH_STEP_SEPARATOR}")')
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def _unquote_skill_string(text: str) -> str:
+    """
+    Undo SKILL's printed string quoting ("..." with backslash escapes).
+    """
+    text = text.strip()
+    if len(text) < 2 or not (text.startswith('"') and text.endswith('"')):
+        return text
+    escapes = {"n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+    out = []
+    chars = iter(text[1:-1])
+    for ch in chars:
+        if ch == "\\":
+            nxt = next(chars, "")
+            out.append(escapes.get(nxt, nxt))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def parse_skill_batch_output(output: str, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Parse the string returned by a composed batch into per-step results.
+
+    Returns:
+        One dict per step: name, status (ok | nil | error | skipped), ok, result, elapsed_ms
+    """
+    records: Dict[int, Dict[str, Any]] = {}
+    text = _unquote_skill_string(output or "")
+    for record in text.split(_BATCH_STEP_SEPARATOR) if text else []:
+        parts = record.split("|", 3)
+        if len(parts) != 4 or not parts[0].isdigit():
+            continue
+        try:
+            elapsed_ms = float(parts[2]) * 1000.0
+        except ValueError:
+            elapsed_ms = None
+        records[int(parts[0])] = {"status": parts[1], "result": parts[3], "elapsed_ms": elapsed_ms}
+
+    results = []
+    for index, step in enumerate(steps):
+        record = records.get(index, {"status": "skipped", "result": "", "elapsed_ms": None})
+        results.append({"name": step["name"], "ok": record["status"] == "ok", **record})
+    return results
+
+
+def rb_exec_batch(steps: List[Dict[str, Any]], timeout: int = 60) -> Dict[str, Any]:
+    """
+    Execute several SKILL steps in one bridge round trip.
+
+    Args:
+        steps: Steps created with skill_step()
+        timeout: Timeout in seconds for the whole batch
+
+    Returns:
+        Dict with ok (all steps ok), steps (see parse_skill_batch_output),
+        round_trip_ms and raw (the unparsed bridge output)
+    """
+    skill = compose_skill_batch(steps)
+    start = time.perf_counter()
+    if use_ramic_bridge():
+        raw = rb_exec(skill, timeout=timeout)
+    else:
+        try:
+            from skillbridge import Workspace  # type: ignore
+            ws = Workspace.open()
+            try:
+                raw = str(ws['evalstring'](skill) or "")
+            finally:
+                ws.close()
+        except Exception as e:
+            raw = f"Bridge execution error: {str(e)}"
+    round_trip_ms = (time.perf_counter() - start) * 1000.0
+    return _batch_result(raw, steps, round_trip_ms)
+
+
+def _batch_result(raw: str, steps: List[Dict[str, Any]], round_trip_ms: float) -> Dict[str, Any]:
+    """
+    Build the rb_exec_batch result from the raw bridge output of a composed batch.
+    """
+    results = parse_skill_batch_output(raw, steps)
+    if results and all(r["status"] == "skipped" for r in results):
+        # Nothing was executed: report the bridge output as the first step's error
+        results[0].update({"status": "error", "result": raw.strip() or "empty result"})
+    return {
+        "ok": all(r["ok"] for r in results),
+        "steps": results,
+        "round_trip_ms": round_trip_ms,
+        "raw": raw,
+    }
+
+
+def get_batch_step(batch_result: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    """
+    Find a step result by name.
+    """
+    for step in batch_result.get("steps", []):
+        if step["name"] == name:
+            return step
+    return None
+
+
+def format_batch_timing(batch_result: Dict[str, Any]) -> str:
+    """
+    Format per-step Virtuoso time and the total round trip, e.g.
+    "open_cell_view 3.0ms | load 812.0ms | round trip 830.5ms".
+    """
+    parts = []
+    for step in batch_result.get("steps", []):
+        if step["elapsed_ms"] is not None:
+            parts.append(f"{step['name']} {step['elapsed_ms']:.1f}ms")
+        else:
+            parts.append(f"{step['name']} {step['status']}")
+    parts.append(f"round trip {batch_result.get('round_trip_ms', 0.0):.1f}ms")
+    return " | ".join(parts)
+
+
+# ===================== Async helpers =====================
+# Coroutine variants of the helpers above with host/port parameters, so that calls to
+# several Virtuoso sessions can be combined with asyncio.gather(). Without ramic_bridge
+# they run the blocking helper in a worker thread (skillbridge has no session routing).
+async def load_skill_file_async(file_path: str, timeout: int = 60, host: Optional[str] = None, port: Optional[int] = None) -> bool:
+    """
+    Load a .il/.skill file in the Virtuoso session at host:port. Returns True on success.
+    """
+    if not use_ramic_bridge():
+        return await asyncio.to_thread(load_skill_file, file_path, timeout)
+    ret = await rb_exec_async(f'load("{_escape_path_for_skill(file_path)}")', timeout=timeout, host=host, port=port)
+    return _is_load_success(ret)
+
+
+async def open_cell_view_by_type_async(
+    lib: str,
+    cell: str,
+    view: str = "layout",
+    view_type: Optional[str] = None,
+    mode: str = "w",
+    timeout: int = 30,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+) -> bool:
+    """
+    Open a cellView in the Virtuoso session at host:port (see open_cell_view_by_type).
+    """
+    if not view_type:
+        view_type = _default_view_type_for(view)
+    if not use_ramic_bridge():
+        return await asyncio.to_thread(open_cell_view_by_type, lib, cell, view, view_type, mode, timeout)
+    ret = await rb_exec_async(_open_cell_view_by_type_skill(lib, cell, view, view_type, mode), timeout=timeout, host=host, port=port)
+    return _is_non_nil(ret)
+
+
+async def load_script_and_take_screenshot_verbose_async(screenshot_script_path: str, save_path: str, timeout: int = 20,
+                                                        host: Optional[str] = None, port: Optional[int] = None) -> tuple[bool, str]:
+    """
+    Take a screenshot of the Virtuoso session at host:port (see load_script_and_take_screenshot_verbose).
+    Returns (success, error_message).
+    """
+    if not use_ramic_bridge():
+        return await asyncio.to_thread(load_script_and_take_screenshot_verbose, screenshot_script_path, save_path, timeout)
+    scr = _escape_path_for_skill(screenshot_script_path)
+    out = _escape_path_for_skill(save_path)
+    load_ret = await rb_exec_async(f'load("{scr}")', timeout=timeout, host=host, port=port)
+    if not _is_screenshot_load_success(load_ret):
+        return False, f"load failed: {load_ret}"
+    take_ret = await rb_exec_async(f'takeScreenshot("{out}")', timeout=timeout, host=host, port=port)
+    return _screenshot_result(take_ret, save_path)
+
+
+async def rb_exec_batch_async(steps: List[Dict[str, Any]], timeout: int = 60,
+                              host: Optional[str] = None, port: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Execute several SKILL steps in one round trip to the session at host:port (see rb_exec_batch).
+    """
+    if not use_ramic_bridge():
+        return await asyncio.to_thread(rb_exec_batch, steps, timeout)
+    start = time.perf_counter()
+    raw = await rb_exec_async(compose_skill_batch(steps), timeout=timeout, host=host, port=port)
+    return _batch_result(raw, steps, (time.perf_counter() - start) * 1000.0)
+
+
+def run_bridge_coroutines(coroutines: List[Awaitable[Any]]) -> List[Any]:
+    """
+    Run bridge coroutines concurrently from synchronous code (e.g. a tool) and return
+    their results in order; an exception raised by one coroutine is returned in its place.
+
+    Uses a fresh event loop, in a helper thread when the caller already runs one, and
+    closes the bridge connections opened by the coroutines before returning.
+    """
+    async def gather_all():
+        try:
+            return await asyncio.gather(*coroutines, return_exceptions=True)
+        finally:
+            try:
+                close_async_client = _import_rb_async("close_async_client")
+            except ImportError:
+                close_async_client = None
+            if close_async_client is not None:
+                await close_async_client()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(gather_all())
+    results: List[Any] = []
+    worker = threading.Thread(target=lambda: results.extend(asyncio.run(gather_all())))
+    worker.start()
+    worker.join()
+    return results
+
+
 def execute_csh_script(script_path: str, *args, timeout: int = 300) -> str:
     """
     Execute a csh script either remotely via ramic_bridge or locally via subprocess.
@@ -449,15 +1031,19 @@ def execute_csh_script(script_path: str, *args, timeout: int = 300) -> str:
             # Use && to chain commands: cd to project root && execute script
             script_cmd = f'csh("cd {project_root} && ./{script_rel_path} {cmd_args}")'
             
-            # Get connection parameters from environment
-            rb_host = os.getenv("RB_HOST", "127.0.0.1")
-            try:
-                rb_port = int(os.getenv("RB_PORT", "65432"))
-            except Exception:
-                rb_port = 65432
-            
-            RBExc = _import_rbexc()
-            result = RBExc(script_cmd, rb_host, rb_port, timeout=timeout)
+            RBExc = _import_rb_executor()
+            scheduler = _pool_scheduler()
+            if scheduler is not None:
+                # Run on the daemon of the calling session, where its cellview was opened
+                endpoint = scheduler.acquire(_call_session(script_cmd))
+                try:
+                    result = RBExc(script_cmd, endpoint[0], endpoint[1], timeout=timeout)
+                finally:
+                    scheduler.release(endpoint)
+            else:
+                # Get connection parameters from bridge_endpoint() or the environment
+                rb_host, rb_port = _resolve_rb_endpoint()
+                result = RBExc(script_cmd, rb_host, rb_port, timeout=timeout)
             
             # Clean control characters and check for success
             # In SKILL, csh() returns "t" on success, "nil" on failure
@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+import asyncio
 import json
 import subprocess
 from typing import Optional, List, Dict, Union
@@ -7,7 +8,7 @@ from datetime import datetime
 from smolagents import tool
 import re
 from collections import defaultdict
-from .bridge_utils import get_current_design as _bridge_get_current_design, execute_csh_script, open_cell_view_by_type, ui_redraw
+from .bridge_utils import get_current_design as _bridge_get_current_design, execute_csh_script, open_cell_view_by_type, ui_redraw, bridge_endpoint
 
 def get_current_design() -> tuple[Optional[str], Optional[str], Optional[str]]:
     """
@@ -237,4 +238,17 @@ def run_drc(cell: Optional[str] = None, lib: Optional[str] = None, view: str = "
             return "❌ DRC check failed"
 
     except Exception as e:
-        return f"❌ Error running DRC check: {e}"
\ No newline at end of file
+        return f"❌ Error running DRC check: {e}"
+
+
+async def run_drc_async(cell: Optional[str] = None, lib: Optional[str] = None, view: str = "layout", tech_node: str = "T28",
+                        host: Optional[str] = None, port: Optional[int] = None) -> str:
+    """
+    Coroutine variant of run_drc for the Virtuoso session at host:port (RB_HOST/RB_PORT when omitted).
+
+    The DRC flow runs in a worker thread with its bridge calls routed to that session, so
+    checks on several sessions run in parallel under asyncio.gather(). Cancelling the task
+    stops waiting for the result; a started Calibre run is not interrupted.
+    """
+    with bridge_endpoint(host, port):
+        return await asyncio.to_thread(run_drc, cell=cell, lib=lib, view=view, tech_node=tech_node)
@@ -228,6 +228,23 @@ def check_virtuoso_connection() -> str:
             report.append("❌ Virtuoso Connection: FAILED")
             report.append("Check if RAMIC Bridge daemon is running")
             report.append("Check RB_HOST and RB_PORT in .env")
+
+        # Per-daemon health and load when calls are scheduled across a pool
+        try:
+            from ..tools.bridge_utils import get_bridge_pool_status
+            pool_status = get_bridge_pool_status()
+        except Exception:
+            pool_status = []
+        if pool_status:
+            report.append(f"\nBridge Pool: {len(pool_status)} daemons")
+            for daemon in pool_status:
+                state = "❔" if daemon["healthy"] is None else ("✅" if daemon["healthy"] else "❌")
+                latency = "n/a" if daemon["latency_ms"] is None else f"{daemon['latency_ms']:.1f}ms"
+                line = f"{state} {daemon['endpoint']}: queue {daemon['in_flight']}, sessions {daemon['sessions']}, " \
+                       f"probe latency {latency}, calls {daemon['calls']}"
+                if daemon["last_error"]:
+                    line += f" ({daemon['last_error']})"
+                report.append(line)
     
     else:
         report.append("Bridge Type: skillbridge")
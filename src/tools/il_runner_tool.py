@@ -1,22 +1,149 @@
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import os
 from smolagents import tool
 from datetime import datetime
-from time import sleep
+from time import sleep, perf_counter
+from collections import Counter
 import json
 from .bridge_utils import (
     use_ramic_bridge,
     rb_exec,
     load_skill_file,
-    save_current_cellview,
     ui_redraw,
     ui_zoom_absolute_scale,
     load_script_and_take_screenshot,
     load_script_and_take_screenshot_verbose,
-    open_cell_view_by_type,
     ge_open_window,
+    skill_step,
+    open_cell_view_steps,
+    rb_exec_batch,
+    rb_exec_batch_async,
+    get_batch_step,
+    format_batch_timing,
+    rb_exec_stream,
 )
+from src.app.utils.layout_dump_parser import LayoutDumpError, LayoutDumpParser, parse_layout_dump
+from src.app.layout.layout_delta import promote_layout_manifest
+
+
+def _resolve_il_path(il_file_path: str):
+    """
+    Resolve the il file path, falling back to the output directory.
+
+    Returns:
+        (Path, None) on success, (None, error message) otherwise
+    """
+    skill_path = Path(il_file_path)
+    
+    # If file doesn't exist, try to find it in output directory
+    if not skill_path.exists():
+        output_path = Path("output") / skill_path.name
+        if output_path.exists():
+            skill_path = output_path
+        else:
+            return None, f"❌ Error: File {il_file_path} does not exist, also not found in output directory: {skill_path.name}"
+    
+    # Check file extension
+    if skill_path.suffix.lower() not in ['.il', '.skill']:
+        return None, f"❌ Error: File {skill_path} is not a valid il/skill file"
+    return skill_path, None
+
+
+def _il_batch_steps(skill_path: Path, lib: str, cell: str, view: str, save: bool = False, zoom: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Steps that open the cellView and window, load the il file and optionally save/redraw/zoom.
+    """
+    # Use load command to execute SKILL file directly (avoids port forwarding truncation issues)
+    abs_path = str(skill_path.resolve())
+    escaped_path = abs_path.replace('\\', '\\\\').replace('"', '\\"')
+    steps = open_cell_view_steps(lib, cell, view=view)
+    steps.append(skill_step("load", f'load("{escaped_path}")', require_non_nil=True))
+    if save:
+        steps.append(skill_step("save", "dbSave(cv)", require_non_nil=True, stop_on_failure=False))
+    if zoom is not None:
+        steps.append(skill_step("redraw_after_load", "hiRedraw()", stop_on_failure=False))
+        steps.append(skill_step("zoom", f"hiZoomAbsoluteScale(geGetEditCellViewWindow(cv) {zoom})", stop_on_failure=False))
+    return steps
+
+
+def _run_il_batch(skill_path: Path, lib: str, cell: str, view: str, save: bool = False, zoom: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Open the cellView and window, load the il file and optionally save/redraw/zoom, in one bridge round trip.
+    """
+    return rb_exec_batch(_il_batch_steps(skill_path, lib, cell, view, save=save, zoom=zoom), timeout=120)
+
+
+def _batch_open_error(batch: Dict[str, Any], lib: str, cell: str, view: str) -> Optional[str]:
+    """
+    Map a failed open step to the error message of the former step-by-step flow.
+    """
+    if not get_batch_step(batch, "open_cell_view")["ok"]:
+        return f"❌ Error: Failed to open cellView {lib}/{cell}/{view}"
+    if not get_batch_step(batch, "open_window")["ok"]:
+        return f"❌ Error: Failed to open window for {lib}/{cell}/{view}"
+    if not get_batch_step(batch, "edit_cell_view")["ok"]:
+        return f"❌ Error: Failed to get edit cellView for {lib}/{cell}/{view}"
+    return None
+
+
+def _load_error_details(batch: Dict[str, Any]) -> str:
+    """
+    Error details of the load step, empty if there are none worth reporting.
+    """
+    error_details = str(get_batch_step(batch, "load")["result"] or "").strip()
+    # Clean up error message for better readability
+    safe_error = error_details.replace('\n', ' ').replace('\r', ' ').strip()
+    if safe_error and safe_error.lower() not in {'nil', 'none'}:
+        return safe_error
+    return ""
+
+def _run_il_result(batch: Dict[str, Any], skill_path: Path, lib: str, cell: str, view: str, save: bool = False) -> str:
+    """
+    Result message of run_il_file (save=False) or run_il_file_with_save (save=True) for an executed batch.
+    """
+    open_error = _batch_open_error(batch, lib, cell, view)
+    if open_error:
+        return open_error
+    timing = f"⏱️ Step timing: {format_batch_timing(batch)}"
+    name = skill_path.name if save else f"[{skill_path.name}]"
+
+    if get_batch_step(batch, "load")["ok"]:
+        # Incremental layout generation diffs against what is loaded now
+        promote_layout_manifest(str(skill_path))
+        if not save:
+            return f"✅ il file {name} executed successfully\n{timing}"
+        # The cellview is saved in the same batch after execution
+        if get_batch_step(batch, "save")["ok"]:
+            return f"✅ il file {name} executed and saved successfully\n{timing}"
+        else:
+            return f"✅ il file {name} executed successfully but save failed\n{timing}"
+    # Return detailed error information
+    safe_error = _load_error_details(batch)
+    if safe_error:
+        return f"❌ il file {name} execution failed\n[Error Details]: {safe_error}\n{timing}"
+    return f"❌ il file {name} execution failed (empty result - check Virtuoso connection and file path)"
+
+
+async def run_il_file_async(il_file_path: str, lib: str, cell: str, view: str = "layout", save: bool = False,
+                            host: Optional[str] = None, port: Optional[int] = None) -> str:
+    """
+    Coroutine variant of run_il_file (run_il_file_with_save when save=True) for the Virtuoso
+    session at host:port (RB_HOST/RB_PORT when omitted).
+
+    Loads into different sessions run in parallel under asyncio.gather(), e.g. the layout
+    in one session and the schematic in another. Same result messages as the tools.
+    """
+    try:
+        skill_path, error = _resolve_il_path(il_file_path)
+        if error:
+            return error
+        steps = _il_batch_steps(skill_path, lib, cell, view, save=save)
+        batch = await rb_exec_batch_async(steps, timeout=120, host=host, port=port)
+        return _run_il_result(batch, skill_path, lib, cell, view, save=save)
+    except Exception as e:
+        return f"❌ Error occurred while running il file: {e}"
+
 
 @tool
 def run_il_file(il_file_path: str, lib: str, cell: str, view: str = "layout") -> str:
@@ -33,50 +160,12 @@ def run_il_file(il_file_path: str, lib: str, cell: str, view: str = "layout") ->
         String description of the run result
     """
     try:
-        # Open specified cellView and set as current edit view
-        ok = open_cell_view_by_type(lib, cell, view=view, view_type=None, mode="w", timeout=30)
-        if not ok:
-            return f"❌ Error: Failed to open cellView {lib}/{cell}/{view}"
-        # Open window to display the cellView
-        window_ok = ge_open_window(lib, cell, view=view, view_type=None, mode="a", timeout=30)
-        if not window_ok:
-            return f"❌ Error: Failed to open window for {lib}/{cell}/{view}"
-        ui_redraw(timeout=10)
-        sleep(0.5)
-        # Set cv variable for IL file to use
-        rb_exec('cv = geGetEditCellView()', timeout=10)
-        # Check if file exists
-        skill_path = Path(il_file_path)
-        
-        # If file doesn't exist, try to find it in output directory
-        if not skill_path.exists():
-            output_path = Path("output") / skill_path.name
-            if output_path.exists():
-                skill_path = output_path
-            else:
-                return f"❌ Error: File {il_file_path} does not exist, also not found in output directory: {skill_path.name}"
-        
-        # Check file extension
-        if skill_path.suffix.lower() not in ['.il', '.skill']:
-            return f"❌ Error: File {skill_path} is not a valid il/skill file"
-        
-        # Use load command to execute SKILL file directly (avoids port forwarding truncation issues)
-        abs_path = str(skill_path.resolve())
-        escaped_path = abs_path.replace('\\', '\\\\').replace('"', '\\"')
-        load_result = rb_exec(f'load("{escaped_path}")', timeout=60)
+        skill_path, error = _resolve_il_path(il_file_path)
+        if error:
+            return error
         
-        # Check if load was successful (returns 't' or empty string on success)
-        if load_result and load_result.strip().lower() in {'t', 't\n', ''}:
-            return f"✅ il file [{skill_path.name}] executed successfully"
-        else:
-            # Return detailed error information
-            if load_result:
-                error_details = str(load_result).strip()
-                # Clean up error message for better readability
-                safe_error = error_details.replace('\n', ' ').replace('\r', ' ').strip()
-                if safe_error and safe_error.lower() not in {'nil', 'none'}:
-                    return f"❌ il file [{skill_path.name}] execution failed\n[Error Details]: {safe_error}"
-            return f"❌ il file [{skill_path.name}] execution failed (empty result - check Virtuoso connection and file path)"
+        batch = _run_il_batch(skill_path, lib, cell, view)
+        return _run_il_result(batch, skill_path, lib, cell, view)
             
     except Exception as e:
         return f"❌ Error occurred while running il file: {e}"
@@ -96,54 +185,12 @@ def run_il_file_with_save(il_file_path: str, lib: str, cell: str, view: str = "l
         String description of the run result
     """
     try:
-        # Open specified cellView and set as current edit view
-        ok = open_cell_view_by_type(lib, cell, view=view, view_type=None, mode="w", timeout=30)
-        if not ok:
-            return f"❌ Error: Failed to open cellView {lib}/{cell}/{view}"
-        # Open window to display the cellView
-        window_ok = ge_open_window(lib, cell, view=view, view_type=None, mode="a", timeout=30)
-        if not window_ok:
-            return f"❌ Error: Failed to open window for {lib}/{cell}/{view}"
-        ui_redraw(timeout=10)
-        sleep(0.5)
-        # Set cv variable for IL file to use
-        rb_exec('cv = geGetEditCellView()', timeout=10)
-        # Check if file exists
-        skill_path = Path(il_file_path)
+        skill_path, error = _resolve_il_path(il_file_path)
+        if error:
+            return error
         
-        # If file doesn't exist, try to find it in output directory
-        if not skill_path.exists():
-            output_path = Path("output") / skill_path.name
-            if output_path.exists():
-                skill_path = output_path
-            else:
-                return f"❌ Error: File {il_file_path} does not exist, also not found in output directory: {skill_path.name}"
-        
-        # Check file extension
-        if skill_path.suffix.lower() not in ['.il', '.skill']:
-            return f"❌ Error: File {skill_path} is not a valid il/skill file"
-        
-        # Use load command to execute SKILL file directly (avoids port forwarding truncation issues)
-        abs_path = str(skill_path.resolve())
-        escaped_path = abs_path.replace('\\', '\\\\').replace('"', '\\"')
-        load_result = rb_exec(f'load("{escaped_path}")', timeout=60)
-        
-        # Check if load was successful (returns 't' or empty string on success)
-        if load_result and load_result.strip().lower() in {'t', 't\n', ''}:
-            # Save the current cellview after execution
-            if save_current_cellview(timeout=30):
-                return f"✅ il file {skill_path.name} executed and saved successfully"
-            else:
-                return f"✅ il file {skill_path.name} executed successfully but save failed"
-        else:
-            # Return detailed error information
-            if load_result:
-                error_details = str(load_result).strip()
-                # Clean up error message for better readability
-                safe_error = error_details.replace('\n', ' ').replace('\r', ' ').strip()
-                if safe_error and safe_error.lower() not in {'nil', 'none'}:
-                    return f"❌ il file {skill_path.name} execution failed\n[Error Details]: {safe_error}"
-            return f"❌ il file {skill_path.name} execution failed (empty result - check Virtuoso connection and file path)"
+        batch = _run_il_batch(skill_path, lib, cell, view, save=True)
+        return _run_il_result(batch, skill_path, lib, cell, view, save=True)
             
     except Exception as e:
         return f"❌ Error occurred while running il file: {e}"
@@ -224,70 +271,37 @@ def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_pa
     }
     
     try:
-        # Open specified cellView and set as current edit view first
-        ok = open_cell_view_by_type(lib, cell, view=view, view_type=None, mode="w", timeout=30)
-        if not ok:
-            result_dict["message"] = f"❌ Error: Failed to open cellView {lib}/{cell}/{view}"
-            return json.dumps(result_dict, ensure_ascii=False)
-        # Open window to display the cellView
-        window_ok = ge_open_window(lib, cell, view=view, view_type=None, mode="a", timeout=30)
-        if not window_ok:
-            result_dict["message"] = f"❌ Error: Failed to open window for {lib}/{cell}/{view}"
+        skill_path, error = _resolve_il_path(il_file_path)
+        if error:
+            result_dict["message"] = error
             return json.dumps(result_dict, ensure_ascii=False)
-        ui_redraw(timeout=10)
-        sleep(0.5)
-        # Set cv variable for IL file to use
-        rb_exec('cv = geGetEditCellView()', timeout=10)
-
-        # Check if file exists
-        skill_path = Path(il_file_path)
         
-        # If file doesn't exist, try to find it in output directory
-        if not skill_path.exists():
-            output_path = Path("output") / skill_path.name
-            if output_path.exists():
-                skill_path = output_path
-            else:
-                result_dict["message"] = f"❌ Error: File {il_file_path} does not exist, also not found in output directory: {skill_path.name}"
-                return json.dumps(result_dict, ensure_ascii=False)
-        
-        # Check file extension
-        if skill_path.suffix.lower() not in ['.il', '.skill']:
-            result_dict["message"] = f"❌ Error: File {skill_path} is not a valid il/skill file"
+        # Open, load, save, redraw and zoom in one bridge round trip
+        batch = _run_il_batch(skill_path, lib, cell, view, save=True, zoom=0.9)
+        open_error = _batch_open_error(batch, lib, cell, view)
+        if open_error:
+            result_dict["message"] = open_error
             return json.dumps(result_dict, ensure_ascii=False)
         
-        # Use load command to execute SKILL file directly (avoids port forwarding truncation issues)
-        abs_path = str(skill_path.resolve())
-        escaped_path = abs_path.replace('\\', '\\\\').replace('"', '\\"')
-        load_result = rb_exec(f'load("{escaped_path}")', timeout=60)
-        
-        # Check if load was successful (returns 't' or empty string on success)
-        if load_result and load_result.strip().lower() in {'t', 't\n', ''}:
+        if get_batch_step(batch, "load")["ok"]:
+            promote_layout_manifest(str(skill_path))
             result_dict["observations"].append(f"✅ SKILL script {skill_path.name} executed successfully")
         else:
             # Return detailed error information
             result_dict["message"] = f"❌ il file {skill_path.name} execution failed"
-            if load_result:
-                error_details = str(load_result).strip()
-                # Clean up error message for better readability
-                safe_error = error_details.replace('\n', ' ').replace('\r', ' ').strip()
-                if safe_error and safe_error.lower() not in {'nil', 'none'}:
-                    result_dict["observations"].append(f"Error Details: {safe_error}")
-                else:
-                    result_dict["observations"].append("Failed to load SKILL file (check Virtuoso connection and file path)")
+            safe_error = _load_error_details(batch)
+            if safe_error:
+                result_dict["observations"].append(f"Error Details: {safe_error}")
             else:
-                result_dict["observations"].append("Failed to load SKILL file (empty result - check Virtuoso connection and file path)")
+                result_dict["observations"].append("Failed to load SKILL file (check Virtuoso connection and file path)")
+            result_dict["observations"].append(f"⏱️ Step timing: {format_batch_timing(batch)}")
             return json.dumps(result_dict, ensure_ascii=False)
         # Save current cellview after load to persist generated content
-        try:
-            if save_current_cellview(timeout=30):
-                result_dict["observations"].append("💾 CellView saved successfully after load")
-            else:
-                result_dict["observations"].append("❌ Failed to save CellView after load")
-        except Exception as se:
-            result_dict["observations"].append(f"❌ Exception during save: {se}")
-        ui_redraw(timeout=10)
-        ui_zoom_absolute_scale(0.9, timeout=10)
+        if get_batch_step(batch, "save")["ok"]:
+            result_dict["observations"].append("💾 CellView saved successfully after load")
+        else:
+            result_dict["observations"].append("❌ Failed to save CellView after load")
+        result_dict["observations"].append(f"⏱️ Step timing: {format_batch_timing(batch)}")
         sleep(2.0)
         # Determine screenshot save path (external path takes precedence)
         if screenshot_path:
@@ -432,3 +446,78 @@ def get_current_cellview_info(lib: Optional[str] = None, cell: Optional[str] = N
             
     except Exception as e:
         return f"❌ Error getting cellview info: {e}"
+
+
+def _layout_dump_records(lib: str, cell: str, view: str, parser: LayoutDumpParser, timeout: int = 600):
+    """
+    Records of a layout object dump. With ramic_bridge the dump is streamed and parsed
+    while it is transferred; with skillbridge Virtuoso writes it to a file that is read
+    back line by line.
+    """
+    script = Path("src/skill/dumpAllLayoutObjects.il").resolve()
+    if not load_skill_file(str(script), timeout=30):
+        raise RuntimeError(f"Failed to load {script}")
+    if use_ramic_bridge():
+        lib_s, cell_s, view_s = (value.replace('"', '\\"') for value in (lib, cell, view))
+        chunks = rb_exec_stream(f'dumpAllLayoutObjects_string("{lib_s}" "{cell_s}" "{view_s}")', timeout=timeout)
+        yield from parse_layout_dump(chunks, quoted=True, parser=parser)
+        return
+    dump_path = (Path("output/layout_dump") / f"{lib}_{cell}_{view}.txt").resolve()
+    dump_path.parent.mkdir(parents=True, exist_ok=True)
+    from skillbridge import Workspace
+    ws = Workspace.open()
+    try:
+        ws['dumpAllLayoutObjects_enhanced'](lib, cell, view, str(dump_path))
+    finally:
+        ws.close()
+    with open(dump_path, "r", encoding="utf-8") as f:
+        yield from parse_layout_dump(f, quoted=False, parser=parser)
+
+
+@tool
+def dump_layout_objects(lib: str, cell: str, view: str = "layout", output_file: Optional[str] = None) -> str:
+    """
+    Dump every shape, label and instance of a layout cellview to a JSON Lines file (one
+    object per line) and summarize it. With the ramic bridge the dump is streamed and
+    parsed while it is transferred, so large cells do not need to fit in memory.
+
+    Args:
+        lib: Library name
+        cell: Cell name
+        view: View name (default: layout)
+        output_file: Output path (default: output/layout_dump/<lib>_<cell>_<view>.jsonl)
+
+    Returns:
+        String with the output path, object counts per type and the most used instance masters and shape layers
+    """
+    try:
+        out_path = Path(output_file) if output_file else Path("output/layout_dump") / f"{lib}_{cell}_{view}.jsonl"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        parser = LayoutDumpParser()
+        types, masters, layers = Counter(), Counter(), Counter()
+        start = perf_counter()
+        with open(out_path, "w", encoding="utf-8") as f:
+            for record in _layout_dump_records(lib, cell, view, parser):
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                types[record["type"]] += 1
+                if record["type"] == "INST":
+                    masters[f"{record['lib']}/{record['cell']}"] += 1
+                elif record["type"] == "SHAPE":
+                    layers[record["layer"]] += 1
+        elapsed = perf_counter() - start
+
+        lines = [
+            f"✅ Dumped {sum(types.values())} objects of {lib}/{cell}/{view} in {elapsed:.1f}s: {out_path}",
+            "   " + ", ".join(f"{tag}: {types[tag]}" for tag in ("INST", "SHAPE", "SHAPE_LABEL", "TEXT_LABEL")),
+        ]
+        if masters:
+            lines.append("   Top masters: " + ", ".join(f"{name} x{count}" for name, count in masters.most_common(5)))
+        if layers:
+            lines.append("   Top shape layers: " + ", ".join(f"{name} x{count}" for name, count in layers.most_common(5)))
+        if parser.skipped:
+            lines.append(f"   ⚠️ Skipped {parser.skipped} lines not in the dump format")
+        return "\n".join(lines)
+    except LayoutDumpError as e:
+        return f"❌ Error: Failed to dump {lib}/{cell}/{view} (does the cellview exist?): {e}"
+    except Exception as e:
+        return f"❌ Error occurred while dumping layout objects: {e}"
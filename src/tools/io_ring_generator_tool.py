@@ -8,17 +8,60 @@ from smolagents import tool
 from src.app.schematic.schematic_generator_T28 import generate_multi_device_schematic as generate_multi_device_schematic_28nm
 from src.app.schematic.schematic_generator_T180 import generate_multi_device_schematic as generate_multi_device_schematic_180nm
 from src.app.intent_graph.json_validator import validate_config, convert_config_to_list, get_config_statistics
-from src.app.layout.layout_generator_factory import generate_layout_from_json, create_layout_generator
+from src.app.layout.layout_generator_factory import generate_layout_from_json, generate_layout_delta, create_layout_generator
+from src.app.layout.layout_delta import pending_manifest_path_for
+from src.app.layout.ring_hierarchy import hierarchy_path_for
+from src.app.layout.geometry_checker import format_geometry_report
 from src.app.layout.T28.layout_visualizer import visualize_layout, visualize_layout_from_components
 from src.app.layout.T180.layout_visualizer import visualize_layout_T180
 from src.app.layout.device_classifier import DeviceClassifier, _normalize_process_node
 from src.app.layout.process_node_config import get_process_node_config, get_template_file_paths, list_supported_process_nodes
+from src.app.utils.artifact_cache import get_artifact_cache, compute_artifact_key
+from src.app.utils.batch_generator import run_batch
+
+def _find_template_file(process_node: str) -> Optional[Path]:
+    """Find the device template file of a process node (tries multiple locations and filenames)"""
+    template_file_names = get_template_file_paths(process_node)
+    
+    # Build possible paths for each template file name
+    possible_paths = []
+    for template_name in template_file_names:
+        possible_paths.extend([
+            Path("src/app/schematic") / template_name,
+            Path("src/schematic") / template_name,
+            Path("device_templates.json") if template_name == "device_templates.json" else Path(template_name),
+            Path("src/scripts/devices") / template_name,
+        ])
+    
+    # For 28nm, also check for IO_device_info_T28.json
+    if process_node == "T28":
+        possible_paths.extend([
+            Path("src/app/schematic") / "IO_device_info_T28.json",
+            Path("src/schematic") / "IO_device_info_T28.json",
+            Path("IO_device_info_T28.json"),
+            Path("src/scripts/devices") / "IO_device_info_T28.json",
+        ])
+    # For 180nm, also check for IO_device_info_T180.json
+    elif process_node == "T180":
+        possible_paths.extend([
+            Path("src/app/schematic") / "IO_device_info_T180.json",
+            Path("src/schematic") / "IO_device_info_T180.json",
+            Path("IO_device_info_T180.json"),
+            Path("src/scripts/devices") / "IO_device_info_T180.json",
+        ])
+    
+    for path in possible_paths:
+        if path.exists():
+            return path
+    return None
 
 @tool
 def generate_io_ring_schematic(
     config_file_path: str, 
     output_file_path: Optional[str] = None,
-    process_node: str = "T28"
+    process_node: str = "T28",
+    use_cache: bool = True,
+    compact_skill: bool = False
     ) -> str:
     """
     Generate IO ring schematic SKILL code from intent graph file
@@ -27,6 +70,8 @@ def generate_io_ring_schematic(
         config_file_path: Path to intent graph file (REQUIRED - use absolute path for better file management)
         output_file_path: Complete path for output file (STRONGLY RECOMMENDED - specify explicit path for better file organization. If not provided, defaults to output directory based on config filename)
         process_node: Process node to use ("T28" or "T180", default: "T28")
+        use_cache: Reuse the schematic generated earlier for an identical intent graph and configuration (default: True)
+        compact_skill: Write runs of instances, wires, labels and pins as placement tables looped over by foreach, a much smaller script for large rings (default: False)
         
     Returns:
         String description of generation result, including file path and statistics
@@ -58,41 +103,9 @@ def generate_io_ring_schematic(
         node_config = get_process_node_config(process_node)
         
         # Check if template file exists (try multiple locations and filenames based on process node)
-        template_file = None
+        template_file = _find_template_file(process_node)
         template_file_names = get_template_file_paths(process_node)
         
-        # Build possible paths for each template file name
-        possible_paths = []
-        for template_name in template_file_names:
-            possible_paths.extend([
-                Path("src/app/schematic") / template_name,
-                Path("src/schematic") / template_name,
-                Path("device_templates.json") if template_name == "device_templates.json" else Path(template_name),
-                Path("src/scripts/devices") / template_name,
-            ])
-        
-        # For 28nm, also check for IO_device_info_T28.json
-        if process_node == "T28":
-            possible_paths.extend([
-                Path("src/app/schematic") / "IO_device_info_T28.json",
-            Path("src/schematic") / "IO_device_info_T28.json",
-                Path("IO_device_info_T28.json"),
-                Path("src/scripts/devices") / "IO_device_info_T28.json",
-            ])
-        # For 180nm, also check for IO_device_info_T180.json
-        elif process_node == "T180":
-            possible_paths.extend([
-                Path("src/app/schematic") / "IO_device_info_T180.json",
-                Path("src/schematic") / "IO_device_info_T180.json",
-                Path("IO_device_info_T180.json"),
-                Path("src/scripts/devices") / "IO_device_info_T180.json",
-            ])
-        
-        for path in possible_paths:
-            if path.exists():
-                template_file = path
-                break
-        
         if template_file is None:
             expected_files = ", ".join(template_file_names)
             return f"❌ Error: device template file not found for {process_node} process node.\n" \
@@ -150,17 +163,37 @@ def generate_io_ring_schematic(
         except ValueError as e:
             return f"❌ Error: {e}"
         
+        # The schematic generator saves relative paths outside output/ under output/
+        if not output_path.is_absolute() and "output" not in output_path.parts:
+            output_path = Path("output") / output_path
+        
         # Generate schematic with process node
         # Library name, cell name, and view name are read from config or use defaults
         try:
+            cache = get_artifact_cache()
+            cache_key = None
+            cached = None
+            if use_cache and process_node in supported_nodes:
+                # process_node may have been overridden by the intent graph, hash its own templates
+                node_template_file = _find_template_file(process_node)
+                # Compact and statement-by-statement scripts are cached separately
+                key_kind = "schematic_compact" if compact_skill else "schematic"
+                cache_key = compute_artifact_key(key_kind, config, process_node,
+                                                 get_process_node_config(process_node),
+                                                 [str(node_template_file)] if node_template_file else [])
+                cached = cache.get("schematic", cache_key, {"il": str(output_path)})
+            
             # Select appropriate generator based on process node
-            if process_node == "T28":
-                generate_multi_device_schematic_28nm(config_list, str(output_path))
-            elif process_node == "T180":
-                generate_multi_device_schematic_180nm(config_list, str(output_path))
-            else:
-                supported_nodes = list_supported_process_nodes()
-                return f"❌ Error: Unsupported process node '{process_node}'. Supported nodes: {', '.join(supported_nodes)}"
+            if not cached:
+                if process_node == "T28":
+                    generate_multi_device_schematic_28nm(config_list, str(output_path), compact=compact_skill)
+                elif process_node == "T180":
+                    generate_multi_device_schematic_180nm(config_list, str(output_path), compact=compact_skill)
+                else:
+                    supported_nodes = list_supported_process_nodes()
+                    return f"❌ Error: Unsupported process node '{process_node}'. Supported nodes: {', '.join(supported_nodes)}"
+                if cache_key:
+                    cache.put("schematic", cache_key, {"il": str(output_path)})
             
             # Get statistics from config_list (filter out ring_config items)
             device_instances = [item for item in config_list if isinstance(item, dict) and 'device' in item]
@@ -171,6 +204,8 @@ def generate_io_ring_schematic(
                     device_types.add(item['device'])
             
             result = f"✅ Successfully generated schematic file: {output_path}\n"
+            if cached:
+                result += f"♻️  Reused cached schematic (identical intent graph and configuration)\n"
             result += f"📊 Statistics:\n"
             result += f"  - Device instance count: {device_count}\n"
             if device_types:
@@ -188,7 +223,12 @@ def generate_io_ring_schematic(
 def generate_io_ring_layout(
     config_file_path: str, 
     output_file_path: Optional[str] = None,
-    process_node: str = "T28"
+    process_node: str = "T28",
+    use_cache: bool = True,
+    incremental: bool = False,
+    check_geometry: bool = True,
+    compact_skill: bool = False,
+    hierarchical: bool = False
 ) -> str:
     """
     Generate IO ring layout SKILL code from intent graph file
@@ -197,6 +237,11 @@ def generate_io_ring_layout(
         config_file_path: Path to intent graph file (REQUIRED - use absolute path for better file management)
         output_file_path: Complete path for output file (STRONGLY RECOMMENDED - specify explicit path for better file organization. If not provided, defaults to output directory based on config filename)
         process_node: Process node to use ("T28" or "T180", default: "T28")
+        use_cache: Reuse the layout and visualization generated earlier for an identical intent graph and configuration (default: True)
+        incremental: After editing an intent graph whose layout (same output_file_path) was loaded in Virtuoso with the il runner tools, also write a delta script that only deletes and recreates the changed pads, fillers, wires and labels. Run the delta script with run_il_file instead of clearing the window and loading the full script (default: False)
+        check_geometry: Fail before the SKILL code reaches Virtuoso when the pre-DRC geometry check finds overlapping or out-of-ring instances (default: True). Gaps in the ring are reported as warnings either way
+        compact_skill: Write runs of pads, fillers, pins and labels as placement tables looped over by foreach, a much smaller script for large rings. The delta script of incremental generation is always written statement by statement (default: False)
+        hierarchical: Place pads, bond pads and fillers through generated per-side sub-cells (<cell>_io_side<k>, <cell>_io_slot<k>) instead of flat in the top cell, for large rings. A <stem>_hierarchy.json next to the output maps every flat instance name to its hierarchical path. Hierarchical layouts are always reloaded in full, incremental only writes the full script (default: False)
         
     Returns:
         String description of generation result, including file path and statistics
@@ -253,32 +298,157 @@ def generate_io_ring_layout(
         # Generate layout with process node configuration
         # Library name, cell name, and view name are read from config or use defaults
         try:
-            result_file = generate_layout_from_json(str(config_path), str(output_path), process_node)
+            # Same visualization and manifest paths as the generator derives from the output file
+            vis_path = output_path.parent / f"{output_path.stem}_visualization.png"
+            manifest_path = pending_manifest_path_for(str(output_path))
+            hierarchy_path = hierarchy_path_for(str(output_path))
+            cache = get_artifact_cache()
+            cache_key = None
+            cached = None
+            result = None
+            if use_cache:
+                key_kind = "layout" + ("_compact" if compact_skill else "") + ("_hierarchical" if hierarchical else "")
+                cache_key = compute_artifact_key(key_kind, config, process_node, get_process_node_config(process_node))
+                # The delta is computed against the manifest of the layout loaded from output_file_path
+                if not incremental:
+                    cached = cache.get("layout", cache_key, {"il": str(output_path), "visualization": str(vis_path),
+                                                             "manifest": manifest_path, "hierarchy": hierarchy_path})
             
-            # Automatically generate visualization (use process-node-specific visualizer)
-            vis_output_path = None
-            try:
-                vis_output_path = output_path.parent / f"{output_path.stem}_visualization.png"
-                if process_node == "T180":
-                    visualize_layout_T180(str(output_path), str(vis_output_path))
+            if cached:
+                vis_output_path = cached.get("visualization")
+            else:
+                if incremental:
+                    result = generate_layout_delta(str(config_path), str(output_path), process_node,
+                                                   compact=compact_skill, hierarchical=hierarchical)
+                else:
+                    result = generate_layout_from_json(str(config_path), str(output_path), process_node,
+                                                       compact=compact_skill, hierarchical=hierarchical)
+                if result is None:
+                    return "❌ Failed to generate layout: layout rule validation failed"
+                geometry_check = result["geometry_check"]
+                if check_geometry and not geometry_check["valid"]:
+                    return f"❌ Layout geometry check failed, do not load {output_path} in Virtuoso " \
+                           f"(fix the intent graph or placement first):\n{format_geometry_report(geometry_check)}"
+                
+                # The generator renders the visualization from its placed components
+                # (optional, generation does not fail if rendering does)
+                vis_output_path = result.get("visualization_file")
+                # Broken rings are not cached, so every call checks them again
+                if cache_key and geometry_check["valid"]:
+                    cache.put("layout", cache_key, {"il": str(output_path), "visualization": vis_output_path,
+                                                    "manifest": result.get("manifest_file"),
+                                                    "hierarchy": result.get("hierarchy_file")})
+            
+            message = f"✅ Successfully generated layout file: {output_path}"
+            if hierarchical:
+                message += f"\n🧩 Ring placed through per-side sub-cells, flat instance names map to hierarchical paths in {hierarchy_path}"
+            if cached:
+                message += "\n♻️  Reused cached layout (identical intent graph and configuration)"
+            elif result["geometry_check"]["errors"] or result["geometry_check"]["warnings"]:
+                message += f"\n{format_geometry_report(result['geometry_check'])}"
+            if incremental and result is not None:
+                if result["delta_file"]:
+                    message += f"\n⚡ Delta script generated: {result['delta_file']} " \
+                               f"({result['deleted']} objects deleted, {result['created']} created, {result['unchanged']} unchanged)\n" \
+                               f"💡 Run the delta script with run_il_file on the open layout instead of clearing the window " \
+                               f"and loading {output_path}"
                 else:
-                    visualize_layout(str(output_path), str(vis_output_path))
-            except Exception as vis_e:
-                # Visualization is optional, don't fail if it doesn't work
-                pass
+                    message += f"\n⚠️  No delta script ({result['full_reload_reason']}): clear the window and load {output_path}"
             
             # Return success message with visualization info if generated
-            if vis_output_path and vis_output_path.exists():
-                return f"✅ Successfully generated layout file: {output_path}\n" \
+            if vis_output_path and Path(vis_output_path).exists():
+                return f"{message}\n" \
                        f"📊 Layout visualization generated: {vis_output_path}\n" \
                        f"💡 Tip: Review the visualization image to verify the layout arrangement."
             else:
-                return f"✅ Successfully generated layout file: {output_path}"
+                return message
         except Exception as e:
             return f"❌ Failed to generate layout: {e}"
     except Exception as e:
         return f"❌ Error occurred while generating IO ring layout: {e}"
 
+@tool
+def get_artifact_cache_stats(clear: bool = False) -> str:
+    """
+    Get hit rates of the artifact cache used by generate_io_ring_schematic and generate_io_ring_layout
+    
+    Args:
+        clear: Remove all cached artifacts after reporting (forces regeneration on the next calls)
+        
+    Returns:
+        String with per-artifact hits, misses, stores, evictions and hit rate for this session,
+        plus the number of cached entries and their size
+    """
+    try:
+        cache = get_artifact_cache()
+        stats = cache.get_stats()
+        
+        result = [f"📊 Artifact cache statistics (this session):"]
+        if not stats["kinds"]:
+            result.append("  • No generation calls yet")
+        for kind, counters in stats["kinds"].items():
+            result.append(f"  • {kind}: {counters['hits']} hits, {counters['misses']} misses, "
+                          f"{counters['stores']} stored, {counters['evictions']} evicted, "
+                          f"hit rate {counters['hit_rate']:.1%}")
+        result.append(f"  • Overall hit rate: {stats['hit_rate']:.1%}")
+        result.append(f"  • Cached entries: {stats['entries']} "
+                      f"({stats['total_bytes'] / 1024 / 1024:.1f} MB of {stats['max_bytes'] / 1024 / 1024:.0f} MB)")
+        
+        if clear:
+            cache.clear()
+            result.append("🧹 Artifact cache cleared")
+        
+        return "\n".join(result)
+    except Exception as e:
+        return f"❌ Error occurred while reading artifact cache statistics: {e}"
+
+@tool
+def generate_io_ring_batch(
+    source: str,
+    output_dir: str = "output/batch",
+    process_node: Optional[str] = None,
+    layout: bool = True,
+    schematic: bool = True,
+    max_workers: Optional[int] = None
+) -> str:
+    """
+    Regenerate layout (with visualization) and schematic SKILL code for every intent graph
+    in a directory, in parallel on all CPU cores (e.g. after a device list update)
+    
+    Args:
+        source: Directory searched recursively for intent graphs, or a glob pattern such as "output/**/*_intent_graph.json"
+        output_dir: Directory for the generated files (mirrors the source tree) and batch_manifest.json (default: "output/batch")
+        process_node: "T28" or "T180" for all files; if not given it is read from ring_config.process_node or a 28nm/180nm directory name, else T28
+        layout: Generate the layout and its visualization (default: True)
+        schematic: Generate the schematic (default: True)
+        max_workers: Number of worker processes (default: number of CPU cores)
+        
+    Returns:
+        String with the number of generated and failed intent graphs, the errors of failed
+        files and the path of the batch manifest listing every generated file
+    """
+    try:
+        views = [view for view, enabled in (("layout", layout), ("schematic", schematic)) if enabled]
+        if not views:
+            return "❌ Error: Nothing to generate, enable layout and/or schematic"
+        
+        manifest = run_batch(source, output_dir, process_node, views, max_workers)
+        if manifest["total"] == 0:
+            return f"❌ Error: No intent graph files found in {source}"
+        
+        result = f"✅ Batch generation finished: {manifest['succeeded']}/{manifest['total']} intent graphs generated " \
+                 f"({', '.join(views)}) with {manifest['workers']} workers in {manifest['wall_time_s']:.1f}s\n"
+        result += f"📄 Manifest: {manifest['manifest_file']}\n"
+        failed = [entry for entry in manifest["files"] if entry["status"] != "success"]
+        if failed:
+            result += f"⚠️  {len(failed)} failed:\n"
+            for entry in failed:
+                errors = "; ".join(f"{view}: {message}" for view, message in entry["errors"].items())
+                result += f"  - {entry['intent_graph']}: {errors}\n"
+        return result
+    except Exception as e:
+        return f"❌ Error occurred during batch generation: {e}"
+
 @tool
 def list_intent_graphs(directory: str = "output") -> str:
     """
@@ -0,0 +1,94 @@
+import time
+import asyncio
+from typing import Any, Dict
+from smolagents import tool
+from .bridge_utils import run_bridge_coroutines, get_bridge_scheduler
+from .il_runner_tool import run_il_file_async
+from .drc_runner_tool import run_drc_async
+from .lvs_runner_tool import run_lvs_async
+
+# Job tools -> (coroutine function, extra keyword arguments)
+_SESSION_JOBS = {
+    "run_il_file": (run_il_file_async, {}),
+    "run_il_file_with_save": (run_il_file_async, {"save": True}),
+    "run_drc": (run_drc_async, {}),
+    "run_lvs": (run_lvs_async, {}),
+}
+
+
+async def _run_session_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one job on its session, return the job label, result message and elapsed time.
+    """
+    args = dict(job)
+    tool_name = args.pop("tool", "run_il_file")
+    timeout = args.pop("timeout", None)
+    port = args.get("port")
+    if args.get("host") is None and port is None and get_bridge_scheduler() is not None:
+        label = f"{tool_name} @ pool"
+    else:
+        label = f"{tool_name} @ {args.get('host') or 'RB_HOST'}:{port if port is not None else 'RB_PORT'}"
+    start = time.perf_counter()
+    if tool_name not in _SESSION_JOBS:
+        message = f"❌ Error: Unknown job tool '{tool_name}', expected one of {', '.join(_SESSION_JOBS)}"
+    else:
+        function, extra = _SESSION_JOBS[tool_name]
+        if port is not None:
+            args["port"] = int(port)
+        try:
+            coroutine = function(**args, **extra)
+            if timeout:
+                message = await asyncio.wait_for(coroutine, float(timeout))
+            else:
+                message = await coroutine
+        except asyncio.TimeoutError:
+            message = f"❌ Error: Job cancelled after {float(timeout):g}s timeout"
+        except TypeError as e:
+            message = f"❌ Error: Invalid job arguments: {e}"
+        except Exception as e:
+            message = f"❌ Error occurred while running job: {e}"
+    return {"label": label, "message": str(message), "elapsed_s": time.perf_counter() - start}
+
+
+@tool
+def run_on_sessions(jobs: list) -> str:
+    """
+    Run il loads and DRC/LVS checks on several Virtuoso sessions (bridge daemons on
+    different RB_PORTs) at the same time, e.g. the layout load on one session and the
+    schematic load on another. Jobs on the same session run one after the other.
+
+    Args:
+        jobs: List of job objects. Each job has "tool" (one of "run_il_file",
+            "run_il_file_with_save", "run_drc", "run_lvs"; default "run_il_file"), the
+            arguments of that tool (il_file_path, lib, cell, view, tech_node), "port" and
+            optionally "host" of the session's bridge daemon (without them the job is
+            scheduled on the ramic_bridge pool of config.yaml, or sent to RB_HOST/RB_PORT),
+            and optionally "timeout" in seconds after which the job is cancelled.
+            Example: [{"il_file_path": "output/io_ring_layout.il", "lib": "LIB", "cell": "IO_RING", "port": 65432},
+                      {"il_file_path": "output/io_ring_schematic.il", "lib": "LIB", "cell": "IO_RING", "view": "schematic", "port": 65433}]
+
+    Returns:
+        String with the number of succeeded jobs, the wall time and the result message of every job
+    """
+    try:
+        if not isinstance(jobs, list) or not jobs or not all(isinstance(job, dict) for job in jobs):
+            return "❌ Error: jobs must be a non-empty list of job objects"
+
+        start = time.perf_counter()
+        outcomes = run_bridge_coroutines([_run_session_job(job) for job in jobs])
+        wall_time = time.perf_counter() - start
+
+        lines = []
+        succeeded = 0
+        for index, outcome in enumerate(outcomes, 1):
+            if isinstance(outcome, BaseException):
+                lines.append(f"[{index}] ❌ Error: {outcome}")
+                continue
+            if outcome["message"].startswith("✅"):
+                succeeded += 1
+            lines.append(f"[{index}] {outcome['label']} ({outcome['elapsed_s']:.1f}s)\n{outcome['message']}")
+        status = "✅" if succeeded == len(jobs) else "❌"
+        header = f"{status} {succeeded}/{len(jobs)} session jobs succeeded in {wall_time:.1f}s"
+        return "\n".join([header] + lines)
+    except Exception as e:
+        return f"❌ Error occurred while running session jobs: {e}"
@@ -0,0 +1,5 @@
+"""
+Benchmarks package for AMS-IO-Agent.
+
+Benchmarks are standalone scripts (bench_*.py) and are not collected by pytest.
+"""
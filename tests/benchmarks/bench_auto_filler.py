@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Auto Filler Scaling Benchmark
+
+Times AutoFillerGeneratorT28 / AutoFillerGeneratorT180 filler insertion on
+synthetic rings of 100 to 2,000 outer pads and fits the log-log slope of
+runtime vs. pad count. A slope close to 1.0 means linear scaling.
+
+Usage:
+    python tests/benchmarks/bench_auto_filler.py
+    python tests/benchmarks/bench_auto_filler.py --sizes 100 500 2000 --repeat 5
+    python tests/benchmarks/bench_auto_filler.py --check          # Exit 1 if scaling is worse than --max-slope
+"""
+
+import sys
+import io
+import math
+import time
+import argparse
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.layout_generator_factory import create_layout_generator
+from tests.benchmarks.synthetic_ring import build_intent_graph, ring_dimensions_for_pad_count
+
+DEFAULT_SIZES = [100, 250, 500, 1000, 2000]
+
+
+def prepare_ring(process_node: str, pad_count: int, placement_order: str = "counterclockwise"):
+    """Build a synthetic ring and convert it to absolute components, as generate_layout_from_json does
+    
+    Returns:
+        Tuple of (generator, outer pads + corners, inner pads)
+    """
+    width, height = ring_dimensions_for_pad_count(pad_count)
+    graph = build_intent_graph(process_node, width, height, placement_order,
+                               inner_pad_every=4 if process_node == "T28" else 0)
+    generator = create_layout_generator(process_node)
+    ring_config = graph["ring_config"]
+    
+    pad_spacing = ring_config.get("pad_spacing", generator.config["pad_spacing"])
+    corner_size = ring_config.get("corner_size", generator.config["corner_size"])
+    ring_config["chip_width"] = width * pad_spacing + corner_size * 2
+    ring_config["chip_height"] = height * pad_spacing + corner_size * 2
+    ring_config.update({"top_count": width, "bottom_count": width, "left_count": height, "right_count": height})
+    generator.set_config(ring_config)
+    for key in ("pad_width", "pad_height", "corner_size", "pad_spacing", "library_name", "view_name"):
+        ring_config.setdefault(key, generator.config[key])
+    
+    components = generator.convert_relative_to_absolute(graph["instances"], ring_config)
+    outer = [c for c in components if c.get("type") in ("pad", "corner")]
+    inner = [c for c in components if c.get("type") == "inner_pad"]
+    return generator, outer, inner
+
+
+def time_auto_filler(process_node: str, pad_count: int, repeat: int) -> float:
+    """Get the best-of-N wall time of one auto filler insertion, in seconds"""
+    generator, outer, inner = prepare_ring(process_node, pad_count)
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(outer, inner)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def fit_slope(sizes: list, times: list) -> float:
+    """Least-squares slope of log(time) vs. log(size)"""
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    den = sum((x - mean_x) ** 2 for x in xs)
+    return num / den if den else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark auto filler insertion scaling for T28 and T180")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Outer pad counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per size (best time is reported)")
+    parser.add_argument("--nodes", nargs="+", default=["T28", "T180"], help="Process nodes to benchmark")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if any slope exceeds --max-slope")
+    parser.add_argument("--max-slope", type=float, default=1.3, help="Maximum accepted log-log slope for --check")
+    args = parser.parse_args()
+    
+    print("⏱️  Auto Filler Scaling Benchmark")
+    print("=" * 60)
+    
+    failed = False
+    for process_node in args.nodes:
+        print(f"\n📌 {process_node}")
+        print(f"{'pads':>8} {'time (ms)':>12} {'us/pad':>10}")
+        times = []
+        for size in args.sizes:
+            elapsed = time_auto_filler(process_node, size, args.repeat)
+            times.append(elapsed)
+            print(f"{size:>8} {elapsed * 1000:>12.2f} {elapsed * 1e6 / size:>10.2f}")
+        
+        slope = fit_slope(args.sizes, times) if len(args.sizes) > 1 else 0.0
+        status = "✅" if slope <= args.max_slope else "❌"
+        print(f"{status} log-log slope: {slope:.2f} (1.0 = linear)")
+        if slope > args.max_slope:
+            failed = True
+    
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch Generation Scaling Benchmark
+
+Regenerates every AMS-IO-Bench golden intent graph with run_batch() for increasing
+worker counts and reports wall time, throughput and speedup over one worker. Files
+are independent, so the speedup should stay close to the worker count up to the
+number of physical cores.
+
+Usage:
+    python tests/benchmarks/bench_batch_generator.py
+    python tests/benchmarks/bench_batch_generator.py --workers 1 2 4 8 --views layout
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.utils.batch_generator import BATCH_VIEWS, run_batch
+
+
+def main():
+    cpu_count = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1))) if cpu_count > 1 else [1]
+    parser = argparse.ArgumentParser(description="Benchmark run_batch() scaling with the number of worker processes")
+    parser.add_argument("--source", default=str(project_root / "AMS-IO-Bench"), help="Directory or glob of intent graphs")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers, help="Worker counts to benchmark")
+    parser.add_argument("--views", nargs="+", choices=list(BATCH_VIEWS), default=list(BATCH_VIEWS), help="Views to generate")
+    args = parser.parse_args()
+
+    # Schematic generators look up device templates relative to the project root
+    os.chdir(project_root)
+    print(f"⏱️  Batch Generation Benchmark ({cpu_count} CPUs, views: {', '.join(args.views)})")
+    print("=" * 60)
+    print(f"{'workers':>8} {'files':>6} {'failed':>7} {'wall (s)':>10} {'files/s':>9} {'speedup':>9}")
+
+    baseline = None
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = run_batch(args.source, tmp, views=args.views, max_workers=workers, progress=None)
+        wall = manifest["wall_time_s"]
+        baseline = baseline or wall
+        throughput = manifest["total"] / wall if wall else 0.0
+        print(f"{manifest['workers']:>8} {manifest['total']:>6} {manifest['failed']:>7} {wall:>10.2f} "
+              f"{throughput:>9.2f} {baseline / wall if wall else 0.0:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
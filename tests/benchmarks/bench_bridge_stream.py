@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streamed Bridge Result Benchmark
+
+Transfers a synthetic layout object dump (the printed string dumpAllLayoutObjects_string
+returns) of N instances from the local echo daemon and parses it into records, once as a
+whole reply (RBExcPersistent, then unquote and parse) and once streamed (RBExcStream
+into parse_layout_dump). Reports wall time, time to the first record and the peak
+memory traced in the process (daemon thread and client).
+
+Usage:
+    python tests/benchmarks/bench_bridge_stream.py
+    python tests/benchmarks/bench_bridge_stream.py --sizes 10000 100000 400000
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "scripts" / "ramic_bridge"))
+
+from src.scripts.ramic_bridge.ramic_bridge import RBExcPersistent, RBExcStream, close_all_pools
+from src.app.utils.layout_dump_parser import parse_dump_line, parse_layout_dump
+from src.tools.bridge_utils import _unquote_skill_string
+from ramic_bridge_echo_daemon import EchoDaemon
+
+DEFAULT_SIZES = [10000, 100000]
+# Printed lines per chunk of the streaming executor (about 64 KB)
+LINES_PER_CHUNK = 1000
+
+
+def _printed_dump_parts(count: int):
+    """The printed dump string of count instances, in pieces"""
+    yield b'"'
+    for start in range(0, count, LINES_PER_CHUNK):
+        yield "".join(f"INST I{i} LIB=tphn28hpcpgv18 CELL=PDB3AC_H_G XY=({i * 0.1:.1f} 350.0) ORIENT=R0\\n"
+                      for i in range(start, min(count, start + LINES_PER_CHUNK))).encode("utf-8")
+    yield b'"'
+
+
+def _executors(count: int):
+    def execute(skill_code, timeout_seconds):
+        return b"\x02" + b"".join(_printed_dump_parts(count))
+
+    def execute_stream(skill_code, timeout_seconds, emit):
+        emit(b"\x02")
+        for part in _printed_dump_parts(count):
+            emit(part)
+        return b""
+
+    return execute, execute_stream
+
+
+def run_whole(host: str, port: int):
+    """Whole reply, then unquote and parse; returns (records, seconds to the first record)"""
+    start = time.perf_counter()
+    text = _unquote_skill_string(RBExcPersistent("dump", host=host, port=port, timeout=300)[1:])
+    first, records = None, 0
+    for line in text.split("\n"):
+        if line and parse_dump_line(line):
+            records += 1
+            first = first or time.perf_counter() - start
+    return records, first
+
+
+def run_streamed(host: str, port: int):
+    """Streamed reply parsed while it arrives; returns (records, seconds to the first record)"""
+    start = time.perf_counter()
+    first, records = None, 0
+    for _ in parse_layout_dump(RBExcStream("dump", host=host, port=port, timeout=300)):
+        records += 1
+        first = first or time.perf_counter() - start
+    return records, first
+
+
+def measure(function, host: str, port: int):
+    """Time one run, then trace the peak memory of a second run (tracing slows it down)"""
+    start = time.perf_counter()
+    records, first = function(host, port)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(host, port)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return records, elapsed, first, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Whole vs streamed layout dump transfer benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Instances in the dump")
+    args = parser.parse_args()
+
+    print("📊 Streamed Bridge Result Benchmark")
+    print("=" * 86)
+    print(f"{'instances':>10} | {'mode':>8} | {'records':>8} | {'wall':>8} | {'first record':>12} | {'peak traced':>12}")
+    print("-" * 86)
+    for size in args.sizes:
+        execute, execute_stream = _executors(size)
+        with EchoDaemon(executor=execute, stream_executor=execute_stream) as echo:
+            for mode, function in (("whole", run_whole), ("streamed", run_streamed)):
+                records, elapsed, first, peak_mb = measure(function, echo.host, echo.port)
+                if records != size:
+                    raise RuntimeError(f"❌ Error: Parsed {records} of {size} records ({mode})")
+                print(f"{size:>10} | {mode:>8} | {records:>8} | {elapsed:>7.2f}s | {first * 1000:>10.1f}ms | {peak_mb:>9.1f} MB")
+        close_all_pools()
+
+
+if __name__ == "__main__":
+    main()
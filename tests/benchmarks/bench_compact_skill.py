@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compact SKILL Emission Benchmark
+
+Generates the layout and schematic scripts of synthetic rings in the default
+(statement per object) and compact (placement tables looped over by foreach) formats
+and compares what Virtuoso has to read:
+
+    bytes       size of the .il file
+    forms       top-level forms, each one a separate read/eval round of load()
+    tokens      SKILL tokens the reader has to scan
+    scan (ms)   time to tokenize the script here, a local stand-in for the reader's
+                parse cost (evaluation inside Virtuoso is not measured)
+
+Usage:
+    python tests/benchmarks/bench_compact_skill.py
+    python tests/benchmarks/bench_compact_skill.py --sizes 10 25 --nodes T28
+    python tests/benchmarks/bench_compact_skill.py --check     # Exit 1 if compact layouts are not below --max-ratio
+"""
+
+import io
+import re
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.intent_graph.json_validator import convert_config_to_list
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from src.app.schematic.schematic_generator_T28 import generate_multi_device_schematic as generate_multi_device_schematic_28nm
+from src.app.schematic.schematic_generator_T180 import generate_multi_device_schematic as generate_multi_device_schematic_180nm
+from tests.benchmarks.synthetic_ring import build_intent_graph
+
+# Pads per side
+DEFAULT_SIZES = [10, 25, 50]
+_TOKEN_RE = re.compile(r'"[^"\\]*"|[()\']|[^\s()\'"]+')
+
+
+def script_stats(script_file: Path, repeat: int = 3) -> dict:
+    """Get the size, form count, token count and best tokenize time of a script"""
+    text = script_file.read_text(encoding="utf-8")
+    forms = sum(1 for line in text.splitlines() if line.strip() and not line.lstrip().startswith(";"))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = len(_TOKEN_RE.findall(text))
+        best = min(best, time.perf_counter() - start)
+    return {"bytes": len(text.encode("utf-8")), "forms": forms, "tokens": tokens, "scan_ms": best * 1000}
+
+
+def generate_scripts(process_node: str, pads_per_side: int, output_dir: Path, compact: bool) -> dict:
+    """Generate the layout and schematic script of a synthetic ring, return their paths"""
+    graph = build_intent_graph(process_node, pads_per_side, pads_per_side)
+    graph_file = output_dir / "intent_graph.json"
+    graph_file.write_text(json.dumps(graph), encoding="utf-8")
+    suffix = "compact" if compact else "default"
+    layout_file = output_dir / f"layout_{suffix}.il"
+    schematic_file = output_dir / f"schematic_{suffix}.il"
+    generate_schematic = generate_multi_device_schematic_180nm if process_node == "T180" else generate_multi_device_schematic_28nm
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_layout_from_json(str(graph_file), str(layout_file), process_node, compact=compact)
+        generate_schematic(convert_config_to_list(graph), str(schematic_file), compact=compact)
+    return {"layout": layout_file, "schematic": schematic_file}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare default and compact SKILL scripts for T28 and T180")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Pads per side to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Tokenize repetitions per script (best time is reported)")
+    parser.add_argument("--nodes", nargs="+", default=["T28", "T180"], help="Process nodes to benchmark")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if a compact layout exceeds --max-ratio")
+    parser.add_argument("--max-ratio", type=float, default=0.8, help="Maximum accepted compact/default layout size for --check")
+    args = parser.parse_args()
+
+    failed = False
+    for process_node in args.nodes:
+        print(f"\n📌 {process_node}")
+        print(f"{'pads':>6} {'script':>10} {'bytes':>18} {'forms':>14} {'tokens':>18} {'scan (ms)':>16} {'size':>6}")
+        for size in args.sizes:
+            with tempfile.TemporaryDirectory() as tmp:
+                default = generate_scripts(process_node, size, Path(tmp), compact=False)
+                compact = generate_scripts(process_node, size, Path(tmp), compact=True)
+                for kind in ("layout", "schematic"):
+                    before = script_stats(default[kind], args.repeat)
+                    after = script_stats(compact[kind], args.repeat)
+                    ratio = after["bytes"] / before["bytes"]
+                    print(f"{size * 4:>6} {kind:>10} {before['bytes']:>8} → {after['bytes']:<7} "
+                          f"{before['forms']:>6} → {after['forms']:<5} {before['tokens']:>8} → {after['tokens']:<7} "
+                          f"{before['scan_ms']:>6.2f} → {after['scan_ms']:<6.2f} {ratio:>5.0%}")
+                    if kind == "layout" and ratio > args.max_ratio:
+                        failed = True
+
+    if failed:
+        print(f"\n❌ Compact layout above {args.max_ratio:.0%} of the default size")
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RAMIC Bridge Daemon I/O Throughput Benchmark
+
+Runs the daemon's execute_in_virtuoso against a fake Virtuoso child process that
+emits multi-megabyte STX/RS framed replies, and reports reply latency and
+throughput. With --baseline, the previous byte-at-a-time reader (read(1) with
+1 ms sleeps on EAGAIN) is timed on the same replies for comparison.
+
+Usage:
+    python tests/benchmarks/bench_daemon_io.py
+    python tests/benchmarks/bench_daemon_io.py --sizes 1 4 16 --repeat 5     # Reply sizes in MB
+    python tests/benchmarks/bench_daemon_io.py --baseline --sizes 1 4
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "scripts" / "ramic_bridge"))
+
+import ramic_bridge_daemon_27 as daemon
+from tests.benchmarks.fake_virtuoso import start_fake_virtuoso
+
+DEFAULT_SIZES_MB = [1, 4, 16]
+
+
+def bytewise_read_until_delimiter(stream, start_ok=b"\x02", start_err=b"\x15", end=b"\x1e"):
+    """Previous daemon reader: one byte per read(1), 1 ms sleep when no data is available"""
+    result = bytearray()
+    while True:
+        ch = stream.read(1)
+        if ch is None:
+            time.sleep(0.001)
+            continue
+        if ch in (start_ok, start_err):
+            break
+    result.extend(ch)
+    while True:
+        ch = stream.read(1)
+        if ch is None:
+            time.sleep(0.001)
+            continue
+        if ch == end:
+            break
+        result.extend(ch)
+    return result
+
+
+def time_replies(proc, size: int, repeat: int, baseline: bool) -> float:
+    """Time `repeat` replies of `size` bytes and return the best time in seconds"""
+    in_fd, out_fd = proc.stdout.fileno(), proc.stdin.fileno()
+    stream = io.open(in_fd, "rb", closefd=False) if baseline else None
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if baseline:
+            os.write(out_fd, f"emit({size})".encode())
+            reply = bytewise_read_until_delimiter(stream)
+        else:
+            reply = daemon.execute_in_virtuoso(f"emit({size})", 60, in_fd=in_fd, out_fd=out_fd)
+        best = min(best, time.perf_counter() - start)
+        if len(reply) != size + 1:
+            raise RuntimeError(f"❌ Error: Reply has {len(reply)} bytes, expected {size + 1}")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RAMIC bridge daemon stdin reader throughput benchmark")
+    parser.add_argument("--sizes", type=float, nargs="+", default=DEFAULT_SIZES_MB, help="Reply sizes in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Replies per size (best time is reported)")
+    parser.add_argument("--baseline", action="store_true", help="Also time the previous byte-at-a-time reader")
+    args = parser.parse_args()
+
+    proc = start_fake_virtuoso()
+    daemon.setup_virtuoso_pipes(proc.stdout.fileno(), proc.stdin.fileno())
+    try:
+        print("📊 RAMIC Bridge Daemon I/O Benchmark")
+        print("=" * 64)
+        print(f"{'reply':>8} | {'buffered':>10} {'MB/s':>8} | {'byte-wise':>10} {'MB/s':>8}")
+        print("-" * 64)
+        for size_mb in args.sizes:
+            size = int(size_mb * 1024 * 1024)
+            buffered = time_replies(proc, size, args.repeat, baseline=False)
+            line = f"{size_mb:>6g}MB | {buffered * 1000:>8.1f}ms {size_mb / buffered:>8.1f} |"
+            if args.baseline:
+                bytewise = time_replies(proc, size, 1, baseline=True)
+                line += f" {bytewise * 1000:>8.1f}ms {size_mb / bytewise:>8.1f}"
+            print(line)
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ring Geometry Checker Scaling Benchmark
+
+Times check_ring_geometry() on synthetic rings of 100 to 8,000 outer pads (plus their
+fillers) against a pairwise all-boxes overlap test, and fits the log-log slope of the
+checker runtime vs. instance count. The sweep should stay close to 1.0 (n log n), the
+pairwise test is 2.0.
+
+Usage:
+    python tests/benchmarks/bench_geometry_checker.py
+    python tests/benchmarks/bench_geometry_checker.py --sizes 500 2000 8000 --repeat 5
+    python tests/benchmarks/bench_geometry_checker.py --check      # Exit 1 if the slope exceeds --max-slope
+"""
+
+import sys
+import io
+import math
+import time
+import argparse
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.geometry_checker import RingGeometryChecker, instance_bbox
+from tests.benchmarks.bench_auto_filler import fit_slope, prepare_ring
+
+DEFAULT_SIZES = [100, 500, 2000, 8000]
+# Pairwise overlap test is only timed up to this many pads
+PAIRWISE_LIMIT = 2000
+
+
+def placed_ring(process_node: str, pad_count: int) -> list:
+    """Get the outer pads, corners and fillers of a synthetic ring"""
+    generator, outer, _ = prepare_ring(process_node, pad_count)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(outer, [])
+
+
+def pairwise_overlaps(checker: RingGeometryChecker, components: list) -> int:
+    """Count overlapping box pairs by testing every pair"""
+    boxes = [instance_bbox(c["position"][0], c["position"][1], c["orientation"], *checker.device_size(c))
+             for c in components]
+    count = 0
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                count += 1
+    return count
+
+
+def best_time(func, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark check_ring_geometry() scaling for T28 and T180")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Outer pad counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per size (best time is reported)")
+    parser.add_argument("--nodes", nargs="+", default=["T28", "T180"], help="Process nodes to benchmark")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if any slope exceeds --max-slope")
+    parser.add_argument("--max-slope", type=float, default=1.3, help="Maximum accepted log-log slope for --check")
+    args = parser.parse_args()
+
+    print("⏱️  Ring Geometry Checker Benchmark")
+    print("=" * 60)
+
+    failed = False
+    for process_node in args.nodes:
+        checker = RingGeometryChecker(process_node)
+        print(f"\n📌 {process_node}")
+        print(f"{'pads':>8} {'instances':>10} {'sweep (ms)':>11} {'pairwise (ms)':>14} {'errors':>7}")
+        counts, times = [], []
+        for size in args.sizes:
+            components = placed_ring(process_node, size)
+            elapsed = best_time(lambda: checker.check(components), args.repeat)
+            report = checker.check(components)
+            pairwise = "-"
+            if size <= PAIRWISE_LIMIT:
+                pairwise = f"{best_time(lambda: pairwise_overlaps(checker, components), 1) * 1000:.1f}"
+            counts.append(len(components))
+            times.append(elapsed)
+            print(f"{size:>8} {len(components):>10} {elapsed * 1000:>11.2f} {pairwise:>14} {len(report['errors']):>7}")
+
+        slope = fit_slope(counts, times) if len(counts) > 1 else 0.0
+        status = "✅" if slope <= args.max_slope else "❌"
+        print(f"{status} log-log slope: {slope:.2f} (1.0 = linear)")
+        if slope > args.max_slope:
+            failed = True
+
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Layout Visualization Render Benchmark
+
+Generates synthetic T28/T180 rings (12x12, 26x12 and 40x40 pads per side by default),
+then times rendering their placed components to PNG with each backend of
+src/app/layout/layout_renderer.py:
+
+    artist      one patch and one boxed text artist per device, tight layout (original path)
+    collection  batched PatchCollections, fixed layout, single draw, fast PNG encoding
+
+Usage:
+    python tests/benchmarks/bench_layout_render.py
+    python tests/benchmarks/bench_layout_render.py --sizes 12x12 40x40 --repeat 3
+    python tests/benchmarks/bench_layout_render.py --nodes T28 --backends collection
+"""
+
+import io
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.layout_generator_factory import create_layout_generator, generate_layout_from_json
+from src.app.layout.layout_renderer import RENDER_BACKENDS
+from src.app.layout.T28.layout_visualizer import visualize_layout_from_components
+from src.app.layout.T180.layout_visualizer import visualize_layout_from_components_T180
+from tests.benchmarks.synthetic_ring import build_intent_graph
+
+DEFAULT_SIZES = ["12x12", "26x12", "40x40"]
+
+
+def parse_size(size: str) -> tuple:
+    """Parse a WIDTHxHEIGHT ring size"""
+    width, height = size.lower().split("x")
+    return int(width), int(height)
+
+
+def prepare_components(process_node: str, width: int, height: int, work_dir: str) -> tuple:
+    """Generate a synthetic ring, returns (placed components, ring_config) as the generator renders them"""
+    graph = build_intent_graph(process_node, width, height, inner_pad_every=4 if process_node == "T28" else 0)
+    graph_file = os.path.join(work_dir, f"{process_node}_{width}x{height}.json")
+    with open(graph_file, "w", encoding="utf-8") as f:
+        json.dump(graph, f)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = generate_layout_from_json(graph_file, os.path.join(work_dir, "io_ring_layout.il"), process_node)
+    if result is None:
+        raise RuntimeError(f"Layout generation failed for {process_node} {width}x{height}")
+
+    # Chip size as the generator derives it (the T180 renderer frames the figure on it)
+    ring_config = graph["ring_config"]
+    generator_config = create_layout_generator(process_node).config
+    pad_spacing = ring_config.get("pad_spacing", generator_config["pad_spacing"])
+    corner_size = ring_config.get("corner_size", generator_config["corner_size"])
+    ring_config.setdefault("chip_width", width * pad_spacing + corner_size * 2)
+    ring_config.setdefault("chip_height", height * pad_spacing + corner_size * 2)
+    return result["components"], ring_config
+
+
+def time_render(process_node: str, components: list, ring_config: dict, backend: str,
+                output_path: str, repeat: int) -> float:
+    """Get the best-of-N wall time of one render, in seconds"""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if process_node == "T180":
+            visualize_layout_from_components_T180(components, output_path, ring_config, backend=backend)
+        else:
+            visualize_layout_from_components(components, output_path, backend=backend)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark layout visualization render backends")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="Ring sizes as WIDTHxHEIGHT pads")
+    parser.add_argument("--nodes", nargs="+", default=["T28", "T180"], help="Process nodes to benchmark")
+    parser.add_argument("--backends", nargs="+", choices=list(RENDER_BACKENDS), default=list(RENDER_BACKENDS),
+                        help="Render backends to compare")
+    parser.add_argument("--repeat", type=int, default=1, help="Renders per size and backend (best time is reported)")
+    args = parser.parse_args()
+
+    print("⏱️  Layout Render Benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for process_node in args.nodes:
+            print(f"\n📌 {process_node}")
+            print(f"{'ring':>8} {'components':>10} " + " ".join(f"{backend + ' (ms)':>16}" for backend in args.backends)
+                  + f" {'speedup':>8}")
+            for size in args.sizes:
+                width, height = parse_size(size)
+                components, ring_config = prepare_components(process_node, width, height, tmp)
+                times = {}
+                for backend in args.backends:
+                    output_path = os.path.join(tmp, f"{process_node}_{size}_{backend}.png")
+                    times[backend] = time_render(process_node, components, ring_config, backend,
+                                                 output_path, args.repeat)
+                speedup = ""
+                if "artist" in times and "collection" in times:
+                    speedup = f"{times['artist'] / times['collection']:.2f}x"
+                print(f"{size:>8} {len(components):>10} "
+                      + " ".join(f"{times[backend] * 1000:>16.1f}" for backend in args.backends)
+                      + f" {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
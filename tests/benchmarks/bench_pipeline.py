@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Intent Graph → SKILL Pipeline Benchmark
+
+Runs every AMS-IO-Bench golden intent graph (golden_output/*/io_ring_intent_graph.json)
+through the deterministic pipeline in-process, with the generator of its process node
+(28nm_wirebonding → T28, 180nm_wirebonding → T180):
+
+    validate    validate_config
+    layout      generate_layout_from_json (includes the visualization rendered from the
+                placed components, as generate_io_ring_layout gets it)
+    schematic   convert_config_to_list + generate_multi_device_schematic
+
+For each stage it records the best wall time over --repeat runs, the peak traced
+memory (tracemalloc, measured in a separate run) and the size of the files written.
+Results are compared against a stored baseline; a stage is a regression when its time
+exceeds baseline * --time-tolerance + --time-slack-ms, or its peak memory exceeds
+baseline * --memory-tolerance. Output size changes are reported, not failed.
+
+Usage:
+    python tests/benchmarks/bench_pipeline.py                     # Run and compare against the baseline
+    python tests/benchmarks/bench_pipeline.py --check             # Exit 1 on regressions
+    python tests/benchmarks/bench_pipeline.py --update-baseline   # Store results as the new baseline
+    python tests/benchmarks/bench_pipeline.py --cases 12x12 --nodes T28 --repeat 5
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.intent_graph.json_validator import validate_config, convert_config_to_list
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from src.app.schematic.schematic_generator_T28 import generate_multi_device_schematic as generate_multi_device_schematic_28nm
+from src.app.schematic.schematic_generator_T180 import generate_multi_device_schematic as generate_multi_device_schematic_180nm
+
+BENCH_DIR = project_root / "AMS-IO-Bench"
+BASELINE_FILE = Path(__file__).parent / "baselines" / "pipeline_baseline.json"
+PROCESS_NODE_DIRS = {"T28": "28nm_wirebonding", "T180": "180nm_wirebonding"}
+STAGES = ["validate", "layout", "schematic"]
+
+
+def discover_cases(nodes: List[str] = None, name_filters: List[str] = None) -> List[Dict[str, str]]:
+    """Find golden intent graphs, sorted by process node and case name
+
+    Returns:
+        List of dicts with 'name', 'process_node' and 'intent_graph'
+    """
+    cases = []
+    for process_node, node_dir in PROCESS_NODE_DIRS.items():
+        if nodes and process_node not in nodes:
+            continue
+        for graph in sorted((BENCH_DIR / node_dir / "golden_output").glob("*/io_ring_intent_graph.json")):
+            name = graph.parent.name
+            if name_filters and not any(f in name for f in name_filters):
+                continue
+            cases.append({"name": name, "process_node": process_node, "intent_graph": str(graph)})
+    return cases
+
+
+def _pipeline_stages(case: Dict[str, str], output_dir: Path) -> List[tuple]:
+    """Build (stage name, callable, output files) for one case"""
+    process_node = case["process_node"]
+    layout_file = output_dir / "layout.il"
+    schematic_file = output_dir / "schematic.il"
+    state = {}
+
+    def validate():
+        with open(case["intent_graph"], "r", encoding="utf-8") as f:
+            state["config"] = json.load(f)
+        if not validate_config(state["config"]):
+            raise ValueError(f"❌ Error: Intent graph validation failed: {case['intent_graph']}")
+
+    def layout():
+        generate_layout_from_json(case["intent_graph"], str(layout_file), process_node)
+
+    def schematic():
+        config_list = convert_config_to_list(state["config"])
+        if process_node == "T180":
+            generate_multi_device_schematic_180nm(config_list, str(schematic_file))
+        else:
+            generate_multi_device_schematic_28nm(config_list, str(schematic_file))
+
+    return [
+        ("validate", validate, []),
+        ("layout", layout, [layout_file, output_dir / "layout_visualization.png"]),
+        ("schematic", schematic, [schematic_file]),
+    ]
+
+
+def run_case(case: Dict[str, str], repeat: int = 1, measure_memory: bool = True) -> Dict[str, Dict]:
+    """Run the pipeline for one case
+
+    Returns:
+        Dict stage -> {'time_ms', 'peak_memory_kb', 'output_bytes'}
+    """
+    results = {stage: {"time_ms": float("inf"), "peak_memory_kb": None, "output_bytes": 0} for stage in STAGES}
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp)
+        # Timing runs (tracemalloc off, it slows allocation-heavy code down)
+        for _ in range(repeat):
+            for stage, func, outputs in _pipeline_stages(case, output_dir):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    func()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                results[stage]["time_ms"] = min(results[stage]["time_ms"], elapsed_ms)
+                results[stage]["output_bytes"] = sum(p.stat().st_size for p in outputs if p.exists())
+        # Memory run
+        if measure_memory:
+            for stage, func, _ in _pipeline_stages(case, output_dir):
+                tracemalloc.start()
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        func()
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                results[stage]["peak_memory_kb"] = peak / 1024
+    for stage in STAGES:
+        results[stage]["time_ms"] = round(results[stage]["time_ms"], 3)
+        if results[stage]["peak_memory_kb"] is not None:
+            results[stage]["peak_memory_kb"] = round(results[stage]["peak_memory_kb"], 1)
+    return results
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict], time_tolerance: float = 1.5,
+                        time_slack_ms: float = 20.0, memory_tolerance: float = 1.25) -> List[str]:
+    """Compare results against a baseline
+
+    Returns:
+        List of messages; regressions start with "❌", output size changes with "⚠️"
+    """
+    messages = []
+    for case_key, stages in results.items():
+        base_stages = baseline.get(case_key)
+        if not base_stages:
+            messages.append(f"⚠️  {case_key}: no baseline")
+            continue
+        for stage, current in stages.items():
+            base = base_stages.get(stage)
+            if not base:
+                continue
+            time_limit = base["time_ms"] * time_tolerance + time_slack_ms
+            if current["time_ms"] > time_limit:
+                messages.append(f"❌ {case_key} [{stage}] time {current['time_ms']:.1f}ms > "
+                                f"{time_limit:.1f}ms (baseline {base['time_ms']:.1f}ms)")
+            if current.get("peak_memory_kb") is not None and base.get("peak_memory_kb") is not None:
+                memory_limit = base["peak_memory_kb"] * memory_tolerance
+                if current["peak_memory_kb"] > memory_limit:
+                    messages.append(f"❌ {case_key} [{stage}] peak memory {current['peak_memory_kb']:.0f}KB > "
+                                    f"{memory_limit:.0f}KB (baseline {base['peak_memory_kb']:.0f}KB)")
+            if current["output_bytes"] != base.get("output_bytes"):
+                messages.append(f"⚠️  {case_key} [{stage}] output size {current['output_bytes']} bytes "
+                                f"(baseline {base.get('output_bytes')} bytes)")
+    return messages
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> Dict[str, Dict]:
+    """Load stored baseline results (empty if there is none)"""
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("cases", {})
+
+
+def save_baseline(results: Dict[str, Dict], path: Path = BASELINE_FILE) -> None:
+    """Store results as the baseline"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"python": sys.version.split()[0], "cases": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def run_benchmark(cases: List[Dict[str, str]], repeat: int, measure_memory: bool,
+                  progress: Optional[Callable[[str], None]] = print) -> Dict[str, Dict]:
+    """Run all cases; result keys are '<process_node>/<case name>'"""
+    results = {}
+    for i, case in enumerate(cases, 1):
+        case_key = f"{case['process_node']}/{case['name']}"
+        results[case_key] = run_case(case, repeat, measure_memory)
+        if progress:
+            stages = results[case_key]
+            progress(f"[{i:2d}/{len(cases)}] {case_key:<58} " + " ".join(
+                f"{stage} {stages[stage]['time_ms']:>8.1f}ms" for stage in STAGES))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process intent graph → SKILL pipeline benchmark")
+    parser.add_argument("--nodes", nargs="+", choices=list(PROCESS_NODE_DIRS), default=None, help="Process nodes to run")
+    parser.add_argument("--cases", nargs="+", default=None, help="Only run cases whose name contains one of these strings")
+    parser.add_argument("--repeat", type=int, default=1, help="Timing runs per case (best time is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak memory run")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on time or memory regressions")
+    parser.add_argument("--time-tolerance", type=float, default=1.5, help="Allowed time factor over baseline")
+    parser.add_argument("--time-slack-ms", type=float, default=20.0, help="Allowed absolute time over baseline (ms)")
+    parser.add_argument("--memory-tolerance", type=float, default=1.25, help="Allowed peak memory factor over baseline")
+    parser.add_argument("--output", type=Path, default=None, help="Also write the results JSON to this file")
+    args = parser.parse_args()
+
+    # Schematic generators look up device templates relative to the project root
+    os.chdir(project_root)
+    cases = discover_cases(args.nodes, args.cases)
+    if not cases:
+        print("❌ Error: No golden intent graphs found")
+        sys.exit(1)
+
+    print(f"📊 Pipeline Benchmark ({len(cases)} cases, best of {args.repeat})")
+    print("=" * 100)
+    results = run_benchmark(cases, args.repeat, not args.no_memory)
+
+    totals = {stage: sum(r[stage]["time_ms"] for r in results.values()) for stage in STAGES}
+    print("-" * 100)
+    print("Total: " + " | ".join(f"{stage} {totals[stage]:.1f}ms" for stage in STAGES))
+
+    if args.output:
+        save_baseline(results, args.output)
+        print(f"💾 Results written to {args.output}")
+
+    if args.update_baseline:
+        baseline = load_baseline(args.baseline)
+        baseline.update(results)
+        save_baseline(baseline, args.baseline)
+        print(f"💾 Baseline updated: {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"⚠️  No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+    messages = compare_to_baseline(results, baseline, args.time_tolerance, args.time_slack_ms, args.memory_tolerance)
+    regressions = [m for m in messages if m.startswith("❌")]
+    for message in messages:
+        print(message)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) against baseline")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
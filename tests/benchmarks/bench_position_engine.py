@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ring Position Engine Benchmark
+
+Times PositionCalculator on synthetic rings of 100 to 8,000 outer pads, for both
+placement orders and process nodes:
+
+- per-pad:  one calculate_position_from_relative() call per instance
+- batch:    one calculate_positions_from_relative() call for the whole ring, as
+            convert_relative_to_absolute does
+
+Usage:
+    python tests/benchmarks/bench_position_engine.py
+    python tests/benchmarks/bench_position_engine.py --sizes 1000 8000 --repeat 5
+    python tests/benchmarks/bench_position_engine.py --check          # Exit 1 if batch is not faster than per-pad at the largest size
+"""
+
+import sys
+import math
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.layout_generator_factory import create_layout_generator
+from tests.benchmarks.synthetic_ring import build_intent_graph, ring_dimensions_for_pad_count
+
+DEFAULT_SIZES = [100, 500, 1000, 2000, 4000, 8000]
+
+
+def prepare_ring(process_node: str, pad_count: int, placement_order: str):
+    """Build a synthetic ring with the ring_config keys generate_layout_from_json fills in
+
+    Returns:
+        Tuple of (position calculator, ring_config, relative positions, instances or None)
+    """
+    width, height = ring_dimensions_for_pad_count(pad_count)
+    graph = build_intent_graph(process_node, width, height, placement_order)
+    generator = create_layout_generator(process_node)
+    ring_config = graph["ring_config"]
+
+    pad_spacing = ring_config.get("pad_spacing", generator.config["pad_spacing"])
+    corner_size = ring_config.get("corner_size", generator.config["corner_size"])
+    ring_config["chip_width"] = width * pad_spacing + corner_size * 2
+    ring_config["chip_height"] = height * pad_spacing + corner_size * 2
+    ring_config.update({"top_count": width, "bottom_count": width, "left_count": height, "right_count": height})
+    generator.set_config(ring_config)
+
+    positions = [instance["position"] for instance in graph["instances"]]
+    # 180nm pads carry their own pad_width/corner_size, 28nm pads use the configuration
+    instances = graph["instances"] if process_node == "T180" else None
+    return generator.position_calculator, ring_config, positions, instances
+
+
+def best_time(func, repeat: int) -> float:
+    """Get the best-of-N wall time of func(), in seconds"""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-pad vs. batch ring position calculation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Outer pad counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per size (best time is reported)")
+    parser.add_argument("--nodes", nargs="+", default=["T28", "T180"], help="Process nodes to benchmark")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if batch is not faster at the largest size")
+    args = parser.parse_args()
+
+    print("⏱️  Ring Position Engine Benchmark")
+    print("=" * 60)
+
+    failed = False
+    for process_node in args.nodes:
+        for placement_order in ("clockwise", "counterclockwise"):
+            print(f"\n📌 {process_node} {placement_order}")
+            print(f"{'pads':>8} {'per-pad (ms)':>14} {'batch (ms)':>12} {'speedup':>9}")
+            for size in args.sizes:
+                calculator, ring_config, positions, instances = prepare_ring(process_node, size, placement_order)
+
+                def per_pad():
+                    for slot, relative_position in enumerate(positions):
+                        calculator.calculate_position_from_relative(relative_position, ring_config,
+                                                                    instances[slot] if instances else None)
+
+                def batch():
+                    calculator.calculate_positions_from_relative(positions, ring_config, instances)
+
+                # Warm up (first numpy import)
+                batch()
+                per_pad_time = best_time(per_pad, args.repeat)
+                batch_time = best_time(batch, args.repeat)
+                speedup = per_pad_time / batch_time if batch_time else math.inf
+                print(f"{size:>8} {per_pad_time * 1000:>14.2f} {batch_time * 1000:>12.2f} {speedup:>8.1f}x")
+                if size == max(args.sizes) and speedup <= 1.0:
+                    failed = True
+
+    if args.check and failed:
+        print("\n❌ Batch position calculation is not faster than per-pad at the largest size")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
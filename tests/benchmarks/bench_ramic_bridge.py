@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RAMIC Bridge Latency Benchmark
+
+Compares per-call latency of the one-shot client (RBExc, one TCP connection per
+call) with the pooled persistent client (RBExcPersistent, framed protocol) against
+the local echo daemon, for several payload sizes.
+
+Usage:
+    python tests/benchmarks/bench_ramic_bridge.py
+    python tests/benchmarks/bench_ramic_bridge.py --calls 500 --sizes 16 65536 4194304
+    python tests/benchmarks/bench_ramic_bridge.py --latency 0.002   # Simulated Skill evaluation time
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "scripts" / "ramic_bridge"))
+
+from src.scripts.ramic_bridge.ramic_bridge import RBExc, RBExcPersistent, close_all_pools
+from ramic_bridge_echo_daemon import EchoDaemon
+
+DEFAULT_SIZES = [16, 4096, 65536, 1024 * 1024]
+
+
+def time_calls(client, skill: str, host: str, port: int, calls: int):
+    """Time calls to client and return per-call latencies in milliseconds"""
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = client(skill, host=host, port=port, timeout=30)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if len(result) != len(skill) + 1:
+            raise RuntimeError(f"❌ Error: Truncated reply ({len(result)} of {len(skill) + 1} chars)")
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RAMIC bridge one-shot vs persistent latency benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Payload sizes in bytes")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per client and payload size")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated Skill evaluation time in seconds")
+    args = parser.parse_args()
+
+    print("📊 RAMIC Bridge Latency Benchmark")
+    print("=" * 78)
+    print(f"{'payload':>10} | {'one-shot p50':>12} {'p95':>8} | {'persistent p50':>14} {'p95':>8} | {'speedup':>7}")
+    print("-" * 78)
+
+    with EchoDaemon(latency=args.latency) as echo:
+        for size in args.sizes:
+            skill = "x" * size
+            calls = max(5, min(args.calls, args.calls * 65536 // max(size, 1)))
+            oneshot = time_calls(RBExc, skill, echo.host, echo.port, calls)
+            RBExcPersistent(skill, host=echo.host, port=echo.port)  # Warm up the pool
+            persistent = time_calls(RBExcPersistent, skill, echo.host, echo.port, calls)
+            close_all_pools()
+
+            oneshot_p50 = statistics.median(oneshot)
+            persistent_p50 = statistics.median(persistent)
+            oneshot_p95 = sorted(oneshot)[int(0.95 * (len(oneshot) - 1))]
+            persistent_p95 = sorted(persistent)[int(0.95 * (len(persistent) - 1))]
+            print(f"{size:>10} | {oneshot_p50:>10.3f}ms {oneshot_p95:>6.3f}ms | "
+                  f"{persistent_p50:>12.3f}ms {persistent_p95:>6.3f}ms | {oneshot_p50 / persistent_p50:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fake Virtuoso Child Process
+
+Stands in for Virtuoso on the daemon's pipes: reads Skill requests from stdin and
+answers on stdout with STX/NAK ... RS framed replies, written in pipe-sized chunks.
+
+Requests:
+    emit(<size>)    -> STX + <size> bytes + RS
+    error(<text>)   -> NAK + <text> + RS
+    noisy(<size>)   -> stray output, then STX + <size> bytes + RS
+    hang()          -> no reply (for watchdog tests)
+    anything else   -> STX + request text + RS (echo)
+
+Usage:
+    proc = start_fake_virtuoso()
+    ramic_bridge_daemon_27.execute_in_virtuoso("emit(1048576)", 30,
+                                               in_fd=proc.stdout.fileno(), out_fd=proc.stdin.fileno())
+"""
+
+import os
+import re
+import sys
+import subprocess
+
+STX = b"\x02"
+NAK = b"\x15"
+RS = b"\x1e"
+WRITE_CHUNK_SIZE = 65536
+
+_REQUEST_PATTERN = re.compile(rb"^(\w+)\((.*)\)$", re.S)
+
+
+def build_reply(request: bytes) -> bytes:
+    """Build the framed reply for one request"""
+    match = _REQUEST_PATTERN.match(request.strip())
+    command, arg = (match.group(1), match.group(2)) if match else (b"", b"")
+    if command == b"emit":
+        return STX + b"x" * int(arg) + RS
+    if command == b"error":
+        return NAK + arg + RS
+    if command == b"noisy":
+        return b"*Warning* stray output\n" + STX + b"y" * int(arg) + RS
+    if command == b"hang":
+        return b""
+    return STX + request + RS
+
+
+def start_fake_virtuoso() -> subprocess.Popen:
+    """Start the fake Virtuoso as a child process with piped stdin/stdout"""
+    return subprocess.Popen([sys.executable, os.path.abspath(__file__)],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+
+
+def main():
+    while True:
+        request = os.read(0, WRITE_CHUNK_SIZE)
+        if not request:
+            break
+        reply = build_reply(request)
+        for offset in range(0, len(reply), WRITE_CHUNK_SIZE):
+            os.write(1, reply[offset:offset + WRITE_CHUNK_SIZE])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic IO Ring Intent Graph Builder
+
+Builds intent graphs of arbitrary size for T28 and T180 so that benchmarks
+can exercise the generators on rings far larger than the AMS-IO-Bench cases.
+"""
+
+from typing import Dict, List
+
+# Per-side device pattern, repeated along each side. Blocks of analog and digital
+# pads alternate so that fillers, separators and digital IO wiring are all exercised.
+_PAD_PATTERN = ["analog", "analog", "analog_vdd", "analog_vss", "digital_io", "digital_io", "digital_vdd", "digital_vss"]
+
+_SIDES = ["left", "bottom", "right", "top"]
+
+
+def _t28_device(kind: str, side: str) -> str:
+    """Get the T28 device name for a pad kind, with the _H_G/_V_G suffix of its side"""
+    suffix = "_H_G" if side in ("left", "right") else "_V_G"
+    base = {
+        "analog": "PDB3AC",
+        "analog_vdd": "PVDD1AC",
+        "analog_vss": "PVSS1AC",
+        "digital_io": "PDDW16SDGZ",
+        "digital_vdd": "PVDD1DGZ",
+        "digital_vss": "PVSS1DGZ",
+    }[kind]
+    return base + suffix
+
+
+def _t28_pad(name: str, kind: str, side: str, position: str, pad_type: str = "pad") -> dict:
+    """Build one T28 pad instance"""
+    instance = {
+        "name": name,
+        "device": _t28_device(kind, side),
+        "position": position,
+        "type": pad_type,
+    }
+    if kind.startswith("analog"):
+        instance["pin_connection"] = {
+            "AIO": {"label": name},
+            "TACVSS": {"label": "AVSS"},
+            "TACVDD": {"label": "AVDD"},
+            "VSS": {"label": "GIOL"},
+        }
+    else:
+        instance["pin_connection"] = {
+            "VDD": {"label": "VIOL"},
+            "VSS": {"label": "GIOL"},
+            "VDDPST": {"label": "VIOH"},
+            "VSSPST": {"label": "GIOH"},
+        }
+        if kind == "digital_io":
+            instance["direction"] = "input" if len(name) % 2 else "output"
+    return instance
+
+
+def _t180_device(kind: str) -> str:
+    """Get the T180 device name for a pad kind"""
+    return {
+        "analog": "PVDD1ANA",
+        "analog_vdd": "PVDD1CDG",
+        "analog_vss": "PVSS1CDG",
+        "digital_io": "PDDW0412SCDG",
+        "digital_vdd": "PVDD1CDG",
+        "digital_vss": "PVSS1CDG",
+    }[kind]
+
+
+def _t180_pad(name: str, kind: str, position: str, pad_type: str = "pad") -> dict:
+    """Build one T180 pad instance"""
+    domain = "analog" if kind.startswith("analog") else "digital"
+    instance = {
+        "name": name,
+        "device": _t180_device(kind),
+        "view_name": "layout",
+        "domain": domain,
+        "pad_width": 80,
+        "pad_height": 120,
+        "position": position,
+        "type": pad_type,
+    }
+    if domain == "analog":
+        instance["pin_config"] = {
+            "VDD": {"label": "VIOLA"},
+            "VSS": {"label": "GIOLA"},
+            "VDDPST": {"label": "VIOHA"},
+            "VSSPST": {"label": "GIOHA"},
+        }
+    else:
+        instance["pin_config"] = {
+            "VDD": {"label": "VIOLD"},
+            "VSS": {"label": "GIOLD"},
+            "VDDPST": {"label": "VIOHD"},
+            "VSSPST": {"label": "GIOHD"},
+        }
+        if kind == "digital_io":
+            instance["io_type"] = "input" if len(name) % 2 else "output"
+    return instance
+
+
+def build_intent_graph(process_node: str = "T28", width: int = 10, height: int = 10,
+                       placement_order: str = "counterclockwise", inner_pad_every: int = 0) -> Dict:
+    """Build a synthetic intent graph
+    
+    Args:
+        process_node: "T28" or "T180"
+        width: Outer pads on the top and bottom sides
+        height: Outer pads on the left and right sides
+        placement_order: "clockwise" or "counterclockwise"
+        inner_pad_every: Insert an inner pad between every N-th pair of outer pads (0 disables inner pads)
+        
+    Returns:
+        Intent graph dictionary in the same format as io_ring_intent_graph.json
+    """
+    if process_node not in ("T28", "T180"):
+        raise ValueError(f"Unsupported process node: {process_node}")
+    
+    pattern = _PAD_PATTERN
+    instances: List[dict] = []
+    counter = 0
+    for side in _SIDES:
+        count = width if side in ("top", "bottom") else height
+        for index in range(count):
+            kind = pattern[index % len(pattern)]
+            name = f"{side.upper()}_{kind.upper()}_{counter}"
+            counter += 1
+            position = f"{side}_{index}"
+            if process_node == "T28":
+                instances.append(_t28_pad(name, kind, side, position))
+            else:
+                instances.append(_t180_pad(name, kind, position))
+        
+        if inner_pad_every and process_node == "T28":
+            for index in range(0, count - 1, inner_pad_every):
+                kind = pattern[index % len(pattern)]
+                name = f"{side.upper()}_INNER_{counter}"
+                counter += 1
+                instances.append(_t28_pad(name, kind, side, f"{side}_{index}_{index + 1}", "inner_pad"))
+    
+    if process_node == "T28":
+        corners = [
+            ("CORNER_TOPLEFT", "PCORNERA_G", "top_left"),
+            ("CORNER_TOPRIGHT", "PCORNER_G", "top_right"),
+            ("CORNER_BOTTOMLEFT", "PCORNERA_G", "bottom_left"),
+            ("CORNER_BOTTOMRIGHT", "PCORNER_G", "bottom_right"),
+        ]
+        for name, device, position in corners:
+            instances.append({"name": name, "device": device, "position": position, "type": "corner"})
+        ring_config = {"width": width, "height": height, "placement_order": placement_order}
+    else:
+        for name, position in (("CORNER_TOPLEFT", "top_left"), ("CORNER_TOPRIGHT", "top_right"),
+                               ("CORNER_BOTTOMLEFT", "bottom_left"), ("CORNER_BOTTOMRIGHT", "bottom_right")):
+            instances.append({
+                "name": name,
+                "device": "PCORNER",
+                "view_name": "layout",
+                "domain": "null",
+                "pad_width": 130,
+                "pad_height": 130,
+                "position": position,
+                "type": "corner",
+            })
+        ring_config = {
+            "width": width,
+            "height": height,
+            "pad_spacing": 90,
+            "placement_order": placement_order,
+            "process_node": "T180",
+        }
+    
+    return {"ring_config": ring_config, "instances": instances}
+
+
+def ring_dimensions_for_pad_count(pad_count: int) -> tuple:
+    """Get (width, height) of a square-ish ring holding roughly pad_count outer pads"""
+    side = max(1, pad_count // 4)
+    return side, side
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Golden Output Regression Check
+
+Regenerates io_ring_layout.il and io_ring_schematic.il for every AMS-IO-Bench case that
+ships a golden intent graph, and diffs them structurally against the golden files with
+src/app/utils/il_differ.py (added / removed / moved instances, labels, pins and shapes).
+Deterministic and offline: no Virtuoso, screenshots or vision-model calls.
+
+Usage:
+    python tests/golden_il_check.py                       # All cases, exit 1 on any difference
+    python tests/golden_il_check.py --cases 12x12 -v      # Print the full diff of each case
+    python tests/golden_il_check.py --views layout
+"""
+
+import io
+import os
+import sys
+import json
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.utils.il_differ import diff_il_files, format_il_diff
+from src.app.intent_graph.json_validator import convert_config_to_list
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from src.app.schematic.schematic_generator_T28 import generate_multi_device_schematic as generate_multi_device_schematic_28nm
+from src.app.schematic.schematic_generator_T180 import generate_multi_device_schematic as generate_multi_device_schematic_180nm
+from tests.benchmarks.bench_pipeline import PROCESS_NODE_DIRS, discover_cases
+
+GOLDEN_FILES = {"layout": "io_ring_layout.il", "schematic": "io_ring_schematic.il"}
+
+
+def generate_case(case: dict, output_dir: Path, views: list) -> dict:
+    """Generate the requested views of one case, returns view -> generated file"""
+    generated = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        if "layout" in views:
+            generated["layout"] = output_dir / GOLDEN_FILES["layout"]
+            generate_layout_from_json(case["intent_graph"], str(generated["layout"]), case["process_node"])
+        if "schematic" in views:
+            generated["schematic"] = output_dir / GOLDEN_FILES["schematic"]
+            with open(case["intent_graph"], "r", encoding="utf-8") as f:
+                config_list = convert_config_to_list(json.load(f))
+            if case["process_node"] == "T180":
+                generate_multi_device_schematic_180nm(config_list, str(generated["schematic"]))
+            else:
+                generate_multi_device_schematic_28nm(config_list, str(generated["schematic"]))
+    return generated
+
+
+def check_case(case: dict, views: list) -> dict:
+    """Regenerate one case and diff it against its golden files, returns view -> diff"""
+    golden_dir = Path(case["intent_graph"]).parent
+    diffs = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        generated = generate_case(case, Path(tmp), views)
+        for view, generated_file in generated.items():
+            golden_file = golden_dir / GOLDEN_FILES[view]
+            if golden_file.exists():
+                diffs[view] = diff_il_files(str(golden_file), str(generated_file))
+    return diffs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff regenerated SKILL against AMS-IO-Bench golden outputs")
+    parser.add_argument("--nodes", nargs="+", choices=list(PROCESS_NODE_DIRS), default=None, help="Process nodes to check")
+    parser.add_argument("--cases", nargs="+", default=None, help="Only check cases whose name contains one of these strings")
+    parser.add_argument("--views", nargs="+", choices=list(GOLDEN_FILES), default=list(GOLDEN_FILES), help="Views to check")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print the full diff of differing cases")
+    parser.add_argument("--max-items", type=int, default=20, help="Entries listed per diff section with --verbose")
+    args = parser.parse_args()
+
+    # Schematic generators look up device templates relative to the project root
+    os.chdir(project_root)
+    cases = discover_cases(args.nodes, args.cases)
+    if not cases:
+        print("❌ Error: No golden intent graphs found")
+        sys.exit(1)
+
+    print(f"🧪 Golden Output Check ({len(cases)} cases, views: {', '.join(args.views)})")
+    print("=" * 80)
+    failed = 0
+    for case in cases:
+        case_key = f"{case['process_node']}/{case['name']}"
+        diffs = check_case(case, args.views)
+        differing = [view for view, diff in diffs.items() if not diff["identical"]]
+        if not differing:
+            print(f"✅ {case_key}")
+            continue
+        failed += 1
+        print(f"❌ {case_key}: " + ", ".join(
+            f"{view} +{len(diffs[view]['added'])} -{len(diffs[view]['removed'])} ~{len(diffs[view]['moved'])}"
+            for view in differing))
+        if args.verbose:
+            for view in differing:
+                print(f"--- {view} ---")
+                print(format_il_diff(diffs[view], args.max_items))
+    print("=" * 80)
+    print(f"📊 {len(cases) - failed}/{len(cases)} cases match their golden outputs")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,12 @@ Usage:
     
     # Run range of experiments
     python run_io_ring_batch.py --start-index 1 --stop-index 10 --model-name deepseek
+    
+    # Run 4 experiments at a time, each worker on its own RAMIC port
+    python run_io_ring_batch.py --workers 4 --ramic-port-start 65432
+    
+    # Continue an interrupted batch, skipping experiments in the checkpoint
+    python run_io_ring_batch.py --workers 4 --ramic-port-start 65432 --resume
 """
 
 # ============================================================================
@@ -235,6 +241,8 @@ import time
 import yaml
 import tempfile
 import threading
+import json
+import queue
 
 # ============================================================================
 # Experiment Runner
@@ -242,7 +250,8 @@ import threading
 
 def run_experiment(excel_file, sheet_name, prefix, template_type, model_name, 
                    ramic_port, ramic_host, log_dir, batch_interrupted_flag, 
-                   current_process_ref, prompt_text, prompt_key):
+                   current_process_ref, prompt_text, prompt_key,
+                   output_prefix="", worker_log=None, output_lock=None):
     """
     Run a single IO ring experiment
     
@@ -259,6 +268,9 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
         current_process_ref: Dictionary with 'process' key for current subprocess
         prompt_text: The actual prompt text to send to the agent
         prompt_key: Key for logging purposes
+        output_prefix: Prefix for each line streamed to stdout (e.g. "[w1] " in parallel mode)
+        worker_log: Optional open file that also receives every streamed line (per-worker log)
+        output_lock: Optional lock serializing stdout/worker log writes between workers
     
     Returns:
         Dictionary with experiment results
@@ -307,6 +319,26 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
         # Run experiment with timeout (50 minutes = 3000 seconds)
         timeout = 3000  # 50 minutes
         
+        def stream_line(line, stdout):
+            """Write a line to stdout (with output_prefix) and the worker log"""
+            if output_lock:
+                output_lock.acquire()
+            try:
+                try:
+                    stdout.write(f"{output_prefix}{line}" if output_prefix else line)
+                    stdout.flush()
+                except (ValueError, OSError):
+                    pass
+                if worker_log:
+                    try:
+                        worker_log.write(line)
+                        worker_log.flush()
+                    except (ValueError, OSError):
+                        pass
+            finally:
+                if output_lock:
+                    output_lock.release()
+        
         # Function to tee output to both file and stdout
         def tee_output(pipe, log_file, stdout):
             """Read from pipe and write to both file and stdout"""
@@ -320,12 +352,8 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
                         log_file.flush()
                     except (ValueError, OSError):
                         pass
-                    # Write to stdout
-                    try:
-                        stdout.write(line)
-                        stdout.flush()
-                    except (ValueError, OSError):
-                        pass
+                    # Write to stdout and worker log
+                    stream_line(line, stdout)
             except Exception:
                 pass
             finally:
@@ -336,7 +364,8 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
             header = f"Experiment: {prompt_key}\nStarted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\nPrompt text:\n{'-'*80}\n{prompt_text}\n{'-'*80}\n\n"
             log_f.write(header)
             log_f.flush()
-            print(header, end='')
+            for header_line in header.splitlines(keepends=True):
+                stream_line(header_line, sys.stdout)
             
             # Start process with PIPE for stdout/stderr
             if sys.platform.startswith('win'):
@@ -443,6 +472,176 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
         
         current_process_ref['process'] = None
 
+# ============================================================================
+# Worker Pool
+# ============================================================================
+
+def resolve_ramic_port(exp_index, worker_id, num_workers, ramic_ports=None, ramic_port_start=None, ramic_port=None):
+    """
+    Determine the RAMIC port for an experiment
+    
+    Args:
+        exp_index: 1-based experiment index in the batch
+        worker_id: 0-based worker index
+        num_workers: Number of workers
+        ramic_ports: Explicit port per worker (--ramic-ports)
+        ramic_port_start: First port (--ramic-port-start); per worker in parallel mode,
+                          per experiment in sequential mode
+        ramic_port: Port shared by all experiments (--ramic-port)
+    
+    Returns:
+        Port number or None (use RB_PORT from environment)
+    """
+    if ramic_ports:
+        return ramic_ports[worker_id]
+    if ramic_port_start is not None:
+        if num_workers > 1:
+            return ramic_port_start + worker_id
+        return ramic_port_start + (exp_index - 1)
+    return ramic_port
+
+
+def load_checkpoint(checkpoint_file):
+    """Load finished experiment results from a checkpoint file, keyed by prompt key"""
+    if not os.path.exists(checkpoint_file):
+        return {}
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {r["prompt_key"]: r for r in data.get("results", [])}
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️  Could not read checkpoint {checkpoint_file}: {e}")
+        return {}
+
+
+def save_checkpoint(checkpoint_file, results_by_key):
+    """Atomically write finished experiment results to the checkpoint file"""
+    os.makedirs(os.path.dirname(checkpoint_file) or ".", exist_ok=True)
+    tmp_file = f"{checkpoint_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({"updated": datetime.now().isoformat(), "results": list(results_by_key.values())},
+                  f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, checkpoint_file)
+
+
+def run_experiments_parallel(experiments, num_workers, log_dir, batch_interrupted, active_processes,
+                             build_job, checkpoint_file=None, checkpoint_results=None,
+                             runner=None):
+    """
+    Run experiments from a shared job queue on a pool of worker threads
+    
+    Each worker runs one main.py subprocess at a time on its own RAMIC port, streams its
+    output with a "[wN] " prefix and appends it to log_dir/worker_N.log. Every finished
+    experiment is written to the checkpoint so an interrupted batch can be resumed.
+    
+    Args:
+        experiments: List of (exp_index, experiment dict) tuples to run
+        num_workers: Number of concurrent workers
+        log_dir: Directory for experiment and worker logs
+        batch_interrupted: Dictionary with 'flag' key; workers stop taking jobs once set
+        active_processes: Dictionary worker_id -> {'process': ...} for the signal handler
+        build_job: Callable (exp_index, exp, worker_id) -> keyword arguments for runner
+        checkpoint_file: Path of the checkpoint JSON (None disables checkpointing)
+        checkpoint_results: Results already in the checkpoint, keyed by prompt key
+        runner: Experiment function (default: run_experiment)
+    
+    Returns:
+        List of result dictionaries in experiment order (only experiments that finished)
+    """
+    runner = runner or run_experiment
+    job_queue = queue.Queue()
+    for job in experiments:
+        job_queue.put(job)
+    
+    output_lock = threading.Lock()
+    results_lock = threading.Lock()
+    finished = {}
+    checkpoint_results = dict(checkpoint_results or {})
+    parallel = num_workers > 1
+    os.makedirs(log_dir, exist_ok=True)
+    
+    def worker(worker_id):
+        process_ref = active_processes.setdefault(worker_id, {'process': None})
+        worker_log = open(os.path.join(log_dir, f"worker_{worker_id}.log"), 'a', encoding='utf-8') if parallel else None
+        try:
+            while not batch_interrupted['flag']:
+                try:
+                    exp_index, exp = job_queue.get_nowait()
+                except queue.Empty:
+                    break
+                job = build_job(exp_index, exp, worker_id)
+                with output_lock:
+                    print(f"\n[{exp_index}/{len(experiments)}] Worker {worker_id} processing: "
+                          f"{exp['prompt_key']} ({exp['pad_layout_name']})"
+                          + (f" on RAMIC port {job['ramic_port']}" if job.get('ramic_port') else ""))
+                try:
+                    result = runner(
+                        log_dir=log_dir,
+                        batch_interrupted_flag=batch_interrupted,
+                        current_process_ref=process_ref,
+                        output_prefix=f"[w{worker_id}] " if parallel else "",
+                        worker_log=worker_log,
+                        output_lock=output_lock,
+                        **job
+                    )
+                except Exception as e:
+                    result = {
+                        "success": False,
+                        "prompt_key": exp["prompt_key"],
+                        "elapsed_time": 0.0,
+                        "log_file": None,
+                        "error": f"Runner error: {e}"
+                    }
+                if batch_interrupted['flag']:
+                    # Killed by the interrupt: leave it out of the checkpoint so --resume reruns it
+                    break
+                result.update({"pad_layout_name": exp["pad_layout_name"], "worker": worker_id,
+                               "ramic_port": job.get("ramic_port")})
+                with results_lock:
+                    finished[exp_index] = result
+                    checkpoint_results[result["prompt_key"]] = result
+                    if checkpoint_file:
+                        save_checkpoint(checkpoint_file, checkpoint_results)
+                if not result["success"]:
+                    with output_lock:
+                        if (result.get("error") or "").startswith("Experiment timed out"):
+                            print(f"\n⚠️  Experiment '{result['prompt_key']}' timed out after 50 minutes, automatically continuing...")
+                        else:
+                            print(f"\n⚠️  Experiment '{result['prompt_key']}' failed: {result.get('error', 'Unknown error')}")
+                            print(f"Automatically continuing to next experiment...")
+        finally:
+            if worker_log:
+                worker_log.close()
+    
+    threads = [threading.Thread(target=worker, args=(w,), daemon=True) for w in range(num_workers)]
+    for t in threads:
+        t.start()
+    # Join with a timeout so the main thread keeps receiving signals
+    for t in threads:
+        while t.is_alive():
+            t.join(timeout=0.5)
+    
+    return [finished[i] for i in sorted(finished)]
+
+
+def write_results_json(results_file, results, experiments, args_dict, total_time, interrupted):
+    """Write the consolidated batch results JSON"""
+    successful = sum(1 for r in results if r["success"])
+    data = {
+        "created": datetime.now().isoformat(),
+        "interrupted": interrupted,
+        "settings": args_dict,
+        "total_experiments": len(experiments),
+        "completed": len(results),
+        "successful": successful,
+        "failed": len(results) - successful,
+        "total_time": total_time,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(results_file) or ".", exist_ok=True)
+    with open(results_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -734,6 +933,29 @@ Examples:
         default=None,
         help="RAMIC bridge port (used for all experiments if --ramic-port-start is not specified)"
     )
+    parser.add_argument(
+        "--ramic-ports",
+        type=int,
+        nargs="+",
+        default=None,
+        help="RAMIC port per worker (e.g. 65432 65433 65434); sets --workers to the number of ports if not given"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of experiments to run concurrently, each worker on its own RAMIC port (default: 1)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip experiments already recorded in the checkpoint of this log directory"
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="With --resume, rerun experiments that failed or timed out"
+    )
     parser.add_argument(
         "--list-layouts",
         action="store_true",
@@ -747,6 +969,17 @@ Examples:
     
     args = parser.parse_args()
     
+    # Determine worker count
+    num_workers = args.workers or (len(args.ramic_ports) if args.ramic_ports else 1)
+    if num_workers < 1:
+        print("Error: --workers must be >= 1")
+        return
+    if args.ramic_ports and len(args.ramic_ports) < num_workers:
+        print(f"Error: --ramic-ports lists {len(args.ramic_ports)} ports for {num_workers} workers")
+        return
+    if num_workers > 1 and args.ramic_ports is None and args.ramic_port_start is None:
+        print("⚠️  Parallel workers without --ramic-ports/--ramic-port-start share one RAMIC port (and Virtuoso session)")
+    
     # Generate YAML file if requested
     if args.generate_yaml:
         output_file = Path("user_prompt/IO_RING.yaml")
@@ -892,9 +1125,26 @@ Examples:
         if not args.list_layouts:
             return
     
+    # Number experiments before filtering by checkpoint so ports and summaries stay stable
+    indexed_experiments = list(enumerate(experiments, 1))
+    checkpoint_file = os.path.join(log_dir, "checkpoint.json")
+    checkpoint_results = load_checkpoint(checkpoint_file) if args.resume else {}
+    resumed_results = []
+    if args.resume:
+        remaining = []
+        for exp_index, exp in indexed_experiments:
+            previous = checkpoint_results.get(exp["prompt_key"])
+            if previous and (previous["success"] or not args.retry_failed):
+                resumed_results.append(previous)
+            else:
+                remaining.append((exp_index, exp))
+        print(f"\nResuming from checkpoint {checkpoint_file}: "
+              f"{len(resumed_results)} finished, {len(remaining)} remaining")
+        indexed_experiments = remaining
+    
     # Show summary before running
     print(f"\n{'='*80}")
-    print(f"About to run {len(experiments)} experiments")
+    print(f"About to run {len(indexed_experiments)} experiments with {num_workers} worker(s)")
     if args.model_name:
         print(f"Model: {args.model_name}")
     print(f"Each experiment will timeout after 50 minutes if not completed")
@@ -905,7 +1155,7 @@ Examples:
     
     # Global flag for batch interruption
     batch_interrupted = {'flag': False}
-    current_process = {'process': None}
+    active_processes = {}  # worker_id -> {'process': ...}
     
     # Global signal handler for batch interruption
     def batch_signal_handler(signum, frame):
@@ -913,83 +1163,61 @@ Examples:
             batch_interrupted['flag'] = True
             print(f"\n\n{'='*80}")
             print(f"[BATCH INTERRUPTED] Received signal {signum}")
-            print(f"Terminating current experiment and stopping batch...")
+            print(f"Terminating running experiments and stopping batch...")
             print(f"{'='*80}\n")
-            if current_process['process'] is not None:
-                try:
-                    if sys.platform.startswith('win'):
-                        current_process['process'].kill()
-                    else:
-                        os.killpg(os.getpgid(current_process['process'].pid), signal.SIGKILL)
-                except Exception:
-                    pass
+            for process_ref in list(active_processes.values()):
+                if process_ref['process'] is not None:
+                    try:
+                        if sys.platform.startswith('win'):
+                            process_ref['process'].kill()
+                        else:
+                            os.killpg(os.getpgid(process_ref['process'].pid), signal.SIGKILL)
+                    except Exception:
+                        pass
     
     # Register global signal handlers
     original_sigint = signal.signal(signal.SIGINT, batch_signal_handler)
     original_sigterm = signal.signal(signal.SIGTERM, batch_signal_handler)
     
+    def build_job(exp_index, exp, worker_id):
+        """Keyword arguments of run_experiment for one experiment"""
+        return dict(
+            excel_file=None,  # Not used for IO ring
+            sheet_name=exp["pad_layout_name"],  # Use pad_layout_name for experiment info
+            prefix=args.prefix,
+            template_type="io_ring",  # Custom type
+            model_name=args.model_name,
+            ramic_port=resolve_ramic_port(exp_index, worker_id, num_workers, args.ramic_ports,
+                                          args.ramic_port_start, args.ramic_port),
+            ramic_host=args.ramic_host,
+            prompt_text=generate_prompt_text(exp["pad_layout_name"], args.prefix),  # Pass prompt text directly
+            prompt_key=exp["prompt_key"]  # Pass prompt key for logging
+        )
+    
     # Run experiments
-    results = []
     total_start_time = time.time()
     
     print(f"Press Ctrl+C once to stop the entire batch immediately")
     
     try:
-        for i, exp in enumerate(experiments, 1):
-            if batch_interrupted['flag']:
-                print(f"\n[BATCH STOPPED] Stopping batch execution after {len(results)} experiments")
-                break
-            
-            prompt_key = exp["prompt_key"]
-            pad_layout_name = exp["pad_layout_name"]
-            
-            # Generate prompt text
-            prompt_text = generate_prompt_text(pad_layout_name, args.prefix)
-            
-            # Determine RAMIC port
-            ramic_port = None
-            if args.ramic_port_start is not None:
-                ramic_port = args.ramic_port_start + (i - 1)
-            elif args.ramic_port is not None:
-                ramic_port = args.ramic_port
-            
-            print(f"\n[{i}/{len(experiments)}] Processing: {prompt_key} ({pad_layout_name})")
-            
-            # Use run_experiment with prompt_text directly
-            result = run_experiment(
-                excel_file=None,  # Not used for IO ring
-                sheet_name=pad_layout_name,  # Use pad_layout_name for experiment info
-                prefix=args.prefix,
-                template_type="io_ring",  # Custom type
-                model_name=args.model_name,
-                ramic_port=ramic_port,
-                ramic_host=args.ramic_host,
-                log_dir=log_dir,
-                batch_interrupted_flag=batch_interrupted,
-                current_process_ref=current_process,
-                prompt_text=prompt_text,  # Pass prompt text directly
-                prompt_key=prompt_key  # Pass prompt key for logging
-            )
-            results.append(result)
-            
-            if batch_interrupted['flag']:
-                print(f"\n[BATCH STOPPED] Stopping batch execution after {len(results)} experiments")
-                break
-            
-            if not result["success"]:
-                is_timeout = result.get("error", "").startswith("Experiment timed out")
-                if is_timeout:
-                    print(f"\n⚠️  Experiment '{prompt_key}' timed out after 50 minutes, automatically continuing...")
-                else:
-                    print(f"\n⚠️  Experiment '{prompt_key}' failed: {result.get('error', 'Unknown error')}")
-                    print(f"Automatically continuing to next experiment...")
+        new_results = run_experiments_parallel(
+            indexed_experiments, num_workers, log_dir, batch_interrupted, active_processes,
+            build_job, checkpoint_file=checkpoint_file, checkpoint_results=checkpoint_results
+        )
     except KeyboardInterrupt:
         batch_interrupted['flag'] = True
+        new_results = []
         print(f"\n[BATCH INTERRUPTED] Stopping batch execution...")
     finally:
         signal.signal(signal.SIGINT, original_sigint)
         signal.signal(signal.SIGTERM, original_sigterm)
     
+    if batch_interrupted['flag']:
+        print(f"\n[BATCH STOPPED] Stopping batch execution after {len(new_results)} experiments")
+    
+    # Consolidated results: experiments finished in earlier runs followed by this run
+    results = resumed_results + new_results
+    
     # Print summary
     total_time = time.time() - total_start_time
     successful = sum(1 for r in results if r["success"])
@@ -1015,9 +1243,11 @@ Examples:
             print(f"      Error: {result['error']}")
     
     if batch_interrupted['flag'] and len(results) < len(experiments):
-        print(f"\nInterrupted experiments (not run):")
-        for exp in experiments[len(results):]:
-            print(f"  - {exp['prompt_key']}")
+        print(f"\nInterrupted experiments (not run, use --resume to continue):")
+        finished_keys = {r['prompt_key'] for r in results}
+        for exp in experiments:
+            if exp['prompt_key'] not in finished_keys:
+                print(f"  - {exp['prompt_key']}")
     
     print(f"{'='*80}\n")
     
@@ -1041,6 +1271,11 @@ Examples:
             f.write(f"      Log: {result['log_file']}\n")
     
     print(f"Summary saved to: {summary_file}")
+    
+    # Save consolidated results JSON
+    results_file = os.path.join(log_dir, f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    write_results_json(results_file, results, experiments, vars(args), total_time, batch_interrupted['flag'])
+    print(f"Results saved to: {results_file}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Content-Addressed Artifact Cache (artifact_cache.py)
+"""
+
+import io
+import os
+import sys
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.tools import io_ring_generator_tool
+from src.app.utils import artifact_cache
+from src.app.utils.artifact_cache import ArtifactCache, compute_artifact_key
+from src.app.layout.process_node_config import get_process_node_config
+
+GOLDEN_DIR = project_root / "AMS-IO-Bench" / "28nm_wirebonding" / "golden_output"
+DOUBLE_RING_GRAPH = GOLDEN_DIR / "IO_28nm_8x8_double_ring_mixed" / "io_ring_intent_graph.json"
+
+
+def test_key_is_canonical():
+    """Test that the key ignores JSON key order but changes with the intent graph, node and kind"""
+    config = get_process_node_config("T28")
+    graph = {"ring_config": {"width": 3, "height": 3}, "instances": [{"name": "A", "device": "PDB3AC_V_G"}]}
+    reordered = {"instances": [{"device": "PDB3AC_V_G", "name": "A"}], "ring_config": {"height": 3, "width": 3}}
+    changed = {"ring_config": {"width": 3, "height": 4}, "instances": graph["instances"]}
+
+    key = compute_artifact_key("layout", graph, "T28", config)
+    assert compute_artifact_key("layout", reordered, "T28", config) == key
+    assert compute_artifact_key("layout", changed, "T28", config) != key
+    assert compute_artifact_key("schematic", graph, "T28", config) != key
+    assert compute_artifact_key("layout", graph, "T180", get_process_node_config("T180")) != key
+
+
+def test_lru_eviction_and_stats():
+    """Test restore on hit, least-recently-used eviction by size and the session counters"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ArtifactCache(os.path.join(tmp, "cache"), max_bytes=2500)
+        for name in ("a", "b", "c"):
+            source = Path(tmp) / f"{name}.il"
+            source.write_text(name * 1000, encoding="utf-8")
+            cache.put("layout", name, {"il": str(source), "visualization": None})
+            if name == "b":
+                # Touch "a" so that "b" becomes the least recently used entry
+                assert cache.get("layout", "a", {"il": os.path.join(tmp, "restored_a.il")})
+
+        assert cache.get("layout", "b", {"il": os.path.join(tmp, "restored_b.il")}) is None
+        # A role the entry does not have removes the stale file left at its destination
+        stale = Path(tmp) / "out" / "stale.png"
+        stale.parent.mkdir()
+        stale.write_bytes(b"old")
+        restored = cache.get("layout", "c", {"il": os.path.join(tmp, "out", "restored_c.il"), "visualization": str(stale)})
+        assert restored == {"il": os.path.join(tmp, "out", "restored_c.il")}
+        assert not stale.exists()
+        assert Path(restored["il"]).read_text(encoding="utf-8") == "c" * 1000
+
+        stats = cache.get_stats()
+        assert stats["kinds"]["layout"] == {"hits": 2, "misses": 1, "stores": 3, "evictions": 1, "hit_rate": 2 / 3}
+        assert stats["entries"] == 2 and stats["total_bytes"] == 2000
+
+        # A new session sees the same entries, in the same LRU order
+        reopened = ArtifactCache(os.path.join(tmp, "cache"), max_bytes=2500)
+        assert list(reopened._index) == ["a", "c"]
+        assert reopened.get_stats()["hits"] == 0
+
+
+def test_tools_reuse_cached_artifacts():
+    """Test that a repeated tool call restores the cached files without running the generator"""
+    original_cache = artifact_cache._cache_instance
+    original_generate = io_ring_generator_tool.generate_layout_from_json
+    calls = []
+
+    def counting_generate(*args, **kwargs):
+        calls.append(args)
+        return original_generate(*args, **kwargs)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            artifact_cache._cache_instance = ArtifactCache(os.path.join(tmp, "cache"))
+            io_ring_generator_tool.generate_layout_from_json = counting_generate
+            with contextlib.redirect_stdout(io.StringIO()):
+                first = io_ring_generator_tool.generate_io_ring_layout(str(DOUBLE_RING_GRAPH), os.path.join(tmp, "a", "layout.il"), "T28")
+                second = io_ring_generator_tool.generate_io_ring_layout(str(DOUBLE_RING_GRAPH), os.path.join(tmp, "b", "layout.il"), "T28")
+                schematics = [io_ring_generator_tool.generate_io_ring_schematic(str(DOUBLE_RING_GRAPH), os.path.join(tmp, run, "schematic.il"), "T28")
+                              for run in ("a", "b")]
+
+            assert len(calls) == 1
+            assert first.startswith("✅") and "Reused" not in first
+            assert "♻️  Reused cached layout" in second and "layout_visualization.png" in second
+            assert "♻️  Reused cached schematic" in schematics[1]
+            for name in ("layout.il", "layout_visualization.png", "schematic.il"):
+                assert (Path(tmp) / "a" / name).read_bytes() == (Path(tmp) / "b" / name).read_bytes()
+
+            stats = io_ring_generator_tool.get_artifact_cache_stats()
+            assert "layout: 1 hits, 1 misses" in stats and "schematic: 1 hits, 1 misses" in stats
+    finally:
+        artifact_cache._cache_instance = original_cache
+        io_ring_generator_tool.generate_layout_from_json = original_generate
+
+
+def main():
+    """Main function"""
+    print("🧪 Artifact Cache Test")
+    print("=" * 50)
+    test_key_is_canonical()
+    test_lru_eviction_and_stats()
+    test_tools_reuse_cached_artifacts()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Auto Filler Generation (T28 / T180)
+"""
+
+import sys
+import io
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.benchmarks.bench_auto_filler import prepare_ring
+
+
+def _run_auto_filler(process_node, pad_count, placement_order="counterclockwise"):
+    generator, outer, inner = prepare_ring(process_node, pad_count, placement_order)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(outer, inner)
+    return generator, outer, inner, result[len(outer):]
+
+
+def test_gap_set_matches_gap_indices():
+    """Test that the precomputed gap set contains every gap pair in both directions"""
+    for placement_order in ("clockwise", "counterclockwise"):
+        generator, outer, inner = prepare_ring("T28", 40, placement_order)
+        handler = generator.inner_pad_handler
+        sorted_components = generator.position_calculator.sort_components_by_position(outer, placement_order)
+        gap_pairs = handler.get_inner_pad_gap_indices(inner, sorted_components)
+        gap_set = handler.get_inner_pad_gap_set(inner, sorted_components)
+        assert gap_pairs, "Synthetic ring should contain inner pad gaps"
+        assert len(gap_set) == 2 * len(set(gap_pairs))
+        for index1, index2 in gap_pairs:
+            assert handler.is_inner_pad_gap_by_index(index2, index1, inner, sorted_components, gap_set)
+            assert handler.is_inner_pad_gap_by_index(index1, index2, inner, sorted_components)
+
+
+def test_side_start_indices():
+    """Test side start indices for both placement orders"""
+    generator, outer, _ = prepare_ring("T28", 40)
+    counts = generator.inner_pad_handler.count_pads_per_side(outer)
+    assert counts == {"R0": 11, "R90": 11, "R180": 11, "R270": 11}
+    ccw = generator.inner_pad_handler.get_side_start_indices(outer, "counterclockwise")
+    assert ccw == {"left": 0, "bottom": 11, "right": 22, "top": 33}
+    cw = generator.inner_pad_handler.get_side_start_indices(outer, "clockwise")
+    assert cw == {"top": 0, "right": 11, "bottom": 22, "left": 33}
+
+
+def test_t28_filler_count():
+    """Test that T28 inserts two fillers per adjacent pad pair plus two per side at the corners"""
+    _, _, _, fillers = _run_auto_filler("T28", 200)
+    pads_per_side = 50
+    assert len(fillers) == 4 * (2 + 2 * (pads_per_side - 1))
+    names = {f["name"] for f in fillers}
+    assert len(names) == len(fillers), "Filler names should be unique"
+
+
+def test_t180_filler_count():
+    """Test that T180 inserts one filler or blank per adjacent pad pair plus two per side at the corners"""
+    _, _, _, fillers = _run_auto_filler("T180", 200)
+    pads_per_side = 50
+    assert len(fillers) == 4 * (2 + (pads_per_side - 1))
+
+
+def main():
+    """Main function"""
+    print("🧪 Auto Filler Test")
+    print("=" * 50)
+    test_gap_set_matches_gap_indices()
+    test_side_start_indices()
+    test_t28_filler_count()
+    test_t180_filler_count()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Multi-core Batch Generation (batch_generator.py)
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.benchmarks.synthetic_ring import build_intent_graph
+from src.app.utils.batch_generator import MANIFEST_FILE, discover_intent_graphs, run_batch
+
+
+def _write_graph(path: Path, graph: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(graph), encoding="utf-8")
+
+
+def test_batch_generates_all_files_with_error_isolation():
+    """Test process node inference, mirrored outputs, a failing file and the manifest"""
+    # Schematic generators look up device templates relative to the project root
+    os.chdir(project_root)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "graphs"
+        _write_graph(source / "28nm_project" / "ring_a.json", build_intent_graph("T28", 4, 4))
+        _write_graph(source / "180nm_project" / "ring_b.json", build_intent_graph("T180", 4, 4))
+        broken = build_intent_graph("T28", 4, 4)
+        broken["ring_config"]["process_node"] = "T40"
+        _write_graph(source / "broken.json", broken)
+        _write_graph(source / "notes.json", {"comment": "not an intent graph"})
+        assert len(discover_intent_graphs(str(source))) == 3
+
+        progress = []
+        manifest = run_batch(str(source), str(Path(tmp) / "out"), max_workers=2,
+                             progress=lambda done, total, entry: progress.append((done, total)))
+
+        assert (manifest["total"], manifest["succeeded"], manifest["failed"]) == (3, 2, 1)
+        assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+        entries = {Path(entry["intent_graph"]).stem: entry for entry in manifest["files"]}
+        assert entries["broken"]["status"] == "failed" and "intent_graph" in entries["broken"]["errors"]
+        assert entries["ring_a"]["process_node"] == "T28" and entries["ring_b"]["process_node"] == "T180"
+        for name in ("ring_a", "ring_b"):
+            assert set(entries[name]["outputs"]) >= {"layout", "schematic"}
+            assert all(Path(output).exists() for output in entries[name]["outputs"].values())
+        assert Path(entries["ring_b"]["outputs"]["layout"]).parent == Path(tmp) / "out" / "180nm_project"
+        assert json.loads((Path(tmp) / "out" / MANIFEST_FILE).read_text(encoding="utf-8"))["total"] == 3
+
+
+def test_single_view_in_process():
+    """Test a layout-only batch over a glob pattern without worker processes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _write_graph(Path(tmp) / "a_intent_graph.json", build_intent_graph("T28", 3, 3))
+        manifest = run_batch(str(Path(tmp) / "*_intent_graph.json"), str(Path(tmp) / "out"), process_node="T28",
+                             views=["layout"], max_workers=1, progress=None)
+        assert manifest["workers"] == 1 and manifest["succeeded"] == 1
+        assert "schematic" not in manifest["files"][0]["outputs"]
+
+
+def main():
+    """Main function"""
+    print("🧪 Batch Generator Test")
+    print("=" * 50)
+    test_batch_generates_all_files_with_error_isolation()
+    test_single_view_in_process()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
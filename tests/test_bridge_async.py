@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test asyncio Bridge Client (ramic_bridge_async.py and the bridge_utils async helpers)
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "scripts" / "ramic_bridge"))
+
+from src.scripts.ramic_bridge.ramic_bridge import FRAME_HEADER, FRAME_MAGIC
+from src.scripts.ramic_bridge.ramic_bridge_async import AsyncRBClient, RBExcAsync, close_async_client
+from src.tools import bridge_utils
+from src.tools.bridge_utils import rb_exec, rb_exec_async, bridge_endpoint, run_bridge_coroutines
+from src.tools.session_runner_tool import run_on_sessions
+from ramic_bridge_echo_daemon import EchoDaemon
+
+LATENCY = 0.3
+
+
+def _with_ramic_bridge(function):
+    """Run function with USE_RAMIC_BRIDGE=1 and persistent connections, restoring the environment"""
+    original = {name: os.environ.get(name) for name in ("USE_RAMIC_BRIDGE", "RB_PERSISTENT")}
+    os.environ["USE_RAMIC_BRIDGE"] = "1"
+    os.environ["RB_PERSISTENT"] = "1"
+    try:
+        return function()
+    finally:
+        for name, value in original.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def test_sessions_run_in_parallel():
+    """Test that calls to two daemons overlap while calls to one daemon are pipelined on one connection"""
+    async def run(first, second):
+        client = AsyncRBClient()
+        try:
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                client.execute("layout", host=first.host, port=first.port, timeout=5),
+                client.execute("schematic", host=second.host, port=second.port, timeout=5),
+                client.execute("screenshot", host=first.host, port=first.port, timeout=5),
+            )
+            elapsed = time.perf_counter() - start
+            return results, elapsed, len(client._connections)
+        finally:
+            await client.close()
+
+    with EchoDaemon(latency=LATENCY) as first, EchoDaemon(latency=LATENCY) as second:
+        results, elapsed, connections = asyncio.run(run(first, second))
+    assert results == ["\x02layout", "\x02schematic", "\x02screenshot"]
+    # Two calls on the first session, the second session in parallel: ~2x latency, serial would be 3x
+    assert elapsed < 2.8 * LATENCY, f"calls were serialized ({elapsed:.2f}s)"
+    assert connections == 2
+
+
+def test_timeout_and_cancellation_keep_connection_usable():
+    """Test per-request timeouts and cancellation, and that late replies are discarded"""
+    async def run(echo):
+        client = AsyncRBClient(timeout_grace=0.05)
+        try:
+            try:
+                await client.execute("slow", host=echo.host, port=echo.port, timeout=0)
+                assert False, "A reply slower than the timeout should raise TimeoutError"
+            except TimeoutError:
+                pass
+            task = asyncio.ensure_future(client.execute("cancelled", host=echo.host, port=echo.port, timeout=5))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            try:
+                await task
+                assert False, "The cancelled request should raise CancelledError"
+            except asyncio.CancelledError:
+                pass
+            # The late replies of both requests arrive first and must not be handed to this call
+            result = await client.execute("next", host=echo.host, port=echo.port, timeout=5)
+            return result, len(client._connections), client._connections[(echo.host, echo.port)]._pending
+        finally:
+            await client.close()
+
+    with EchoDaemon(latency=0.2) as echo:
+        result, connections, pending = asyncio.run(run(echo))
+    assert result == "\x02next"
+    assert connections == 1 and not pending
+
+
+def test_pipelined_requests_budget_queued_work():
+    """Test that a pipelined request's deadline covers the requests Virtuoso evaluates before it"""
+    async def run(echo):
+        client = AsyncRBClient(timeout_grace=0.05)
+        try:
+            # Each call fits its own timeout, but the third reply comes after ~3x latency
+            return await asyncio.gather(*(client.execute(f"{i}+1", host=echo.host, port=echo.port, timeout=0.25)
+                                          for i in range(3)))
+        finally:
+            await client.close()
+
+    with EchoDaemon(latency=0.2) as echo:
+        assert asyncio.run(run(echo)) == ["\x020+1", "\x021+1", "\x022+1"]
+
+
+def test_sent_request_is_not_retried():
+    """Test that a request lost after it was sent is not executed again on a new connection"""
+    received = []
+
+    async def handle(reader, writer):
+        # Answers the first request; the daemon dies while evaluating the second, later connections work
+        writer.write(await reader.readexactly(len(FRAME_MAGIC)))
+        while True:
+            try:
+                request_id, length = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+            except asyncio.IncompleteReadError:
+                break
+            received.append(await reader.readexactly(length))
+            if len(received) == 2:
+                break
+            writer.write(FRAME_HEADER.pack(request_id, 2) + b"\x02t")
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = AsyncRBClient()
+        try:
+            first = await client.execute("1", host="127.0.0.1", port=port, timeout=5)
+            try:
+                await client.execute('load("a.il")', host="127.0.0.1", port=port, timeout=5)
+                assert False, "A request lost after it was sent should raise ConnectionError"
+            except ConnectionError:
+                pass
+            # The closed connection is replaced before the next request goes out
+            third = await client.execute("3", host="127.0.0.1", port=port, timeout=5)
+            return first, third
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+    assert asyncio.run(run()) == ("\x02t", "\x02t")
+    assert len(received) == 3
+
+
+def test_fallback_to_oneshot_daemon():
+    """Test that daemons without framed protocol support are served one connection per request"""
+    async def run(echo):
+        results = await asyncio.gather(*(RBExcAsync(f"{i}+1", host=echo.host, port=echo.port, timeout=5)
+                                         for i in range(3)))
+        await close_async_client()
+        return results
+
+    with EchoDaemon(oneshot_only=True) as echo:
+        assert asyncio.run(run(echo)) == ["\x020+1", "\x021+1", "\x022+1"]
+        # Unreachable daemons are reported like RBExcPersistent does
+        assert asyncio.run(RBExcAsync("1+2", host=echo.host, port=1, timeout=1)) == ""
+
+
+def test_bridge_utils_helpers():
+    """Test rb_exec_async cleaning, batch helpers and bridge_endpoint routing of blocking calls"""
+    def run(first, second):
+        async def batch():
+            steps = [bridge_utils.skill_step("load", 'load("a.il")')]
+            return await bridge_utils.rb_exec_batch_async(steps, host=first.host, port=first.port)
+
+        cleaned, raw_batch = run_bridge_coroutines([rb_exec_async("1+2", host=first.host, port=first.port), batch()])
+        with bridge_endpoint(second.host, second.port):
+            routed = rb_exec("3+4")
+        return cleaned, raw_batch, routed
+
+    with EchoDaemon() as first, EchoDaemon() as second:
+        cleaned, batch, routed = _with_ramic_bridge(lambda: run(first, second))
+    assert cleaned == "1+2"
+    # The echo daemon returns the composed batch instead of step records
+    assert batch["raw"].startswith("let(") and batch["steps"][0]["status"] == "error"
+    assert routed == "3+4"
+
+
+def test_run_on_sessions():
+    """Test that il jobs on two sessions run in parallel and report per-job results"""
+    with tempfile.TemporaryDirectory() as tmp:
+        il_file = Path(tmp) / "io_ring.il"
+        il_file.write_text("t\n", encoding="utf-8")
+        with EchoDaemon(latency=LATENCY) as first, EchoDaemon(latency=LATENCY) as second:
+            jobs = [
+                {"il_file_path": str(il_file), "lib": "LIB", "cell": "IO_RING", "port": first.port},
+                {"tool": "run_il_file_with_save", "il_file_path": str(il_file), "lib": "LIB", "cell": "IO_RING",
+                 "view": "schematic", "port": second.port},
+                {"tool": "run_pex", "port": first.port},
+            ]
+            start = time.perf_counter()
+            result = _with_ramic_bridge(lambda: run_on_sessions(jobs))
+            elapsed = time.perf_counter() - start
+    assert result.startswith("❌ 0/3 session jobs succeeded")
+    assert "[1] run_il_file @ RB_HOST:" in result and "[2] run_il_file_with_save @ RB_HOST:" in result
+    assert "Unknown job tool 'run_pex'" in result
+    # Echo replies are not batch records, so the open step fails on both sessions
+    assert result.count("Failed to open cellView LIB/IO_RING") == 2
+    assert elapsed < 1.8 * LATENCY, f"sessions were serialized ({elapsed:.2f}s)"
+    assert run_on_sessions([]).startswith("❌ Error")
+
+
+def test_run_bridge_coroutines_inside_event_loop():
+    """Test that the synchronous entry point also works when called from a running loop"""
+    async def caller():
+        async def value():
+            return threading.get_ident()
+        return run_bridge_coroutines([value()])[0], threading.get_ident()
+
+    worker, loop_thread = asyncio.run(caller())
+    assert worker != loop_thread
+
+
+def main():
+    """Main function"""
+    print("🧪 Async Bridge Client Test")
+    print("=" * 50)
+    test_sessions_run_in_parallel()
+    test_timeout_and_cancellation_keep_connection_usable()
+    test_pipelined_requests_budget_queued_work()
+    test_sent_request_is_not_retried()
+    test_fallback_to_oneshot_daemon()
+    test_bridge_utils_helpers()
+    test_run_on_sessions()
+    test_run_bridge_coroutines_inside_event_loop()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Batched SKILL Execution (bridge_utils.rb_exec_batch)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.tools import bridge_utils
+from src.tools.bridge_utils import (
+    skill_step, open_cell_view_steps, compose_skill_batch, parse_skill_batch_output,
+    rb_exec_batch, get_batch_step, format_batch_timing,
+)
+
+# Bridge output of a batch whose load step failed, as printed by Virtuoso (%L of the result string)
+LOAD_FAILED_OUTPUT = (
+    '"0|ok|0.01|db:0x3a1b2c1a@@RBSTEP@@1|ok|0.25|window:4@@RBSTEP@@2|ok|0.0|t'
+    '@@RBSTEP@@3|ok|0.0|db:0x3a1b2c1a@@RBSTEP@@4|error|0.5|'
+    '(\\"load\\" 0 t nil (\\"*Error* load: can not access file\\" \\"/tmp/a|b.il\\"))"'
+)
+
+
+def _il_steps():
+    return open_cell_view_steps("LIB", "CELL") + [
+        skill_step("load", 'load("/tmp/a|b.il")', require_non_nil=True),
+        skill_step("save", "dbSave(cv)", require_non_nil=True, stop_on_failure=False),
+    ]
+
+
+def test_compose_skill_batch():
+    """Test that every step is wrapped in errset/measureTime inside one let expression"""
+    steps = _il_steps()
+    skill = compose_skill_batch(steps)
+    assert skill.startswith("let(") and skill.endswith(")")
+    assert skill.count("errset(progn(") == len(steps)
+    assert skill.count("measureTime(") == len(steps)
+    assert 'cv = dbOpenCellViewByType("LIB" "CELL" "layout" "maskLayout" "w")' in skill
+    assert 'geOpen(?lib "LIB" ?cell "CELL" ?view "layout" ?viewType "maskLayout" ?mode "a")' in skill
+    assert skill.count("(") == skill.count(")")
+
+
+def test_parse_skill_batch_output():
+    """Test that step status, values, timing and skipped steps are parsed"""
+    results = parse_skill_batch_output(LOAD_FAILED_OUTPUT, _il_steps())
+    assert [r["name"] for r in results] == ["open_cell_view", "open_window", "redraw", "edit_cell_view", "load", "save"]
+    assert [r["status"] for r in results] == ["ok", "ok", "ok", "ok", "error", "skipped"]
+    assert results[0]["result"] == "db:0x3a1b2c1a"
+    assert results[1]["elapsed_ms"] == 250.0
+    assert results[4]["result"] == '("load" 0 t nil ("*Error* load: can not access file" "/tmp/a|b.il"))'
+    assert not results[5]["ok"] and results[5]["elapsed_ms"] is None
+
+
+def test_rb_exec_batch_single_round_trip():
+    """Test that a batch makes exactly one bridge call and reports timing"""
+    calls = []
+    original_rb_exec = bridge_utils.rb_exec
+    original_env = os.environ.get("USE_RAMIC_BRIDGE")
+    bridge_utils.rb_exec = lambda skill, timeout=30: calls.append(skill) or LOAD_FAILED_OUTPUT
+    os.environ["USE_RAMIC_BRIDGE"] = "1"
+    try:
+        batch = rb_exec_batch(_il_steps(), timeout=60)
+    finally:
+        bridge_utils.rb_exec = original_rb_exec
+        if original_env is None:
+            os.environ.pop("USE_RAMIC_BRIDGE", None)
+        else:
+            os.environ["USE_RAMIC_BRIDGE"] = original_env
+    assert len(calls) == 1
+    assert not batch["ok"]
+    assert get_batch_step(batch, "edit_cell_view")["ok"]
+    timing = format_batch_timing(batch)
+    assert "open_window 250.0ms" in timing and "save skipped" in timing and "round trip" in timing
+
+
+def test_rb_exec_batch_without_output():
+    """Test that an empty bridge reply marks the first step as failed"""
+    original_rb_exec = bridge_utils.rb_exec
+    original_env = os.environ.get("USE_RAMIC_BRIDGE")
+    bridge_utils.rb_exec = lambda skill, timeout=30: ""
+    os.environ["USE_RAMIC_BRIDGE"] = "1"
+    try:
+        batch = rb_exec_batch(_il_steps())
+    finally:
+        bridge_utils.rb_exec = original_rb_exec
+        if original_env is None:
+            os.environ.pop("USE_RAMIC_BRIDGE", None)
+        else:
+            os.environ["USE_RAMIC_BRIDGE"] = original_env
+    assert get_batch_step(batch, "open_cell_view")["status"] == "error"
+    assert not batch["ok"]
+
+
+def main():
+    """Main function"""
+    print("🧪 Bridge Batch Test")
+    print("=" * 50)
+    test_compose_skill_batch()
+    test_parse_skill_batch_output()
+    test_rb_exec_batch_single_round_trip()
+    test_rb_exec_batch_without_output()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
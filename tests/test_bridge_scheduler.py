@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Bridge Pool Scheduling (bridge_scheduler.py) against a local echo daemon fleet
+"""
+
+import io
+import os
+import sys
+import time
+import contextlib
+import contextvars
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "scripts" / "ramic_bridge"))
+
+from src.scripts.ramic_bridge.ramic_bridge import close_all_pools
+from src.tools import bridge_utils
+from src.tools.bridge_utils import (
+    configure_bridge_pool, get_bridge_scheduler, get_bridge_pool_status, rb_exec, rb_exec_async,
+    run_bridge_coroutines, bridge_session,
+)
+from src.tools.bridge_scheduler import cellview_session_key, parse_pool_entry
+from ramic_bridge_echo_daemon import EchoDaemonFleet
+
+LATENCY = 0.2
+
+
+def _open(cell: str) -> str:
+    return f'cv = dbOpenCellViewByType("LIB" "{cell}" "layout" "maskLayout" "w")'
+
+
+def _in_pool(function, pool, **kwargs):
+    """Run function in a fresh context with USE_RAMIC_BRIDGE=1 and calls scheduled over pool"""
+    original = os.environ.get("USE_RAMIC_BRIDGE")
+    os.environ["USE_RAMIC_BRIDGE"] = "1"
+    configure_bridge_pool(pool, **kwargs)
+    try:
+        return contextvars.copy_context().run(function)
+    finally:
+        configure_bridge_pool(None)
+        close_all_pools()
+        if original is None:
+            os.environ.pop("USE_RAMIC_BRIDGE", None)
+        else:
+            os.environ["USE_RAMIC_BRIDGE"] = original
+
+
+def test_session_keys_and_pool_entries():
+    """Test cellview detection in SKILL snippets and the accepted pool entry formats"""
+    assert cellview_session_key(_open("IO_RING")) == "LIB/IO_RING/layout"
+    assert cellview_session_key('window = geOpen(?lib "LIB" ?cell "TOP" ?view "schematic" ?viewType "schematic" ?mode "a")') == "LIB/TOP/schematic"
+    assert cellview_session_key("cv = geGetEditCellView()") is None
+    assert parse_pool_entry({"host": "10.0.0.2", "port": "65433"}) == ("10.0.0.2", 65433)
+    assert parse_pool_entry("10.0.0.3:65434") == ("10.0.0.3", 65434)
+    assert parse_pool_entry(65435) == ("127.0.0.1", 65435)
+    # The shipped config.yaml has an empty pool: calls stay on RB_HOST/RB_PORT
+    bridge_utils._scheduler_loaded = False
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert get_bridge_scheduler() is None
+    assert get_bridge_pool_status() == []
+
+
+def test_sessions_are_sticky_and_spread():
+    """Test that each cellview session stays on one daemon and concurrent sessions use different daemons"""
+    def run():
+        scheduler = get_bridge_scheduler()
+        assert rb_exec(_open("A")) == _open("A")
+        # Calls without a cellview follow the last cellview opened in this context
+        assert rb_exec("cv = geGetEditCellView()") == "cv = geGetEditCellView()"
+        with bridge_session("LIB/A/layout"):
+            rb_exec("dbSave(cv)")
+        start = time.perf_counter()
+        run_bridge_coroutines([rb_exec_async(_open("B")), rb_exec_async(_open("C"))])
+        elapsed = time.perf_counter() - start
+        # Pinned calls bypass the scheduler
+        first_host, first_port = fleet.endpoints[0]
+        rb_exec("1+2", host=first_host, port=first_port)
+        sessions = {cell: scheduler.session_endpoint(f"LIB/{cell}/layout") for cell in "ABC"}
+        return sessions, elapsed, scheduler.status()
+
+    with EchoDaemonFleet(3, latency=LATENCY) as fleet:
+        sessions, elapsed, status = _in_pool(run, fleet.pool, probe_interval=60)
+    assert set(sessions.values()) == set(fleet.endpoints)
+    assert elapsed < 1.8 * LATENCY, f"sessions were serialized ({elapsed:.2f}s)"
+    calls = {entry["endpoint"]: entry["calls"] for entry in status}
+    assert calls[f"{sessions['A'][0]}:{sessions['A'][1]}"] == 3
+    assert sum(calls.values()) == 5
+    assert all(entry["healthy"] and entry["sessions"] == 1 and entry["in_flight"] == 0 for entry in status)
+
+
+def test_failover_to_healthy_daemon():
+    """Test that a failed call is not re-run, the next call of its session moves, and an empty pool is reported"""
+    def run():
+        scheduler = get_bridge_scheduler()
+        rb_exec(_open("A"))
+        before = scheduler.session_endpoint("LIB/A/layout")
+        fleet.stop(fleet.endpoints.index(before))
+        with contextlib.redirect_stdout(io.StringIO()):
+            failed = rb_exec("dbSave(cv)")
+            down = {entry["endpoint"]: entry for entry in scheduler.status()}[f"{before[0]}:{before[1]}"]
+            moved = rb_exec("dbSave(cv)")
+        after = scheduler.session_endpoint("LIB/A/layout")
+        fleet.stop()
+        scheduler.probe_stale(force=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            unavailable = rb_exec("1+1")
+        return before, after, failed, moved, down, unavailable
+
+    with EchoDaemonFleet(2) as fleet:
+        before, after, failed, moved, down, unavailable = _in_pool(run, fleet.pool, probe_interval=60)
+    # The call may have run before the daemon went away, so it fails instead of running twice
+    assert failed == "" and moved == "dbSave(cv)"
+    assert after != before and after in fleet.endpoints
+    # Taken out of rotation by the failed call, without a probe queued behind it
+    assert down["healthy"] is False and down["failed_probes"] == 0 and down["last_error"] == "no reply to a call"
+    assert unavailable.startswith("Bridge execution error: No healthy bridge daemon")
+
+
+def test_failed_single_daemon_is_probed_again():
+    """Test that a pool whose only daemon failed a call probes it again instead of staying unavailable"""
+    def run():
+        scheduler = get_bridge_scheduler()
+        scheduler.mark_failed(fleet.endpoints[0], "no reply to a call")
+        return rb_exec("1+2"), scheduler.status()[0]
+
+    with EchoDaemonFleet(1) as fleet:
+        result, status = _in_pool(run, fleet.pool, probe_interval=60)
+    assert result == "1+2" and status["healthy"] is True
+
+
+def main():
+    """Main function"""
+    print("🧪 Bridge Pool Scheduling Test")
+    print("=" * 50)
+    test_session_keys_and_pool_entries()
+    test_sessions_are_sticky_and_spread()
+    test_failover_to_healthy_daemon()
+    test_failed_single_daemon_is_probed_again()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
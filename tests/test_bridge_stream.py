@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Streamed Bridge Results (RBExcStream, the daemon's chunk forwarding and layout_dump_parser.py)
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "scripts" / "ramic_bridge"))
+
+from src.scripts.ramic_bridge.ramic_bridge import RBExcStream, RBStreamError, close_all_pools, get_connection_pool
+from src.app.utils.layout_dump_parser import (
+    LayoutDumpError, LayoutDumpParser, SkillStringDecoder, parse_dump_line, parse_layout_dump,
+)
+from src.tools.il_runner_tool import dump_layout_objects
+from ramic_bridge_echo_daemon import EchoDaemon, make_echo_executor
+import ramic_bridge_daemon_27 as daemon
+from tests.benchmarks.fake_virtuoso import start_fake_virtuoso
+
+DUMP_LINES = [
+    "SHAPE rect LAYER=M1 BBOX=((0.0 0.0) (1.5 2.0))",
+    "SHAPE_LABEL LAYER=M2 BBOX=((0.0 0.0) (1.0 1.0)) CENTER=(0.5 0.5)",
+    'TEXT_LABEL NAME="VDD "core"" LAYER=M7 AT=(10.0 -20.5)',
+    "INST I0 LIB=tphn28hpcpgv18 CELL=PVDD1DGZ_H_G XY=(0.0 350.0) ORIENT=R90",
+]
+
+
+def _printed_dump(count: int) -> bytes:
+    """The dump of count instances as the bridge prints the string dumpAllLayoutObjects_string returns"""
+    lines = DUMP_LINES[:3] + [f"INST I{i} LIB=LIB CELL=PAD{i % 3} XY=({i}.0 0.0) ORIENT=R0" for i in range(count)]
+    text = "".join(line + "\n" for line in lines)
+    return ('"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"').encode("utf-8")
+
+
+def _dump_stream_executor(count: int, chunk_size: int = 1000):
+    """Streaming executor answering like Virtuoso evaluating dumpAllLayoutObjects_string"""
+    def execute(skill_code, timeout_seconds, emit):
+        if "NO_SUCH_CELL" in skill_code:
+            emit(b"\x02nil")
+            return b""
+        if "error(" in skill_code:
+            emit(b"\x15*Error* eval: undefined function")
+            return b""
+        reply = b"\x02" + _printed_dump(count)
+        for offset in range(0, len(reply), chunk_size):
+            emit(reply[offset:offset + chunk_size])
+        return b"\x15TimeoutError" if "slow" in skill_code else b""
+    return execute
+
+
+def _load_ok_executor(skill_code, timeout_seconds):
+    return b"\x02t" if skill_code.startswith("load(") else b"\x02" + skill_code.encode("utf-8")
+
+
+def test_daemon_forwards_chunks_from_virtuoso():
+    """Test that the daemon forwards a multi-megabyte reply in pipe-sized chunks without collecting it"""
+    size = 3 * 1024 * 1024 + 5
+    proc = start_fake_virtuoso()
+    in_fd, out_fd = proc.stdout.fileno(), proc.stdin.fileno()
+    daemon.setup_virtuoso_pipes(in_fd, out_fd)
+    try:
+        chunks = []
+        rest = daemon.execute_in_virtuoso(f"noisy({size})", 10, in_fd=in_fd, out_fd=out_fd, emit=chunks.append)
+        # The next request still finds its reply (nothing after RS was lost or forwarded)
+        after = daemon.execute_in_virtuoso("1+2", 10, in_fd=in_fd, out_fd=out_fd)
+        hang_chunks = []
+        hang_rest = daemon.execute_in_virtuoso("hang()", 0.2, in_fd=in_fd, out_fd=out_fd, emit=hang_chunks.append)
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=5)
+    assert rest == b"" and after == b"\x021+2"
+    assert b"".join(chunks) == b"\x02" + b"y" * size
+    assert len(chunks) > 1 and max(len(chunk) for chunk in chunks) <= daemon.STDIN_CHUNK_SIZE
+    assert hang_chunks == [] and hang_rest == b"\x15TimeoutError"
+
+
+def test_stream_over_framed_connection():
+    """Test chunked delivery, errors, daemons without streaming support and abandoned streams"""
+    close_all_pools()
+    skill = "x" * (100 * 1024)
+    with EchoDaemon() as echo, EchoDaemon(stream_executor=_dump_stream_executor(10)) as dump:
+        chunks = list(RBExcStream(skill, host=echo.host, port=echo.port, timeout=5))
+        errors = []
+        for call in ("error(1)", "slow()"):
+            received = []
+            try:
+                for chunk in RBExcStream(call, host=dump.host, port=dump.port, timeout=5):
+                    received.append(chunk)
+                assert False, f"{call} should raise RBStreamError"
+            except RBStreamError as e:
+                errors.append((str(e), len(received)))
+        # The connection stays in sync after a failed stream
+        assert len(get_connection_pool(dump.host, dump.port)._idle) == 1
+        # Abandoning a stream closes its connection instead of pooling it with unread frames
+        stream = RBExcStream(skill, host=echo.host, port=echo.port, timeout=5)
+        next(stream)
+        stream.close()
+        idle = len(get_connection_pool(echo.host, echo.port)._idle)
+        assert list(RBExcStream("1+2", host=echo.host, port=echo.port, timeout=5)) == ["1+2"]
+    assert "".join(chunks) == skill and len(chunks) > 1
+    # A NAK reply yields nothing; a timeout after the output started ends the chunks with an error
+    assert errors[0] == ("*Error* eval: undefined function", 0)
+    assert errors[1][0] == "TimeoutError" and errors[1][1] > 0
+    assert idle == 0
+
+    with EchoDaemon(executor=make_echo_executor()) as single, EchoDaemon(oneshot_only=True) as oneshot:
+        assert list(RBExcStream(skill, host=single.host, port=single.port, timeout=5)) == [skill]
+        assert list(RBExcStream("3+4", host=oneshot.host, port=oneshot.port, timeout=5)) == ["3+4"]
+    close_all_pools()
+
+
+def test_skill_string_decoder_and_parser_across_chunk_boundaries():
+    """Test that splitting the printed dump at every position yields the same records"""
+    printed = _printed_dump(2).decode("utf-8")
+    expected = list(parse_layout_dump([printed]))
+    assert [record["type"] for record in expected] == ["SHAPE", "SHAPE_LABEL", "TEXT_LABEL", "INST", "INST"]
+    assert expected[2] == {"type": "TEXT_LABEL", "name": 'VDD "core"', "layer": "M7", "xy": [10.0, -20.5]}
+    for split in range(1, len(printed)):
+        assert list(parse_layout_dump([printed[:split], printed[split:]])) == expected, split
+    assert list(parse_layout_dump(iter(printed))) == expected
+
+    assert parse_dump_line(DUMP_LINES[3]) == {"type": "INST", "name": "I0", "lib": "tphn28hpcpgv18",
+                                              "cell": "PVDD1DGZ_H_G", "xy": [0.0, 350.0], "orient": "R90"}
+    assert parse_dump_line("Dump completed to: /tmp/x") is None
+    parser = LayoutDumpParser()
+    assert parser.feed("SHAPE rect LAYER=M1 BBOX=((0 0) (1 1))\ngarbage\nINST I1 LIB=L CELL=C XY=(1 2) ORIENT=R0") != []
+    assert parser.close()[0]["xy"] == [1.0, 2.0] and parser.skipped == 1
+    for result in ("nil", '"unterminated'):
+        try:
+            decoder = SkillStringDecoder()
+            decoder.decode(result)
+            decoder.close()
+            assert False, f"{result!r} should raise LayoutDumpError"
+        except LayoutDumpError:
+            pass
+
+
+def test_dump_layout_objects_tool():
+    """Test the tool end to end: stream, parse, write JSON Lines and summarize"""
+    close_all_pools()
+    original = os.environ.get("USE_RAMIC_BRIDGE")
+    os.environ["USE_RAMIC_BRIDGE"] = "1"
+    try:
+        with tempfile.TemporaryDirectory() as tmp, \
+                EchoDaemon(executor=_load_ok_executor, stream_executor=_dump_stream_executor(500)) as echo:
+            os.environ["RB_HOST"], os.environ["RB_PORT"] = echo.host, str(echo.port)
+            out = Path(tmp) / "dump.jsonl"
+            result = dump_layout_objects("LIB", "IO_RING", output_file=str(out))
+            records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+            missing = dump_layout_objects("LIB", "NO_SUCH_CELL", output_file=str(out))
+            timed_out = dump_layout_objects("LIB", "slow", output_file=str(out))
+    finally:
+        os.environ.pop("RB_HOST", None)
+        os.environ.pop("RB_PORT", None)
+        if original is None:
+            os.environ.pop("USE_RAMIC_BRIDGE", None)
+        else:
+            os.environ["USE_RAMIC_BRIDGE"] = original
+        close_all_pools()
+    assert result.startswith("✅ Dumped 503 objects of LIB/IO_RING/layout")
+    assert "INST: 500, SHAPE: 1, SHAPE_LABEL: 1, TEXT_LABEL: 1" in result
+    assert "Top masters: LIB/PAD0 x167" in result
+    assert len(records) == 503 and records[-1]["name"] == "I499"
+    assert missing.startswith("❌ Error: Failed to dump LIB/NO_SUCH_CELL/layout") and "nil" in missing
+    assert timed_out.startswith("❌ Error") and "TimeoutError" in timed_out
+
+
+def main():
+    """Main function"""
+    print("🧪 Streamed Bridge Results Test")
+    print("=" * 50)
+    test_daemon_forwards_chunks_from_virtuoso()
+    test_stream_over_framed_connection()
+    test_skill_string_decoder_and_parser_across_chunk_boundaries()
+    test_dump_layout_objects_tool()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Compiled Device Classification Tables (device_classifier.py)
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.device_classifier import DeviceClassifier, DEVICE_CATEGORIES, get_classification_table
+from src.app.layout.voltage_domain import VoltageDomainHandler
+
+CONFIG_DIR = project_root / "src" / "app" / "layout" / "config"
+
+
+def test_table_matches_config_lists():
+    """Test that exact and substring lookups give the same result as scanning the config lists"""
+    for process_node, config_file in (("T28", "lydevices_28.json"), ("T180", "lydevices_180.json")):
+        with open(CONFIG_DIR / config_file, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        table = get_classification_table(process_node)
+        names = set()
+        for category in DEVICE_CATEGORIES:
+            names.update(config.get(category, []))
+        probes = names | {name + "_X" for name in names} | {"X" + name for name in names} | {name[:-1] for name in names}
+        probes |= {"", "PAD60GU", "PCORNER", "PRCUTA"}
+        for probe in probes:
+            for category in DEVICE_CATEGORIES:
+                device_list = config.get(category, [])
+                assert table.is_a(probe, category) == (probe in device_list), (process_node, probe, category)
+                assert table.contains(probe, category) == any(dev in probe for dev in device_list), (process_node, probe, category)
+
+
+def test_table_is_shared_and_cached():
+    """Test that every caller gets the same table and repeated lookups hit the cache"""
+    table = get_classification_table("T28")
+    assert get_classification_table("28nm") is table
+    assert DeviceClassifier("T28")._table is table
+
+    table.contains("PDB3AC_H_G_variant", "analog_devices")
+    hits = table.cache_info()["contains"].hits
+    assert table.contains("PDB3AC_H_G_variant", "analog_devices")
+    assert table.cache_info()["contains"].hits == hits + 1
+
+
+def test_classifier_and_voltage_domain():
+    """Test the DeviceClassifier and VoltageDomainHandler lookups built on the tables"""
+    assert DeviceClassifier.is_digital_io_device("PDDW16SDGZ_V_G", "T28")
+    assert not DeviceClassifier.is_digital_io_device("PDDW16SDGZ", "T28")
+    assert DeviceClassifier.is_separator_device("PRCUTA_G", "T28")
+    assert DeviceClassifier.is_corner_device("PCORNER", "T180")
+    assert DeviceClassifier("T180").is_filler("PFILLER20")
+
+    assert VoltageDomainHandler.get_voltage_domain({"device": "PDDW16SDGZ"}) == "digital"
+    assert VoltageDomainHandler.get_voltage_domain({"device": "PCORNERA_G"}) == "analog"
+    assert VoltageDomainHandler.get_voltage_domain({"device": "PFILLER20_G"}) == "unknown"
+    assert VoltageDomainHandler.get_voltage_domain_key({"device": "PVSS2DGZ_H_G"}) == "DIGITAL_2"
+
+
+def main():
+    """Main function"""
+    print("🧪 Device Classification Table Test")
+    print("=" * 50)
+    test_table_matches_config_lists()
+    test_table_is_shared_and_cached()
+    test_classifier_and_voltage_domain()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
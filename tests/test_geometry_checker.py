@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Pre-DRC Ring Geometry Checker (geometry_checker.py)
+"""
+
+import io
+import sys
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.benchmarks.synthetic_ring import build_intent_graph
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from src.app.layout.geometry_checker import RingGeometryChecker, check_ring_geometry, instance_bbox
+
+
+def _placed_components(process_node: str, width: int = 5, height: int = 5) -> list:
+    """Generate a synthetic ring and return its placed components as dicts"""
+    with tempfile.TemporaryDirectory() as tmp:
+        graph_file = Path(tmp) / "ring.json"
+        graph_file.write_text(json.dumps(build_intent_graph(process_node, width, height)), encoding="utf-8")
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = generate_layout_from_json(str(graph_file), str(Path(tmp) / "ring.il"), process_node)
+    assert result["geometry_check"]["valid"], result["geometry_check"]["errors"]
+    return [component.to_dict() for component in result["components"]]
+
+
+def _first(components: list, component_type: str, orientation: str) -> dict:
+    return next(c for c in components if c["type"] == component_type and c["orientation"] == orientation)
+
+
+def test_instance_bbox_orientations():
+    """Test the rotated bounding boxes of a 20 x 110 pad"""
+    assert instance_bbox(100, 0, "R0", 20, 110) == (100, 0, 120, 110)
+    assert instance_bbox(500, 100, "R90", 20, 110) == (390, 100, 500, 120)
+    assert instance_bbox(300, 500, "R180", 20, 110) == (280, 390, 300, 500)
+    assert instance_bbox(0, 300, "R270", 20, 110) == (0, 280, 110, 300)
+    assert instance_bbox(0, 0, "MX", 20, 110) is None
+
+
+def test_generated_rings_are_clean():
+    """Test that generated T28 and T180 rings have no overlaps or out-of-ring instances"""
+    components = _placed_components("T28")
+    report = check_ring_geometry(components, "T28")
+    assert report["valid"] and not report["warnings"]
+    assert report["stats"]["instances"] == len(components)
+
+    report = check_ring_geometry(_placed_components("T180"), "T180")
+    assert report["valid"] and report["stats"]["overlaps"] == report["stats"]["out_of_ring"] == 0
+
+
+def test_overlap_gap_and_out_of_ring():
+    """Test a shifted pad, a removed filler and a pad moved into the core"""
+    components = _placed_components("T28")
+
+    shifted = [dict(c) for c in components]
+    pad = _first(shifted, "pad", "R0")
+    pad["position"] = [pad["position"][0] + 5, pad["position"][1]]
+    report = check_ring_geometry(shifted, "T28")
+    assert not report["valid"] and report["stats"]["overlaps"] >= 1
+    assert any(pad["name"] in error and "overlaps" in error for error in report["errors"])
+
+    filler = _first(components, "filler", "R0")
+    report = check_ring_geometry([c for c in components if c is not filler], "T28")
+    assert report["valid"] and report["stats"]["gaps"] == 1
+    assert report["warnings"][0].startswith("Gap on the bottom side")
+
+    moved = [dict(c) for c in components]
+    pad = _first(moved, "pad", "R90")
+    pad["position"] = [pad["position"][0] - 200, pad["position"][1]]
+    report = check_ring_geometry(moved, "T28")
+    assert report["stats"]["out_of_ring"] == 1 and "reaches into the core" in report["errors"][-1]
+
+
+def test_chained_overlaps():
+    """Test that a box overlapping only an already overlapping box is reported"""
+    overlaps = RingGeometryChecker._find_overlaps([(0, 0, 10, 10), (5, 0, 20, 10), (15, 0, 25, 10)], ["A", "B", "C"])
+    assert [overlap.split(" by ")[0] for overlap in overlaps] == ["B overlaps A", "C overlaps B"]
+    # Stacked boxes of different heights, found through the tallest active box
+    overlaps = RingGeometryChecker._find_overlaps([(0, 0, 10, 30), (2, 5, 8, 8), (4, 25, 12, 40)], ["A", "B", "C"])
+    assert sorted(overlap.split(" by ")[0] for overlap in overlaps) == ["B overlaps A", "C overlaps A"]
+
+
+def main():
+    """Main function"""
+    print("🧪 Ring Geometry Checker Test")
+    print("=" * 50)
+    test_instance_bbox_orientations()
+    test_generated_rings_are_clean()
+    test_overlap_gap_and_out_of_ring()
+    test_chained_overlaps()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
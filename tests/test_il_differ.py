@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Structural SKILL Differ (il_differ.py)
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.utils.il_differ import parse_il, parse_il_file, diff_il_records, format_il_diff
+
+GOLDEN_CASE = project_root / "AMS-IO-Bench" / "28nm_wirebonding" / "golden_output" / "IO_28nm_3x3_single_ring_digital"
+
+LAYOUT = """; Generated Layout Script
+dbCreateParamInstByMasterName(cv "tphn28hpcpgv18" "PDDW16SDGZ_H_G" "layout" "SDI_left_2" list(0 150) "R270")
+dbCreateParamInstByMasterName(cv "PAD" "PAD60GU" "layout" "pad60gu_SDI_left_2" list(0 150) "R270")
+dbCreatePath(cv list("M3" "drawing") list(list(130 110.5) list(270 110.5)) 0.2)
+dbCreateLabel(cv list("M4" "pin") list(109.875 255.67) "RSTN_CORE" "centerLeft" "R0" "roman" 2)
+dbCreateLabel(cv list("M4" "pin") list(109.875 195.67) "VIOL" "centerLeft" "R0" "roman" 2)
+dbCreateLabel(cv list("M4" "pin") list(109.875 135.67) "VIOL" "centerLeft" "R0" "roman" 2)
+viaDefId = techFindViaDefByName(tech "M2_M1")
+newVia = dbCreateVia(cv viaDefId list(125 290) "R270" viaParams)
+"""
+
+SCHEMATIC = """pddw16sdgz_h_gMaster = dbOpenCellView("tphn28hpcpgv18" "PDDW16SDGZ_H_G" "symbol")
+dbCreateInst(cv pddw16sdgz_h_gMaster "RSTN_left0" '(0 7.6875) "R270")
+schCreateWire(cv "route" "full" '((1.000 7.562) (1.750 7.562)) 0 0 0 nil nil)
+schCreateWireLabel(cv nil '(1.250 7.562) "GIOL" "lowerLeft" "R0" "stick" 0.0625 nil)
+schCreatePin(cv nil "RSTN_CORE" "inputOutput" nil '(1.750 7.438) "R180")
+"""
+
+
+def test_parse_il():
+    """Test that every supported call becomes a record with normalized coordinates"""
+    records = parse_il(LAYOUT)
+    assert [r["kind"] for r in records] == ["instance", "instance", "path", "label", "label", "label", "via"]
+    assert records[0]["name"] == "SDI_left_2"
+    assert records[0]["master"] == "tphn28hpcpgv18/PDDW16SDGZ_H_G/layout"
+    assert records[0]["position"] == (0.0, 150.0) and records[0]["orientation"] == "R270"
+    assert records[2]["geometry"] == (130.0, 110.5, 270.0, 110.5, 0.2)
+    assert records[6]["master"] == "M2_M1" and records[6]["line"] == 9
+
+    records = parse_il(SCHEMATIC)
+    assert [r["kind"] for r in records] == ["instance", "wire", "label", "pin"]
+    assert records[0]["master"] == "tphn28hpcpgv18/PDDW16SDGZ_H_G/symbol"
+    assert records[0]["position"] == (0.0, 7.6875)
+    assert records[3]["name"] == "RSTN_CORE" and records[3]["position"] == (1.75, 7.438)
+
+
+def test_diff_added_removed_moved():
+    """Test that changes are classified as added, removed or moved"""
+    generated = LAYOUT.replace('"SDI_left_2" list(0 150)', '"SDI_left_2" list(0 160)')
+    generated = generated.replace('list(109.875 135.67) "VIOL"', 'list(109.875 140) "VIOL"')
+    generated = generated.replace("list(list(130 110.5) list(270 110.5)) 0.2", "list(list(130 110.5) list(280 110.5)) 0.2")
+    generated = generated.replace('"pad60gu_SDI_left_2"', '"pad60gu_SDI_left_3"')
+    diff = diff_il_records(parse_il(LAYOUT), parse_il(generated))
+    assert not diff["identical"]
+    assert [(old["name"], new["position"]) for old, new in diff["moved"]] == [
+        ("SDI_left_2", (0.0, 160.0)), ("VIOL", (109.875, 140.0))]
+    assert sorted(r["kind"] + ":" + str(r["name"]) for r in diff["added"]) == ["instance:pad60gu_SDI_left_3", "path:None"]
+    assert sorted(r["kind"] + ":" + str(r["name"]) for r in diff["removed"]) == ["instance:pad60gu_SDI_left_2", "path:None"]
+    assert diff["unchanged"] == 3
+    report = format_il_diff(diff)
+    assert "2 added, 2 removed, 2 moved" in report
+
+
+def test_diff_ignores_formatting_and_order():
+    """Test that reordered statements and number formatting are not differences"""
+    reordered = "\n".join(reversed(LAYOUT.replace("list(0 150)", "list(0.000 150.0)").splitlines()[1:7]))
+    reordered = LAYOUT.splitlines()[0] + "\n" + reordered + "\n" + "\n".join(LAYOUT.splitlines()[7:])
+    diff = diff_il_records(parse_il(LAYOUT), parse_il(reordered))
+    assert diff["identical"], format_il_diff(diff)
+
+
+def test_golden_case_against_itself():
+    """Test a real golden layout and schematic parse completely and diff clean"""
+    for filename in ("io_ring_layout.il", "io_ring_schematic.il"):
+        records = parse_il_file(str(GOLDEN_CASE / filename))
+        assert records
+        assert diff_il_records(records, list(reversed(records)))["identical"]
+    layout = parse_il_file(str(GOLDEN_CASE / "io_ring_layout.il"))
+    assert sum(r["kind"] == "instance" for r in layout) == 52
+
+
+def main():
+    """Main function"""
+    print("🧪 SKILL Differ Test")
+    print("=" * 50)
+    test_parse_il()
+    test_diff_added_removed_moved()
+    test_diff_ignores_formatting_and_order()
+    test_golden_case_against_itself()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test IO Ring Batch Runner Worker Pool (run_IO_Ring_batch.py)
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.run_IO_Ring_batch import (
+    resolve_ramic_port, load_checkpoint, run_experiments_parallel, write_results_json,
+)
+
+
+def _experiments(count):
+    return [(i, {"pad_layout_name": f"layout_{i}", "prompt_key": f"io_ring_layout_{i}"}) for i in range(1, count + 1)]
+
+
+def _build_job(exp_index, exp, worker_id):
+    return {"prompt_key": exp["prompt_key"], "ramic_port": resolve_ramic_port(exp_index, worker_id, 3, ramic_port_start=7000)}
+
+
+def _make_runner(running, peak, fail_keys=()):
+    lock = threading.Lock()
+
+    def runner(prompt_key, ramic_port, log_dir, batch_interrupted_flag, current_process_ref,
+               output_prefix="", worker_log=None, output_lock=None):
+        with lock:
+            running.append(ramic_port)
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(ramic_port)
+        return {"success": prompt_key not in fail_keys, "prompt_key": prompt_key, "elapsed_time": 0.05,
+                "log_file": None, "error": None if prompt_key not in fail_keys else "Process exited with code 1"}
+
+    return runner
+
+
+def test_resolve_ramic_port():
+    """Test port assignment per worker (parallel) and per experiment (sequential)"""
+    assert resolve_ramic_port(5, 2, 4, ramic_ports=[100, 101, 102, 103]) == 102
+    assert resolve_ramic_port(5, 2, 4, ramic_port_start=7000) == 7002
+    assert resolve_ramic_port(5, 0, 1, ramic_port_start=7000) == 7004
+    assert resolve_ramic_port(5, 0, 1, ramic_port=65432) == 65432
+    assert resolve_ramic_port(5, 0, 1) is None
+
+
+def test_parallel_workers_and_checkpoint():
+    """Test that workers run jobs concurrently on distinct ports and checkpoint every result"""
+    running, peak = [], [0]
+    with tempfile.TemporaryDirectory() as log_dir:
+        checkpoint_file = os.path.join(log_dir, "checkpoint.json")
+        results = run_experiments_parallel(
+            _experiments(7), 3, log_dir, {"flag": False}, {}, _build_job,
+            checkpoint_file=checkpoint_file, runner=_make_runner(running, peak, {"io_ring_layout_4"}),
+        )
+        assert [r["prompt_key"] for r in results] == [f"io_ring_layout_{i}" for i in range(1, 8)]
+        assert peak[0] == 3
+        assert {r["ramic_port"] for r in results} <= {7000, 7001, 7002}
+        assert sorted(os.listdir(log_dir)) == ["checkpoint.json", "worker_0.log", "worker_1.log", "worker_2.log"]
+
+        checkpoint = load_checkpoint(checkpoint_file)
+        assert len(checkpoint) == 7
+        assert not checkpoint["io_ring_layout_4"]["success"]
+
+        results_file = os.path.join(log_dir, "results.json")
+        write_results_json(results_file, results, _experiments(7), {"workers": 3}, 1.0, False)
+        assert os.path.exists(results_file)
+
+
+def test_interrupted_batch_stops_taking_jobs():
+    """Test that no new jobs start after the interrupt flag is set"""
+    flag = {"flag": False}
+    started = []
+
+    def runner(prompt_key, ramic_port, **kwargs):
+        started.append(prompt_key)
+        flag["flag"] = True
+        return {"success": True, "prompt_key": prompt_key, "elapsed_time": 0.0, "log_file": None, "error": None}
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        checkpoint_file = os.path.join(log_dir, "checkpoint.json")
+        results = run_experiments_parallel(_experiments(5), 1, log_dir, flag, {}, _build_job,
+                                           checkpoint_file=checkpoint_file, runner=runner)
+        assert started == ["io_ring_layout_1"]
+        assert results == []
+        assert load_checkpoint(checkpoint_file) == {}
+
+
+def main():
+    """Main function"""
+    print("🧪 IO Ring Batch Runner Test")
+    print("=" * 50)
+    test_resolve_ramic_port()
+    test_parallel_workers_and_checkpoint()
+    test_interrupted_batch_stops_taking_jobs()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
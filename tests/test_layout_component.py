@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Slotted Layout Component Model (layout_component.py)
+"""
+
+import io
+import sys
+import json
+import pickle
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.layout_component import LayoutComponent, components_to_dicts
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+
+GOLDEN_DIR = project_root / "AMS-IO-Bench" / "28nm_wirebonding" / "golden_output"
+DOUBLE_RING_GRAPH = GOLDEN_DIR / "IO_28nm_8x8_double_ring_mixed" / "io_ring_intent_graph.json"
+
+
+def test_dict_compatibility_and_round_trip():
+    """Test mapping behaviour, missing fields, unknown keys and the intent-graph round trip"""
+    instance = {"name": "D0", "device": "PDDW16SDGZ_H_G", "position": "left_0", "type": "pad",
+                "direction": "input", "pin_connection": {"VDD": {"label": "VIOL"}}}
+    component = LayoutComponent.from_dict(instance)
+
+    assert not hasattr(component, "__dict__")
+    assert component == instance and component.to_dict() == instance
+    assert component["device"] == "PDDW16SDGZ_H_G" and component["direction"] == "input"
+    assert component.get("position_str", "abs") == "abs" and "position_str" not in component
+    assert "direction" in component and len(component) == len(instance)
+
+    component["position_str"] = "left_0"
+    component["pad_width"] = None
+    assert "pad_width" in component and component.get("pad_width", 80) is None
+    del component["position_str"]
+    try:
+        component["position_str"]
+        assert False, "missing field must raise KeyError"
+    except KeyError:
+        pass
+
+    assert pickle.loads(pickle.dumps(component)) == component
+    assert json.loads(json.dumps(components_to_dicts([component]))) == [component.to_dict()]
+
+
+def test_repeated_strings_are_interned():
+    """Test that device and orientation strings built at runtime share one object"""
+    device = "".join(["PVDD1", "DGZ_V_G"])
+    first = LayoutComponent(device=device, orientation="".join(["R", "180"]))
+    second = LayoutComponent(device="".join(["PVDD1DGZ", "_V_G"]), orientation="".join(["R1", "80"]))
+    assert first["device"] is second["device"] and first["orientation"] is second["orientation"]
+
+
+def test_pipeline_passes_components_through():
+    """Test that the generator returns slotted components that serialize to JSON"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = generate_layout_from_json(str(DOUBLE_RING_GRAPH), str(Path(tmp) / "layout.il"), "T28")
+    assert result["components"] and all(isinstance(c, LayoutComponent) for c in result["components"])
+    assert {"name", "device", "position", "orientation", "type"} <= set(json.loads(json.dumps(
+        components_to_dicts(result["components"])))[0])
+
+
+def main():
+    """Main function"""
+    print("🧪 Layout Component Test")
+    print("=" * 50)
+    test_dict_compatibility_and_round_trip()
+    test_repeated_strings_are_interned()
+    test_pipeline_passes_components_through()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
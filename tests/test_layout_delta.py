@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Incremental Layout Regeneration (layout_delta.py)
+"""
+
+import io
+import re
+import sys
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.benchmarks.synthetic_ring import build_intent_graph
+from src.app.layout.layout_generator_factory import generate_layout_delta
+from src.app.layout.layout_delta import manifest_path_for, pending_manifest_path_for, promote_layout_manifest
+from src.app.utils.il_differ import parse_il, parse_il_file, diff_il_records
+
+_CALL_RE = re.compile(r'^(ioDeltaDelete\w+)\(cv (.*)\)$')
+_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?(?:e[-+]?\d+)?')
+
+
+def _numbers(text):
+    return [round(float(value), 4) for value in _NUMBER_RE.findall(text)]
+
+
+def _matches(call, args, record):
+    """Check whether a delete call of the delta script targets a record of the loaded layout"""
+    strings = re.findall(r'"([^"]*)"', args)
+    numbers = _numbers(re.sub(r'"[^"]*"', "", args))
+    if call == "ioDeltaDeleteInst":
+        return record["kind"] == "instance" and record["name"] == strings[0]
+    if call == "ioDeltaDeleteLabel":
+        return (record["kind"] == "label" and record["master"] == "/".join(strings[:2])
+                and record["name"] == strings[2] and _numbers(str(record["position"])) == numbers)
+    if call == "ioDeltaDeleteVia":
+        return record["kind"] == "via" and record["master"] == strings[0] and _numbers(str(record["geometry"][:2])) == numbers
+    kind = strings[0]
+    if record["kind"] != kind or record["master"] != "/".join(strings[1:3]):
+        return False
+    geometry = [round(v, 4) for v in record["geometry"] if not isinstance(v, str)]
+    if kind == "path":
+        geometry = geometry[:-1]
+    return geometry == numbers
+
+
+def _apply_delta(loaded, delta_file):
+    """Apply a delta script to the records of the loaded layout, as Virtuoso would"""
+    records = list(loaded)
+    text = Path(delta_file).read_text(encoding="utf-8")
+    for line in text.splitlines():
+        match = _CALL_RE.match(line)
+        if match:
+            target = next(record for record in records if _matches(match.group(1), match.group(2), record))
+            records.remove(target)
+    created_section = text.split("; ==================== Created Objects ====================", 1)[1]
+    return records + parse_il(created_section)
+
+
+def _generate(graph, tmp, process_node="T28", **kwargs):
+    graph_file = Path(tmp) / "intent_graph.json"
+    graph_file.write_text(json.dumps(graph), encoding="utf-8")
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generate_layout_delta(str(graph_file), str(Path(tmp) / "layout.il"), process_node, **kwargs)
+
+
+def _check_delta_reproduces_full_script(process_node, edit):
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = build_intent_graph(process_node, 10, 10)
+        first = _generate(graph, tmp, process_node)
+        assert first["delta_file"] is None and first["full_reload_reason"]
+        promote_layout_manifest(str(Path(tmp) / "layout.il"))
+        loaded = parse_il_file(str(Path(tmp) / "layout.il"))
+
+        edit(graph["instances"])
+        second = _generate(graph, tmp, process_node)
+        assert second["delta_file"], second["full_reload_reason"]
+        assert 0 < second["deleted"] + second["created"] < second["unchanged"]
+
+        applied = _apply_delta(loaded, second["delta_file"])
+        diff = diff_il_records(parse_il_file(str(Path(tmp) / "layout.il")), applied)
+        assert diff["identical"], diff
+
+
+def test_delta_reproduces_full_script():
+    """Test that applying the delta to the previous layout gives the regenerated layout"""
+    def rename_analog_pad(instances):
+        pad = next(instance for instance in instances if instance["name"].startswith("LEFT_ANALOG_"))
+        pad["name"] = "LEFT_RENAMED"
+        pad["pin_connection"]["AIO"]["label"] = "LEFT_RENAMED"
+
+    def flip_digital_direction(instances):
+        pad = next(instance for instance in instances if instance.get("direction"))
+        pad["direction"] = "output" if pad["direction"] == "input" else "input"
+
+    def rename_t180_pad(instances):
+        pad = next(instance for instance in instances if instance["domain"] == "analog")
+        pad["name"] = "RENAMED_ANALOG"
+
+    _check_delta_reproduces_full_script("T28", rename_analog_pad)
+    _check_delta_reproduces_full_script("T28", flip_digital_direction)
+    _check_delta_reproduces_full_script("T180", rename_t180_pad)
+
+
+def test_full_reload_fallbacks():
+    """Test the full reload when no layout was loaded or too much changed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        layout_file = str(Path(tmp) / "layout.il")
+        graph = build_intent_graph("T28", 8, 8)
+        first = _generate(graph, tmp)
+        # Generating alone loads nothing, so there is still nothing to diff against
+        again = _generate(graph, tmp)
+        assert first["delta_file"] is None and again["delta_file"] is None
+        assert "no manifest" in again["full_reload_reason"]
+
+        assert promote_layout_manifest(layout_file) == manifest_path_for(layout_file)
+        unchanged = _generate(graph, tmp)
+        assert unchanged["delta_file"] and unchanged["deleted"] == unchanged["created"] == 0
+
+        resized = build_intent_graph("T28", 12, 12)
+        result = _generate(resized, tmp)
+        assert result["delta_file"] is None and "objects" in result["full_reload_reason"]
+        # The stale delta of the previous call can no longer promote a manifest
+        assert not Path(pending_manifest_path_for(unchanged["delta_file"])).exists()
+
+        Path(manifest_path_for(layout_file)).unlink()
+        result = _generate(resized, tmp)
+        assert result["delta_file"] is None and "no manifest" in result["full_reload_reason"]
+
+
+def test_manifest_follows_loaded_layout():
+    """Test that only loading a script, full or delta, changes the layout deltas are computed against"""
+    with tempfile.TemporaryDirectory() as tmp:
+        layout_file = str(Path(tmp) / "layout.il")
+        graph = build_intent_graph("T28", 8, 8)
+        _generate(graph, tmp)
+        promote_layout_manifest(layout_file)
+        loaded = Path(manifest_path_for(layout_file)).read_text(encoding="utf-8")
+
+        # A generation that is never loaded leaves the loaded manifest alone
+        pad = next(instance for instance in graph["instances"] if instance["name"].startswith("LEFT_ANALOG_"))
+        pad["name"] = "LEFT_RENAMED"
+        pad["pin_connection"]["AIO"]["label"] = "LEFT_RENAMED"
+        edited = _generate(graph, tmp)
+        assert edited["delta_file"] and Path(manifest_path_for(layout_file)).read_text(encoding="utf-8") == loaded
+        assert _generate(graph, tmp)["created"] == edited["created"]
+
+        # Loading the delta records the edited layout as loaded
+        assert promote_layout_manifest(edited["delta_file"]) == manifest_path_for(layout_file)
+        assert _generate(graph, tmp)["deleted"] == 0
+        assert promote_layout_manifest(str(Path(tmp) / "missing.il")) is None
+
+
+def main():
+    """Main function"""
+    print("🧪 Layout Delta Test")
+    print("=" * 50)
+    test_delta_reproduces_full_script()
+    test_full_reload_fallbacks()
+    test_manifest_follows_loaded_layout()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
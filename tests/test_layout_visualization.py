@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Layout Visualization From Placed Components
+"""
+
+import io
+import os
+import sys
+import tempfile
+import subprocess
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import matplotlib.image as mpimg
+
+from src.tools import io_ring_generator_tool
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from src.app.layout.layout_renderer import RENDER_BACKENDS
+from src.app.layout.T28.layout_visualizer import visualize_layout, parse_skill_layout
+
+GOLDEN_DIR = project_root / "AMS-IO-Bench" / "28nm_wirebonding" / "golden_output"
+DOUBLE_RING_GRAPH = GOLDEN_DIR / "IO_28nm_8x8_double_ring_mixed" / "io_ring_intent_graph.json"
+
+
+def test_generation_returns_placed_components():
+    """Test that the generator returns the placed instances and renders the same image as the SKILL file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        layout_file = os.path.join(tmp, "io_ring_layout.il")
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = generate_layout_from_json(str(DOUBLE_RING_GRAPH), layout_file, "T28")
+            file_image = visualize_layout(layout_file, os.path.join(tmp, "from_file.png"))
+        assert result["output_file"] == layout_file
+        assert result["visualization_file"] == os.path.join(tmp, "io_ring_layout_visualization.png")
+
+        # Same instances as parsed back from the SKILL file (physical pads are not drawn)
+        parsed = {(d["inst_name"], d["cell_name"], d["x"], d["y"], d["rotation"]) for d in parse_skill_layout(layout_file)}
+        placed = {(c["name"], c["device"], float(c["position"][0]), float(c["position"][1]), c["orientation"])
+                  for c in result["components"]}
+        assert placed == parsed
+        assert any(c["type"] == "inner_pad" for c in result["components"])
+
+        assert np.array_equal(mpimg.imread(result["visualization_file"]), mpimg.imread(file_image))
+
+
+def test_layout_tool_renders_once():
+    """Test that generate_io_ring_layout reports the generator's visualization without rendering again"""
+    calls = []
+    original = io_ring_generator_tool.visualize_layout
+    io_ring_generator_tool.visualize_layout = lambda *args, **kwargs: calls.append(args)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            output_file = os.path.join(tmp, "io_ring_layout.il")
+            with contextlib.redirect_stdout(io.StringIO()):
+                message = io_ring_generator_tool.generate_io_ring_layout(str(DOUBLE_RING_GRAPH), output_file, "T28",
+                                                                         use_cache=False)
+            assert message.startswith("✅"), message
+            assert "io_ring_layout_visualization.png" in message
+    finally:
+        io_ring_generator_tool.visualize_layout = original
+    assert calls == []
+
+
+def test_render_backends():
+    """Test that every render backend writes an image of about the same size, and unknown backends are rejected"""
+    with tempfile.TemporaryDirectory() as tmp:
+        layout_file = os.path.join(tmp, "io_ring_layout.il")
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_layout_from_json(str(DOUBLE_RING_GRAPH), layout_file, "T28")
+        shapes = {}
+        for backend in RENDER_BACKENDS:
+            image_file = visualize_layout(layout_file, os.path.join(tmp, f"{backend}.png"), backend=backend)
+            shapes[backend] = mpimg.imread(image_file).shape
+        heights = [shape[0] for shape in shapes.values()]
+        assert max(heights) < 1.5 * min(heights), shapes
+
+        try:
+            visualize_layout(layout_file, os.path.join(tmp, "unknown.png"), backend="svg")
+            assert False, "Expected ValueError for unknown backend"
+        except ValueError as e:
+            assert "svg" in str(e)
+
+
+def test_import_defers_matplotlib():
+    """Test that importing the layout tools does not import matplotlib until a render is requested"""
+    code = "import sys; import src.tools.io_ring_generator_tool; print('matplotlib' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=str(project_root),
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def main():
+    """Main function"""
+    print("🧪 Layout Visualization Test")
+    print("=" * 50)
+    test_generation_returns_placed_components()
+    test_layout_tool_renders_once()
+    test_render_backends()
+    test_import_defers_matplotlib()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
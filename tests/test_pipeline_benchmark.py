@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Pipeline Benchmark Harness (benchmarks/bench_pipeline.py)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.benchmarks.bench_pipeline import STAGES, discover_cases, run_case, compare_to_baseline
+
+
+def test_discover_cases():
+    """Test that golden intent graphs are found per process node"""
+    cases = discover_cases(["T28"], ["3x3_single_ring_digital"])
+    assert len(cases) == 1
+    assert cases[0]["process_node"] == "T28"
+    assert cases[0]["intent_graph"].endswith("io_ring_intent_graph.json")
+    assert discover_cases(["T28"], ["no_such_case"]) == []
+
+
+def test_run_case_records_every_stage():
+    """Test that a small case runs every stage and records time, memory and output size"""
+    case = discover_cases(["T28"], ["3x3_single_ring_digital"])[0]
+    cwd = os.getcwd()
+    os.chdir(project_root)
+    try:
+        results = run_case(case, repeat=1, measure_memory=True)
+    finally:
+        os.chdir(cwd)
+    assert list(results) == STAGES
+    for stage in STAGES:
+        assert results[stage]["time_ms"] > 0
+        assert results[stage]["peak_memory_kb"] > 0
+    assert results["layout"]["output_bytes"] > 0
+    assert results["schematic"]["output_bytes"] > 0
+
+
+def test_compare_to_baseline():
+    """Test regression detection against a baseline"""
+    baseline = {"T28/case": {"layout": {"time_ms": 100.0, "peak_memory_kb": 1000.0, "output_bytes": 10}}}
+    ok = {"T28/case": {"layout": {"time_ms": 160.0, "peak_memory_kb": 1200.0, "output_bytes": 10}}}
+    assert compare_to_baseline(ok, baseline) == []
+
+    slow = {"T28/case": {"layout": {"time_ms": 200.0, "peak_memory_kb": 1300.0, "output_bytes": 12}}}
+    messages = compare_to_baseline(slow, baseline)
+    assert len(messages) == 3
+    assert messages[0].startswith("❌") and messages[1].startswith("❌") and messages[2].startswith("⚠️")
+    assert "time" in messages[0] and "peak memory" in messages[1]
+
+    assert compare_to_baseline({"T28/new": ok["T28/case"]}, baseline)[0].startswith("⚠️")
+
+
+def main():
+    """Main function"""
+    print("🧪 Pipeline Benchmark Test")
+    print("=" * 50)
+    test_discover_cases()
+    test_run_case_records_every_stage()
+    test_compare_to_baseline()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Batch Ring Position Calculation (position_calculator.py)
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.position_calculator import PositionCalculator
+
+RING_CONFIG = {
+    "chip_width": 580, "chip_height": 490, "pad_spacing": 90,
+    "top_count": 3, "bottom_count": 3, "left_count": 2, "right_count": 2,
+}
+
+
+def test_batch_positions_both_orders():
+    """Test corners and edge pads of a 3x2 ring in both placement orders"""
+    calculator = PositionCalculator({"pad_width": 20, "corner_size": 110, "process_node": "T28"})
+    positions = ["top_left", "top_0", "top_2", "bottom_0", "left_1", "right_0", "bottom_right", "unknown"]
+
+    clockwise = calculator.calculate_positions_from_relative(positions, dict(RING_CONFIG, placement_order="clockwise"))
+    assert clockwise == [
+        ([0, 490], "R270"),
+        ([150, 490], "R180"),
+        ([330, 490], "R180"),
+        ([430, 0], "R0"),
+        ([0, 240], "R270"),
+        ([580, 340], "R90"),
+        ([580, 0], "R90"),
+        ([0, 0], "R0"),
+    ]
+
+    counterclockwise = calculator.calculate_positions_from_relative(positions, dict(RING_CONFIG, placement_order="counterclockwise"))
+    assert [position for position, _ in counterclockwise[1:6]] == [[330, 490], [150, 490], [250, 0], [0, 150], [580, 250]]
+
+    # The per-instance method gives the same result as the batch
+    for relative_position, expected in zip(positions, counterclockwise):
+        assert calculator.calculate_position_from_relative(relative_position, RING_CONFIG) == expected
+
+
+def test_instance_overrides_and_number_types():
+    """Test per-instance pad_width/corner_size (180nm) and that int inputs give int coordinates"""
+    calculator = PositionCalculator({"pad_width": 80, "corner_size": 130})
+    ring_config = dict(RING_CONFIG, placement_order="clockwise", process_node="T180")
+    instances = [{"pad_width": 80, "corner_size": 130}, {"pad_width": 60.5}, None]
+
+    results = calculator.calculate_positions_from_relative(["top_1", "top_1", "left_0"], ring_config, instances)
+    assert results == [([310, 490], "R180"), ([290.5, 490], "R180"), ([0, 220], "R270")]
+    assert [type(position[0]) for position, _ in results] == [int, float, int]
+
+
+def main():
+    """Main function"""
+    print("🧪 Position Calculator Test")
+    print("=" * 50)
+    test_batch_positions_both_orders()
+    test_instance_overrides_and_number_types()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
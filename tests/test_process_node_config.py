@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Process Node Configuration Registry (process_node_config.py)
+"""
+
+import io
+import os
+import copy
+import sys
+import json
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.process_node_config import (
+    PROCESS_NODE_CONFIGS, ProcessNodeRegistry, get_process_node_config, get_process_node_registry,
+)
+from src.app.layout.device_classifier import get_classification_table
+
+CONFIG_DIR = project_root / "src" / "app" / "layout" / "config"
+
+
+def test_loaded_once_and_read_only():
+    """Test that repeated lookups share one load, registry views are read-only and configs are the caller's"""
+    registry = get_process_node_registry()
+    version = registry.version("T28")
+    first = get_process_node_config("T28")
+    second = get_process_node_config("T28")
+    assert registry.version("T28") == version
+    assert first == second and first is not second
+
+    # The returned config is a mutable copy, as before the registry
+    first["pad_spacing"] = -1
+    first["filler_components"]["analog_20"] = "X"
+    first["device_lists"]["digital_io"] += ["EXTRA_IO"]
+    assert json.loads(json.dumps(copy.deepcopy(first)))["filler_components"]["analog_20"] == "X"
+    fresh = get_process_node_config("T28")
+    assert fresh["pad_spacing"] != -1 and fresh["filler_components"]["analog_20"] != "X"
+    assert "EXTRA_IO" not in fresh["device_lists"]["digital_io"]
+
+    # The registry itself hands out shared read-only views
+    assert registry.get_node_config("T28")["filler_components"] is registry.get_node_config("T28")["filler_components"]
+    try:
+        registry.get_node_config("T28")["filler_components"]["analog_20"] = "X"
+        assert False, "registry views must be read-only"
+    except TypeError:
+        pass
+    assert isinstance(registry.get_device_config("T28")["digital_io"], tuple)
+    assert get_classification_table("T28").process_node == "T28"
+
+
+def test_reload_on_file_change():
+    """Test that a changed config file is reloaded and listeners are notified"""
+    with tempfile.TemporaryDirectory() as tmp:
+        config_file = Path(tmp) / "lydevices_28.json"
+        shutil.copy(CONFIG_DIR / "lydevices_28.json", config_file)
+        registry = ProcessNodeRegistry(Path(tmp))
+        reloaded = []
+        registry.add_reload_listener(reloaded.append)
+
+        spacing = registry.get_node_config("T28")["pad_spacing"]
+        assert registry.get_node_config("T28") is registry.get_node_config("T28") and not reloaded
+
+        config = json.loads(config_file.read_text(encoding="utf-8"))
+        config["layout_params"]["pad_spacing"] = spacing + 5
+        config_file.write_text(json.dumps(config), encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert registry.get_node_config("T28")["pad_spacing"] == spacing + 5
+        assert reloaded == ["T28"] and registry.version("T28") == 2
+
+
+def test_missing_file_falls_back():
+    """Test the base configuration fallback and the required load error"""
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = ProcessNodeRegistry(Path(tmp))
+        assert registry.get_device_config("T180") is None
+        assert registry.get_node_config("T180")["pad_width"] == PROCESS_NODE_CONFIGS["T180"]["pad_width"]
+        try:
+            registry.get_device_config("T180", required=True)
+            assert False, "missing config file must raise"
+        except FileNotFoundError:
+            pass
+        try:
+            registry.get_node_config("T40")
+            assert False, "unsupported process node must raise"
+        except ValueError:
+            pass
+
+
+def main():
+    """Main function"""
+    print("🧪 Process Node Config Registry Test")
+    print("=" * 50)
+    test_loaded_once_and_read_only()
+    test_reload_on_file_change()
+    test_missing_file_falls_back()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test RAMIC Bridge Client and Daemon Protocols (against the local echo daemon and a fake Virtuoso)
+"""
+
+import sys
+import time
+import socket
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src" / "scripts" / "ramic_bridge"))
+
+from src.scripts.ramic_bridge import ramic_bridge
+from src.scripts.ramic_bridge.ramic_bridge import (
+    RBExc, RBExcPersistent, RBConnection, RBLegacyDaemonError, close_all_pools, get_connection_pool,
+)
+from ramic_bridge_echo_daemon import EchoDaemon
+import ramic_bridge_daemon_27 as daemon
+from tests.benchmarks.fake_virtuoso import start_fake_virtuoso
+
+
+def _execute_on_fake_virtuoso(requests, timeout=10):
+    """Run requests through the daemon's Virtuoso I/O path against the fake Virtuoso child"""
+    proc = start_fake_virtuoso()
+    in_fd, out_fd = proc.stdout.fileno(), proc.stdin.fileno()
+    daemon.setup_virtuoso_pipes(in_fd, out_fd)
+    try:
+        return [daemon.execute_in_virtuoso(skill, timeout, in_fd=in_fd, out_fd=out_fd) for skill in requests]
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=5)
+
+
+def test_oneshot_round_trip():
+    """Test that the one-shot client still works against the new daemon"""
+    with EchoDaemon() as echo:
+        assert RBExc("1+2", host=echo.host, port=echo.port, timeout=5) == "\x021+2"
+
+
+def test_persistent_reuses_connection():
+    """Test that consecutive persistent calls share one pooled connection"""
+    close_all_pools()
+    with EchoDaemon() as echo:
+        for i in range(20):
+            assert RBExcPersistent(f"{i}+1", host=echo.host, port=echo.port, timeout=5) == f"\x02{i}+1"
+        pool = get_connection_pool(echo.host, echo.port)
+        assert len(pool._idle) == 1
+    close_all_pools()
+
+
+def test_large_replies_are_not_truncated():
+    """Test that replies larger than 1MB arrive intact in both protocols"""
+    close_all_pools()
+    skill = "x" * (3 * 1024 * 1024)
+    with EchoDaemon() as echo:
+        assert RBExc(skill, host=echo.host, port=echo.port, timeout=10) == "\x02" + skill
+        assert RBExcPersistent(skill, host=echo.host, port=echo.port, timeout=10) == "\x02" + skill
+    close_all_pools()
+
+
+def test_request_ids_are_echoed():
+    """Test that every reply frame carries the id of its request"""
+    with EchoDaemon() as echo:
+        conn = RBConnection(echo.host, echo.port)
+        try:
+            results = [conn.execute(f"list({i})", timeout=5) for i in range(5)]
+        finally:
+            conn.close()
+    assert results == [f"\x02list({i})" for i in range(5)]
+
+
+def test_concurrent_persistent_calls():
+    """Test that threads sharing the pool each get their own reply"""
+    close_all_pools()
+    errors = []
+
+    with EchoDaemon() as echo:
+        def worker(worker_id):
+            for i in range(10):
+                skill = f"{worker_id}*{i}"
+                if RBExcPersistent(skill, host=echo.host, port=echo.port, timeout=5) != "\x02" + skill:
+                    errors.append(skill)
+
+        threads = [threading.Thread(target=worker, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    close_all_pools()
+    assert not errors, f"Mismatched replies: {errors}"
+
+
+def test_fallback_to_oneshot_daemon():
+    """Test that daemons without framed protocol support are served through RBExc"""
+    close_all_pools()
+    with EchoDaemon(oneshot_only=True) as echo:
+        try:
+            RBConnection(echo.host, echo.port)
+            assert False, "Handshake with a one-shot daemon should fail"
+        except RBLegacyDaemonError:
+            pass
+        assert RBExcPersistent("1+2", host=echo.host, port=echo.port, timeout=5) == "\x021+2"
+        assert (echo.host, echo.port) in ramic_bridge._legacy_endpoints
+        assert RBExcPersistent("3+4", host=echo.host, port=echo.port, timeout=5) == "\x023+4"
+    close_all_pools()
+
+
+def test_stale_pooled_connection_is_replaced():
+    """Test that a pooled connection closed by the daemon is retried on a fresh one"""
+    close_all_pools()
+    with EchoDaemon() as echo:
+        assert RBExcPersistent("1", host=echo.host, port=echo.port, timeout=5) == "\x021"
+        pool = get_connection_pool(echo.host, echo.port)
+        pool._idle[0].sock.shutdown(socket.SHUT_RDWR)
+        assert RBExcPersistent("2", host=echo.host, port=echo.port, timeout=5) == "\x022"
+    close_all_pools()
+
+
+def _serve_then_drop(server, received):
+    """Framed daemon that drops its first connection on the second request; later ones are answered"""
+    server.settimeout(1)
+    for connection in range(2):
+        try:
+            conn, _ = server.accept()
+        except socket.timeout:
+            return
+        with conn:
+            conn.sendall(conn.recv(len(ramic_bridge.FRAME_MAGIC)))
+            for _ in range(2 if connection == 0 else 1):
+                request_id, length = ramic_bridge.FRAME_HEADER.unpack(ramic_bridge._recv_exact(conn, ramic_bridge.FRAME_HEADER.size))
+                received.append(ramic_bridge._recv_exact(conn, length))
+                if len(received) != 2:
+                    conn.sendall(ramic_bridge.FRAME_HEADER.pack(request_id, 2) + b"\x02t")
+
+
+def test_sent_request_is_not_retried():
+    """Test that a request lost after it was sent is not executed again on a new connection"""
+    close_all_pools()
+    received = []
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(2)
+        port = server.getsockname()[1]
+        thread = threading.Thread(target=_serve_then_drop, args=(server, received), daemon=True)
+        thread.start()
+        assert RBExcPersistent("1", host="127.0.0.1", port=port, timeout=5) == "\x02t"
+        # The daemon dies mid-evaluation: the call fails instead of loading the script twice
+        assert RBExcPersistent('load("a.il")', host="127.0.0.1", port=port, timeout=5) == ""
+        thread.join(timeout=5)
+    assert len(received) == 2
+    close_all_pools()
+
+
+def test_invalid_oneshot_request():
+    """Test that the daemon answers malformed one-shot requests with a NAK error"""
+    with EchoDaemon() as echo:
+        with socket.create_connection((echo.host, echo.port), timeout=5) as s:
+            s.sendall(b'{"skill": ')
+            reply = s.recv(1024)
+    assert reply.startswith(b"\x15JSONDecodeError")
+
+
+def test_daemon_reads_framed_replies():
+    """Test that the buffered stdin reader returns complete multi-megabyte replies"""
+    size = 5 * 1024 * 1024 + 3
+    replies = _execute_on_fake_virtuoso(["emit(0)", f"emit({size})", "error(Undefined function)", "noisy(10)", "1+2"])
+    assert replies[0] == b"\x02"
+    assert replies[1] == b"\x02" + b"x" * size
+    assert replies[2] == b"\x15Undefined function"
+    assert replies[3] == b"\x02" + b"y" * 10
+    assert replies[4] == b"\x021+2"
+
+
+def test_daemon_watchdog_timeout():
+    """Test that a reply that never arrives returns TimeoutError after the watchdog fires"""
+    start = time.time()
+    replies = _execute_on_fake_virtuoso(["hang()", "emit(4)"], timeout=0.3)
+    assert replies[0] == b"\x15TimeoutError"
+    assert 0.3 <= time.time() - start < 3
+    assert replies[1] == b"\x02xxxx"
+
+
+def main():
+    """Main function"""
+    print("🧪 RAMIC Bridge Test")
+    print("=" * 50)
+    test_oneshot_round_trip()
+    test_persistent_reuses_connection()
+    test_large_replies_are_not_truncated()
+    test_request_ids_are_echoed()
+    test_concurrent_persistent_calls()
+    test_fallback_to_oneshot_daemon()
+    test_stale_pooled_connection_is_replaced()
+    test_sent_request_is_not_retried()
+    test_invalid_oneshot_request()
+    test_daemon_reads_framed_replies()
+    test_daemon_watchdog_timeout()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Hierarchical Ring Emission (ring_hierarchy.py)
+"""
+
+import io
+import re
+import sys
+import json
+import tempfile
+import contextlib
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.layout.layout_generator_factory import generate_layout_from_json, generate_layout_delta
+from src.app.layout.ring_hierarchy import RingHierarchy, rotate
+from src.app.layout.layout_delta import promote_layout_manifest
+from tests.benchmarks.synthetic_ring import build_intent_graph
+
+_INST_RE = re.compile(r'dbCreateParamInstByMasterName\((\w+) "([^"]*)" "([^"]*)" "([^"]*)" "([^"]*)" list\((\S+) (\S+)\) "R(\d+)"\)')
+_SUB_INST_RE = re.compile(r'dbCreateInst\((\w+) (\w+) "([^"]*)" list\((\S+) (\S+)\) "R(\d+)"\)')
+
+
+def flatten_script(script_file: str) -> dict:
+    """Resolve the sub-cell instances of a layout script, as Virtuoso would place them
+
+    Returns:
+        Dict instance path -> (library, cell, view, x, y, angle) in the top cell
+    """
+    cells = {}
+    for line in Path(script_file).read_text(encoding="utf-8").splitlines():
+        match = _INST_RE.fullmatch(line.strip())
+        if match:
+            cellview, library, cell, view, name, x, y, angle = match.groups()
+            cells.setdefault(cellview, []).append((None, (library, cell, view), name, float(x), float(y), int(angle)))
+            continue
+        match = _SUB_INST_RE.fullmatch(line.strip())
+        if match:
+            cellview, master, name, x, y, angle = match.groups()
+            cells.setdefault(cellview, []).append((master, None, name, float(x), float(y), int(angle)))
+
+    placed = {}
+
+    def place(cellview, origin_x, origin_y, angle, prefix):
+        for master, leaf, name, x, y, inst_angle in cells.get(cellview, []):
+            dx, dy = rotate(x, y, angle)
+            if master is None:
+                placed[prefix + name] = leaf + (round(origin_x + dx, 4), round(origin_y + dy, 4), (inst_angle + angle) % 360)
+            else:
+                place(master, origin_x + dx, origin_y + dy, (inst_angle + angle) % 360, f"{prefix}{name}/")
+
+    place("cv", 0, 0, 0, "")
+    return placed
+
+
+def generate(graph: dict, tmp: str, process_node: str, **kwargs):
+    graph_file = Path(tmp) / "intent_graph.json"
+    graph_file.write_text(json.dumps(graph), encoding="utf-8")
+    output_file = Path(tmp) / ("hierarchical" if kwargs.get("hierarchical") else "flat") / "io_ring_layout.il"
+    with contextlib.redirect_stdout(io.StringIO()):
+        return generate_layout_from_json(str(graph_file), str(output_file), process_node, **kwargs)
+
+
+def test_hierarchy_places_the_same_instances():
+    """Test that the sub-cells place every flat instance at its flat position, under its mapped path"""
+    for process_node, inner_pad_every in (("T28", 4), ("T180", 0)):
+        for placement_order in ("counterclockwise", "clockwise"):
+            graph = build_intent_graph(process_node, 12, 10, placement_order, inner_pad_every=inner_pad_every)
+            with tempfile.TemporaryDirectory() as tmp:
+                flat = generate(graph, tmp, process_node)
+                hierarchical = generate(graph, tmp, process_node, hierarchical=True)
+                flat_placed = flatten_script(flat["output_file"])
+                hier_placed = flatten_script(hierarchical["output_file"])
+                assert Counter(flat_placed.values()) == Counter(hier_placed.values())
+
+                manifest = json.loads(Path(hierarchical["hierarchy_file"]).read_text(encoding="utf-8"))
+                assert manifest == hierarchical["hierarchy"]
+                assert flat["hierarchy_file"] is None
+                assert manifest["instances"]
+                for name, path in manifest["instances"].items():
+                    assert "/" in path
+                    assert hier_placed[path] == flat_placed[name]
+                # Top and bottom (and left and right) sides hold the same devices, so they share cells
+                assert len(manifest["side_cells"]) == 2
+                assert manifest["slot_cells"]
+
+
+def test_repeated_groups_share_cells():
+    """Test that identical sides share one cell and repeated pad groups become slot cells"""
+    hierarchy = RingHierarchy()
+    for side, angle in (("R0", 0), ("R90", 90), ("R180", 180), ("R270", 270)):
+        for index in range(4):
+            x, y = rotate(100 + index * 20, 0, angle)
+            hierarchy.add("LIB", "PAD", "layout", f"{side}_pad{index}", x, y, side, side, starts_group=True)
+            x, y = rotate(110 + index * 20, 0, angle)
+            hierarchy.add("LIB", "FILL", "layout", f"{side}_fill{index}", x, y, side, side)
+    assert not hierarchy.add("LIB", "CORNER", "layout", "corner", 0, 0, "R0", None)
+    layout = hierarchy.build()
+    assert len(layout["slot_cells"]) == 1
+    assert len(layout["side_cells"]) == 1
+    assert layout["paths"]["R180_fill2"] == "IO_SIDE_TOP/G2/I1"
+    commands = hierarchy.skill_commands(layout)
+    assert commands[1] == 'ioRingSlot0 = ioRingOpenSubCell(cv "_io_slot0")'
+    assert commands[-1] == 'dbCreateInst(cv ioRingSide0 "IO_SIDE_LEFT" list(0 -100) "R270")'
+    assert RingHierarchy().skill_commands() == []
+
+
+def test_hierarchical_layout_is_reloaded_in_full():
+    """Test that delta mode does not write deltas across hierarchical generations"""
+    graph = build_intent_graph("T28", 6, 6)
+    with tempfile.TemporaryDirectory() as tmp:
+        graph_file = Path(tmp) / "intent_graph.json"
+        graph_file.write_text(json.dumps(graph), encoding="utf-8")
+        output_file = str(Path(tmp) / "io_ring_layout.il")
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_layout_from_json(str(graph_file), output_file, "T28")
+            promote_layout_manifest(output_file)
+            result = generate_layout_delta(str(graph_file), output_file, "T28", hierarchical=True)
+            assert result["delta_file"] is None and result["full_reload_reason"] == "hierarchical layout"
+            promote_layout_manifest(output_file)
+            result = generate_layout_delta(str(graph_file), output_file, "T28")
+            assert result["delta_file"] is None and result["full_reload_reason"] == "hierarchical layout"
+
+
+def main():
+    """Main function"""
+    print("🧪 Hierarchical Ring Emission Test")
+    print("=" * 50)
+    test_hierarchy_places_the_same_instances()
+    test_repeated_groups_share_cells()
+    test_hierarchical_layout_is_reloaded_in_full()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Ring Topology (ring_topology.py)
+"""
+
+import io
+import sys
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.benchmarks.bench_auto_filler import prepare_ring
+from src.app.layout.ring_topology import RingTopology
+
+PLACEMENT_ORDERS = ("clockwise", "counterclockwise")
+
+
+def test_topology_matches_per_call_computation():
+    """Test the shared topology against sorting and gap computation per call"""
+    for placement_order in PLACEMENT_ORDERS:
+        generator, outer, inner = prepare_ring("T28", 40, placement_order)
+        topology = generator.ring_topology
+        handler = generator.inner_pad_handler
+        sorted_components = generator.position_calculator.sort_components_by_position(outer, placement_order)
+        assert topology.sorted_components == sorted_components
+        assert topology.gap_set == handler.get_inner_pad_gap_set(inner, sorted_components)
+        assert topology.gap_set, "Synthetic ring should contain inner pad gaps"
+
+        pads = [c for c in outer if c["type"] == "pad"]
+        for inner_pad in inner:
+            expected = handler.calculate_inner_pad_position(inner_pad["position_str"], pads, generator.config)
+            assert (inner_pad["position"], inner_pad["orientation"]) == expected
+            assert topology.inner_pad_position(inner_pad["position_str"]) == expected
+
+
+def test_lookups():
+    """Test the name and position lookup maps"""
+    generator, outer, _ = prepare_ring("T28", 40)
+    topology = generator.ring_topology
+    for index, component in enumerate(topology.sorted_components):
+        assert topology.index_by_name[component["name"]] == index
+        assert topology.index_of(component) == index
+        assert topology.index_of(component.to_dict()) == index
+    assert topology.index_of({"position": [-1, -1], "orientation": "R0"}) is None
+
+
+def test_auto_filler_with_shared_topology():
+    """Test that the auto-filler gives the same fillers with a shared or its own topology"""
+    for placement_order in PLACEMENT_ORDERS:
+        generator, outer, inner = prepare_ring("T28", 40, placement_order)
+        with contextlib.redirect_stdout(io.StringIO()):
+            shared = generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(outer, inner, generator.ring_topology)
+            own = generator.auto_filler_generator.auto_insert_fillers_with_inner_pads(outer, inner)
+        assert [c.to_dict() for c in shared] == [c.to_dict() for c in own]
+
+
+def test_invalid_positions():
+    """Test that malformed inner pad positions are rejected"""
+    generator, outer, _ = prepare_ring("T28", 40)
+    topology = RingTopology(outer, "counterclockwise", 11, 11)
+    for position_str in ("left_1", "middle_1_2"):
+        try:
+            topology.inner_pad_position(position_str)
+        except ValueError:
+            continue
+        raise AssertionError(f"{position_str} should be rejected")
+    assert topology.find_gap_pairs([{"position_str": "left_1"}, {"position": [0, 0]}]) == []
+
+
+def main():
+    """Main function"""
+    print("🧪 Ring Topology Test")
+    print("=" * 50)
+    test_topology_matches_per_call_computation()
+    test_lookups()
+    test_auto_filler_with_shared_topology()
+    test_invalid_positions()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Compact SKILL Emission (skill_compact.py)
+"""
+
+import io
+import sys
+import json
+import tempfile
+import contextlib
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.utils.skill_emitter import SkillEmitter
+from src.app.utils.skill_compact import SkillCompactor, expand_compact_lines, is_compact_statement
+from src.app.utils.il_differ import parse_il
+from src.app.intent_graph.json_validator import convert_config_to_list
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from src.app.schematic.schematic_generator_T28 import generate_multi_device_schematic
+from tests.benchmarks.synthetic_ring import build_intent_graph
+
+PREAMBLE = ["cv = geGetWindowCellView()"]
+
+
+def compact_lines(statements, **kwargs) -> list:
+    """Write statements through a compact emitter and read the script back"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = Path(tmp) / "script.il"
+        with SkillEmitter(str(output_file), preamble=PREAMBLE, compact=True, **kwargs) as emitter:
+            emitter.emit_all(statements)
+        return output_file.read_text(encoding="utf-8").splitlines()
+
+
+def test_layout_round_trip():
+    """Test that compact layout scripts expand to the statements of the default script"""
+    for process_node in ("T28", "T180"):
+        graph = build_intent_graph(process_node, 10, 10, inner_pad_every=4 if process_node == "T28" else 0)
+        with tempfile.TemporaryDirectory() as tmp:
+            graph_file = Path(tmp) / "intent_graph.json"
+            graph_file.write_text(json.dumps(graph), encoding="utf-8")
+            default_file = Path(tmp) / "default" / "io_ring_layout.il"
+            compact_file = Path(tmp) / "compact" / "io_ring_layout.il"
+            with contextlib.redirect_stdout(io.StringIO()):
+                default = generate_layout_from_json(str(graph_file), str(default_file), process_node)
+                compact = generate_layout_from_json(str(graph_file), str(compact_file), process_node, compact=True)
+
+            default_lines = default_file.read_text(encoding="utf-8").splitlines()
+            compact_lines_ = compact_file.read_text(encoding="utf-8").splitlines()
+            assert any(is_compact_statement(line) for line in compact_lines_)
+            assert len(compact_file.read_bytes()) < len(default_file.read_bytes())
+            assert Counter(expand_compact_lines(compact_lines_)) == Counter(default_lines)
+
+            # Manifests and structural diffs see the objects, not the tables
+            manifests = [json.loads(Path(result["manifest_file"]).read_text(encoding="utf-8"))
+                         for result in (default, compact)]
+            assert sorted(map(str, manifests[0]["objects"])) == sorted(map(str, manifests[1]["objects"]))
+            assert len(parse_il(compact_file.read_text(encoding="utf-8"))) == \
+                len(parse_il(default_file.read_text(encoding="utf-8")))
+
+
+def test_schematic_round_trip():
+    """Test that a compact schematic script expands to the statements of the default script"""
+    config_list = convert_config_to_list(build_intent_graph("T28", 8, 8))
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            default_files = generate_multi_device_schematic(config_list, str(Path(tmp) / "default.il"))
+            compact_files = generate_multi_device_schematic(config_list, str(Path(tmp) / "compact.il"), compact=True)
+        default_lines = Path(default_files[0]).read_text(encoding="utf-8").splitlines()
+        compact_lines_ = Path(compact_files[0]).read_text(encoding="utf-8").splitlines()
+        assert len(compact_lines_) < len(default_lines) // 4
+        assert Counter(expand_compact_lines(compact_lines_)) == Counter(default_lines)
+
+
+def test_batches_and_runs():
+    """Test batch splitting and that other statements end a run in order"""
+    statements = [f'dbCreateRect(cv list("M1" "drawing") list(list({i} 0) list({i + 1} 1)))' for i in range(1000)]
+    statements += ["dbSave(cv)"]
+    lines = compact_lines(statements, max_chunk_bytes=None)
+    assert lines[0] == PREAMBLE[0]
+    assert len(lines) > 3, "1000 rectangles should not fit into a single 16 KB batch"
+    assert lines[-1] == "dbSave(cv)"
+    assert list(expand_compact_lines(lines[1:])) == statements
+
+    compactor = SkillCompactor(batch_bytes=64)
+    batches = [batch for statement in statements[:-1] for batch in compactor.add(statement)]
+    batches += compactor.flush()
+    assert not compactor.pending
+    assert list(expand_compact_lines(batches)) == statements[:-1]
+    assert compactor.add("dbSave(cv)") is None
+
+
+def test_independent_assignments():
+    """Test that master assignments only pass a run when the pending rows do not use them"""
+    compactor = SkillCompactor()
+    assert compactor.add("dbCreateInst(cv pvdd1acMaster \"I0\" '(0 0) \"R0\")") == []
+    assert compactor.is_independent('pvss1acMaster = dbOpenCellView("lib" "PVSS1AC" "symbol")')
+    assert not compactor.is_independent('pvdd1acMaster = dbOpenCellView("lib" "PVDD1AC" "symbol")')
+    assert not compactor.is_independent("x = dbCreateInst(cv pvss1acMaster \"I1\" '(0 0) \"R0\")")
+    compactor.flush()
+    assert compactor.is_independent('pvdd1acMaster = dbOpenCellView("lib" "PVDD1AC" "symbol")')
+
+
+def main():
+    """Main function"""
+    print("🧪 Compact SKILL Emission Test")
+    print("=" * 50)
+    test_layout_round_trip()
+    test_schematic_round_trip()
+    test_batches_and_runs()
+    test_independent_assignments()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
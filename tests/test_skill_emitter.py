@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Streaming SKILL Emitter (skill_emitter.py)
+"""
+
+import io
+import sys
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.utils.skill_emitter import SkillEmitter
+from src.app.layout.layout_generator_factory import generate_layout_from_json
+from tests.benchmarks.synthetic_ring import build_intent_graph
+
+PREAMBLE = ["cv = geGetWindowCellView()"]
+
+
+def chunk_body(chunk_file: str) -> list:
+    """Get the statements of a chunk without its preamble"""
+    lines = Path(chunk_file).read_text(encoding="utf-8").splitlines()
+    assert lines[:len(PREAMBLE)] == PREAMBLE
+    return lines[len(PREAMBLE):]
+
+
+def test_single_file_output():
+    """Test that the unsplit output matches joining the statements"""
+    statements = ["; header", ""] + [f'dbCreateInst(cv master "I{i}" list({i} 0) "R0")' for i in range(100)] + ["dbSave(cv)"]
+    with tempfile.TemporaryDirectory() as tmp:
+        for trailing_newline in (False, True):
+            output_file = Path(tmp) / "script.il"
+            with SkillEmitter(str(output_file), preamble=PREAMBLE, trailing_newline=trailing_newline) as emitter:
+                emitter.emit(statements[0])
+                emitter.emit_all(line for line in statements[1:])
+            expected = "\n".join(PREAMBLE + statements) + ("\n" if trailing_newline else "")
+            assert output_file.read_text(encoding="utf-8") == expected
+            assert emitter.files == [str(output_file)]
+            assert emitter.statement_count == len(PREAMBLE) + len(statements)
+            assert emitter.bytes_written == len(expected)
+
+
+def test_chunked_output():
+    """Test the size-based split, the chunk callback and the loader file"""
+    statements = [f'dbCreateInst(cv master "I{i}" list({i} 0) "R0")' for i in range(200)] + ["x" * 900]
+    finished = []
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = Path(tmp) / "script.il"
+        emitter = SkillEmitter(str(output_file), preamble=PREAMBLE, max_chunk_bytes=512, on_chunk=finished.append)
+        for line in statements:
+            emitter.emit(line)
+            # Finished chunks are complete on disk while later statements are still coming
+            assert all(chunk_body(chunk) for chunk in finished)
+        files = emitter.close()
+
+        assert len(files) > 2
+        assert finished == files
+        assert [chunk_body(chunk) for chunk in files][-1] == ["x" * 900]  # oversized statement gets its own chunk
+        assert [line for chunk in files for line in chunk_body(chunk)] == statements
+        for chunk in files[:-1]:
+            assert len(Path(chunk).read_bytes()) <= 512
+
+        loader = output_file.read_text(encoding="utf-8").splitlines()
+        assert loader == [f'load("{Path(chunk).resolve().as_posix()}")' for chunk in files] + ["t"]
+
+        try:
+            emitter.emit("t")
+            assert False, "emit() after close() should fail"
+        except ValueError:
+            pass
+
+
+def test_chunked_layout_generation():
+    """Test that a chunked layout script holds the same statements as the single-file script"""
+    graph = build_intent_graph("T28", 12, 12, inner_pad_every=4)
+    with tempfile.TemporaryDirectory() as tmp:
+        graph_file = Path(tmp) / "intent_graph.json"
+        graph_file.write_text(json.dumps(graph), encoding="utf-8")
+        single_file = Path(tmp) / "single" / "io_ring_layout.il"
+        chunked_file = Path(tmp) / "chunked" / "io_ring_layout.il"
+        with contextlib.redirect_stdout(io.StringIO()):
+            single = generate_layout_from_json(str(graph_file), str(single_file), "T28")
+            chunked = generate_layout_from_json(str(graph_file), str(chunked_file), "T28", max_chunk_bytes=4096)
+
+        assert single["chunk_files"] == [str(single_file)]
+        assert len(chunked["chunk_files"]) > 1
+        statements = single_file.read_text(encoding="utf-8").splitlines()
+        assert statements[0] == PREAMBLE[0]
+        assert [line for chunk in chunked["chunk_files"] for line in chunk_body(chunk)] == statements[1:]
+
+
+def main():
+    """Main function"""
+    print("🧪 Streaming SKILL Emitter Test")
+    print("=" * 50)
+    test_single_file_output()
+    test_chunked_output()
+    test_chunked_layout_generation()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()
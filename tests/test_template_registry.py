@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test Device Template Registry (template_registry.py)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.app.schematic import schematic_generator_T28, schematic_generator_T180
+from src.app.schematic.template_registry import TemplateRegistry, rotate_point
+
+ORIENTATIONS = ("R0", "R90", "R180", "R270")
+
+
+def test_registry_loaded_once():
+    """Test that the registry and its placements are shared across calls"""
+    os.chdir(project_root)
+    for module in (schematic_generator_T28, schematic_generator_T180):
+        registry = module.get_template_registry()
+        assert module.get_template_registry() is registry
+        device = next(iter(registry.template_manager.templates))
+        assert registry.placement(device, "R90") is registry.placement(device, "R90")
+        assert registry.placement("NO_SUCH_DEVICE", "R0") is None
+
+
+def test_placements_match_per_pin_computation():
+    """Test rotated offsets, sides and default configs against the template manager"""
+    os.chdir(project_root)
+    for module in (schematic_generator_T28, schematic_generator_T180):
+        registry = module.get_template_registry()
+        manager = registry.template_manager
+        side_of = module.SchematicGenerator.get_pin_side_from_center
+        for device, template in manager.templates.items():
+            for orientation in ORIENTATIONS:
+                placement = registry.placement(device, orientation)
+                center = rotate_point(template.center_x, template.center_y, orientation)
+                for pin, placed in zip(template.pins, placement.pins):
+                    x, y = rotate_point(pin['x'], pin['y'], orientation)
+                    assert (placed.name, placed.dx, placed.dy) == (pin['name'], x, y)
+                    assert placed.side == side_of(100 + x, 50 + y, 100 + center[0], 50 + center[1], orientation)
+
+            for pin in registry.placement(device, "R0").pins:
+                for direction in ("input", "output"):
+                    for pin_label in (None, "NET_A"):
+                        expected = manager.get_pin_config(device, pin.name, "PAD1", direction, pin_label=pin_label,
+                                                          vdd_label="VDD_X", vss_label="VSS_X")
+                        config = registry.pin_config(device, pin, "PAD1", direction, pin_label=pin_label,
+                                                     vdd_label="VDD_X", vss_label="VSS_X")
+                        assert config == (expected['label'], expected['create_wire'],
+                                          expected['create_label'], expected['create_pin'])
+
+
+def test_stale_after_template_change():
+    """Test that a changed template file marks the registry stale"""
+    with tempfile.TemporaryDirectory() as tmp:
+        template_file = Path(tmp) / "IO_device_info_T28.json"
+        shutil.copy(project_root / "src" / "scripts" / "devices" / "IO_device_info_T28.json", template_file)
+        manager = schematic_generator_T28.load_templates_from_json(str(template_file))
+        registry = TemplateRegistry(manager, schematic_generator_T28.SchematicGenerator.get_pin_side_from_center,
+                                    source_file=str(template_file))
+        assert not registry.is_stale()
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert registry.is_stale()
+
+
+def main():
+    """Main function"""
+    print("🧪 Template Registry Test")
+    print("=" * 50)
+    test_registry_loaded_once()
+    test_placements_match_per_pin_computation()
+    test_stale_after_template_change()
+    print("🎉 Test completed!")
+
+
+if __name__ == "__main__":
+    main()